@@ -36,12 +36,12 @@ def get_batch_failure_predictions() -> Response:
 
     Query params:
     - unit_id: Optional unit filter
-    - threshold: Minimum risk score (default: 0.0)
+    - threshold: Minimum failure probability (default: 0.0)
     - risk_level: Filter by level (low/medium/high/critical)
 
     Returns:
     - List of actuators with predictions
-    - Sorted by risk score (highest first)
+    - Sorted by failure probability (highest first)
     - Summary statistics
     """
     unit_id = request.args.get("unit_id", type=int)
@@ -59,27 +59,32 @@ def get_batch_failure_predictions() -> Response:
 
     actuators = actuator_svc.list_actuators(unit_id=unit_id) if unit_id else actuator_svc.list_actuators()
 
+    actuator_ids = [a["actuator_id"] for a in actuators if a.get("actuator_id") is not None]
+    results = analytics.predict_device_failures(actuator_ids)
+
     predictions = []
     for actuator in actuators:
-        try:
-            actuator_id = actuator["actuator_id"]
-            prediction = analytics.predict_device_failure(actuator_id)
-
-            # Apply filters
-            if prediction["risk_score"] >= threshold and (not risk_level or prediction["risk_level"] == risk_level):
-                predictions.append(
-                    {
-                        "actuator_id": actuator_id,
-                        "actuator_name": actuator.get("name"),
-                        "actuator_type": actuator.get("actuator_type"),
-                        "prediction": prediction,
-                    }
-                )
-        except Exception as e:
-            logger.warning("Failed to predict for actuator %s: %s", actuator_id, e)
-
-    # Sort by risk score (highest first)
-    predictions.sort(key=lambda x: x["prediction"]["risk_score"], reverse=True)
+        actuator_id = actuator.get("actuator_id")
+        prediction = results.get(actuator_id)
+        if not prediction or "error" in prediction:
+            logger.warning("Failed to predict for actuator %s: %s", actuator_id, (prediction or {}).get("error"))
+            continue
+
+        # Apply filters
+        if prediction["failure_probability"] >= threshold and (
+            not risk_level or prediction["risk_level"] == risk_level
+        ):
+            predictions.append(
+                {
+                    "actuator_id": actuator_id,
+                    "actuator_name": actuator.get("name"),
+                    "actuator_type": actuator.get("actuator_type"),
+                    "prediction": prediction,
+                }
+            )
+
+    # Sort by failure probability (highest first)
+    predictions.sort(key=lambda x: x["prediction"]["failure_probability"], reverse=True)
 
     return _success(
         {
@@ -7,11 +7,15 @@ Endpoints for sensor data visualization, trends, and correlations.
 
 from __future__ import annotations
 
+import csv
+import io
+import json
 import logging
+from collections.abc import Iterator
 from contextlib import suppress
 from datetime import timedelta
 
-from flask import Response, request
+from flask import Response, request, stream_with_context
 
 from app.blueprints.api._common import (
     fail as _fail,
@@ -22,11 +26,19 @@ from app.blueprints.api._common import (
     success as _success,
 )
 from app.blueprints.api.analytics import analytics_api
+from app.utils.downsampling import DOWNSAMPLE_MODES
 from app.utils.http import safe_route
 from app.utils.time import iso_now, utc_now
+from infrastructure.database.pagination import KeysetCursor
 
 logger = logging.getLogger(__name__)
 
+EXPORT_FORMATS = ("ndjson", "csv")
+# Rows buffered per response chunk
+EXPORT_CHUNK_ROWS = 200
+# Reading fields written before the per-metric columns of a CSV export
+EXPORT_CSV_FIELDS = ("timestamp", "unit_id", "sensor_id", "sensor_name", "reading_id", "quality_score")
+
 
 @analytics_api.get("/sensors/overview")
 @safe_route("Failed to get sensors overview")
@@ -76,7 +88,8 @@ def get_sensors_history() -> Response:
     - unit_id: Optional unit filter
     - sensor_id: Optional sensor filter
     - limit: Max readings (default: 500)
-    - interval: Aggregation interval (optional: '1h', '6h', '1d')
+    - interval: Aggregation interval (optional: '1min', '15min', '1hour', '6hour', '1day')
+    - downsample: Point selection per series ('lttb' or 'minmax', default: 'lttb')
 
     Returns:
     - Time-series data for all sensor types
@@ -91,12 +104,17 @@ def get_sensors_history() -> Response:
     sensor_id = request.args.get("sensor_id", type=int)
     limit = request.args.get("limit", 500, type=int)
     interval = request.args.get("interval")
+    downsample = request.args.get("downsample", "lttb")
 
     if start >= end:
         return _fail("start must be before end", 400)
+    if downsample not in DOWNSAMPLE_MODES:
+        return _fail(f"downsample must be one of: {', '.join(DOWNSAMPLE_MODES)}", 400)
 
-    # Fetch history
-    readings = analytics.fetch_sensor_history(start, end, unit_id=unit_id, sensor_id=sensor_id, limit=limit)
+    # Fetch history (raw readings or a rollup tier, whichever fits the point budget)
+    readings = analytics.fetch_chart_readings(
+        start, end, unit_id=unit_id, sensor_id=sensor_id, max_points=limit, interval=interval, downsample=downsample
+    )
 
     # Format for charts using AnalyticsService
     chart_data = analytics.format_sensor_chart_data(readings, interval)
@@ -114,6 +132,116 @@ def get_sensors_history() -> Response:
     )
 
 
+@analytics_api.get("/sensors/history/export")
+@safe_route("Failed to export sensor history")
+def export_sensors_history() -> Response:
+    """
+    Stream raw sensor readings for export with constant memory.
+
+    Readings are read in keyset pages of (timestamp, reading_id) and written
+    as they arrive, so multi-month windows never materialize in memory.
+
+    Query params:
+    - start: Start datetime (ISO 8601, default: 24h ago)
+    - end: End datetime (ISO 8601, default: now)
+    - unit_id: Optional unit filter
+    - sensor_id: Optional sensor filter
+    - metric: Optional metric filter (repeatable or comma-separated)
+    - format: 'ndjson' (one reading per line, default) or 'csv' (one metric per row)
+    - cursor: Resume after the reading that carried this cursor
+    - limit: Optional cap on the number of readings
+
+    Every NDJSON line and CSV row carries the ``cursor`` of its reading; pass
+    the cursor of the last fully received reading to resume an export.
+    """
+    analytics = _analytics_service()
+
+    end = _parse_datetime(request.args.get("end"), utc_now())
+    start = _parse_datetime(request.args.get("start"), end - timedelta(hours=24))
+    unit_id = request.args.get("unit_id", type=int)
+    sensor_id = request.args.get("sensor_id", type=int)
+    limit = request.args.get("limit", type=int)
+    export_format = request.args.get("format", "ndjson").lower()
+    metrics = [m.strip() for arg in request.args.getlist("metric") for m in arg.split(",") if m.strip()]
+
+    if start >= end:
+        return _fail("start must be before end", 400)
+    if export_format not in EXPORT_FORMATS:
+        return _fail(f"format must be one of: {', '.join(EXPORT_FORMATS)}", 400)
+    if limit is not None and limit < 1:
+        return _fail("limit must be at least 1", 400)
+    cursor = None
+    if request.args.get("cursor"):
+        try:
+            cursor = KeysetCursor.decode(request.args["cursor"])
+        except ValueError:
+            return _fail("Invalid cursor", 400)
+
+    rows = analytics.iter_sensor_history_export(
+        start,
+        end,
+        unit_id=unit_id,
+        sensor_id=sensor_id,
+        metrics=metrics or None,
+        cursor=cursor,
+        limit=limit,
+    )
+    encode = _ndjson_chunks if export_format == "ndjson" else _csv_chunks
+    mimetype = "application/x-ndjson" if export_format == "ndjson" else "text/csv"
+    filename = f"sensor_history_{start:%Y%m%dT%H%M%S}_{end:%Y%m%dT%H%M%S}.{export_format}"
+    return Response(
+        stream_with_context(encode(rows)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+def _ndjson_chunks(rows) -> Iterator[str]:
+    lines: list[str] = []
+    try:
+        for row, cursor in rows:
+            lines.append(json.dumps({**row, "cursor": cursor.encode()}, default=str))
+            if len(lines) >= EXPORT_CHUNK_ROWS:
+                yield "\n".join(lines) + "\n"
+                lines = []
+    except Exception as e:
+        # Headers are already sent: flush what was read, then abort the stream so the
+        # client sees a truncated transfer and resumes from its last cursor
+        logger.error("Sensor history export aborted: %s", e, exc_info=True)
+        if lines:
+            yield "\n".join(lines) + "\n"
+        raise
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _csv_chunks(rows) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([*EXPORT_CSV_FIELDS, "metric", "value", "cursor"])
+    pending = 0
+    try:
+        for row, cursor in rows:
+            token = cursor.encode()
+            base = [row.get(field, "") for field in EXPORT_CSV_FIELDS]
+            for metric, value in row.items():
+                if metric not in EXPORT_CSV_FIELDS:
+                    writer.writerow([*base, metric, value, token])
+            pending += 1
+            if pending >= EXPORT_CHUNK_ROWS:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+    except Exception as e:
+        # Headers are already sent: flush what was read, then abort the stream so the
+        # client sees a truncated transfer and resumes from its last cursor
+        logger.error("Sensor history export aborted: %s", e, exc_info=True)
+        yield buffer.getvalue()
+        raise
+    yield buffer.getvalue()
+
+
 @analytics_api.get("/sensors/history/enriched")
 @safe_route("Failed to get enriched sensor history")
 def get_sensors_history_enriched() -> Response:
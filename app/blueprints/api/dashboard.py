@@ -240,6 +240,7 @@ def get_timeseries() -> Response:
                 sensor_id=request.args.get("sensor_id", type=int),
                 limit=request.args.get("limit", default=500, type=int),
                 hours=hours,
+                downsample=request.args.get("downsample", default="lttb"),
             )
         )
     except ValueError as exc:
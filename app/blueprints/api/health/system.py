@@ -52,6 +52,7 @@ def register_system_routes(health_api: Blueprint):
                 "status": "healthy|degraded|critical",
                 "units": {...},
                 "event_bus": {...},
+                "emitter": {...},
                 "summary": {...},
                 "timestamp": "2025-12-08T..."
             }
@@ -112,12 +113,15 @@ def register_system_routes(health_api: Blueprint):
             system_status = HealthLevel.HEALTHY
 
         event_bus_metrics = EventBus().get_metrics()
+        emitter = getattr(_container(), "emitter_service", None)
+        emitter_metrics = emitter.get_metrics() if emitter is not None else {}
 
         return _success(
             {
                 "status": str(system_status),
                 "units": units,
                 "event_bus": event_bus_metrics,
+                "emitter": emitter_metrics,
                 "summary": {
                     "total_units": total_units,
                     "healthy_units": healthy_count,
@@ -220,6 +224,8 @@ def register_system_routes(health_api: Blueprint):
                     "ActuatorStateHistory": int,
                     ...
                 },
+                "write_behind": {"pending": int, "rejected": int, "last_commit_ms": float, ...},
+                "connection_lanes": {"read": {...}, "write": {"contended": int, "wait_ms_max": float, ...}},
                 "timestamp": ISO timestamp
             }
         """
@@ -243,6 +249,11 @@ def register_system_routes(health_api: Blueprint):
 
         table_counts = maintenance.get_table_row_counts()
 
+        # Group-commit queue depth and backpressure counters
+        write_behind = database.get_write_behind_stats() if hasattr(database, "get_write_behind_stats") else {}
+        # Read pool / writer lane wait times and lock contention
+        lanes = database.get_connection_lane_stats() if hasattr(database, "get_connection_lane_stats") else {}
+
         # Add retention settings info
         retention_info = {
             "sensor_retention_days": getattr(config, "sensor_retention_days", 30) if config else 30,
@@ -255,12 +266,14 @@ def register_system_routes(health_api: Blueprint):
                 "size": size_info,
                 "tables": table_counts,
                 "retention_settings": retention_info,
-                "recommendations": _get_db_recommendations(size_info, table_counts),
+                "write_behind": write_behind,
+                "connection_lanes": lanes,
+                "recommendations": _get_db_recommendations(size_info, table_counts, write_behind),
                 "timestamp": iso_now(),
             }
         )
 
-    def _get_db_recommendations(size_info: dict, table_counts: dict) -> list:
+    def _get_db_recommendations(size_info: dict, table_counts: dict, write_behind: dict | None = None) -> list:
         """Generate recommendations based on database metrics."""
         recommendations = []
 
@@ -300,6 +313,15 @@ def register_system_routes(health_api: Blueprint):
                 }
             )
 
+        if (write_behind or {}).get("rejected", 0) > 0:
+            recommendations.append(
+                {
+                    "severity": "warning",
+                    "message": f"Write-behind queue overflowed {write_behind['rejected']} times (rows written inline)",
+                    "action": "Increase SYSGROW_DB_WRITE_QUEUE_SIZE or reduce ingest rate",
+                }
+            )
+
         if not recommendations:
             recommendations.append(
                 {"severity": "info", "message": "Database health is good", "action": "No action needed"}
@@ -39,7 +39,9 @@ def ml_health() -> Response:
             "model_registry": true,
             "drift_detector": true,
             "retraining_service": true
-        }
+        },
+        "model_cache": {"entries": 3, "resident_bytes": 1048576, "hits": 42, ...},
+        "inference": {"disease_classifier": {"batches": 12, "avg_batch_rows": 4.5, "avg_latency_ms": 1.8, ...}}
     }
     """
     container = _container()
@@ -51,8 +53,14 @@ def ml_health() -> Response:
     }
 
     healthy = all(components.values())
-
-    return _success({"healthy": healthy, "components": components})
+    payload = {"healthy": healthy, "components": components}
+    if container.model_registry is not None:
+        payload["model_cache"] = container.model_registry.get_cache_stats()
+    inference_service = getattr(container, "inference_service", None)
+    if inference_service is not None:
+        payload["inference"] = inference_service.get_stats()
+
+    return _success(payload)
 
 
 @base_bp.get("/training/history")
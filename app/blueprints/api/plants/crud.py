@@ -21,7 +21,6 @@ from app.blueprints.api._common import (
 from app.enums.growth import PlantStage
 from app.schemas import AddPlantToCrudRequest, ModifyPlantCrudRequest
 from app.utils.http import safe_route
-from app.utils.plant_json_handler import PlantJsonHandler
 
 from . import plants_api
 
@@ -260,7 +259,7 @@ def get_plant_catalog() -> Response:
     Returns catalog data suitable for dropdown selection and auto-fill.
     """
     logger.info("Loading plant catalog")
-    handler = PlantJsonHandler()
+    handler = _plant_service().plant_json_handler
     plants = handler.get_plants_info()
 
     # Transform for frontend use
@@ -342,7 +341,7 @@ def add_custom_plant_to_catalog() -> Response:
     if missing:
         return _fail(f"Missing required fields: {', '.join(missing)}", 400)
 
-    handler = PlantJsonHandler()
+    handler = _plant_service().plant_json_handler
 
     # Check if plant already exists
     if handler.plant_exists(data["common_name"]):
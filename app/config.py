@@ -68,10 +68,30 @@ class AppConfig:
     db_cache_size_kb: int = field(default_factory=lambda: _env_int("SYSGROW_DB_CACHE_SIZE_KB", 8_000))
     db_mmap_size_bytes: int = field(default_factory=lambda: _env_int("SYSGROW_DB_MMAP_SIZE_BYTES", 33_554_432))
 
+    # Write-behind group commit for ingest rows (readings, actuator/connectivity history, drift metrics).
+    # A batch is committed when it reaches the size limit or the flush interval elapses.
+    db_write_batch_size: int = field(default_factory=lambda: _env_int("SYSGROW_DB_WRITE_BATCH_SIZE", 250))
+    db_write_flush_ms: int = field(default_factory=lambda: _env_int("SYSGROW_DB_WRITE_FLUSH_MS", 500))
+    db_write_queue_size: int = field(default_factory=lambda: _env_int("SYSGROW_DB_WRITE_QUEUE_SIZE", 10_000))
+    # Pooled query_only connections for analytics reads; writers wait up to busy_timeout for a lock.
+    db_read_pool_size: int = field(default_factory=lambda: _env_int("SYSGROW_DB_READ_POOL_SIZE", 4))
+    db_busy_timeout_ms: int = field(default_factory=lambda: _env_int("SYSGROW_DB_BUSY_TIMEOUT_MS", 5_000))
+
     enable_mqtt: bool = field(default_factory=lambda: _env_bool("SYSGROW_ENABLE_MQTT", True))
     mqtt_broker_host: str = field(default_factory=lambda: os.getenv("SYSGROW_MQTT_HOST", "localhost"))
     mqtt_broker_port: int = field(default_factory=lambda: _env_int("SYSGROW_MQTT_PORT", 1883))
+    # MQTT ingest stage: the network thread only enqueues; a worker drains in micro-batches.
+    # 0 disables the stage and processes messages on the MQTT thread.
+    mqtt_ingest_queue_size: int = field(default_factory=lambda: _env_int("SYSGROW_MQTT_INGEST_QUEUE_SIZE", 2048))
+    mqtt_ingest_batch_size: int = field(default_factory=lambda: _env_int("SYSGROW_MQTT_INGEST_BATCH_SIZE", 64))
+    mqtt_ingest_flush_ms: int = field(default_factory=lambda: _env_int("SYSGROW_MQTT_INGEST_FLUSH_MS", 50))
+    # Local hardware sensors on independent buses (I2C bus, SPI bus, ADC chip, GPIO pin) are read in parallel.
+    sensor_poll_workers: int = field(default_factory=lambda: _env_int("SYSGROW_SENSOR_POLL_WORKERS", 2))
     socketio_cors_origins: str = field(default_factory=lambda: os.getenv("SYSGROW_SOCKETIO_CORS", "*"))
+    # /dashboard sends deltas between full snapshots; a keyframe goes out at least this often.
+    dashboard_keyframe_seconds: int = field(default_factory=lambda: _env_int("SYSGROW_DASHBOARD_KEYFRAME_SEC", 30))
+    # Sensor events are coalesced per room and flushed at this rate (0 = emit immediately).
+    socketio_emit_rate_hz: int = field(default_factory=lambda: _env_int("SYSGROW_SOCKETIO_EMIT_HZ", 4))
 
     cache_enabled: bool = field(default_factory=lambda: _env_bool("SYSGROW_CACHE_ENABLED", True))
     cache_ttl_seconds: int = field(default_factory=lambda: _env_int("SYSGROW_CACHE_TTL", 30))
@@ -81,6 +101,11 @@ class AppConfig:
     )
     sensor_retention_days: int = field(default_factory=lambda: _env_int("SYSGROW_SENSOR_RETENTION_DAYS", 30))
     models_path: str = field(default_factory=lambda: os.getenv("SYSGROW_MODELS_PATH", "models"))
+    model_cache_max_mb: int = field(default_factory=lambda: _env_int("SYSGROW_MODEL_CACHE_MAX_MB", 256))
+    ml_inference_max_wait_ms: int = field(default_factory=lambda: _env_int("SYSGROW_ML_INFERENCE_MAX_WAIT_MS", 20))
+    anomaly_state_path: str = field(
+        default_factory=lambda: os.getenv("SYSGROW_ANOMALY_STATE_PATH", "var/anomaly_windows.json")
+    )
 
     # Session Configuration
     session_lifetime_default_minutes: int = field(
@@ -108,6 +133,9 @@ class AppConfig:
 
     eventbus_queue_size: int = field(default_factory=lambda: _env_int("SYSGROW_EVENTBUS_QUEUE_SIZE", 1024))
     eventbus_worker_count: int = field(default_factory=lambda: _env_int("SYSGROW_EVENTBUS_WORKER_COUNT", 2))
+    eventbus_partition_queue_size: int = field(
+        default_factory=lambda: _env_int("SYSGROW_EVENTBUS_PARTITION_QUEUE_SIZE", 256)
+    )
 
     DEBUG: bool = field(default_factory=lambda: _env_bool("SYSGROW_DEBUG", False))
     audit_log_path: str = field(default_factory=lambda: os.getenv("SYSGROW_AUDIT_LOG_PATH", "logs/audit.log"))
@@ -151,6 +151,7 @@ class DataLimits:
     # Sensor analytics
     SENSOR_HISTORY_FETCH = 200
     SENSOR_READINGS_MAX = 1000
+    SENSOR_EXPORT_PAGE = 500  # Readings per keyset page of a streaming export
 
     # Alerts & notifications
     ALERTS_FETCH = 100
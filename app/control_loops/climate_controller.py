@@ -21,7 +21,7 @@ from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from app.control_loops.throttle_config import DEFAULT_THROTTLE_CONFIG, ThrottleConfig
-from app.enums.events import PlantEvent, RuntimeEvent, SensorEvent
+from app.enums.events import EventDelivery, PlantEvent, RuntimeEvent, SensorEvent
 from app.utils.event_bus import EventBus
 from app.utils.time import iso_now, utc_now
 
@@ -205,16 +205,23 @@ class ClimateController:
             return False
 
     def _subscribe_to_events(self):
-        """Subscribe to sensor update events."""
-        self.event_bus.subscribe(SensorEvent.TEMPERATURE_UPDATE, self.on_temperature_update)
-        self.event_bus.subscribe(SensorEvent.HUMIDITY_UPDATE, self.on_humidity_update)
-        self.event_bus.subscribe(SensorEvent.CO2_UPDATE, self.on_co2_update)
-        self.event_bus.subscribe(SensorEvent.VOC_UPDATE, self.on_voc_update)
-        self.event_bus.subscribe(SensorEvent.LIGHT_UPDATE, self.on_light_update)
-        self.event_bus.subscribe(SensorEvent.PRESSURE_UPDATE, self.on_pressure_update)
-        self.event_bus.subscribe(SensorEvent.AIR_QUALITY_UPDATE, self.on_air_quality_update)
-        self.event_bus.subscribe(RuntimeEvent.THRESHOLDS_UPDATE, self.on_thresholds_update)
-        logger.info("Subscribed to sensor update events")
+        """Subscribe to sensor update events for this unit's partition only."""
+        unit = int(self.unit_id)
+        # LATEST: a burst of readings from one sensor collapses to the newest,
+        # delivered in order, so ControlLogic never acts on a stale value.
+        sensor_handlers = (
+            (SensorEvent.TEMPERATURE_UPDATE, self.on_temperature_update),
+            (SensorEvent.HUMIDITY_UPDATE, self.on_humidity_update),
+            (SensorEvent.CO2_UPDATE, self.on_co2_update),
+            (SensorEvent.VOC_UPDATE, self.on_voc_update),
+            (SensorEvent.LIGHT_UPDATE, self.on_light_update),
+            (SensorEvent.PRESSURE_UPDATE, self.on_pressure_update),
+            (SensorEvent.AIR_QUALITY_UPDATE, self.on_air_quality_update),
+        )
+        for topic, handler in sensor_handlers:
+            self.event_bus.subscribe(topic, handler, partition_key=unit, delivery=EventDelivery.LATEST)
+        self.event_bus.subscribe(RuntimeEvent.THRESHOLDS_UPDATE, self.on_thresholds_update, partition_key=unit)
+        logger.info("Subscribed to sensor update events (partition unit=%s)", unit)
 
     @track_performance("on_thresholds_update")
     def on_thresholds_update(self, data: dict[str, Any]) -> None:
@@ -468,7 +475,7 @@ class ClimateController:
             now = utc_now()
             logger.info("Storing analytics data (metrics=%s): %s", list(savable_metrics.keys()), savable_metrics)
             # THE LEDGER: Write raw sensor reading (Throttled Hardware Audit)
-            self.analytics_repo.insert_sensor_reading(
+            self.analytics_repo.enqueue_sensor_reading(
                 sensor_id=sensor_id, reading_data=savable_metrics, timestamp=iso_now()
             )
             for metric in savable_metrics:
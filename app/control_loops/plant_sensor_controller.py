@@ -30,7 +30,7 @@ from typing import Any, Callable
 from app.control_loops.throttle_config import ThrottleConfig
 from app.control_loops.throttled_analytics_writer import ThrottledAnalyticsWriter
 from app.enums import IrrigationEligibilityDecision, IrrigationSkipReason, NotificationSeverity
-from app.enums.events import NotificationEvent, SensorEvent
+from app.enums.events import EventDelivery, NotificationEvent, SensorEvent
 from app.utils.event_bus import EventBus
 from app.utils.psychrometrics import calculate_vpd_kpa
 from app.utils.time import iso_now
@@ -90,10 +90,20 @@ class PlantSensorController(ThrottledAnalyticsWriter):
     def _subscribe_to_events(self) -> None:
         """Subscribe to plant sensor events."""
         self._unsubscribe_from_events()
+        unit = int(self.unit_id)
         self._unsubscribe_callbacks = [
-            self.event_bus.subscribe(SensorEvent.SOIL_MOISTURE_UPDATE, self.on_soil_moisture_update),
-            self.event_bus.subscribe(SensorEvent.PH_UPDATE, self.on_ph_update),
-            self.event_bus.subscribe(SensorEvent.EC_UPDATE, self.on_ec_update),
+            self.event_bus.subscribe(
+                SensorEvent.SOIL_MOISTURE_UPDATE,
+                self.on_soil_moisture_update,
+                partition_key=unit,
+                delivery=EventDelivery.LATEST,
+            ),
+            self.event_bus.subscribe(
+                SensorEvent.PH_UPDATE, self.on_ph_update, partition_key=unit, delivery=EventDelivery.LATEST
+            ),
+            self.event_bus.subscribe(
+                SensorEvent.EC_UPDATE, self.on_ec_update, partition_key=unit, delivery=EventDelivery.LATEST
+            ),
         ]
         logger.debug("PlantSensorController subscribed to events for unit %s", self.unit_id)
 
@@ -41,6 +41,7 @@ from app.enums.device import (
 )
 from app.enums.events import (
     DeviceEvent,
+    EventDelivery,
     EventType,
     IrrigationEligibilityDecision,
     IrrigationSkipReason,
@@ -75,6 +76,7 @@ __all__ = [
     "DeviceType",
     "DiseaseType",
     "DriftRecommendation",
+    "EventDelivery",
     "EventType",
     "GrowthPhase",
     "HealthLevel",
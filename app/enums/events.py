@@ -11,6 +11,7 @@ class WebSocketEvent(str, Enum):
 
     # Dashboard namespace events
     DASHBOARD_SNAPSHOT = "dashboard_snapshot"
+    DASHBOARD_DELTA = "dashboard_delta"
 
     # Actuator events
     ACTUATOR_STATE_UPDATE = "actuator_state_update"
@@ -143,4 +144,12 @@ class ActivityEvent(str, Enum):
     USER_LOGOUT = "activity.user_logout"
 
 
+class EventDelivery(str, Enum):
+    """How the EventBus delivers a topic to one subscriber."""
+
+    FIFO = "fifo"  # Shared worker pool; no ordering guarantee across workers
+    ORDERED = "ordered"  # Serialized per payload key (unit/sensor), in publish order
+    LATEST = "latest"  # Ordered, and pending events for the same key collapse to the newest
+
+
 EventType: TypeAlias = SensorEvent | PlantEvent | DeviceEvent | RuntimeEvent | ActivityEvent | WebSocketEvent
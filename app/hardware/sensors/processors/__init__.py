@@ -20,7 +20,7 @@ Utilities:
 - utils module: Shared helper functions and constants
 """
 
-from .base_processor import IDataProcessor, PreparedPayloads, ProcessorError, SensorResolver
+from .base_processor import IDataProcessor, PreparedPayloads, ProcessedReading, ProcessorError, SensorResolver
 from .calibration_processor import CalibrationProcessor
 from .composite_processor import CompositeProcessor
 from .enrichment_processor import EnrichmentProcessor
@@ -55,6 +55,7 @@ __all__ = [
     "PreparedPayloads",
     # Priority & Pipeline
     "PriorityProcessor",
+    "ProcessedReading",
     "ProcessorError",
     "SensorResolver",
     "TransformationProcessor",
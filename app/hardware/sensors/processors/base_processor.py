@@ -14,7 +14,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 if TYPE_CHECKING:
     from app.domain.sensors import CalibrationData, SensorEntity, SensorReading
@@ -45,6 +45,26 @@ class PreparedPayloads:
     controller_events: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
 
 
+@dataclass
+class ProcessedReading:
+    """
+    Outcome of one reading in ``CompositeProcessor.process_batch()``.
+
+    Attributes:
+        sensor: The SensorEntity the raw data belonged to
+        raw_data: The raw payload as received
+        reading: The processed SensorReading (None if a stage failed)
+        prepared: Payloads to publish/emit (None if failed or dropped)
+        error: The ProcessorError raised by a stage, if any
+    """
+
+    sensor: "SensorEntity"
+    raw_data: dict[str, Any]
+    reading: "SensorReading" | None = None
+    prepared: PreparedPayloads | None = None
+    error: ProcessorError | None = None
+
+
 # Type alias for sensor resolver function
 SensorResolver = Callable[[int], Any | None]
 
@@ -168,3 +188,27 @@ class IDataProcessor(ABC):
             NotImplementedError: If not implemented by subclass
         """
         raise NotImplementedError()
+
+    def process_batch(self, items: Iterable[tuple["SensorEntity", dict[str, Any]]]) -> list[ProcessedReading]:
+        """
+        Run process() + build_payloads() over a burst of readings.
+
+        The default handles one reading at a time; CompositeProcessor
+        overrides it to build one dashboard snapshot per unit.
+
+        Args:
+            items: (sensor, raw_data) pairs in arrival order
+
+        Returns:
+            One ProcessedReading per input item, in the same order.
+        """
+        results: list[ProcessedReading] = []
+        for sensor, raw_data in items:
+            item = ProcessedReading(sensor=sensor, raw_data=raw_data)
+            results.append(item)
+            try:
+                item.reading = self.process(sensor, raw_data)
+                item.prepared = self.build_payloads(sensor=sensor, reading=item.reading)
+            except ProcessorError as exc:
+                item.error = exc
+        return results
@@ -5,6 +5,10 @@ Chains multiple processors into a single pipeline.
 
 Implements both stage methods and pipeline methods (process, build_payloads)
 so it can be used directly by mqtt_sensor_service.
+
+``process_batch`` runs a burst of readings (e.g. one Zigbee2MQTT/ESP32 flush)
+through the same stages but builds one dashboard snapshot per unit instead of
+one per reading.
 """
 
 from __future__ import annotations
@@ -14,7 +18,7 @@ from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from app.enums.events import SensorEvent
 
-from .base_processor import IDataProcessor, PreparedPayloads, ProcessorError
+from .base_processor import IDataProcessor, PreparedPayloads, ProcessedReading, ProcessorError
 from .utils import (
     UNIT_MAP,
     coerce_int,
@@ -154,6 +158,57 @@ class CompositeProcessor(IDataProcessor):
         Raises:
             ProcessorError: If any processing stage fails
         """
+        return self._run_stages(sensor, raw_data, set(self._meta_keys))
+
+    def process_batch(self, items: Iterable[tuple["SensorEntity", dict[str, Any]]]) -> list[ProcessedReading]:
+        """
+        Run the full pipeline over a burst of readings.
+
+        Each reading gets the same stages, device payload and controller events
+        as ``process()`` + ``build_payloads()``. The priority processor is
+        updated per reading, but the dashboard snapshot is built once per unit
+        after the whole batch and attached to that unit's last prepared payload.
+
+        Args:
+            items: (sensor, raw_data) pairs in arrival order
+
+        Returns:
+            One ProcessedReading per input item, in the same order. Stage
+            failures are reported in ``error`` instead of being raised.
+        """
+        results: list[ProcessedReading] = []
+        last_by_unit: dict[int, PreparedPayloads] = {}
+        meta_keys = set(self._meta_keys)
+
+        for sensor, raw_data in items:
+            item = ProcessedReading(sensor=sensor, raw_data=raw_data)
+            results.append(item)
+            try:
+                item.reading = self._run_stages(sensor, raw_data, meta_keys)
+                item.prepared = self._prepare_payloads(sensor=sensor, reading=item.reading, build_snapshot=False)
+            except ProcessorError as exc:
+                item.error = exc
+                continue
+            except Exception as exc:
+                logger.error("Batch payload build failed for sensor %s: %s", getattr(sensor, "id", "?"), exc)
+                item.error = ProcessorError(f"Payload build failed: {exc}")
+                continue
+            if item.prepared is not None:
+                last_by_unit[item.prepared.unit_id] = item.prepared
+
+        if self._priority is not None:
+            for unit_id, prepared in last_by_unit.items():
+                try:
+                    prepared.dashboard_payload = self._priority.refresh_snapshot(
+                        unit_id, resolve_sensor=self._resolve_sensor
+                    )
+                except Exception as e:
+                    logger.warning("Priority processor failed: %s", e)
+
+        return results
+
+    def _run_stages(self, sensor: "SensorEntity", raw_data: dict[str, Any], meta_keys: set[str]) -> "SensorReading":
+        """validate -> calibrate -> transform -> enrich for one reading."""
         if sensor is None:
             raise ProcessorError("sensor is required")
         if not isinstance(raw_data, dict):
@@ -162,7 +217,7 @@ class CompositeProcessor(IDataProcessor):
         try:
             # 0) Pre-process: Standardize field names & Flatten nested data
             # Delegated to TransformationProcessor to keep standardization logic centralized.
-            sanitized = self.transformer.standardize_fields(raw_data, meta_keys=set(self._meta_keys))
+            sanitized = self.transformer.standardize_fields(raw_data, meta_keys=meta_keys)
 
             # 1) Validate
             validated = self.validate(sanitized)
@@ -198,6 +253,12 @@ class CompositeProcessor(IDataProcessor):
             PreparedPayloads with device and optional dashboard payloads,
             or None if unit_id is invalid (payload should be dropped).
         """
+        return self._prepare_payloads(sensor=sensor, reading=reading, build_snapshot=True)
+
+    def _prepare_payloads(
+        self, *, sensor: "SensorEntity", reading: "SensorReading", build_snapshot: bool
+    ) -> PreparedPayloads | None:
+        """Build payloads; with ``build_snapshot=False`` the priority state is updated but no snapshot is built."""
         from app.schemas.events import DashboardSnapshotPayload
 
         # Strict unit_id validation
@@ -238,11 +299,14 @@ class CompositeProcessor(IDataProcessor):
         dashboard_payload: DashboardSnapshotPayload | None = None
         if self._priority is not None:
             try:
-                dashboard_payload = self._priority.ingest(
-                    sensor=sensor,
-                    reading=reading,
-                    resolve_sensor=self._resolve_sensor,
-                )
+                if build_snapshot:
+                    dashboard_payload = self._priority.ingest(
+                        sensor=sensor,
+                        reading=reading,
+                        resolve_sensor=self._resolve_sensor,
+                    )
+                else:
+                    self._priority.observe(sensor=sensor, reading=reading, resolve_sensor=self._resolve_sensor)
             except Exception as e:
                 logger.warning("Priority processor failed: %s", e)
 
@@ -10,6 +10,7 @@ Responsible for:
 - Handling stale sensor detection
 - Supporting manual priority overrides
 - Building DashboardSnapshotPayload with best available readings
+- Refreshing snapshots incrementally (only metrics touched by new readings)
 
 Design:
 - Does NOT own SensorManager; uses injected resolver
@@ -112,6 +113,13 @@ class PriorityProcessor:
     MIN_TRACKED_SENSORS = 10
     MAX_TRACKED_SENSORS = 10000
 
+    # Incremental snapshots are rebuilt from scratch at least this often so
+    # primaries that went stale without a new reading drop out of the snapshot.
+    FULL_REBUILD_SECONDS = 10
+
+    # Metrics computed from temperature/humidity when no sensor reports them
+    DERIVED_METRICS = frozenset({"vpd", "dew_point", "heat_index"})
+
     def __init__(self, *, stale_seconds: int = 180, max_tracked_sensors: int = 500):
         """
         Initialize the priority processor.
@@ -163,9 +171,19 @@ class PriorityProcessor:
         self._snapshot_cache: dict[int, tuple[DashboardSnapshotPayload, datetime]] = {}
         self._snapshot_cache_ttl_seconds: float = self.MIN_STALE_SECONDS  # Cache TTL for REST endpoints
 
+        # Incremental snapshot state: last computed metrics per unit, the
+        # metrics touched by readings since then, and when the unit was last
+        # fully rebuilt.
+        self._unit_metrics: dict[int, dict[str, Any]] = {}
+        self._dirty_metrics: dict[int, set[str]] = {}
+        self._last_full_build: dict[int, datetime] = {}
+
         # Observability counters
         self._stats = {
             "ingest_count": 0,
+            "snapshots_built": 0,
+            "full_rebuilds": 0,
+            "metrics_recomputed": 0,
             "primary_changes": 0,
             "evictions": 0,
             "cache_hits": 0,
@@ -208,6 +226,7 @@ class PriorityProcessor:
             keys_to_remove = [k for k in list(self.primary_sensors.keys()) if k[1] == metric]
             for key in keys_to_remove:
                 self.primary_sensors.pop(key, None)
+        self._reset_incremental_state()
 
     def clear_manual_priority(self, sensor_id: int) -> None:
         """Remove manual priority override for a sensor."""
@@ -228,14 +247,28 @@ class PriorityProcessor:
         Returns:
             DashboardSnapshotPayload for the unit, or None if no metrics available
         """
+        unit_id = self.observe(sensor=sensor, reading=reading, resolve_sensor=resolve_sensor)
+        if unit_id is None:
+            return None
+        return self.refresh_snapshot(unit_id, resolve_sensor=resolve_sensor)
+
+    def observe(self, *, sensor: Any, reading: Any, resolve_sensor: SensorResolver | None = None) -> int | None:
+        """
+        Update selection state for one reading without building a snapshot.
+
+        Batch callers observe every reading first and then call
+        ``refresh_snapshot()`` once per unit.
+
+        Returns:
+            The reading's unit_id, or None if the reading was ignored.
+        """
         unit_id = int(getattr(reading, "unit_id", 0) or 0)
         sensor_id = int(getattr(sensor, "id", 0) or 0)
 
         if unit_id <= 0 or sensor_id <= 0:
             return None
 
-        now = utc_now()
-        self.last_seen[sensor_id] = now
+        self.last_seen[sensor_id] = utc_now()
         self.last_readings[sensor_id] = reading
 
         # Maintain per-unit sensor index for efficient lookups
@@ -248,21 +281,40 @@ class PriorityProcessor:
             self._evict_stale_entries()
 
         logger.debug(
-            "PriorityProcessor.ingest: unit_id=%s sensor_id=%s metrics=%s",
+            "PriorityProcessor.observe: unit_id=%s sensor_id=%s metrics=%s",
             unit_id,
             sensor_id,
             list((getattr(reading, "data", {}) or {}).keys()),
         )
         self._consider_primary(sensor=sensor, reading=reading, resolve_sensor=resolve_sensor)
-        snapshot = self._build_snapshot(unit_id=unit_id, resolve_sensor=resolve_sensor)
-
-        # Update cache and stats
+        data = getattr(reading, "data", None) or {}
+        self._ensure_primaries(unit_id, data, resolve_sensor)
+        self._dirty_metrics.setdefault(unit_id, set()).update(DASHBOARD_METRICS.intersection(data))
         self._stats["ingest_count"] += 1
+        return unit_id
+
+    def refresh_snapshot(
+        self, unit_id: int, *, resolve_sensor: SensorResolver | None = None
+    ) -> DashboardSnapshotPayload | None:
+        """Refresh the unit's snapshot from current state and update the REST cache.
+
+        Only the metrics touched by readings observed since the last refresh
+        are recomputed; the rest are reused. A full rebuild happens when the
+        unit has no previous state or every ``FULL_REBUILD_SECONDS``.
+        """
+        dirty = self._dirty_metrics.pop(unit_id, set())
+        cached = self._unit_metrics.get(unit_id)
+        last_full = self._last_full_build.get(unit_id)
+        if cached is None or last_full is None or (utc_now() - last_full).total_seconds() >= self.FULL_REBUILD_SECONDS:
+            snapshot = self._build_snapshot(unit_id=unit_id, resolve_sensor=resolve_sensor)
+        else:
+            snapshot = self._update_snapshot(unit_id, cached, dirty, resolve_sensor)
+        self._stats["snapshots_built"] += 1
         if snapshot:
-            self._snapshot_cache[unit_id] = (snapshot, now)
+            self._snapshot_cache[unit_id] = (snapshot, utc_now())
 
         logger.debug(
-            "PriorityProcessor.ingest -> snapshot metrics=%s", list(snapshot.metrics.keys()) if snapshot else None
+            "PriorityProcessor.refresh_snapshot -> metrics=%s", list(snapshot.metrics.keys()) if snapshot else None
         )
         return snapshot
 
@@ -337,8 +389,9 @@ class PriorityProcessor:
         """Get observability statistics for monitoring.
 
         Returns:
-            Dict with counters for ingest_count, primary_changes, evictions,
-            cache_hits, cache_misses, and current tracking sizes.
+            Dict with counters for ingest_count, snapshots_built, full_rebuilds,
+            metrics_recomputed, primary_changes, evictions, cache_hits,
+            cache_misses, and current tracking sizes.
         """
         return {
             **self._stats,
@@ -352,6 +405,7 @@ class PriorityProcessor:
     def clear_cache(self) -> None:
         """Clear the snapshot cache. Useful after manual priority changes."""
         self._snapshot_cache.clear()
+        self._reset_incremental_state()
 
     # -------------------------------------------------------------------------
     # Trend Computation
@@ -405,6 +459,12 @@ class PriorityProcessor:
     # Internal Methods
     # -------------------------------------------------------------------------
 
+    def _reset_incremental_state(self) -> None:
+        """Force the next refresh of every unit to be a full rebuild."""
+        self._unit_metrics.clear()
+        self._dirty_metrics.clear()
+        self._last_full_build.clear()
+
     def _is_stale(self, sensor_id: int) -> bool:
         """Check if a sensor is stale (no recent readings)."""
         last = self.last_seen.get(sensor_id)
@@ -466,6 +526,8 @@ class PriorityProcessor:
         affected_units = {uid for uid, _ in keys_to_remove}
         for uid in affected_units:
             self._snapshot_cache.pop(uid, None)
+        if stale_ids:
+            self._reset_incremental_state()
 
         if stale_ids:
             self._stats["evictions"] += len(stale_ids)
@@ -648,6 +710,29 @@ class PriorityProcessor:
                     new_pr,
                 )
 
+    def _ensure_primaries(self, unit_id: int, data: dict[str, Any], resolve_sensor: SensorResolver | None) -> None:
+        """Pick the primaries a snapshot build would pick for metrics that have none yet.
+
+        Controller-event gating reads ``primary_sensors``, so it must not depend
+        on whether a snapshot was built after this reading (batch ingest).
+        """
+        for metric in DASHBOARD_METRICS.intersection(data):
+            if metric == "soil_moisture" or (unit_id, metric) in self.primary_sensors:
+                continue
+            if metric == "lux":
+                self._fallback_lux_sensor(unit_id)
+            else:
+                self._select_best_sensor(unit_id=unit_id, metric=metric, resolve_sensor=resolve_sensor)
+
+    def _fallback_lux_sensor(self, unit_id: int) -> int | None:
+        """Adopt any sensor in the unit that reports lux as the lux primary."""
+        for candidate_sid in self._unit_sensors.get(unit_id, set()):
+            data = getattr(self.last_readings.get(candidate_sid), "data", None) or {}
+            if "lux" in data:
+                self.primary_sensors[(unit_id, "lux")] = candidate_sid
+                return candidate_sid
+        return None
+
     def _build_snapshot(
         self, *, unit_id: int, resolve_sensor: SensorResolver | None = None
     ) -> DashboardSnapshotPayload | None:
@@ -655,16 +740,53 @@ class PriorityProcessor:
         metrics: dict[str, Any] = {}
 
         for metric in sorted(DASHBOARD_METRICS):
-            if metric == "soil_moisture":
-                self._add_soil_moisture_aggregate(unit_id, metrics)
-            elif metric == "lux":
-                self._add_lux_metric(unit_id, metrics, resolve_sensor)
-            else:
-                self._add_standard_metric(unit_id, metric, metrics, resolve_sensor)
+            self._add_metric(unit_id, metric, metrics, resolve_sensor)
 
         # Compute derived metrics (VPD, etc.) from best T/H
         self._fill_derived_metrics(unit_id, metrics)
 
+        self._unit_metrics[unit_id] = metrics
+        self._dirty_metrics.pop(unit_id, None)
+        self._last_full_build[unit_id] = utc_now()
+        self._stats["full_rebuilds"] += 1
+        self._stats["metrics_recomputed"] += len(DASHBOARD_METRICS)
+        return self._snapshot_payload(unit_id, metrics)
+
+    def _update_snapshot(
+        self,
+        unit_id: int,
+        cached: dict[str, Any],
+        dirty: set[str],
+        resolve_sensor: SensorResolver | None,
+    ) -> DashboardSnapshotPayload | None:
+        """Recompute only the dirty metrics on top of the unit's previous metrics."""
+        if dirty & {"temperature", "humidity"}:
+            dirty = dirty | self.DERIVED_METRICS
+
+        metrics = dict(cached)
+        for metric in sorted(dirty):
+            metrics.pop(metric, None)
+            self._add_metric(unit_id, metric, metrics, resolve_sensor)
+
+        if dirty & self.DERIVED_METRICS:
+            self._fill_derived_metrics(unit_id, metrics)
+
+        self._unit_metrics[unit_id] = metrics
+        self._stats["metrics_recomputed"] += len(dirty)
+        return self._snapshot_payload(unit_id, metrics)
+
+    def _add_metric(
+        self, unit_id: int, metric: str, metrics: dict[str, Any], resolve_sensor: SensorResolver | None
+    ) -> None:
+        """Compute one dashboard metric into ``metrics`` (no-op if unavailable)."""
+        if metric == "soil_moisture":
+            self._add_soil_moisture_aggregate(unit_id, metrics)
+        elif metric == "lux":
+            self._add_lux_metric(unit_id, metrics, resolve_sensor)
+        else:
+            self._add_standard_metric(unit_id, metric, metrics, resolve_sensor)
+
+    def _snapshot_payload(self, unit_id: int, metrics: dict[str, Any]) -> DashboardSnapshotPayload | None:
         if not metrics:
             return None
 
@@ -743,13 +865,7 @@ class PriorityProcessor:
 
         # Fallback to finding any lux sensor if primary not set
         if not sid:
-            unit_sensor_ids = self._unit_sensors.get(unit_id, set())
-            for candidate_sid in unit_sensor_ids:
-                data = getattr(self.last_readings.get(candidate_sid), "data", None) or {}
-                if "lux" in data:
-                    sid = candidate_sid
-                    self.primary_sensors[(unit_id, "lux")] = sid
-                    break
+            sid = self._fallback_lux_sensor(unit_id)
 
         if not sid:
             return
@@ -92,6 +92,21 @@ class DashboardSnapshotPayload(BaseModel):
     timestamp: str
     # Metrics keyed by reading_type (e.g., "temperature", "humidity", "soil_moisture")
     metrics: dict[str, DashboardMetric] = Field(description="Primary metrics for this unit, keyed by reading type")
+    # Set when the snapshot is sent as a Socket.IO keyframe
+    seq: int | None = Field(None, description="Frame sequence number for delta resync")
+
+
+class DashboardDeltaPayload(BaseModel):
+    """Payload for dashboard delta events (changes since the previous frame)."""
+
+    schema_version: int = Field(default=1)
+    unit_id: int
+    seq: int = Field(description="Frame sequence number; a gap means a frame was missed")
+    timestamp: str
+    metrics: dict[str, DashboardMetric] = Field(
+        default_factory=dict, description="Metrics that changed since the previous frame"
+    )
+    removed: list[str] = Field(default_factory=list, description="Metrics no longer present in the snapshot")
 
 
 class UnregisteredSensorPayload(BaseModel):
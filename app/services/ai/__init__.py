@@ -11,6 +11,7 @@ Services:
 - MLTrainer: Model training and retraining orchestration
 - ModelDriftDetector: Model performance monitoring
 - ABTesting: A/B testing for model deployment
+- BatchedInferenceService: Micro-batched model predictions shared by predictors
 
 All public symbols are importable via ``from app.services.ai import X``.
 Imports are **lazy** — each submodule is loaded only when one of its
@@ -65,6 +66,8 @@ _LAZY_IMPORTS: dict[str, str] = {
     "FeatureSet": "app.services.ai.feature_engineering",
     "PLANT_HEALTH_FEATURES_V1": "app.services.ai.feature_engineering",
     "PlantHealthFeatureExtractor": "app.services.ai.feature_engineering",
+    # inference_service
+    "BatchedInferenceService": "app.services.ai.inference_service",
     # irrigation_predictor
     "DurationPrediction": "app.services.ai.irrigation_predictor",
     "IrrigationPrediction": "app.services.ai.irrigation_predictor",
@@ -27,6 +27,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from app.services.ai.inference_service import BatchedInferenceService
+
 if TYPE_CHECKING:
     from app.domain.unit_runtime import UnitDimensions
     from app.services.ai.model_registry import ModelRegistry
@@ -158,10 +160,12 @@ class ClimateOptimizer:
         personalized_learning: "PersonalizedLearningService" | None = None,
         # Legacy: analytics_repo kept for backward compat but no longer used
         analytics_repo: Any | None = None,
+        inference_service: BatchedInferenceService | None = None,
     ):
         self.threshold_service = threshold_service
         self.plant_handler = plant_handler
         self.model_registry = model_registry
+        self._inference = inference_service or BatchedInferenceService()
         self.sun_times_service = sun_times_service
         self.personalized_learning = personalized_learning
 
@@ -319,7 +323,7 @@ class ClimateOptimizer:
             if current_conditions:
                 features.update(current_conditions)
 
-            prediction = self._model.predict([list(features.values())])
+            prediction = self._inference.predict("climate_optimizer", self._model, [list(features.values())])
             if self._validate_prediction(prediction[0]):
                 return ClimateConditions(
                     temperature=float(prediction[0][0]),
@@ -14,6 +14,7 @@ from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from app.enums import DiseaseType, RiskLevel
+from app.services.ai.inference_service import BatchedInferenceService
 from app.utils.time import utc_now
 
 if TYPE_CHECKING:
@@ -72,6 +73,7 @@ class DiseasePredictor:
         repo_health: "AIHealthDataRepository",
         model_registry: "ModelRegistry" | None = None,
         personalized_learning: "PersonalizedLearningService" | None = None,
+        inference_service: BatchedInferenceService | None = None,
     ):
         """
         Initialize disease predictor.
@@ -80,9 +82,11 @@ class DiseasePredictor:
             repo_health: AI health data repository
             model_registry: Optional model registry for ML models
             personalized_learning: Optional personalized learning service for user-specific adjustments
+            inference_service: Shared batched inference service (one is created if omitted)
         """
         self.repo_health = repo_health
         self.model_registry = model_registry
+        self._inference = inference_service or BatchedInferenceService()
         self.personalized_learning = personalized_learning
         self.model_loaded = False
         self.ml_model = None
@@ -324,7 +328,7 @@ class DiseasePredictor:
             features_scaled = self.ml_scaler.transform(features)
 
             # Get prediction and probability
-            prediction = self.ml_model.predict(features_scaled)[0]
+            prediction = self._inference.predict("disease_classifier", self.ml_model, features_scaled)[0]
 
             # Only return if prediction is not "healthy"
             if prediction == "healthy":
@@ -332,7 +336,7 @@ class DiseasePredictor:
 
             # Get probability scores if available
             try:
-                probabilities = self.ml_model.predict_proba(features_scaled)[0]
+                probabilities = self._inference.predict_proba("disease_classifier", self.ml_model, features_scaled)[0]
                 classes = self.ml_model.classes_
                 prob_dict = dict(zip(classes, probabilities))
                 confidence = prob_dict.get(prediction, 0.5)
@@ -12,6 +12,7 @@ Provides:
 from __future__ import annotations
 
 import logging
+import threading
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,15 +20,17 @@ from typing import TYPE_CHECKING, Any
 
 from app.utils.time import iso_now
 
-# ML libraries lazy loaded in methods for faster startup
-# import numpy as np
-
 if TYPE_CHECKING:
     from app.services.ai.model_registry import ModelRegistry
     from infrastructure.database.repositories.ai import AITrainingDataRepository
 
 logger = logging.getLogger(__name__)
 
+# Running per-model counters: (with_actual, correct, wrong, with_confidence, confidence_sum).
+# Each history record carries the counters as they were before it, so the stats of
+# any trailing window are the current counters minus the window's first record.
+_EMPTY_TOTALS = (0, 0, 0, 0, 0.0)
+
 
 @dataclass
 class DriftMetrics:
@@ -95,6 +98,8 @@ class ModelDriftDetectorService:
         # Metrics history (in-memory cache)
         self.metrics_history: dict[str, deque] = {}
         self.max_history_size = 1000
+        self._totals: dict[str, tuple[int, int, int, int, float]] = {}
+        self._lock = threading.Lock()
 
     def track_prediction(
         self, model_name: str, prediction: Any, actual: Any | None = None, confidence: float | None = None
@@ -109,9 +114,6 @@ class ModelDriftDetectorService:
             confidence: Prediction confidence score
         """
         try:
-            if model_name not in self.metrics_history:
-                self.metrics_history[model_name] = deque(maxlen=self.max_history_size)
-
             # Calculate error if actual value is available
             error = None
             if actual is not None:
@@ -120,19 +122,34 @@ class ModelDriftDetectorService:
                 else:
                     error = 0 if prediction == actual else 1
 
-            record = {
-                "timestamp": datetime.now(),
-                "prediction": prediction,
-                "actual": actual,
-                "confidence": confidence,
-                "error": error,
-            }
-
-            self.metrics_history[model_name].append(record)
-
-            # Persist to database
+            with self._lock:
+                history = self.metrics_history.get(model_name)
+                if history is None:
+                    history = self.metrics_history[model_name] = deque(maxlen=self.max_history_size)
+                totals = self._totals.get(model_name, _EMPTY_TOTALS)
+                history.append(
+                    {
+                        "timestamp": datetime.now(),
+                        "prediction": prediction,
+                        "actual": actual,
+                        "confidence": confidence,
+                        "error": error,
+                        "totals_before": totals,
+                    }
+                )
+                with_actual, correct, wrong, with_confidence, confidence_sum = totals
+                if error is not None:
+                    with_actual += 1
+                    correct += error < 0.1
+                    wrong += error > 0.1
+                if confidence is not None:
+                    with_confidence += 1
+                    confidence_sum += confidence
+                self._totals[model_name] = (with_actual, correct, wrong, with_confidence, confidence_sum)
+
+            # Persist to database (group-committed by the write-behind lane)
             if self.ai_health_repo:
-                self.ai_health_repo.save_drift_metric(
+                self.ai_health_repo.enqueue_drift_metric(
                     model_name=model_name,
                     prediction=prediction,
                     actual=actual,
@@ -168,12 +185,15 @@ class ModelDriftDetectorService:
                     details={"message": "No prediction history available"},
                 )
 
-            # Get recent predictions
-            history = list(self.metrics_history[model_name])
-            if len(history) > window_size:
-                history = history[-window_size:]
+            # Window stats from the running counters (no rescan of the history)
+            with self._lock:
+                history = self.metrics_history[model_name]
+                count = min(len(history), window_size) if window_size > 0 else len(history)
+                if count:
+                    start = history[-count]["totals_before"]
+                    end = self._totals.get(model_name, _EMPTY_TOTALS)
 
-            if not history:
+            if not count:
                 return DriftMetrics(
                     model_name=model_name,
                     timestamp=datetime.now(),
@@ -186,30 +206,14 @@ class ModelDriftDetectorService:
                     details={"message": "No predictions in window"},
                 )
 
-            # Lazy load numpy for statistics
-            import numpy as np
+            with_actual, correct, wrong, with_confidence, confidence_sum = (b - a for a, b in zip(start, end))
 
-            # Calculate metrics
-            predictions_with_actual = [r for r in history if r["actual"] is not None]
-            predictions_with_confidence = [r for r in history if r["confidence"] is not None]
-
-            # Accuracy
-            accuracy = 1.0
-            if predictions_with_actual:
-                correct = sum(1 for r in predictions_with_actual if r["error"] is not None and r["error"] < 0.1)
-                accuracy = correct / len(predictions_with_actual)
+            # Accuracy and error rate over predictions with a known actual value
+            accuracy = correct / with_actual if with_actual else 1.0
+            error_rate = wrong / with_actual if with_actual else 0.0
 
             # Mean confidence
-            mean_confidence = 1.0
-            if predictions_with_confidence:
-                mean_confidence = np.mean([r["confidence"] for r in predictions_with_confidence])
-
-            # Error rate
-            error_rate = 0.0
-            if predictions_with_actual:
-                errors = [r["error"] for r in predictions_with_actual if r["error"] is not None]
-                if errors:
-                    error_rate = np.mean([1 if e > 0.1 else 0 for e in errors])
+            mean_confidence = confidence_sum / with_confidence if with_confidence else 1.0
 
             # Calculate drift score (weighted combination)
             accuracy_score = 1.0 - accuracy
@@ -240,7 +244,7 @@ class ModelDriftDetectorService:
                 timestamp=datetime.now(),
                 prediction_accuracy=accuracy,
                 mean_confidence=mean_confidence,
-                prediction_count=len(history),
+                prediction_count=count,
                 error_rate=error_rate,
                 drift_score=drift_score,
                 recommendation=recommendation,
@@ -327,8 +331,11 @@ class ModelDriftDetectorService:
         Args:
             model_name: Model name to clear (clears all if None)
         """
-        if model_name:
-            if model_name in self.metrics_history:
-                self.metrics_history[model_name].clear()
-        else:
-            self.metrics_history.clear()
+        with self._lock:
+            if model_name:
+                if model_name in self.metrics_history:
+                    self.metrics_history[model_name].clear()
+                self._totals.pop(model_name, None)
+            else:
+                self.metrics_history.clear()
+                self._totals.clear()
@@ -0,0 +1,205 @@
+"""
+Batched Inference Service
+=========================
+Shared micro-batching front end for model ``predict``/``predict_proba`` calls.
+
+Predictors hand over their single-row feature frames; concurrent requests for
+the same model are merged into one vectorized call and the results are fanned
+back out to each caller.
+
+Batching is group-commit style: the first caller for an idle model runs the
+batch itself, and requests that arrive meanwhile are collected for the next
+one. Once a model has seen concurrent requests, the caller leading a batch also
+waits up to ``max_wait_ms`` for more to join, so a sequential caller never pays
+the wait.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WAIT_MS = 20
+DEFAULT_MAX_BATCH_ROWS = 256
+
+
+@dataclass
+class _Request:
+    """One caller's rows and, once its batch has run, the matching results."""
+
+    rows: Any
+    size: int
+    result: Any = None
+    error: BaseException | None = None
+    done: bool = False
+
+
+@dataclass
+class _Lane:
+    """Pending requests for one (model, method) pair."""
+
+    cond: threading.Condition
+    pending: list[_Request] = field(default_factory=list)
+    running: bool = False
+    waiting: int = 0
+    contended: bool = False
+
+
+@dataclass
+class _ModelStats:
+    batches: int = 0
+    requests: int = 0
+    rows: int = 0
+    max_batch_rows: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    errors: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "rows": self.rows,
+            "avg_batch_rows": round(self.rows / self.batches, 2) if self.batches else 0.0,
+            "max_batch_rows": self.max_batch_rows,
+            "avg_latency_ms": round(self.total_latency_ms / self.batches, 3) if self.batches else 0.0,
+            "max_latency_ms": round(self.max_latency_ms, 3),
+            "errors": self.errors,
+        }
+
+
+class BatchedInferenceService:
+    """
+    Coalesces concurrent prediction requests per model into micro-batches.
+
+    Args:
+        max_wait_ms: Longest a batch waits for more requests once a model has
+            seen concurrent callers (0 disables waiting)
+        max_batch_rows: Upper bound on rows in one vectorized call
+    """
+
+    def __init__(self, max_wait_ms: int = DEFAULT_MAX_WAIT_MS, max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS):
+        self.max_wait = max(0, max_wait_ms) / 1000.0
+        self.max_batch_rows = max(1, max_batch_rows)
+        self._lock = threading.Lock()
+        self._lanes: dict[tuple[str, int, str], _Lane] = {}
+        self._stats: dict[str, _ModelStats] = {}
+
+    def predict(self, model_key: str, model: Any, rows: Any) -> Any:
+        """Batched ``model.predict(rows)``; returns the predictions for ``rows``."""
+        return self._submit(model_key, model, "predict", rows)
+
+    def predict_proba(self, model_key: str, model: Any, rows: Any) -> Any:
+        """Batched ``model.predict_proba(rows)``; returns the probabilities for ``rows``."""
+        return self._submit(model_key, model, "predict_proba", rows)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-model batch-size and latency statistics."""
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._stats.items()}
+
+    # ── Internals ────────────────────────────────────────────────────
+
+    def _submit(self, model_key: str, model: Any, method: str, rows: Any) -> Any:
+        # Lanes are keyed by object identity so a reloaded model never shares a batch with its predecessor
+        lane_key = (model_key, id(model), method)
+        request = _Request(rows=rows, size=len(rows))
+
+        with self._lock:
+            lane = self._lanes.get(lane_key)
+            if lane is None:
+                lane = self._lanes[lane_key] = _Lane(cond=threading.Condition(self._lock))
+            if lane.running or lane.pending:
+                lane.contended = True
+            lane.pending.append(request)
+            lane.waiting += 1
+            if lane.running:
+                lane.cond.notify_all()
+            try:
+                while not request.done:
+                    if lane.running:
+                        lane.cond.wait()
+                    else:
+                        self._lead_batch(lane, model_key, model, method)
+            finally:
+                lane.waiting -= 1
+                if not lane.waiting and self._lanes.get(lane_key) is lane:
+                    del self._lanes[lane_key]
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _lead_batch(self, lane: _Lane, model_key: str, model: Any, method: str) -> None:
+        """Run one batch for ``lane``; called with the lock held, releases it around inference."""
+        lane.running = True
+        if lane.contended and self.max_wait:
+            deadline = time.monotonic() + self.max_wait
+            while self._pending_rows(lane) < self.max_batch_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                lane.cond.wait(remaining)
+
+        batch, total = [], 0
+        while lane.pending and (not batch or total + lane.pending[0].size <= self.max_batch_rows):
+            request = lane.pending.pop(0)
+            batch.append(request)
+            total += request.size
+        # A lone request means the burst is over; go back to running immediately
+        lane.contended = len(batch) > 1 or bool(lane.pending)
+
+        self._lock.release()
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            results = getattr(model, method)(_stack([r.rows for r in batch]))
+            offset = 0
+            for request in batch:
+                request.result = results[offset : offset + request.size]
+                offset += request.size
+        except BaseException as exc:
+            error = exc
+            logger.debug("Batched %s failed for %s: %s", method, model_key, exc)
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            self._lock.acquire()
+
+        for request in batch:
+            request.error = error
+            request.done = True
+        stats = self._stats.setdefault(model_key, _ModelStats())
+        stats.batches += 1
+        stats.requests += len(batch)
+        stats.rows += total
+        stats.max_batch_rows = max(stats.max_batch_rows, total)
+        stats.total_latency_ms += latency_ms
+        stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+        stats.errors += error is not None
+        lane.running = False
+        lane.cond.notify_all()
+
+    @staticmethod
+    def _pending_rows(lane: _Lane) -> int:
+        return sum(request.size for request in lane.pending)
+
+
+def _stack(parts: list[Any]) -> Any:
+    """Concatenate row blocks, keeping the callers' container type where possible."""
+    if len(parts) == 1:
+        return parts[0]
+    first = parts[0]
+    if hasattr(first, "iloc"):
+        import pandas as pd
+
+        return pd.concat(parts, ignore_index=True)
+    if hasattr(first, "ndim"):
+        import numpy as np
+
+        return np.vstack(parts)
+    return [row for part in parts for row in part]
@@ -30,6 +30,7 @@ from app.domain.irrigation import (
     TimingPrediction,
     UserResponsePrediction,
 )
+from app.services.ai.inference_service import BatchedInferenceService
 from app.utils.time import utc_now
 
 if TYPE_CHECKING:
@@ -66,6 +67,7 @@ class IrrigationPredictor:
         model_registry: "ModelRegistry" | None = None,
         feature_engineer: "FeatureEngineer" | None = None,
         recommendation_provider: "RecommendationProvider" | None = None,
+        inference_service: BatchedInferenceService | None = None,
     ):
         """
         Initialize irrigation predictor.
@@ -74,9 +76,11 @@ class IrrigationPredictor:
             irrigation_ml_repo: Repository for irrigation ML data
             model_registry: Optional model registry for trained models
             feature_engineer: Optional feature engineering service
+            inference_service: Shared batched inference service (one is created if omitted)
         """
         self._repo = irrigation_ml_repo
         self._model_registry = model_registry
+        self._inference = inference_service or BatchedInferenceService()
         self._feature_engineer = feature_engineer
         self._recommendation_provider = recommendation_provider
 
@@ -497,7 +501,7 @@ class IrrigationPredictor:
                 row = self._align_features(feature_values, expected_features)
                 if bundle.get("scaler") is not None:
                     row = bundle["scaler"].transform([row])[0].tolist()
-                prediction = bundle["model"].predict([row])[0]
+                prediction = self._inference.predict(bundle["model_name"], bundle["model"], [row])[0]
                 optimal = max(20.0, min(80.0, float(prediction)))
 
                 mae = metrics.get("mae")
@@ -605,9 +609,13 @@ class IrrigationPredictor:
                     row = bundle["scaler"].transform([row])[0].tolist()
 
                 model = bundle.get("model")
-                proba = model.predict_proba([row])[0] if hasattr(model, "predict_proba") else None
+                proba = (
+                    self._inference.predict_proba(bundle["model_name"], model, [row])[0]
+                    if hasattr(model, "predict_proba")
+                    else None
+                )
                 if proba is None:
-                    pred = model.predict([row])[0]
+                    pred = self._inference.predict(bundle["model_name"], model, [row])[0]
                     proba = [0.0] * len(set([pred]))
 
                 labels: list[str] = []
@@ -708,7 +716,7 @@ class IrrigationPredictor:
                 row = self._align_features(feature_values, expected_features)
                 if bundle.get("scaler") is not None:
                     row = bundle["scaler"].transform([row])[0].tolist()
-                prediction = bundle["model"].predict([row])[0]
+                prediction = self._inference.predict(bundle["model_name"], bundle["model"], [row])[0]
 
                 recommended_seconds = int(max(30, min(600, float(prediction))))
                 expected_increase = max(0.0, float(target_moisture) - float(current_moisture))
@@ -803,9 +811,13 @@ class IrrigationPredictor:
                     row = bundle["scaler"].transform([row])[0].tolist()
 
                 model = bundle.get("model")
-                proba = model.predict_proba([row])[0] if hasattr(model, "predict_proba") else None
+                proba = (
+                    self._inference.predict_proba(bundle["model_name"], model, [row])[0]
+                    if hasattr(model, "predict_proba")
+                    else None
+                )
                 if proba is None:
-                    pred = model.predict([row])[0]
+                    pred = self._inference.predict(bundle["model_name"], model, [row])[0]
                     proba = [0.0] * len(set([pred]))
 
                 labels: list[str] = []
@@ -1167,7 +1179,7 @@ class IrrigationPredictor:
                     )
 
                     # Predict using trained model
-                    prediction = self._duration_model.predict([features])[0]
+                    prediction = self._inference.predict("irrigation_duration", self._duration_model, [features])[0]
                     if prediction > 0:
                         logger.info("Using trained ML model for plant %s: %sml", plant_id, prediction)
                         return max(20.0, min(prediction, 500.0))
@@ -8,6 +8,7 @@ Provides:
 - Safe model loading/saving
 - Model metadata tracking
 - Production deployment control
+- Bounded, memory-mapped model/artifact cache
 """
 
 from __future__ import annotations
@@ -16,6 +17,8 @@ import contextlib
 import json
 import logging
 import shutil
+import threading
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
@@ -31,6 +34,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default byte budget for loaded models and artifacts (fits a 2 GB Pi)
+DEFAULT_MODEL_CACHE_BYTES = 256 * 1024 * 1024
+
 
 class ModelStatus(Enum):
     """Model deployment status."""
@@ -82,6 +88,97 @@ class ModelMetadata:
         return cls(**data)
 
 
+class ModelCache:
+    """
+    Thread-safe LRU of loaded models and artifacts bounded by a byte budget.
+
+    Entries are sized by their pickled size on disk. Least recently used
+    entries are evicted until a new entry fits; an entry larger than the
+    whole budget is returned to the caller but not kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MODEL_CACHE_BYTES):
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._resident_bytes = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached object for ``key`` (marking it recently used) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size_bytes: int) -> None:
+        """Cache ``value`` under ``key``, evicting LRU entries to stay within budget."""
+        size_bytes = max(0, int(size_bytes))
+        with self._lock:
+            self._discard(key)
+            if size_bytes > self.max_bytes:
+                logger.debug("Not caching %s: %d bytes exceeds budget of %d", key, size_bytes, self.max_bytes)
+                return
+            while self._entries and self._resident_bytes + size_bytes > self.max_bytes:
+                evicted, (_, evicted_size) = self._entries.popitem(last=False)
+                self._resident_bytes -= evicted_size
+                self._evictions += 1
+                logger.debug("Evicted %s from model cache (%d bytes)", evicted, evicted_size)
+            self._entries[key] = (value, size_bytes)
+            self._resident_bytes += size_bytes
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry for ``key`` if present."""
+        with self._lock:
+            self._discard(key)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every entry whose key starts with ``prefix``."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._resident_bytes -= entry[1]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary with entry count, resident/max bytes, hits, misses,
+            hit rate (0-100) and evictions.
+        """
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            stats = {
+                "entries": len(self._entries),
+                "resident_bytes": self._resident_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "evictions": self._evictions,
+            }
+        total = hits + misses
+        stats["hit_rate"] = round(hits / total * 100, 2) if total else 0.0
+        return stats
+
+
 class ModelRegistry:
     """
     ML model registry for version management and deployment.
@@ -105,12 +202,21 @@ class ModelRegistry:
                 └── metadata.json
     """
 
-    def __init__(self, base_path: Path | None = None):
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        *,
+        cache_max_bytes: int = DEFAULT_MODEL_CACHE_BYTES,
+        mmap_mode: str | None = "r",
+    ):
         """
         Initialize model registry.
 
         Args:
             base_path: Base directory for models (defaults to 'models/')
+            cache_max_bytes: Byte budget shared by cached models and artifacts
+            mmap_mode: joblib mmap mode for loading (``"r"`` shares numpy pages
+                read-only between loads; None copies into memory)
         """
         self.base_path = Path(base_path) if base_path else Path("models")
         self.base_path.mkdir(parents=True, exist_ok=True)
@@ -120,8 +226,9 @@ class ModelRegistry:
         # Keep it flexible to avoid breaking older training scripts.
         self._registry: dict[str, Any] = self._load_registry()
 
-        # Model cache to avoid reloading
-        self._model_cache: dict[str, Any] = {}
+        # Bounded cache of loaded models and artifacts to avoid reloading
+        self._model_cache = ModelCache(cache_max_bytes)
+        self._mmap_mode = mmap_mode
 
     def _parse_iso_ts(self, value: object) -> datetime:
         """Best-effort ISO timestamp parsing for registry sorting."""
@@ -380,9 +487,11 @@ class ModelRegistry:
 
             # Check cache
             cache_key = f"{model_name}:{version}"
-            if use_cache and cache_key in self._model_cache:
-                logger.debug("Using cached model %s", cache_key)
-                return self._model_cache[cache_key]
+            if use_cache:
+                cached = self._model_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached model %s", cache_key)
+                    return cached
 
             version_path = self._get_version_path(model_name, version)
             model_file = None
@@ -396,12 +505,12 @@ class ModelRegistry:
                 logger.error("Model file not found for %s %s in %s", model_name, version, version_path)
                 return None
 
-            model = joblib.load(model_file)
+            model = self._load_file(model_file)
             logger.info("Loaded model %s version %s", model_name, version)
 
             # Cache it
             if use_cache:
-                self._model_cache[cache_key] = model
+                self._model_cache.put(cache_key, model, model_file.stat().st_size)
 
             return model
 
@@ -427,6 +536,12 @@ class ModelRegistry:
                 if version is None:
                     return None
 
+            cache_key = f"{model_name}:{version}:{artifact_name}"
+            cached = self._model_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached artifact %s", cache_key)
+                return cached
+
             version_path = self._get_version_path(model_name, version)
             artifact_file = None
             for candidate in (f"{artifact_name}.joblib", f"{artifact_name}.pkl"):
@@ -439,14 +554,19 @@ class ModelRegistry:
                 logger.warning("Artifact not found for %s (%s): %s", model_name, artifact_name, version_path)
                 return None
 
-            artifact = joblib.load(artifact_file)
+            artifact = self._load_file(artifact_file)
             logger.debug("Loaded artifact %s for %s", artifact_name, model_name)
+            self._model_cache.put(cache_key, artifact, artifact_file.stat().st_size)
             return artifact
 
         except Exception as e:
             logger.error("Failed to load artifact: %s", e, exc_info=True)
             return None
 
+    def _load_file(self, path: Path) -> Any:
+        """Load a joblib/pickle file, memory-mapping numpy arrays when configured."""
+        return joblib.load(path, mmap_mode=self._mmap_mode)
+
     def get_metadata(self, model_name: str, version: str | None = None) -> ModelMetadata | None:
         """
         Get model metadata.
@@ -658,6 +778,8 @@ class ModelRegistry:
             version_path = self._get_version_path(model_name, version)
             if version_path.exists():
                 shutil.rmtree(version_path)
+            self._model_cache.invalidate(f"{model_name}:{version}")
+            self._model_cache.invalidate_prefix(f"{model_name}:{version}:")
 
             # Update registry
             if model_name in self._registry and version in self._registry[model_name]["versions"]:
@@ -739,12 +861,14 @@ class ModelRegistry:
 
         return models
 
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Hit/miss/eviction counts and resident bytes of the model cache."""
+        return self._model_cache.get_stats()
+
     def _clear_model_cache(self, model_name: str | None = None) -> None:
         """Clear model cache for a specific model or all models."""
         if model_name:
-            keys_to_remove = [k for k in self._model_cache if k.startswith(f"{model_name}:")]
-            for key in keys_to_remove:
-                del self._model_cache[key]
+            self._model_cache.invalidate_prefix(f"{model_name}:")
         else:
             self._model_cache.clear()
         logger.debug("Cleared model cache for %s", model_name or "all models")
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from app.enums import PlantStage
+from app.services.ai.inference_service import BatchedInferenceService
 
 # ML libraries lazy loaded in methods for faster startup
 # import numpy as np
@@ -138,6 +139,7 @@ class PlantGrowthPredictor:
         model_registry: "ModelRegistry" | None = None,
         enable_validation: bool = True,
         threshold_service: "ThresholdService" | None = None,
+        inference_service: BatchedInferenceService | None = None,
     ):
         """
         Initialize plant growth predictor.
@@ -146,8 +148,10 @@ class PlantGrowthPredictor:
             model_registry: Optional ModelRegistry for ML model access
             enable_validation: If True, validate predictions against known ranges
             threshold_service: Optional ThresholdService for plant-specific defaults
+            inference_service: Shared batched inference service (one is created if omitted)
         """
         self.model_registry = model_registry
+        self._inference = inference_service or BatchedInferenceService()
         self.enable_validation = enable_validation
         self.threshold_service = threshold_service
 
@@ -271,7 +275,7 @@ class PlantGrowthPredictor:
                 input_data = np.array([[encoded_stage]])
 
                 # Make prediction
-                prediction = self._model.predict(input_data)[0]
+                prediction = self._inference.predict("growth_stage", self._model, input_data)[0]
 
                 # Validate prediction
                 if self.enable_validation and not self._validate_prediction(prediction):
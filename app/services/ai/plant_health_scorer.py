@@ -17,11 +17,16 @@ This service is the primary entry point for per-plant health assessments.
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from app.enums import RiskLevel
+from app.enums.events import PlantEvent, RuntimeEvent, SensorEvent
+from app.services.ai.inference_service import BatchedInferenceService
+from app.utils.event_bus import EventBus
 from app.utils.time import utc_now
 
 if TYPE_CHECKING:
@@ -99,6 +104,23 @@ class PlantHealthScore:
         }
 
 
+@dataclass
+class UnitScoringContext:
+    """
+    Unit-scoped inputs shared by every plant scored in one pass.
+
+    Environment metrics and disease risk are unit-level; plant readings are
+    bulk-loaded for all plants in the unit and thresholds are memoized per
+    (plant_type, growth_stage).
+    """
+
+    unit_id: int
+    env_metrics: dict[str, float | None]
+    disease_risk: str
+    plant_readings: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    thresholds: dict[tuple[str | None, str | None], dict[str, dict[str, float]]] = field(default_factory=dict)
+
+
 class PlantHealthScorer:
     """
     Calculate per-plant health scores by combining plant-specific metrics
@@ -145,6 +167,22 @@ class PlantHealthScorer:
     MODEL_NAME_CLASSIFIER = "plant_health_classifier"
     MIN_ML_CONFIDENCE = 0.6
 
+    # Unit score cache is invalidated by readings; this bounds staleness when events stop arriving
+    UNIT_CACHE_MAX_AGE_SECONDS = 300.0
+
+    # Events that invalidate a unit's cached scores
+    INVALIDATING_EVENTS = (
+        SensorEvent.TEMPERATURE_UPDATE,
+        SensorEvent.HUMIDITY_UPDATE,
+        SensorEvent.SOIL_MOISTURE_UPDATE,
+        SensorEvent.PH_UPDATE,
+        SensorEvent.EC_UPDATE,
+        RuntimeEvent.THRESHOLDS_UPDATE,
+        PlantEvent.PLANT_ADDED,
+        PlantEvent.PLANT_REMOVED,
+        PlantEvent.PLANT_STAGE_UPDATE,
+    )
+
     def __init__(
         self,
         analytics_repo: "AnalyticsRepository" | None = None,
@@ -154,6 +192,8 @@ class PlantHealthScorer:
         plant_service: "PlantViewService" | None = None,
         model_registry: "ModelRegistry" | None = None,
         feature_extractor: "PlantHealthFeatureExtractor" | None = None,
+        event_bus: EventBus | None = None,
+        inference_service: BatchedInferenceService | None = None,
     ):
         """
         Initialize the plant health scorer.
@@ -166,6 +206,8 @@ class PlantHealthScorer:
             plant_service: For plant profile access
             model_registry: For loading trained ML models
             feature_extractor: For extracting ML features
+            event_bus: For invalidating cached unit scores on new readings
+            inference_service: For batching model predictions across callers
         """
         self.analytics_repo = analytics_repo
         self.threshold_service = threshold_service
@@ -173,6 +215,7 @@ class PlantHealthScorer:
         self.environmental_scorer = environmental_scorer
         self.plant_service = plant_service
         self.model_registry = model_registry
+        self._inference = inference_service or BatchedInferenceService()
         self.feature_extractor = feature_extractor
 
         # ML model state (loaded lazily)
@@ -183,6 +226,16 @@ class PlantHealthScorer:
         self._label_encoder = None
         self._models_loaded = False
 
+        # Per-unit score cache: unit_id -> (computed_at monotonic, scores)
+        self._unit_scores: dict[int, tuple[float, list[PlantHealthScore]]] = {}
+        # Bumped on every invalidation so in-flight computations don't cache stale results
+        self._unit_versions: dict[int, int] = {}
+        self._cache_lock = threading.Lock()
+
+        self.event_bus = event_bus or EventBus()
+        for event in self.INVALIDATING_EVENTS:
+            self.event_bus.subscribe(event, self._on_unit_data_changed)
+
     def load_models(self) -> bool:
         """
         Load trained ML models from registry.
@@ -284,13 +337,15 @@ class PlantHealthScorer:
             # Get regressor prediction
             if self._regressor_model and self._regressor_scaler:
                 X_scaled = self._regressor_scaler.transform(X)
-                score_pred = float(self._regressor_model.predict(X_scaled)[0])
+                score_pred = float(
+                    self._inference.predict(self.MODEL_NAME_REGRESSOR, self._regressor_model, X_scaled)[0]
+                )
                 score_pred = max(0.0, min(100.0, score_pred))
 
             # Get classifier prediction
             if self._classifier_model and self._classifier_scaler:
                 X_scaled = self._classifier_scaler.transform(X)
-                status_idx = self._classifier_model.predict(X_scaled)[0]
+                status_idx = self._inference.predict(self.MODEL_NAME_CLASSIFIER, self._classifier_model, X_scaled)[0]
                 if self._label_encoder:
                     status_pred = self._label_encoder.inverse_transform([status_idx])[0]
                 else:
@@ -298,7 +353,9 @@ class PlantHealthScorer:
 
                 # Get confidence
                 if hasattr(self._classifier_model, "predict_proba"):
-                    proba = self._classifier_model.predict_proba(X_scaled)[0]
+                    proba = self._inference.predict_proba(self.MODEL_NAME_CLASSIFIER, self._classifier_model, X_scaled)[
+                        0
+                    ]
                     confidence = float(np.max(proba))
 
             # Combine predictions using ensemble strategy
@@ -457,108 +514,8 @@ class PlantHealthScorer:
             if not unit_id:
                 unit_id = plant_info.get("unit_id", 0)
 
-            plant_type = plant_info.get("plant_type")
-            growth_stage = plant_info.get("current_stage")
-
-            # Get thresholds for this plant type
-            thresholds = self._get_thresholds(plant_type, growth_stage)
-
-            # Collect all metrics
-            plant_metrics, plant_status = self._get_plant_metrics(plant_id, plant_info)
-            env_metrics = self._get_environmental_metrics(unit_id)
-            metric_status = dict(plant_status)
-
-            # Try ML prediction first if models are available
-            if self.feature_extractor and (self._regressor_model or self._classifier_model or not self._models_loaded):
-                ml_result = self._predict_with_ml(
-                    plant_id=plant_id,
-                    unit_id=unit_id,
-                    plant_info=plant_info,
-                    plant_metrics=plant_metrics,
-                    env_metrics=env_metrics,
-                    thresholds=thresholds,
-                )
-                if ml_result and ml_result.data_completeness >= self.MIN_ML_CONFIDENCE:
-                    return ml_result
-
-            # Fall back to rule-based scoring
-
-            # Calculate component scores
-            scores = {}
-            raw_values = {}
-            available_components = 0
-            total_components = len(self.WEIGHTS)
-
-            # Score plant-specific metrics
-            for metric in ["soil_moisture", "ph", "ec"]:
-                value = plant_metrics.get(metric)
-                raw_values[metric] = value
-                if value is not None:
-                    scores[metric] = self._calculate_metric_score(
-                        value, thresholds.get(metric, self.DEFAULT_THRESHOLDS[metric])
-                    )
-                    if metric_status.get(metric) != "n/a":
-                        available_components += 1
-                else:
-                    scores[metric] = 50.0  # Default to neutral
-
-            # Score environmental metrics
-            for metric in ["temperature", "humidity", "vpd"]:
-                value = env_metrics.get(metric)
-                raw_values[metric] = value
-                if value is not None:
-                    scores[metric] = self._calculate_metric_score(
-                        value, thresholds.get(metric, self.DEFAULT_THRESHOLDS[metric])
-                    )
-                    metric_status[metric] = "ok"
-                    available_components += 1
-                else:
-                    scores[metric] = 50.0  # Default to neutral
-                    metric_status[metric] = "n/a"
-
-            # Calculate overall score (weighted average)
-            overall_score = sum(scores[m] * self.WEIGHTS[m] for m in self.WEIGHTS)
-
-            # Calculate data completeness
-            data_completeness = available_components / total_components
-
-            # Determine health status
-            health_status = self._determine_health_status(overall_score)
-
-            # Get disease risk
-            disease_risk = self._get_disease_risk(unit_id, env_metrics)
-
-            # Determine nutrient status
-            nutrient_status = self._determine_nutrient_status(plant_metrics.get("ec"), plant_metrics.get("ph"))
-
-            # Generate recommendations and urgent actions
-            recommendations, urgent_actions = self._generate_recommendations(
-                scores, raw_values, thresholds, health_status
-            )
-            missing_metrics = [m for m, status in metric_status.items() if status == "n/a"]
-            if missing_metrics:
-                recommendations.append(f"No sensor data configured for: {', '.join(sorted(missing_metrics))} (N/A)")
-
-            return PlantHealthScore(
-                plant_id=plant_id,
-                unit_id=unit_id,
-                timestamp=utc_now(),
-                overall_score=overall_score,
-                soil_moisture_score=scores["soil_moisture"],
-                ph_score=scores["ph"],
-                ec_score=scores["ec"],
-                temperature_score=scores["temperature"],
-                humidity_score=scores["humidity"],
-                vpd_score=scores["vpd"],
-                health_status=health_status,
-                disease_risk=disease_risk,
-                nutrient_status=nutrient_status,
-                recommendations=recommendations,
-                urgent_actions=urgent_actions,
-                data_completeness=data_completeness,
-                raw_values=raw_values,
-                metric_status=metric_status,
-            )
+            context = self._build_unit_context(unit_id, [plant_info])
+            return self._score_plants(context, [plant_info])[0]
 
         except Exception as e:
             logger.error("Failed to score plant %s: %s", plant_id, e, exc_info=True)
@@ -568,31 +525,262 @@ class PlantHealthScorer:
         """
         Calculate health scores for all plants in a unit.
 
+        Environment metrics, thresholds and plant readings are loaded once for
+        the whole unit. Results are cached until the next reading (or
+        threshold/plant change) for the unit arrives.
+
         Args:
             unit_id: Growth unit ID
 
         Returns:
             List of PlantHealthScore for each plant in the unit
         """
-        scores = []
+        with self._cache_lock:
+            cached = self._unit_scores.get(unit_id)
+            version = self._unit_versions.get(unit_id, 0)
+        if cached and time.monotonic() - cached[0] < self.UNIT_CACHE_MAX_AGE_SECONDS:
+            return list(cached[1])
+
+        scores: list[PlantHealthScore] = []
 
         try:
-            # Get plants in unit
-            plants = self._get_plants_in_unit(unit_id)
+            plants = [p for p in self._get_plants_in_unit(unit_id) if p.get("plant_id")]
+        except Exception as e:
+            logger.error("Failed to list plants in unit %s: %s", unit_id, e, exc_info=True)
+            return scores
+
+        if plants:
+            try:
+                context = self._build_unit_context(unit_id, plants)
+                scores = self._score_plants(context, plants)
+            except Exception as e:
+                # Not cached, so the next call retries with fresh data
+                logger.error("Failed to score plants in unit %s: %s", unit_id, e, exc_info=True)
+                return [self._get_default_score(p["plant_id"], unit_id) for p in plants]
+
+        with self._cache_lock:
+            if self._unit_versions.get(unit_id, 0) == version:
+                self._unit_scores[unit_id] = (time.monotonic(), scores)
+        return list(scores)
+
+    def invalidate_unit(self, unit_id: int | None = None) -> None:
+        """Drop cached scores for a unit (all units when unit_id is None)."""
+        with self._cache_lock:
+            if unit_id is None:
+                for uid in self._unit_scores:
+                    self._unit_versions[uid] = self._unit_versions.get(uid, 0) + 1
+                self._unit_scores.clear()
+                return
+            self._unit_versions[unit_id] = self._unit_versions.get(unit_id, 0) + 1
+            self._unit_scores.pop(unit_id, None)
+
+    def _on_unit_data_changed(self, payload: Any) -> None:
+        unit_id = payload.get("unit_id") if isinstance(payload, dict) else None
+        try:
+            self.invalidate_unit(int(unit_id) if unit_id is not None else None)
+        except (TypeError, ValueError):
+            self.invalidate_unit(None)
+
+    def _build_unit_context(self, unit_id: int, plants: list[dict[str, Any]]) -> UnitScoringContext:
+        """Bulk-load the unit-level inputs for scoring ``plants``."""
+        env_metrics = self._get_environmental_metrics(unit_id)
+        plant_readings: dict[int, list[dict[str, Any]]] = {}
+        if self.analytics_repo:
+            try:
+                plant_readings = self.analytics_repo.get_latest_plant_readings_for_plants(
+                    [p["plant_id"] for p in plants], limit=10
+                )
+            except Exception as exc:
+                logger.debug("Failed to get plant readings for unit %s: %s", unit_id, exc)
+        return UnitScoringContext(
+            unit_id=unit_id,
+            env_metrics=env_metrics,
+            disease_risk=self._get_disease_risk(unit_id, env_metrics),
+            plant_readings=plant_readings,
+        )
+
+    def _context_thresholds(
+        self,
+        context: UnitScoringContext,
+        plant_type: str | None,
+        growth_stage: str | None,
+    ) -> dict[str, dict[str, float]]:
+        key = (plant_type, growth_stage)
+        if key not in context.thresholds:
+            context.thresholds[key] = self._get_thresholds(plant_type, growth_stage)
+        return context.thresholds[key]
+
+    def _score_plants(
+        self,
+        context: UnitScoringContext,
+        plants: list[dict[str, Any]],
+    ) -> list[PlantHealthScore]:
+        """
+        Score plants against a shared unit context.
 
-            # Pre-fetch environmental data (shared across all plants)
-            self._get_environmental_metrics(unit_id)
+        ML predictions are tried per plant; the rest are scored rule-based in
+        a single vectorized pass over all (plant, metric) pairs. A plant whose
+        data cannot be scored falls back to a default score without affecting
+        the others.
+        """
+        unit_id = context.unit_id
+        env_metrics = context.env_metrics
+        results: list[PlantHealthScore | None] = [None] * len(plants)
+        pending: list[tuple[int, dict[str, Any], dict, dict, dict]] = []
+
+        for index, plant_info in enumerate(plants):
+            plant_id = plant_info["plant_id"]
+            try:
+                thresholds = self._context_thresholds(
+                    context, plant_info.get("plant_type"), plant_info.get("current_stage")
+                )
+                plant_metrics, plant_status = self._get_plant_metrics(
+                    plant_id, plant_info, readings=context.plant_readings.get(plant_id, [])
+                )
+
+                # Try ML prediction first if models are available
+                if self.feature_extractor and (
+                    self._regressor_model or self._classifier_model or not self._models_loaded
+                ):
+                    ml_result = self._predict_with_ml(
+                        plant_id=plant_id,
+                        unit_id=unit_id,
+                        plant_info=plant_info,
+                        plant_metrics=plant_metrics,
+                        env_metrics=env_metrics,
+                        thresholds=thresholds,
+                    )
+                    if ml_result and ml_result.data_completeness >= self.MIN_ML_CONFIDENCE:
+                        results[index] = ml_result
+                        continue
+            except Exception as e:
+                logger.error("Failed to score plant %s: %s", plant_id, e, exc_info=True)
+                results[index] = self._get_default_score(plant_id, unit_id)
+                continue
 
-            for plant in plants:
-                plant_id = plant.get("plant_id")
-                if plant_id:
-                    score = self.score_plant_health(plant_id, unit_id)
-                    scores.append(score)
+            pending.append((index, plant_info, thresholds, plant_metrics, plant_status))
 
+        if pending:
+            # Fall back to rule-based scoring
+            metrics = list(self.WEIGHTS)
+            values = [
+                [{**plant_metrics, **env_metrics}.get(metric) for metric in metrics]
+                for _i, _p, _t, plant_metrics, _s in pending
+            ]
+            bounds = [
+                [thresholds.get(metric, self.DEFAULT_THRESHOLDS[metric]) for metric in metrics]
+                for _i, _p, thresholds, _m, _s in pending
+            ]
+            rows = self._score_rows(values, bounds)
+
+            for row, (index, plant_info, thresholds, plant_metrics, plant_status) in enumerate(pending):
+                plant_id = plant_info["plant_id"]
+                try:
+                    if rows[row] is None:
+                        raise ValueError("metric values or thresholds could not be scored")
+                    component_scores, overall_score = rows[row]
+                    results[index] = self._build_rule_score(
+                        context,
+                        plant_id,
+                        thresholds,
+                        plant_metrics,
+                        plant_status,
+                        dict(zip(metrics, component_scores, strict=True)),
+                        dict(zip(metrics, values[row], strict=True)),
+                        overall_score,
+                    )
+                except Exception as e:
+                    logger.error("Failed to score plant %s: %s", plant_id, e, exc_info=True)
+                    results[index] = self._get_default_score(plant_id, unit_id)
+
+        return [r for r in results if r is not None]
+
+    def _score_rows(
+        self,
+        values: list[list[float | None]],
+        thresholds: list[list[dict[str, float]]],
+    ) -> list[tuple[list[float], float] | None]:
+        """
+        Score every row in one vectorized pass.
+
+        If the batch fails, rows are retried one at a time so a single
+        malformed row only loses its own score (returned as None).
+        """
+        try:
+            component_scores, overall_scores = self._calculate_metric_scores(values, thresholds)
+            return list(zip(component_scores, overall_scores, strict=True))
         except Exception as e:
-            logger.error("Failed to score plants in unit %s: %s", unit_id, e, exc_info=True)
+            logger.warning("Vectorized health scoring failed, scoring plants individually: %s", e)
 
-        return scores
+        rows: list[tuple[list[float], float] | None] = []
+        for row_values, row_thresholds in zip(values, thresholds, strict=True):
+            try:
+                component_scores, overall_scores = self._calculate_metric_scores([row_values], [row_thresholds])
+                rows.append((component_scores[0], overall_scores[0]))
+            except Exception:
+                rows.append(None)
+        return rows
+
+    def _build_rule_score(
+        self,
+        context: UnitScoringContext,
+        plant_id: int,
+        thresholds: dict[str, dict[str, float]],
+        plant_metrics: dict[str, float | None],
+        plant_status: dict[str, str],
+        scores: dict[str, float],
+        raw_values: dict[str, float | None],
+        overall_score: float,
+    ) -> PlantHealthScore:
+        """Assemble a rule-based PlantHealthScore from precomputed component scores."""
+        metric_status = dict(plant_status)
+        available_components = sum(
+            1
+            for metric in ("soil_moisture", "ph", "ec")
+            if plant_metrics.get(metric) is not None and metric_status.get(metric) != "n/a"
+        )
+        for metric in ("temperature", "humidity", "vpd"):
+            if context.env_metrics.get(metric) is not None:
+                metric_status[metric] = "ok"
+                available_components += 1
+            else:
+                metric_status[metric] = "n/a"
+
+        # Calculate data completeness
+        data_completeness = available_components / len(self.WEIGHTS)
+
+        # Determine health status
+        health_status = self._determine_health_status(overall_score)
+
+        # Determine nutrient status
+        nutrient_status = self._determine_nutrient_status(plant_metrics.get("ec"), plant_metrics.get("ph"))
+
+        # Generate recommendations and urgent actions
+        recommendations, urgent_actions = self._generate_recommendations(scores, raw_values, thresholds, health_status)
+        missing_metrics = [m for m, status in metric_status.items() if status == "n/a"]
+        if missing_metrics:
+            recommendations.append(f"No sensor data configured for: {', '.join(sorted(missing_metrics))} (N/A)")
+
+        return PlantHealthScore(
+            plant_id=plant_id,
+            unit_id=context.unit_id,
+            timestamp=utc_now(),
+            overall_score=overall_score,
+            soil_moisture_score=scores["soil_moisture"],
+            ph_score=scores["ph"],
+            ec_score=scores["ec"],
+            temperature_score=scores["temperature"],
+            humidity_score=scores["humidity"],
+            vpd_score=scores["vpd"],
+            health_status=health_status,
+            disease_risk=context.disease_risk,
+            nutrient_status=nutrient_status,
+            recommendations=recommendations,
+            urgent_actions=urgent_actions,
+            data_completeness=data_completeness,
+            raw_values=raw_values,
+            metric_status=metric_status,
+        )
 
     def get_plants_needing_attention(
         self,
@@ -682,7 +870,9 @@ class PlantHealthScorer:
                         "plant_id": p.plant_id,
                         "plant_type": p.plant_type,
                         "current_stage": p.current_stage,
+                        "unit_id": p.unit_id,
                         "moisture_level": p.moisture_level,
+                        "sensor_id": getattr(p, "sensor_id", None),
                     }
                     for p in plants
                 ]
@@ -692,7 +882,10 @@ class PlantHealthScorer:
         return []
 
     def _get_plant_metrics(
-        self, plant_id: int, plant_info: dict[str, Any]
+        self,
+        plant_id: int,
+        plant_info: dict[str, Any],
+        readings: list[dict[str, Any]] | None = None,
     ) -> tuple[dict[str, float | None], dict[str, str]]:
         """
         Get plant-specific metrics (soil_moisture, pH, EC).
@@ -700,6 +893,9 @@ class PlantHealthScorer:
         Strategy:
         1. Prefer latest PlantReadings per metric (including zero values).
         2. Fallback to PlantProfile.moisture_level if a sensor is configured.
+
+        ``readings`` (newest first) skips the per-plant query when the caller
+        has already bulk-loaded them.
         """
         metrics: dict[str, float | None] = {
             "soil_moisture": None,
@@ -713,13 +909,13 @@ class PlantHealthScorer:
             has_sensor = len(sensor_id) > 0
         else:
             has_sensor = sensor_id is not None
-        readings: list[dict[str, Any]] = []
-
-        if self.analytics_repo:
-            try:
-                readings = self.analytics_repo.get_latest_plant_readings(plant_id, limit=10) or []
-            except Exception as exc:
-                logger.debug("Failed to get plant readings: %s", exc)
+        if readings is None:
+            readings = []
+            if self.analytics_repo:
+                try:
+                    readings = self.analytics_repo.get_latest_plant_readings(plant_id, limit=10) or []
+                except Exception as exc:
+                    logger.debug("Failed to get plant readings: %s", exc)
 
         if readings:
             for metric in metrics:
@@ -830,38 +1026,51 @@ class PlantHealthScorer:
 
         return self.DEFAULT_THRESHOLDS
 
-    def _calculate_metric_score(
+    def _calculate_metric_scores(
         self,
-        value: float,
-        threshold: dict[str, float],
-    ) -> float:
+        values: list[list[float | None]],
+        thresholds: list[list[dict[str, float]]],
+    ) -> tuple[list[list[float]], list[float]]:
         """
-        Calculate score (0-100) for a metric based on thresholds.
+        Score each metric (0-100) against its thresholds over a (plants x WEIGHTS) matrix.
 
-        Uses a bell curve centered on optimal value.
+        A bell curve centered on the optimal value: out of bounds is critical
+        (10), within one tolerance perfect (100), then 80/60/40/20 for each
+        further tolerance band.
+
+        Missing values score a neutral 50.
+
+        Returns:
+            (component scores per plant, weighted overall score per plant)
         """
-        optimal = threshold.get("optimal", 50.0)
-        tolerance = threshold.get("tolerance", 10.0)
-        min_val = threshold.get("min", optimal - 30)
-        max_val = threshold.get("max", optimal + 30)
-
-        # Out of bounds check
-        if value < min_val or value > max_val:
-            return 10.0  # Critical
-
-        # Calculate deviation from optimal
-        deviation = abs(value - optimal)
-
-        if deviation <= tolerance:
-            return 100.0  # Perfect
-        elif deviation <= tolerance * 2:
-            return 80.0  # Good
-        elif deviation <= tolerance * 3:
-            return 60.0  # Moderate stress
-        elif deviation <= tolerance * 4:
-            return 40.0  # Significant stress
-        else:
-            return 20.0  # Severe stress
+        import numpy as np
+
+        vals = np.array([[np.nan if v is None else float(v) for v in row] for row in values], dtype=float)
+        optimal = np.array([[t.get("optimal", 50.0) for t in row] for row in thresholds], dtype=float)
+        tolerance = np.array([[t.get("tolerance", 10.0) for t in row] for row in thresholds], dtype=float)
+        min_val = np.array(
+            [[t.get("min", t.get("optimal", 50.0) - 30) for t in row] for row in thresholds], dtype=float
+        )
+        max_val = np.array(
+            [[t.get("max", t.get("optimal", 50.0) + 30) for t in row] for row in thresholds], dtype=float
+        )
+
+        deviation = np.abs(vals - optimal)
+        scores = np.select(
+            [
+                (vals < min_val) | (vals > max_val),  # Critical
+                deviation <= tolerance,  # Perfect
+                deviation <= tolerance * 2,  # Good
+                deviation <= tolerance * 3,  # Moderate stress
+                deviation <= tolerance * 4,  # Significant stress
+            ],
+            [10.0, 100.0, 80.0, 60.0, 40.0],
+            default=20.0,  # Severe stress
+        )
+        scores = np.where(np.isnan(vals), 50.0, scores)
+
+        weights = np.array(list(self.WEIGHTS.values()), dtype=float)
+        return scores.tolist(), (scores @ weights).tolist()
 
     def _determine_health_status(self, overall_score: float) -> str:
         """Determine health status based on overall score."""
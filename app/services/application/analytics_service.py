@@ -15,6 +15,7 @@ Sub-services:
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Any
 
@@ -25,6 +26,7 @@ from app.services.application.environmental_analytics_service import (
 from app.services.application.sensor_analytics_service import SensorAnalyticsService
 from app.services.application.threshold_service import ThresholdService
 from app.services.hardware.scheduling_service import SchedulingService
+from infrastructure.database.pagination import KeysetCursor
 from infrastructure.database.repositories.analytics import AnalyticsRepository
 from infrastructure.database.repositories.devices import DeviceRepository
 from infrastructure.database.repositories.growth import GrowthRepository
@@ -44,6 +46,8 @@ class AnalyticsService:
         growth_repository: GrowthRepository | None = None,
         threshold_service: "ThresholdService" | None = None,
         scheduling_service: "SchedulingService" | None = None,
+        *,
+        sensor_retention_days: int | None = None,
     ):
         self.repository = repository
         self.device_repository = device_repository
@@ -60,6 +64,7 @@ class AnalyticsService:
             growth_repository=growth_repository,
             threshold_service=threshold_service,
             scheduling_service=scheduling_service,
+            sensor_retention_days=sensor_retention_days,
         )
         self._energy = EnergyAnalyticsService(
             repository=repository,
@@ -98,6 +103,48 @@ class AnalyticsService:
             start_datetime, end_datetime, unit_id=unit_id, sensor_id=sensor_id, limit=limit
         )
 
+    def iter_sensor_history_export(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        metrics: Sequence[str] | None = None,
+        cursor: KeysetCursor | None = None,
+        limit: int | None = None,
+    ) -> Iterator[tuple[dict[str, Any], KeysetCursor]]:
+        return self._sensor.iter_sensor_history_export(
+            start_datetime,
+            end_datetime,
+            unit_id=unit_id,
+            sensor_id=sensor_id,
+            metrics=metrics,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def fetch_chart_readings(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        max_points: int = 500,
+        interval: str | None = None,
+        downsample: str = "lttb",
+    ) -> list[dict[str, Any]]:
+        return self._sensor.fetch_chart_readings(
+            start_datetime,
+            end_datetime,
+            unit_id=unit_id,
+            sensor_id=sensor_id,
+            max_points=max_points,
+            interval=interval,
+            downsample=downsample,
+        )
+
     def get_sensors_history_enriched(
         self,
         start_datetime: datetime,
@@ -230,6 +277,9 @@ class AnalyticsService:
     def predict_device_failure(self, actuator_id: int, days_ahead: int = 30) -> dict[str, Any]:
         return self._energy.predict_device_failure(actuator_id, days_ahead)
 
+    def predict_device_failures(self, actuator_ids: list[int], days_ahead: int = 30) -> dict[int, dict[str, Any]]:
+        return self._energy.predict_device_failures(actuator_ids, days_ahead)
+
     # ══════════════════════════════════════════════════════════════════
     # Environmental Analytics  (delegates → EnvironmentalAnalyticsService)
     # ══════════════════════════════════════════════════════════════════
@@ -133,8 +133,9 @@ class DashboardService:
         sensor_id: int | None = None,
         limit: int = 500,
         hours: int | None = None,
+        downsample: str = "lttb",
     ) -> dict[str, Any]:
-        """Return sensor readings for charts, with caching and downsampling."""
+        """Return sensor readings for charts, with caching and shape-preserving downsampling."""
         analytics = getattr(self._c, "analytics_service", None)
         if not analytics:
             raise RuntimeError("Analytics service unavailable")
@@ -146,14 +147,15 @@ class DashboardService:
             target_limit = min(target_limit, 1200)
         target_limit = max(50, target_limit)
 
-        key = self._ts_key(start, end, unit_id, sensor_id, target_limit, hours)
+        key = self._ts_key(start, end, unit_id, sensor_id, target_limit, hours, downsample)
         cached = self._ts_get(key)
         if cached is not None:
             return cached
 
-        db_limit = max(target_limit * 4, 0) if target_limit else None
-        readings = analytics.fetch_sensor_history(start, end, unit_id=unit_id, sensor_id=sensor_id, limit=db_limit)
-        series = self._downsample(readings, target=target_limit)
+        # Downsampled per series over the full window (LTTB or per-bucket min/max).
+        series = analytics.fetch_chart_readings(
+            start, end, unit_id=unit_id, sensor_id=sensor_id, max_points=target_limit, downsample=downsample
+        )
 
         for row in series:
             parsed = coerce_datetime(row.get("timestamp"))
@@ -165,7 +167,7 @@ class DashboardService:
             "end": end.isoformat(),
             "unit_id": unit_id,
             "sensor_id": sensor_id,
-            "count": len(readings),
+            "count": len(series),
             "returned": len(series),
             "series": series,
         }
@@ -948,8 +950,8 @@ class DashboardService:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _ts_key(start, end, uid, sid, limit, hours):
-        return (start.isoformat(), end.isoformat(), uid, sid, limit, hours)
+    def _ts_key(start, end, uid, sid, limit, hours, downsample):
+        return (start.isoformat(), end.isoformat(), uid, sid, limit, hours, downsample)
 
     def _ts_get(self, key):
         return self._ts_cache.get(key)
@@ -961,13 +963,6 @@ class DashboardService:
     # Static / pure helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _downsample(rows: list[dict], target: int) -> list[dict]:
-        if not target or len(rows) <= target:
-            return rows
-        stride = max(1, len(rows) // target)
-        return rows[::stride][:target]
-
     @staticmethod
     def _fallback_status(value, sensor_type: str) -> str:
         """Fallback sensor status when DeviceHealthService is unavailable."""
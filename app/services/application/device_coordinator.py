@@ -114,7 +114,7 @@ class DeviceCoordinator:
             elif timestamp is None:
                 timestamp = iso_now()
 
-            self.repository.save_actuator_state(
+            self.repository.enqueue_actuator_state(
                 actuator_id=actuator_id,
                 state=state,
                 value=value,
@@ -155,7 +155,7 @@ class DeviceCoordinator:
             if isinstance(details, dict):
                 details = json.dumps(details)
 
-            self.repository.save_connectivity_event(
+            self.repository.enqueue_connectivity_event(
                 connection_type=connection_type,
                 status=status,
                 endpoint=endpoint,
@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 class EnergyAnalyticsService:
     """Energy and actuator analytics: cost trends, anomalies, recommendations, predictions."""
 
+    # Distinct actuator sets whose batch failure predictions are kept
+    FAILURE_PREDICTION_CACHE_SIZE = 32
+
     def __init__(
         self,
         repository: AnalyticsRepository,
@@ -40,6 +43,9 @@ class EnergyAnalyticsService:
         self.electricity_rate = electricity_rate
         self.logger = logger
 
+        # (actuator_ids, days_ahead) -> (health stamp, predictions)
+        self._failure_prediction_cache: dict[tuple[tuple[int, ...], int], tuple[tuple, dict[int, dict[str, Any]]]] = {}
+
     # ── Cost Trends ──────────────────────────────────────────────────
 
     def get_actuator_energy_cost_trends(self, actuator_id: int, days: int = 7) -> dict[str, Any]:
@@ -655,90 +661,149 @@ class EnergyAnalyticsService:
         try:
             health_history = self.device_repository.get_actuator_health_history(actuator_id, limit=30)
             anomalies = self.device_repository.get_actuator_anomalies(actuator_id, limit=DataLimits.DEFAULT_FETCH_LIMIT)
+            unresolved = sum(1 for a in anomalies if a.get("resolved_at") is None)
+
+            prediction = self._score_failure_risk(actuator_id, health_history, unresolved, days_ahead)
+            if "risk_factors" in prediction:
+                logger.info(
+                    "🔮 Failure prediction for actuator %s: %s (%s)",
+                    actuator_id,
+                    prediction["failure_probability"],
+                    prediction["risk_level"],
+                )
+            return prediction
 
-            if not health_history:
-                return {
-                    "actuator_id": actuator_id,
-                    "failure_probability": 0.0,
-                    "risk_level": "unknown",
-                    "confidence": 0.0,
-                    "message": "Insufficient historical data",
-                }
+        except Exception as e:
+            logger.error("Error predicting failure for actuator %s: %s", actuator_id, e, exc_info=True)
+            return {"error": str(e)}
 
-            risk_score = 0.0
-            risk_factors: list[dict[str, Any]] = []
+    def predict_device_failures(self, actuator_ids: list[int], days_ahead: int = 7) -> dict[int, dict[str, Any]]:
+        """Predict failure risk for many actuators at once.
 
-            # 1. Health score trend
-            if len(health_history) >= 2:
-                recent_avg = sum(h.get("health_score", 100) for h in health_history[:5]) / min(5, len(health_history))
-                older_avg = sum(h.get("health_score", 100) for h in health_history[-5:]) / min(5, len(health_history))
-                if recent_avg < older_avg * 0.9:
-                    risk_score += 0.3
-                    risk_factors.append(
-                        {
-                            "factor": "declining_health",
-                            "description": f"Health score declining: {older_avg:.1f} → {recent_avg:.1f}",
-                            "impact": "high",
-                        }
-                    )
+        Inputs for all actuators come from two windowed queries instead of two
+        queries per actuator. Results are cached until a health snapshot or
+        anomaly is written or resolved.
+
+        Returns:
+            ``{actuator_id: prediction}`` with the same shape as
+            ``predict_device_failure``.
+        """
+        if not self.device_repository:
+            return {int(a): {"error": "DeviceRepository not configured"} for a in actuator_ids}
+
+        ids = sorted({int(a) for a in actuator_ids})
+        if not ids:
+            return {}
+
+        cache_key = (tuple(ids), int(days_ahead))
+        stamp = self.device_repository.get_actuator_health_stamp()
+        cached = self._failure_prediction_cache.get(cache_key)
+        if cached is not None and stamp and cached[0] == stamp:
+            return cached[1]
+
+        inputs = self.device_repository.get_actuator_failure_inputs(
+            ids, history_limit=30, anomaly_limit=DataLimits.DEFAULT_FETCH_LIMIT
+        )
+        predictions: dict[int, dict[str, Any]] = {}
+        for actuator_id in ids:
+            entry = inputs.get(actuator_id) or {}
+            predictions[actuator_id] = self._score_failure_risk(
+                actuator_id,
+                entry.get("health_history") or [],
+                int(entry.get("unresolved_anomalies") or 0),
+                days_ahead,
+            )
+
+        if len(self._failure_prediction_cache) >= self.FAILURE_PREDICTION_CACHE_SIZE:
+            self._failure_prediction_cache.pop(next(iter(self._failure_prediction_cache)))
+        self._failure_prediction_cache[cache_key] = (stamp, predictions)
+
+        logger.info("🔮 Failure predictions computed for %d actuators", len(ids))
+        return predictions
+
+    def _score_failure_risk(
+        self,
+        actuator_id: int,
+        health_history: list[dict[str, Any]],
+        unresolved_anomalies: int,
+        days_ahead: int,
+    ) -> dict[str, Any]:
+        """Score failure risk from health snapshots (newest first) and unresolved anomaly count."""
+        if not health_history:
+            return {
+                "actuator_id": actuator_id,
+                "failure_probability": 0.0,
+                "risk_level": "unknown",
+                "confidence": 0.0,
+                "message": "Insufficient historical data",
+            }
+
+        risk_score = 0.0
+        risk_factors: list[dict[str, Any]] = []
 
-            # 2. Recent anomalies
-            recent_anomalies = [a for a in anomalies if a.get("resolved_at") is None]
-            if len(recent_anomalies) > 5:
-                risk_score += 0.4
+        # 1. Health score trend
+        if len(health_history) >= 2:
+            recent_avg = sum(h.get("health_score", 100) for h in health_history[:5]) / min(5, len(health_history))
+            older_avg = sum(h.get("health_score", 100) for h in health_history[-5:]) / min(5, len(health_history))
+            if recent_avg < older_avg * 0.9:
+                risk_score += 0.3
                 risk_factors.append(
                     {
-                        "factor": "high_anomaly_count",
-                        "description": f"{len(recent_anomalies)} unresolved anomalies",
+                        "factor": "declining_health",
+                        "description": f"Health score declining: {older_avg:.1f} → {recent_avg:.1f}",
                         "impact": "high",
                     }
                 )
 
-            # 3. Error rate
-            if health_history:
-                latest = health_history[0]
-                total_ops = latest.get("total_operations", 0)
-                failed_ops = latest.get("failed_operations", 0)
-                if total_ops > 0:
-                    error_rate = failed_ops / total_ops
-                    if error_rate > 0.1:
-                        risk_score += 0.3
-                        risk_factors.append(
-                            {
-                                "factor": "high_error_rate",
-                                "description": f"Error rate: {error_rate * 100:.1f}%",
-                                "impact": "medium",
-                            }
-                        )
-
-            failure_probability = min(1.0, risk_score)
-
-            if failure_probability < 0.2:
-                risk_level = "low"
-            elif failure_probability < 0.5:
-                risk_level = "medium"
-            elif failure_probability < 0.8:
-                risk_level = "high"
-            else:
-                risk_level = "critical"
-
-            confidence = min(1.0, len(health_history) / 30.0)
-
-            logger.info("🔮 Failure prediction for actuator %s: %s (%s)", actuator_id, failure_probability, risk_level)
+        # 2. Recent anomalies
+        if unresolved_anomalies > 5:
+            risk_score += 0.4
+            risk_factors.append(
+                {
+                    "factor": "high_anomaly_count",
+                    "description": f"{unresolved_anomalies} unresolved anomalies",
+                    "impact": "high",
+                }
+            )
 
-            return {
-                "actuator_id": actuator_id,
-                "failure_probability": round(failure_probability, 3),
-                "risk_level": risk_level,
-                "risk_factors": risk_factors,
-                "confidence": round(confidence, 2),
-                "prediction_window_days": days_ahead,
-                "recommendation": self._get_maintenance_recommendation(risk_level),
-            }
+        # 3. Error rate
+        latest = health_history[0]
+        total_ops = latest.get("total_operations", 0)
+        failed_ops = latest.get("failed_operations", 0)
+        if total_ops > 0:
+            error_rate = failed_ops / total_ops
+            if error_rate > 0.1:
+                risk_score += 0.3
+                risk_factors.append(
+                    {
+                        "factor": "high_error_rate",
+                        "description": f"Error rate: {error_rate * 100:.1f}%",
+                        "impact": "medium",
+                    }
+                )
 
-        except Exception as e:
-            logger.error("Error predicting failure for actuator %s: %s", actuator_id, e, exc_info=True)
-            return {"error": str(e)}
+        failure_probability = min(1.0, risk_score)
+
+        if failure_probability < 0.2:
+            risk_level = "low"
+        elif failure_probability < 0.5:
+            risk_level = "medium"
+        elif failure_probability < 0.8:
+            risk_level = "high"
+        else:
+            risk_level = "critical"
+
+        confidence = min(1.0, len(health_history) / 30.0)
+
+        return {
+            "actuator_id": actuator_id,
+            "failure_probability": round(failure_probability, 3),
+            "risk_level": risk_level,
+            "risk_factors": risk_factors,
+            "confidence": round(confidence, 2),
+            "prediction_window_days": days_ahead,
+            "recommendation": self._get_maintenance_recommendation(risk_level),
+        }
 
     @staticmethod
     def _get_maintenance_recommendation(risk_level: str) -> str:
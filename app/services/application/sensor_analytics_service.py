@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 import sqlite3
 from collections import defaultdict
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -21,7 +22,10 @@ from app.domain.photoperiod import Photoperiod
 from app.services.application.threshold_service import ThresholdService
 from app.services.hardware.scheduling_service import SchedulingService
 from app.utils.cache import CacheRegistry, TTLCache
+from app.utils.downsampling import DOWNSAMPLE_MODES, downsample_rows
 from app.utils.time import coerce_datetime, utc_now
+from infrastructure.database.ops.analytics import SENSOR_ROLLUP_TIERS
+from infrastructure.database.pagination import KeysetCursor
 from infrastructure.database.repositories.analytics import AnalyticsRepository
 from infrastructure.database.repositories.devices import DeviceRepository
 from infrastructure.database.repositories.growth import GrowthRepository
@@ -40,6 +44,17 @@ ANALYTICS_RECOVERABLE_ERRORS = (
     ArithmeticError,
 )
 
+# Chart aggregation intervals accepted by format_sensor_chart_data.
+CHART_INTERVALS: dict[str, timedelta] = {
+    "1min": timedelta(minutes=1),
+    "5min": timedelta(minutes=5),
+    "15min": timedelta(minutes=15),
+    "30min": timedelta(minutes=30),
+    "1hour": timedelta(hours=1),
+    "6hour": timedelta(hours=6),
+    "1day": timedelta(days=1),
+}
+
 
 class SensorAnalyticsService:
     """Sensor data access, caching, formatting, enrichment, and plant readings."""
@@ -53,6 +68,7 @@ class SensorAnalyticsService:
         scheduling_service: "SchedulingService" | None = None,
         *,
         cache_name_prefix: str = "analytics_service",
+        sensor_retention_days: int | None = None,
     ):
         self.repository = repository
         self.device_repository = device_repository
@@ -60,6 +76,7 @@ class SensorAnalyticsService:
         self.growth_repo = growth_repository
         self.threshold_service = threshold_service
         self.scheduling_service = scheduling_service
+        self.sensor_retention_days = sensor_retention_days
         self.logger = logger
 
         # Caches
@@ -145,6 +162,143 @@ class SensorAnalyticsService:
 
         return self._history_cache.get(cache_key, loader)
 
+    def fetch_chart_readings(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        max_points: int = 500,
+        interval: str | None = None,
+        downsample: str = "lttb",
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch chart rows from raw readings or a pre-aggregated rollup tier. Cached 30s.
+
+        With an explicit ``interval`` the coarsest rollup tier that evenly
+        divides it is read; otherwise the repository's planner picks raw
+        readings when they fit ``max_points`` and the finest adequate tier
+        when they do not.  Rollup rows carry ``reading_count`` and the bucket
+        mean of each metric, and are shaped like raw history rows.
+
+        Either source is streamed through a time-bucketed ``downsample``
+        reducer (``"lttb"`` or ``"minmax"``) over the whole window, so at most
+        about ``max_points`` points per series are returned and no SQL row
+        cap truncates the newest part of a long window.
+        """
+        if downsample not in DOWNSAMPLE_MODES:
+            raise ValueError(f"Unknown downsample mode '{downsample}'")
+        cache_key = (
+            f"chart_{start_datetime.isoformat()}_{end_datetime.isoformat()}_{unit_id}_{sensor_id}"
+            f"_{max_points}_{interval}_{downsample}"
+        )
+
+        def loader():
+            try:
+                if start_datetime >= end_datetime:
+                    raise ValueError("Start datetime must be before end datetime")
+                if interval in CHART_INTERVALS:
+                    tier = self._rollup_tier_for_interval(CHART_INTERVALS[interval])
+                else:
+                    tier = self.repository.plan_sensor_history_resolution(
+                        start_datetime,
+                        end_datetime,
+                        max_points,
+                        unit_id=unit_id,
+                        sensor_id=sensor_id,
+                        raw_retention_days=self.sensor_retention_days,
+                    )
+                logger.debug("Chart readings %s..%s served from tier=%ss (0 = raw)", start_datetime, end_datetime, tier)
+                if tier:
+                    rows = self.repository.fetch_sensor_rollup_history(
+                        start_datetime, end_datetime, tier, unit_id=unit_id, sensor_id=sensor_id
+                    )
+                else:
+                    rows = self.repository.iter_sensor_history(
+                        start_datetime, end_datetime, unit_id=unit_id, sensor_id=sensor_id
+                    )
+                return downsample_rows(
+                    rows,
+                    start_epoch=coerce_datetime(start_datetime).timestamp(),
+                    end_epoch=coerce_datetime(end_datetime).timestamp(),
+                    target=max_points,
+                    mode=downsample,
+                )
+            except ValueError as e:
+                logger.warning("Invalid chart request: %s", e)
+                raise
+            except ANALYTICS_RECOVERABLE_ERRORS as e:
+                logger.error("Error fetching chart readings: %s", e)
+                raise
+
+        return self._history_cache.get(cache_key, loader)
+
+    def iter_sensor_history_export(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        metrics: Sequence[str] | None = None,
+        cursor: KeysetCursor | None = None,
+        limit: int | None = None,
+        page_size: int = DataLimits.SENSOR_EXPORT_PAGE,
+    ) -> Iterator[tuple[dict[str, Any], KeysetCursor]]:
+        """
+        Stream raw readings for export, one keyset page at a time. Not cached.
+
+        Each reading is yielded with the cursor that resumes right after it,
+        so an interrupted export can continue from the last reading received.
+        At most ``page_size`` readings are held in memory at once and no read
+        connection is held between pages.
+
+        Args:
+            start_datetime: Start of the window
+            end_datetime: End of the window
+            unit_id: Optional unit filter
+            sensor_id: Optional sensor filter
+            metrics: Optional metric names to include
+            cursor: Resume strictly after this position
+            limit: Optional cap on the number of readings yielded
+            page_size: Readings fetched per query
+
+        Raises:
+            ValueError: If the window is empty
+            sqlite3.Error: If a page query fails; readings already yielded
+                carry the cursor to resume from
+        """
+        if start_datetime >= end_datetime:
+            raise ValueError("Start datetime must be before end datetime")
+
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self.repository.fetch_sensor_history_page(
+                start_datetime,
+                end_datetime,
+                unit_id=unit_id,
+                sensor_id=sensor_id,
+                metrics=metrics,
+                after=cursor,
+                limit=size,
+            )
+            for row in page:
+                cursor = KeysetCursor(ts_epoch=row.pop("ts_epoch"), row_id=row["reading_id"])
+                yield row, cursor
+            if len(page) < size:
+                return
+            if remaining is not None:
+                remaining -= len(page)
+
+    @staticmethod
+    def _rollup_tier_for_interval(delta: timedelta) -> int:
+        """Largest rollup tier that evenly divides *delta* (0 when none does)."""
+        seconds = int(delta.total_seconds())
+        fitting = [tier for tier in SENSOR_ROLLUP_TIERS if tier <= seconds and seconds % tier == 0]
+        return fitting[-1] if fitting else 0
+
     # ── Enriched History (VPD + Photoperiod) ─────────────────────────
 
     def get_sensors_history_enriched(
@@ -371,17 +525,7 @@ class SensorAnalyticsService:
         if not readings:
             return []
 
-        interval_map = {
-            "1min": timedelta(minutes=1),
-            "5min": timedelta(minutes=5),
-            "15min": timedelta(minutes=15),
-            "30min": timedelta(minutes=30),
-            "1hour": timedelta(hours=1),
-            "6hour": timedelta(hours=6),
-            "1day": timedelta(days=1),
-        }
-
-        delta = interval_map.get(interval)
+        delta = CHART_INTERVALS.get(interval)
         if not delta:
             logger.warning("Unknown interval '%s', skipping aggregation", interval)
             return readings
@@ -400,20 +544,19 @@ class SensorAnalyticsService:
         for bucket_time in sorted(buckets.keys()):
             bucket_readings = buckets[bucket_time]
 
-            def _safe_mean(values: list) -> float | None:
-                valid = [v for v in values if v is not None]
-                return sum(valid) / len(valid) if valid else None
+            # Rollup rows are already bucket means; weight them by their reading count.
+            weights = [r.get("reading_count") or 1 for r in bucket_readings]
 
             aggregated.append(
                 {
                     "timestamp": bucket_time.isoformat(),
-                    "temperature": _safe_mean([r.get("temperature") for r in bucket_readings]),
-                    "humidity": _safe_mean([r.get("humidity") for r in bucket_readings]),
-                    "soil_moisture": _safe_mean([r.get("soil_moisture") for r in bucket_readings]),
-                    "lux": _safe_mean([r.get("lux") for r in bucket_readings]),
-                    "co2": _safe_mean([r.get("co2") for r in bucket_readings]),
-                    "voc": _safe_mean([r.get("voc") for r in bucket_readings]),
-                    "reading_count": len(bucket_readings),
+                    "temperature": self._weighted_mean(bucket_readings, weights, "temperature"),
+                    "humidity": self._weighted_mean(bucket_readings, weights, "humidity"),
+                    "soil_moisture": self._weighted_mean(bucket_readings, weights, "soil_moisture"),
+                    "lux": self._weighted_mean(bucket_readings, weights, "lux"),
+                    "co2": self._weighted_mean(bucket_readings, weights, "co2"),
+                    "voc": self._weighted_mean(bucket_readings, weights, "voc"),
+                    "reading_count": sum(weights),
                 }
             )
 
@@ -504,9 +647,12 @@ class SensorAnalyticsService:
         unit_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Get sensor history enriched with photoperiod and day/night analysis."""
-        readings = self.fetch_sensor_history(
-            start_datetime, end_datetime, unit_id=unit_id, sensor_id=sensor_id, limit=limit
-        )
+        if limit:
+            readings = self.fetch_chart_readings(
+                start_datetime, end_datetime, unit_id=unit_id, sensor_id=sensor_id, max_points=limit, interval=interval
+            )
+        else:
+            readings = self.fetch_sensor_history(start_datetime, end_datetime, unit_id=unit_id, sensor_id=sensor_id)
         chart_data = self.format_sensor_chart_data(readings, interval)
         parsed_timestamps = self._normalize_chart_timestamps(chart_data)
 
@@ -728,6 +874,13 @@ class SensorAnalyticsService:
         if day_avg is not None and night_avg is not None:
             summary["dif_c"] = round(day_avg - night_avg, 3)
 
+    @staticmethod
+    def _weighted_mean(rows: list[dict], weights: list[int], field: str) -> float | None:
+        """Mean of ``field`` over ``rows`` weighted by ``weights``, ignoring missing values."""
+        valid = [(row.get(field), weight) for row, weight in zip(rows, weights) if row.get(field) is not None]
+        total = sum(weight for _, weight in valid)
+        return sum(value * weight for value, weight in valid) / total if total else None
+
     @staticmethod
     def _safe_mean(values: list[float]) -> float | None:
         if not values:
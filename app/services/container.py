@@ -10,6 +10,7 @@ from app.hardware.sensors.processors import IDataProcessor
 from app.services.ai import (
     ABTestingService,
     AutomatedRetrainingService,
+    BatchedInferenceService,
     ClimateOptimizer,
     DiseasePredictor,
     MLTrainerService,
@@ -41,6 +42,7 @@ from app.services.container_builder import ContainerBuilder
 from app.services.hardware import ActuatorManagementService, SensorManagementService
 from app.services.hardware.camera_service import CameraService
 from app.services.hardware.mqtt_sensor_service import MQTTSensorService
+from app.services.hardware.schedule_transition_engine import ScheduleTransitionEngine
 from app.services.utilities.anomaly_detection_service import AnomalyDetectionService
 from app.services.utilities.database_maintenance_service import DatabaseMaintenanceService
 from app.services.utilities.system_health_service import SystemHealthService
@@ -131,6 +133,8 @@ class ServiceContainer:
     personalized_learning: PersonalizedLearningService | None
     training_data_collector: TrainingDataCollector | None
     ml_readiness_monitor: object | None  # MLReadinessMonitorService (avoid import cycle)
+    schedule_transition_engine: ScheduleTransitionEngine | None = None
+    inference_service: BatchedInferenceService | None = None
     _shutdown_complete: bool = False
 
     @classmethod
@@ -184,6 +188,14 @@ class ServiceContainer:
         except Exception as e:
             logger.warning("Failed to stop UnifiedScheduler: %s", e)
 
+        # Stop schedule transition engine
+        if self.schedule_transition_engine is not None:
+            try:
+                self.schedule_transition_engine.stop()
+                logger.info("✓ ScheduleTransitionEngine stopped")
+            except Exception as e:
+                logger.warning("Failed to stop ScheduleTransitionEngine: %s", e)
+
         # Stop continuous monitoring if enabled
         if self.continuous_monitor is not None:
             try:
@@ -206,7 +218,27 @@ class ServiceContainer:
         # Stop all unit runtimes (includes per-unit hardware managers and actuator managers)
         self.growth_service.shutdown()
 
+        # Keep anomaly detection windows for a warm restart
+        try:
+            self.sensor_management_service.anomaly_service.save_state()
+        except Exception as e:
+            logger.warning("Failed to save anomaly detection state: %s", e)
+
+        # Stop the emission scheduler
+        try:
+            self.emitter_service.shutdown()
+        except Exception as e:
+            logger.warning("Failed to stop EmitterService: %s", e)
+
+        # Commit buffered ingest rows before closing connections
+        try:
+            self.database.stop_write_behind()
+            logger.info("✓ Write-behind queue flushed")
+        except Exception as e:
+            logger.warning("Failed to flush write-behind queue: %s", e)
+
         # Then close connections
+        self.database.close_read_pool()
         self.database.close_db()
         if self.mqtt_client is not None:
             self.mqtt_client.disconnect()
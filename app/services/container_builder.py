@@ -39,6 +39,7 @@ from app.hardware.sensors.processors import (
 from app.services.ai import (
     ABTestingService,
     AutomatedRetrainingService,
+    BatchedInferenceService,
     ClimateOptimizer,
     DiseasePredictor,
     EnvironmentalFeatureExtractor,
@@ -73,6 +74,7 @@ from app.services.hardware import ActuatorManagementService, SensorManagementSer
 from app.services.hardware.camera_service import CameraService
 from app.services.hardware.mqtt_sensor_service import MQTTSensorService
 from app.services.hardware.pump_calibration import PumpCalibrationService
+from app.services.hardware.schedule_transition_engine import ScheduleTransitionEngine
 from app.services.utilities.anomaly_detection_service import AnomalyDetectionService
 from app.services.utilities.database_maintenance_service import DatabaseMaintenanceService
 from app.services.utilities.email_service import EmailService
@@ -168,6 +170,7 @@ class AIComponents:
     environmental_health_scorer: EnvironmentalLeafHealthScorer
     plant_health_scorer: PlantHealthScorer
     recommendation_provider: object | None  # RuleBasedRecommendationProvider
+    inference_service: BatchedInferenceService | None = None
 
 
 @dataclass
@@ -240,6 +243,11 @@ class ContainerBuilder:
             self.config.database_path,
             cache_size_kb=self.config.db_cache_size_kb,
             mmap_size_bytes=self.config.db_mmap_size_bytes,
+            write_batch_size=self.config.db_write_batch_size,
+            write_flush_seconds=self.config.db_write_flush_ms / 1000.0,
+            write_queue_size=self.config.db_write_queue_size,
+            read_pool_size=self.config.db_read_pool_size,
+            busy_timeout_ms=self.config.db_busy_timeout_ms,
         )
         database.init_app(None)
         # Run idempotent startup migrations (backfill dedupe table if empty)
@@ -369,7 +377,12 @@ class ContainerBuilder:
         from app.extensions import socketio
 
         # Initialize emitter service
-        emitter_service = EmitterService(sio=socketio, replay_maxlen=100)
+        emitter_service = EmitterService(
+            sio=socketio,
+            replay_maxlen=100,
+            dashboard_keyframe_seconds=self.config.dashboard_keyframe_seconds,
+            emit_rate_hz=self.config.socketio_emit_rate_hz,
+        )
 
         # Create sensor data processor pipeline
         sensor_processor = CompositeProcessor(
@@ -410,7 +423,15 @@ class ContainerBuilder:
         models_path = Path(getattr(self.config, "models_path", "models"))
 
         # Initialize model registry
-        model_registry = ModelRegistry(base_path=models_path)
+        model_registry = ModelRegistry(
+            base_path=models_path,
+            cache_max_bytes=int(getattr(self.config, "model_cache_max_mb", 256)) * 1024 * 1024,
+        )
+
+        # Shared micro-batching for predictor inference
+        inference_service = BatchedInferenceService(
+            max_wait_ms=int(getattr(self.config, "ml_inference_max_wait_ms", 20)),
+        )
 
         # Feature engineering
         feature_engineer = FeatureEngineer()
@@ -419,6 +440,7 @@ class ContainerBuilder:
         # Climate optimizer (threshold_service, plant_handler, sun_times_service wired later)
         climate_optimizer = ClimateOptimizer(
             model_registry=model_registry,
+            inference_service=inference_service,
         )
 
         # Plant health monitor (threshold_service will be set later)
@@ -431,10 +453,15 @@ class ContainerBuilder:
         growth_predictor = PlantGrowthPredictor(
             model_registry=model_registry,
             enable_validation=True,
+            inference_service=inference_service,
         )
 
         # Disease predictor
-        disease_predictor = DiseasePredictor(repo_health=infra.ai_health_repo, model_registry=model_registry)
+        disease_predictor = DiseasePredictor(
+            repo_health=infra.ai_health_repo,
+            model_registry=model_registry,
+            inference_service=inference_service,
+        )
         disease_predictor.load_models()
 
         # Environmental health scorer (threshold_service wired later)
@@ -454,6 +481,7 @@ class ContainerBuilder:
             plant_service=None,
             model_registry=model_registry,
             feature_extractor=plant_health_feature_extractor,
+            inference_service=inference_service,
         )
         # Try to load ML models (gracefully handles missing models)
         plant_health_scorer.load_models()
@@ -484,6 +512,7 @@ class ContainerBuilder:
                     irrigation_ml_repo=infra.irrigation_ml_repo,
                     model_registry=model_registry,
                     feature_engineer=feature_engineer,
+                    inference_service=inference_service,
                 )
                 irrigation_predictor.load_models()
                 logger.info("✓ IrrigationPredictor initialized")
@@ -550,6 +579,7 @@ class ContainerBuilder:
             environmental_health_scorer=environmental_health_scorer,
             plant_health_scorer=plant_health_scorer,
             recommendation_provider=recommendation_provider,
+            inference_service=inference_service,
         )
 
     def build_optional_ai_components(
@@ -743,6 +773,7 @@ class ContainerBuilder:
             zigbee_service=mqtt.zigbee_service,
             cache_ttl_seconds=self.config.cache_ttl_seconds,
             cache_maxsize=self.config.cache_maxsize,
+            poll_workers=self.config.sensor_poll_workers,
         )
 
         # Actuator management service
@@ -766,6 +797,9 @@ class ContainerBuilder:
                 emitter=utils.emitter_service,
                 sensor_manager=sensor_management_service,
                 processor=utils.sensor_processor,
+                ingest_queue_size=self.config.mqtt_ingest_queue_size,
+                ingest_batch_size=self.config.mqtt_ingest_batch_size,
+                ingest_flush_seconds=self.config.mqtt_ingest_flush_ms / 1000.0,
             )
 
             # Ensure dashboard snapshots can resolve sensor metadata.
@@ -882,6 +916,7 @@ class ContainerBuilder:
             growth_repository=infra.growth_repo,
             threshold_service=threshold_service,
             scheduling_service=scheduling_service,
+            sensor_retention_days=int(getattr(self.config, "sensor_retention_days", 30)),
         )
 
         # Growth service
@@ -1083,6 +1118,10 @@ class ContainerBuilder:
         anomaly_service = AnomalyDetectionService()
         temp_system_health = SystemHealthService(anomaly_service=anomaly_service, alert_service=infra.alert_service)
         hardware = self.build_hardware_components(infra, mqtt, utils, temp_system_health)
+        # Warm the ingest-path anomaly windows from the last shutdown
+        ingest_anomaly_service = hardware.sensor_management_service.anomaly_service
+        ingest_anomaly_service.state_path = getattr(self.config, "anomaly_state_path", None)
+        ingest_anomaly_service.load_state()
 
         # Wire irrigation workflow service with actuator management service and scheduler
         # (ActuatorManagementService now contains all actuator manager functionality)
@@ -1118,6 +1157,16 @@ class ContainerBuilder:
         infra.irrigation_workflow_service.set_plant_service(app.plant_service)
         logger.info("✓ Irrigation workflow wired with calculator, pump calibration, and plant service")
 
+        # Event-driven schedule execution (started by the actuator.startup_sync task)
+        schedule_transition_engine = None
+        if scheduling_service:
+            schedule_transition_engine = ScheduleTransitionEngine(
+                scheduling_service,
+                hardware.actuator_management_service,
+                growth_service=app.growth_service,
+                analytics_service=app.analytics_service,
+            )
+
         # Build optional AI components
         optional_ai = self.build_optional_ai_components(ai, infra)
 
@@ -1163,6 +1212,7 @@ class ContainerBuilder:
             "harvest_service": app.harvest_service,
             "plant_journal_service": app.plant_journal_service,
             "scheduler": app.scheduler,
+            "schedule_transition_engine": schedule_transition_engine,
             "camera_service": app.camera_service,
             "mqtt_client": mqtt.mqtt_client,
             "zigbee_service": mqtt.zigbee_service,
@@ -1174,6 +1224,7 @@ class ContainerBuilder:
             "emitter_service": utils.emitter_service,
             "sensor_processor": utils.sensor_processor,
             "model_registry": ai.model_registry,
+            "inference_service": ai.inference_service,
             "disease_predictor": ai.disease_predictor,
             "plant_health_monitor": ai.plant_health_monitor,
             "climate_optimizer": ai.climate_optimizer,
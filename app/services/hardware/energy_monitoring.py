@@ -8,7 +8,8 @@ Integrates with Zigbee2MQTT smart switches that report energy usage.
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+import math
+from array import array
 from datetime import datetime, timedelta
 from typing import Any, Callable
 
@@ -16,6 +17,175 @@ from app.domain.energy import ConsumptionStats, EnergyReading, PowerProfile
 
 logger = logging.getLogger(__name__)
 
+# Intervals longer than this are treated as a reporting gap (device offline)
+# and contribute neither energy nor runtime.
+MAX_SAMPLE_GAP_SECONDS = 900.0
+
+
+class EnergySampleBuffer:
+    """
+    Fixed-capacity ring buffer of energy samples for one actuator.
+
+    Samples live in typed arrays (timestamps, watts, meter kWh, voltage,
+    power factor) so memory is bounded by ``capacity``. Alongside each sample
+    the buffer keeps running totals of trapezoidal energy, on-time and power,
+    so any window ending at the newest sample is answered with a binary
+    search on timestamps plus a subtraction. Peak power uses a max segment
+    tree over the slots.
+
+    Timestamps must be non-decreasing; late samples are clamped to the newest
+    timestamp so the binary search stays valid.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._start = 0
+        self._size = 0
+
+        def zeros() -> array:
+            return array("d", bytes(8 * capacity))
+
+        self._ts = zeros()
+        self._watts = zeros()
+        self._kwh = zeros()
+        self._voltage = zeros()
+        self._power_factor = zeros()
+        # Running totals up to and including each sample
+        self._cum_wh = zeros()
+        self._cum_on_s = zeros()
+        self._cum_watts = zeros()
+        self._peak_tree = array("d", [-math.inf]) * (2 * capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % self.capacity
+
+    def append(
+        self,
+        timestamp: float,
+        watts: float,
+        kwh: float | None = None,
+        voltage: float | None = None,
+        power_factor: float | None = None,
+    ) -> None:
+        """Add a sample, overwriting the oldest once the buffer is full."""
+        if self._size:
+            last = self._slot(self._size - 1)
+            timestamp = max(timestamp, self._ts[last])
+            dt = timestamp - self._ts[last]
+            prev_watts = self._watts[last]
+            if dt > MAX_SAMPLE_GAP_SECONDS:
+                dt = 0.0
+            cum_wh = self._cum_wh[last] + (prev_watts + watts) / 2.0 * dt / 3600.0
+            cum_on_s = self._cum_on_s[last] + (dt if prev_watts > 0 else 0.0)
+            cum_watts = self._cum_watts[last] + watts
+        else:
+            cum_wh = cum_on_s = 0.0
+            cum_watts = watts
+
+        if self._size < self.capacity:
+            slot = self._slot(self._size)
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        nan = math.nan
+        self._ts[slot] = timestamp
+        self._watts[slot] = watts
+        self._kwh[slot] = nan if kwh is None else kwh
+        self._voltage[slot] = nan if voltage is None else voltage
+        self._power_factor[slot] = nan if power_factor is None else power_factor
+        self._cum_wh[slot] = cum_wh
+        self._cum_on_s[slot] = cum_on_s
+        self._cum_watts[slot] = cum_watts
+
+        node = slot + self.capacity
+        self._peak_tree[node] = watts
+        node //= 2
+        while node:
+            self._peak_tree[node] = max(self._peak_tree[2 * node], self._peak_tree[2 * node + 1])
+            node //= 2
+
+    def index_at_or_after(self, timestamp: float) -> int:
+        """Logical index of the first sample with ts >= timestamp (len if none)."""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ts[self._slot(mid)] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _peak(self, lo_slot: int, hi_slot: int) -> float:
+        """Max watts over physical slots [lo_slot, hi_slot)."""
+        best = -math.inf
+        lo, hi = lo_slot + self.capacity, hi_slot + self.capacity
+        while lo < hi:
+            if lo & 1:
+                best = max(best, self._peak_tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = max(best, self._peak_tree[hi])
+            lo //= 2
+            hi //= 2
+        return best
+
+    def window_stats(self, since: float | None = None) -> dict[str, float] | None:
+        """
+        Aggregate the samples with ts >= since (all samples if None).
+
+        Returns:
+            Dict with sample_count, energy_kwh, average_power_watts,
+            peak_power_watts and runtime_hours, or None when empty.
+        """
+        first = 0 if since is None else self.index_at_or_after(since)
+        if first >= self._size:
+            return None
+        last = self._size - 1
+        first_slot, last_slot = self._slot(first), self._slot(last)
+        count = last - first + 1
+
+        energy_kwh = (self._cum_wh[last_slot] - self._cum_wh[first_slot]) / 1000.0
+        # Prefer the device's own cumulative meter when both ends report it
+        meter_start, meter_end = self._kwh[first_slot], self._kwh[last_slot]
+        if not math.isnan(meter_start) and not math.isnan(meter_end) and meter_end >= meter_start:
+            energy_kwh = meter_end - meter_start
+
+        if first_slot <= last_slot:
+            peak = self._peak(first_slot, last_slot + 1)
+        else:
+            peak = max(self._peak(first_slot, self.capacity), self._peak(0, last_slot + 1))
+
+        watts_sum = self._cum_watts[last_slot] - self._cum_watts[first_slot] + self._watts[first_slot]
+        return {
+            "sample_count": count,
+            "energy_kwh": energy_kwh,
+            "average_power_watts": watts_sum / count,
+            "peak_power_watts": peak,
+            "runtime_hours": (self._cum_on_s[last_slot] - self._cum_on_s[first_slot]) / 3600.0,
+        }
+
+    def voltages(self) -> list[float]:
+        return self._present(self._voltage)
+
+    def power_factors(self) -> list[float]:
+        return self._present(self._power_factor)
+
+    def _present(self, values: array) -> list[float]:
+        out = []
+        for i in range(self._size):
+            value = values[self._slot(i)]
+            if not math.isnan(value):
+                out.append(value)
+        return out
+
 
 class EnergyMonitoringService:
     """
@@ -29,16 +199,22 @@ class EnergyMonitoringService:
     - Power profiling per actuator type
     """
 
-    def __init__(self, electricity_rate_kwh: float = 0.12, analytics_repo=None):
+    def __init__(
+        self,
+        electricity_rate_kwh: float = 0.12,
+        analytics_repo=None,
+        max_readings_per_actuator: int = 1000,
+    ):
         """
         Initialize energy monitoring service.
 
         Args:
             electricity_rate_kwh: Cost per kWh in local currency
             analytics_repo: AnalyticsRepository for database persistence (optional)
+            max_readings_per_actuator: Ring buffer capacity per actuator
         """
-        # Storage (in-memory cache for fast access)
-        self.readings: dict[int, list[EnergyReading]] = defaultdict(list)
+        # Storage (in-memory ring buffers for fast access)
+        self.samples: dict[int, EnergySampleBuffer] = {}
         self.power_profiles: dict[str, PowerProfile] = {}
         self.latest_readings: dict[int, EnergyReading] = {}
 
@@ -47,7 +223,7 @@ class EnergyMonitoringService:
 
         # Configuration
         self.electricity_rate = electricity_rate_kwh
-        self.max_readings_per_actuator = 1000  # Limit memory usage
+        self.max_readings_per_actuator = max_readings_per_actuator  # Limit memory usage
 
         # Callbacks
         self.power_threshold_callbacks: list[Callable[[int, float], None]] = []
@@ -93,13 +269,19 @@ class EnergyMonitoringService:
         """
         actuator_id = reading.actuator_id
 
-        # Store in memory (fast access)
-        self.readings[actuator_id].append(reading)
+        # Store in memory (fast access); readings without power carry no usage data
         self.latest_readings[actuator_id] = reading
-
-        # Limit memory usage
-        if len(self.readings[actuator_id]) > self.max_readings_per_actuator:
-            self.readings[actuator_id].pop(0)
+        if reading.power is not None:
+            buffer = self.samples.get(actuator_id)
+            if buffer is None:
+                buffer = self.samples[actuator_id] = EnergySampleBuffer(self.max_readings_per_actuator)
+            buffer.append(
+                reading.timestamp.timestamp(),
+                reading.power,
+                kwh=reading.energy,
+                voltage=reading.voltage,
+                power_factor=reading.power_factor,
+            )
 
         # Persist to database
         if self.analytics_repo:
@@ -143,6 +325,10 @@ class EnergyMonitoringService:
         """
         Get consumption statistics for an actuator.
 
+        Energy is the device's cumulative meter delta when available, else the
+        trapezoidal integral of power; runtime is the time spent between
+        samples with power > 0.
+
         Args:
             actuator_id: Actuator ID
             hours: Number of hours to analyze (None = all)
@@ -150,42 +336,23 @@ class EnergyMonitoringService:
         Returns:
             ConsumptionStats or None
         """
-        readings = self.readings.get(actuator_id, [])
-        if not readings:
-            return None
-
-        # Filter by time if specified
-        if hours:
-            cutoff = datetime.now() - timedelta(hours=hours)
-            readings = [r for r in readings if r.timestamp >= cutoff]
-
-        if not readings:
+        buffer = self.samples.get(actuator_id)
+        if buffer is None:
             return None
 
-        # Calculate statistics
-        power_values = [r.power for r in readings if r.power is not None]
-        if not power_values:
+        since = (datetime.now() - timedelta(hours=hours)).timestamp() if hours else None
+        stats = buffer.window_stats(since)
+        if stats is None:
             return None
 
-        total_energy_kwh = 0.0
-        if readings[-1].energy and readings[0].energy:
-            total_energy_kwh = readings[-1].energy - readings[0].energy
-
-        average_power = sum(power_values) / len(power_values)
-        peak_power = max(power_values)
-
-        # Calculate runtime (time when power > 0)
-        runtime_hours = sum(1 for r in readings if r.power and r.power > 0) / (3600 / 60)  # Assuming 1-minute intervals
-
-        cost = total_energy_kwh * self.electricity_rate
-
+        total_energy_kwh = stats["energy_kwh"]
         return ConsumptionStats(
             actuator_id=actuator_id,
             total_energy_kwh=total_energy_kwh,
-            average_power_watts=average_power,
-            peak_power_watts=peak_power,
-            runtime_hours=runtime_hours,
-            cost_estimate=cost,
+            average_power_watts=stats["average_power_watts"],
+            peak_power_watts=stats["peak_power_watts"],
+            runtime_hours=stats["runtime_hours"],
+            cost_estimate=total_energy_kwh * self.electricity_rate,
         )
 
     def get_total_power_consumption(self, actuator_ids: list[int]) -> float:
@@ -255,8 +422,7 @@ class EnergyMonitoringService:
 
     def clear_readings(self, actuator_id: int) -> None:
         """Clear readings for an actuator"""
-        if actuator_id in self.readings:
-            del self.readings[actuator_id]
+        self.samples.pop(actuator_id, None)
         if actuator_id in self.latest_readings:
             del self.latest_readings[actuator_id]
         logger.info("Cleared energy readings for actuator %s", actuator_id)
@@ -268,16 +434,16 @@ class EnergyMonitoringService:
         Returns:
             Dictionary with efficiency metrics
         """
-        readings = self.readings.get(actuator_id, [])
-        if len(readings) < 10:
+        buffer = self.samples.get(actuator_id)
+        if buffer is None or len(buffer) < 10:
             return None
 
         # Power factor analysis
-        power_factors = [r.power_factor for r in readings if r.power_factor]
+        power_factors = [pf for pf in buffer.power_factors() if pf]
         avg_power_factor = sum(power_factors) / len(power_factors) if power_factors else None
 
         # Voltage stability
-        voltages = [r.voltage for r in readings if r.voltage]
+        voltages = [v for v in buffer.voltages() if v]
         voltage_variance = 0.0
         if len(voltages) > 1:
             avg_voltage = sum(voltages) / len(voltages)
@@ -286,7 +452,7 @@ class EnergyMonitoringService:
         return {
             "average_power_factor": round(avg_power_factor, 3) if avg_power_factor else None,
             "voltage_variance": round(voltage_variance, 2),
-            "reading_count": len(readings),
+            "reading_count": len(buffer),
         }
 
     def _persist_reading(
@@ -25,6 +25,15 @@ Architecture:
     - Primary metrics snapshots (/dashboard)
     - Internal events (EventBus) for automation and persistence.
 
+Ingest stage:
+------------
+With ``ingest_queue_size > 0`` the paho network thread only appends
+``(topic, payload, retained, recv_ts)`` to a bounded ring buffer (oldest
+message dropped when full) so keepalives are never delayed by processing.
+One ingest worker drains it in micro-batches, skips retained messages that
+repeat the last payload seen on their topic, and runs the readings through
+``processor.process_batch()``.
+
 Author: Sebastian Gomez
 Updated: January 2026
 """
@@ -34,7 +43,9 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -95,6 +106,9 @@ class MQTTSensorService:
         sensor_manager: "SensorManagementService",
         processor: IDataProcessor,
         metrics: Any | None = None,
+        ingest_queue_size: int = 0,
+        ingest_batch_size: int = 64,
+        ingest_flush_seconds: float = 0.05,
     ):
         """
         Initializes the service and binds events.
@@ -105,6 +119,10 @@ class MQTTSensorService:
             sensor_manager: Primary source of truth for Sensor entities.
             processor: The processing pipeline (must implement process and build_payloads).
             metrics: Optional Prometheus/OpenTelemetry metrics collector.
+            ingest_queue_size: Ring-buffer capacity for the ingest stage
+                (0 processes messages inline on the MQTT thread).
+            ingest_batch_size: Maximum messages per ingest micro-batch.
+            ingest_flush_seconds: Max wait to fill a batch after its first message.
         """
         self.mqtt_client = mqtt_client
         self.emitter = emitter
@@ -128,6 +146,18 @@ class MQTTSensorService:
         # Cooldown for 'unmapped device' logs to avoid log flooding
         self._unmapped_log_cooldown_s = int(os.getenv("SYSGROW_UNMAPPED_LOG_COOLDOWN", "600"))
 
+        # Ingest stage: ring buffer filled by the MQTT thread, drained by one worker.
+        self._ingest_capacity = max(0, int(ingest_queue_size))
+        self._ingest_batch_size = max(1, int(ingest_batch_size))
+        self._ingest_flush_s = max(0.0, float(ingest_flush_seconds))
+        self._ingest_buffer: deque[tuple[str, bytes, bool, float]] = deque(maxlen=self._ingest_capacity or None)
+        self._ingest_cond = threading.Condition()
+        self._ingest_thread: threading.Thread | None = None
+        self._ingest_busy = False
+        self._ingest_stopping = False
+        # Last payload per topic, to skip retained redeliveries of data already processed.
+        self._last_payload_by_topic: dict[str, bytes] = {}
+
         # Keep caches coherent when sensors are modified.
         try:
             self.event_bus.subscribe(DeviceEvent.SENSOR_CREATED, lambda _p: self._clear_mapping_caches())
@@ -173,8 +203,8 @@ class MQTTSensorService:
         Central message router for ALL incoming MQTT traffic.
 
         Guaranteed not to raise exceptions to prevent killing the MQTT loop.
+        When the ingest stage is enabled this only enqueues the message.
         """
-        t0 = time.perf_counter()
         topic = str(getattr(msg, "topic", ""))
         payload_bytes = getattr(msg, "payload", b"")
         source = self._source_from_topic(topic)
@@ -185,11 +215,28 @@ class MQTTSensorService:
             with contextlib.suppress(Exception):
                 logger.info("MQTT [%s] -> %s", topic, payload_bytes.decode(errors="ignore")[:250])
 
+        if self._ingest_capacity:
+            retain = getattr(msg, "retain", False)
+            self._enqueue_message(topic, payload_bytes, isinstance(retain, (bool, int)) and bool(retain), source)
+            return
+
+        self._route_message(topic, payload_bytes, source=source)
+
+    def _route_message(
+        self,
+        topic: str,
+        payload_bytes: bytes,
+        *,
+        source: str,
+        readings: list[tuple[SensorEntity, dict[str, Any], str]] | None = None,
+    ) -> None:
+        """Route one message by topic; registered readings go to ``readings`` when batching."""
+        t0 = time.perf_counter()
         try:
             if topic.startswith("zigbee2mqtt/"):
-                self._handle_mqtt_message(topic, payload_bytes)
+                self._handle_mqtt_message(topic, payload_bytes, readings)
             elif topic.startswith("sysgrow/"):
-                self._handle_sysgrow_message(topic, payload_bytes)
+                self._handle_sysgrow_message(topic, payload_bytes, readings)
             else:
                 logger.warning("Unroutable MQTT topic: %s", topic)
                 self.metrics.inc("mqtt_messages_unknown_topic_total")
@@ -201,6 +248,103 @@ class MQTTSensorService:
         finally:
             self.metrics.observe("mqtt_message_handle_latency_seconds", time.perf_counter() - t0, source=source)
 
+    # ---------------------------------------------------------------------
+    # Ingest Stage (micro-batching off the MQTT network thread)
+    # ---------------------------------------------------------------------
+
+    def _enqueue_message(self, topic: str, payload: bytes, retained: bool, source: str) -> None:
+        """Append a message to the ring buffer; runs on the MQTT network thread."""
+        with self._ingest_cond:
+            if self._ingest_stopping:
+                dropped = True
+            else:
+                # deque(maxlen) evicts the oldest message when full.
+                dropped = len(self._ingest_buffer) == self._ingest_capacity
+                self._ingest_buffer.append((topic, payload, retained, time.monotonic()))
+                depth = len(self._ingest_buffer)
+                if self._ingest_thread is None:
+                    self._ingest_thread = threading.Thread(
+                        target=self._ingest_loop, name="MQTTSensorIngest", daemon=True
+                    )
+                    self._ingest_thread.start()
+                if depth == 1 or depth >= self._ingest_batch_size:
+                    self._ingest_cond.notify_all()
+        if dropped:
+            self.metrics.inc("mqtt_ingest_dropped_total", source=source)
+
+    def _ingest_loop(self) -> None:
+        """Drain the ring buffer in micro-batches until shutdown."""
+        while True:
+            with self._ingest_cond:
+                while not self._ingest_buffer and not self._ingest_stopping:
+                    self._ingest_cond.wait()
+                if not self._ingest_buffer:
+                    return
+                # Give a burst a moment to accumulate into one batch.
+                deadline = time.monotonic() + self._ingest_flush_s
+                while len(self._ingest_buffer) < self._ingest_batch_size and not self._ingest_stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._ingest_cond.wait(remaining)
+                take = min(self._ingest_batch_size, len(self._ingest_buffer))
+                batch = [self._ingest_buffer.popleft() for _ in range(take)]
+                depth = len(self._ingest_buffer)
+                self._ingest_busy = True
+
+            self.metrics.observe("mqtt_ingest_queue_depth", depth)
+            self.metrics.observe("mqtt_ingest_batch_size", len(batch))
+            try:
+                self._process_message_batch(batch)
+            except Exception as exc:
+                logger.exception("MQTT ingest batch failed: %s", exc)
+            finally:
+                with self._ingest_cond:
+                    self._ingest_busy = False
+                    self._ingest_cond.notify_all()
+
+    def _process_message_batch(self, batch: list[tuple[str, bytes, bool, float]]) -> None:
+        """Route a micro-batch, then run its registered readings through the pipeline together."""
+        readings: list[tuple[SensorEntity, dict[str, Any], str]] = []
+        received: list[tuple[str, float]] = []
+        for topic, payload, retained, recv_ts in batch:
+            source = self._source_from_topic(topic)
+            received.append((source, recv_ts))
+            if retained and self._last_payload_by_topic.get(topic) == payload:
+                self.metrics.inc("mqtt_ingest_retained_duplicates_total", source=source)
+                continue
+            self._last_payload_by_topic[topic] = payload
+            self._route_message(topic, payload, source=source, readings=readings)
+
+        if readings:
+            self._ingest_registered_batch(readings)
+
+        done = time.monotonic()
+        for source, recv_ts in received:
+            self.metrics.observe("mqtt_ingest_e2e_latency_seconds", done - recv_ts, source=source)
+
+    def flush_ingest(self, timeout: float = 5.0) -> bool:
+        """Block until every buffered message has been processed."""
+        deadline = time.monotonic() + timeout
+        with self._ingest_cond:
+            while self._ingest_buffer or self._ingest_busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._ingest_thread is None:
+                    return False
+                self._ingest_cond.wait(remaining)
+        return True
+
+    def get_ingest_stats(self) -> dict[str, Any]:
+        """Current ingest-stage state (queue depth/capacity) for health endpoints."""
+        with self._ingest_cond:
+            return {
+                "enabled": bool(self._ingest_capacity),
+                "queue_depth": len(self._ingest_buffer),
+                "capacity": self._ingest_capacity,
+                "batch_size": self._ingest_batch_size,
+                "running": bool(self._ingest_thread and self._ingest_thread.is_alive()),
+            }
+
     def _source_from_topic(self, topic: str) -> str:
         """Categorizes the MQTT message source based on its topic prefix."""
         if topic.startswith("zigbee2mqtt/"):
@@ -213,7 +357,12 @@ class MQTTSensorService:
     # Zigbee2MQTT handling
     # ---------------------------------------------------------------------
 
-    def _handle_mqtt_message(self, topic: str, payload: bytes) -> None:
+    def _handle_mqtt_message(
+        self,
+        topic: str,
+        payload: bytes,
+        readings: list[tuple[SensorEntity, dict[str, Any], str]] | None = None,
+    ) -> None:
         """
         Handles Zigbee2MQTT messages (Format: zigbee2mqtt/<friendly_name>).
 
@@ -250,7 +399,7 @@ class MQTTSensorService:
             self.metrics.inc("mqtt_dropped_invalid_unit_total", source="zigbee2mqtt")
             return
 
-        self._ingest_registered(sensor=sensor, raw_data=data, source="zigbee2mqtt")
+        self._submit_reading(sensor, data, "zigbee2mqtt", readings)
 
     def _handle_zigbee_availability(self, friendly_name: str, payload: bytes) -> None:
         """
@@ -311,7 +460,12 @@ class MQTTSensorService:
     # SYSGrow Zigbee2MQTT-style handling
     # ---------------------------------------------------------------------
 
-    def _handle_sysgrow_message(self, topic: str, payload: bytes) -> None:
+    def _handle_sysgrow_message(
+        self,
+        topic: str,
+        payload: bytes,
+        readings: list[tuple[SensorEntity, dict[str, Any], str]] | None = None,
+    ) -> None:
         """
         Handles SYSGrow Zigbee2MQTT-style messages.
 
@@ -382,7 +536,7 @@ class MQTTSensorService:
 
             # Pass raw data directly - normalization is handled by the processor pipeline
             # (TransformationProcessor.standardize_fields() handles field mapping)
-            self._ingest_registered(sensor=sensor, raw_data=data, source="sysgrow")
+            self._submit_reading(sensor, data, "sysgrow", readings)
 
     def _handle_sysgrow_bridge(self, topic: str, payload: bytes) -> None:
         """
@@ -560,6 +714,19 @@ class MQTTSensorService:
     # Processing & Emission Flow
     # ---------------------------------------------------------------------
 
+    def _submit_reading(
+        self,
+        sensor: SensorEntity,
+        raw_data: dict[str, Any],
+        source: str,
+        readings: list[tuple[SensorEntity, dict[str, Any], str]] | None,
+    ) -> None:
+        """Process a registered reading now, or collect it for the current micro-batch."""
+        if readings is None:
+            self._ingest_registered(sensor=sensor, raw_data=raw_data, source=source)
+        else:
+            readings.append((sensor, raw_data, source))
+
     def _ingest_registered(self, *, sensor: SensorEntity, raw_data: dict[str, Any], source: str) -> None:
         """
         Orchestrates the transition from raw hardware data to enriched system domain models.
@@ -581,24 +748,10 @@ class MQTTSensorService:
             # 1) Execute Pipeline: Raw Data -> Domain Reading
             # This triggers: Standardization -> Validation -> Calibration -> Transformation -> Enrichment
             reading = self.processor.process(sensor, raw_data)
-
-            # Sync with hardware-level adapter (if registered) to support on-demand /read API
-            try:
-                active_sensor = self._get_sensor_entity(sensor_id)
-                if (
-                    active_sensor
-                    and hasattr(active_sensor, "_adapter")
-                    and active_sensor._adapter
-                    and hasattr(active_sensor._adapter, "update_data")
-                ):
-                    active_sensor._adapter.update_data(raw_data)
-            except Exception as e:
-                logger.debug("Failed to sync adapter for sensor %s: %s", sensor_id, e)
+            self._sync_adapter(sensor_id, raw_data)
 
             # verify reading contains a valid unit (pipeline should ensure this)
-            reading_unit = _safe_int(getattr(reading, "unit_id", 0))
-            if reading_unit <= 0:
-                logger.error("Pipeline failure: Reading for sensor %s missing unit context", sensor_id)
+            if not self._has_unit_context(reading, sensor_id):
                 return
 
             # 2) Build Multi-Target Payloads (WebSocket/Events bundle)
@@ -606,25 +759,8 @@ class MQTTSensorService:
             if prepared is None:
                 return
 
-            # Track health status (last seen and processing result)
-            now = utc_now()
-            self.last_seen[sensor_id] = now
-            self.sensor_health[sensor_id] = {
-                "last_seen": now.isoformat(),
-                "status": getattr(getattr(reading, "status", None), "value", "unknown"),
-                "is_anomaly": bool(getattr(reading, "is_anomaly", False)),
-                "source": source,
-            }
-
-            # 3) Dispatch internal events (Automation layers, MQTT-back-persistence, etc)
-            controller_events = getattr(prepared, "controller_events", []) or []
-            for event_name, payload in controller_events:
-                self.event_bus.publish(event_name, payload)
-
-            # 4) Broadcast to external clients
-            self._emit_prepared(prepared, source=source)
-
-            self.metrics.inc("mqtt_processed_total", source=source)
+            # 3) + 4) Publish internal events and broadcast
+            self._dispatch_prepared(sensor_id=sensor_id, reading=reading, prepared=prepared, source=source)
 
         except ProcessorError as exc:
             logger.error("Data processing failed for sensor %s: %s", sensor_id, exc)
@@ -635,6 +771,83 @@ class MQTTSensorService:
         finally:
             self.metrics.observe("mqtt_processing_latency_seconds", time.perf_counter() - t0, source=source)
 
+    def _ingest_registered_batch(self, readings: list[tuple[SensorEntity, dict[str, Any], str]]) -> None:
+        """Batch counterpart of _ingest_registered: one pipeline pass, one snapshot per unit."""
+        t0 = time.perf_counter()
+        readings = [item for item in readings if _safe_int(getattr(item[0], "unit_id", 0)) > 0]
+        if not readings:
+            return
+        try:
+            results = self.processor.process_batch([(sensor, raw_data) for sensor, raw_data, _ in readings])
+        except Exception as exc:
+            logger.exception("Unexpected batch processing error: %s", exc)
+            for _, _, source in readings:
+                self.metrics.inc("mqtt_processing_errors_total", source=source, kind="exception")
+            return
+
+        for (sensor, raw_data, source), item in zip(readings, results, strict=False):
+            sensor_id = _safe_int(getattr(sensor, "id", 0))
+            if item.error is not None:
+                logger.error("Data processing failed for sensor %s: %s", sensor_id, item.error)
+                self.metrics.inc("mqtt_processing_errors_total", source=source, kind="processor_error")
+                continue
+            try:
+                self._sync_adapter(sensor_id, raw_data)
+                if item.prepared is None or not self._has_unit_context(item.reading, sensor_id):
+                    continue
+                self._dispatch_prepared(
+                    sensor_id=sensor_id, reading=item.reading, prepared=item.prepared, source=source
+                )
+            except Exception as exc:
+                logger.exception("Unexpected processing error (source=%s): %s", source, exc)
+                self.metrics.inc("mqtt_processing_errors_total", source=source, kind="exception")
+
+        elapsed = time.perf_counter() - t0
+        self.metrics.observe("mqtt_batch_processing_latency_seconds", elapsed, size=len(readings))
+
+    def _sync_adapter(self, sensor_id: int, raw_data: dict[str, Any]) -> None:
+        """Sync with hardware-level adapter (if registered) to support on-demand /read API."""
+        try:
+            active_sensor = self._get_sensor_entity(sensor_id)
+            if (
+                active_sensor
+                and hasattr(active_sensor, "_adapter")
+                and active_sensor._adapter
+                and hasattr(active_sensor._adapter, "update_data")
+            ):
+                active_sensor._adapter.update_data(raw_data)
+        except Exception as e:
+            logger.debug("Failed to sync adapter for sensor %s: %s", sensor_id, e)
+
+    @staticmethod
+    def _has_unit_context(reading: Any, sensor_id: int) -> bool:
+        if _safe_int(getattr(reading, "unit_id", 0)) <= 0:
+            logger.error("Pipeline failure: Reading for sensor %s missing unit context", sensor_id)
+            return False
+        return True
+
+    def _dispatch_prepared(self, *, sensor_id: int, reading: Any, prepared: Any, source: str) -> None:
+        """Record health, publish controller events and broadcast a prepared reading."""
+        # Track health status (last seen and processing result)
+        now = utc_now()
+        self.last_seen[sensor_id] = now
+        self.sensor_health[sensor_id] = {
+            "last_seen": now.isoformat(),
+            "status": getattr(getattr(reading, "status", None), "value", "unknown"),
+            "is_anomaly": bool(getattr(reading, "is_anomaly", False)),
+            "source": source,
+        }
+
+        # Dispatch internal events (Automation layers, MQTT-back-persistence, etc)
+        controller_events = getattr(prepared, "controller_events", []) or []
+        for event_name, payload in controller_events:
+            self.event_bus.publish(event_name, payload)
+
+        # Broadcast to external clients
+        self._emit_prepared(prepared, source=source)
+
+        self.metrics.inc("mqtt_processed_total", source=source)
+
     def _emit_prepared(self, prepared: Any, *, source: str) -> None:
         """Broadcasts processed results to WebSocket namespaces."""
         t0 = time.perf_counter()
@@ -697,7 +910,7 @@ class MQTTSensorService:
             if hasattr(self.processor, "_priority") and self.processor._priority:
                 # Clear snapshots and primary mappings
                 self.processor._priority.primary_sensors.clear()
-                self.processor._priority._snapshot_cache.clear()
+                self.processor._priority.clear_cache()
                 logger.info("MQTTSensorService: PriorityProcessor state cleared")
         except Exception as e:
             logger.warning("Failed to clear PriorityProcessor state: %s", e)
@@ -797,6 +1010,12 @@ class MQTTSensorService:
         }
 
     def shutdown(self) -> None:
-        """Gracefully releases MQTT subscriptions."""
+        """Drains the ingest stage and releases MQTT subscriptions."""
         logger.info("MQTTSensorService shutting down")
+        with self._ingest_cond:
+            self._ingest_stopping = True
+            thread = self._ingest_thread
+            self._ingest_cond.notify_all()
+        if thread is not None:
+            thread.join(timeout=5.0)
         # MQTT client cleanup handled by container/framework
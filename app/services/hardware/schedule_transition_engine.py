@@ -0,0 +1,520 @@
+"""
+Schedule Transition Engine
+==========================
+
+Drives actuators from DeviceSchedules by firing exactly at schedule edges.
+
+Instead of re-evaluating every enabled schedule on a fixed sweep, the engine
+asks SchedulingService for each schedule's next activation/deactivation
+instant and keeps those instants in a min-heap. A single thread sleeps until
+the earliest edge, re-evaluates only the affected unit, and recomputes only the
+schedules that fired. Schedule edits arrive through SchedulingService change
+callbacks and are applied immediately.
+
+Schedules that follow live lux readings (sensor/hybrid photoperiods) cannot be
+predicted and are re-checked every ``fallback_seconds`` instead.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from app.domain.schedules import Schedule
+from app.enums import ScheduleState
+
+if TYPE_CHECKING:
+    from app.services.hardware.scheduling_service import SchedulingService
+
+logger = logging.getLogger(__name__)
+
+TRANSITION_ERRORS = (
+    RuntimeError,
+    ValueError,
+    TypeError,
+    AttributeError,
+    OSError,
+    ImportError,
+)
+
+
+def get_active_unit_ids(growth_service) -> list:
+    """Get list of active unit IDs from growth service."""
+    if not growth_service:
+        return []
+
+    try:
+        # Try to get unit runtimes (preferred - only active units)
+        runtimes = getattr(growth_service, "get_unit_runtimes", None)
+        if runtimes:
+            return list(runtimes().keys())
+
+        # Fall back to listing all units
+        units = growth_service.list_units()
+        return [u.get("unit_id") or u.get("id") for u in units if u]
+
+    except TRANSITION_ERRORS as e:
+        logger.warning("Failed to get unit IDs: %s", e)
+        return []
+
+
+def get_unit_timezone(growth_service, unit_id: int) -> str | None:
+    """Resolve the timezone string for a unit (if configured)."""
+    if not growth_service:
+        return None
+    try:
+        runtime = growth_service.get_unit_runtime(unit_id)
+        settings = getattr(runtime, "settings", None) if runtime else None
+        return getattr(settings, "timezone", None) if settings else None
+    except TRANSITION_ERRORS as exc:
+        logger.debug("Could not resolve timezone for unit %s: %s", unit_id, exc)
+        return None
+
+
+def get_lux_reading(analytics_service, unit_id: int) -> float | None:
+    """Get current lux reading for a unit from analytics service."""
+    if not analytics_service:
+        return None
+
+    try:
+        reading = analytics_service.get_latest_sensor_reading(unit_id=unit_id)
+        if not reading:
+            return None
+        val = reading.get("lux")
+        if val is not None:
+            return float(val)
+
+        return None
+
+    except TRANSITION_ERRORS as e:
+        logger.debug("Could not get lux reading for unit %s: %s", unit_id, e)
+        return None
+
+
+class ScheduleTransitionEngine:
+    """
+    Event-driven executor for device schedules.
+
+    State that used to live in module globals of the schedule-check task
+    (last schedule state, last command and driving schedule per actuator) is
+    owned here. ``reconcile()`` performs a full sweep and rebuilds the heap;
+    it runs at startup and as a periodic safety net.
+    """
+
+    def __init__(
+        self,
+        scheduling_service: "SchedulingService",
+        actuator_service: Any,
+        *,
+        growth_service: Any | None = None,
+        analytics_service: Any | None = None,
+        fallback_seconds: float = 30.0,
+        horizon_days: int = 8,
+    ):
+        """
+        Initialize the transition engine.
+
+        Args:
+            scheduling_service: Schedule storage and evaluation
+            actuator_service: ActuatorManagementService used to switch devices
+            growth_service: Source of active units and their timezones
+            analytics_service: Source of lux readings for sensor photoperiods
+            fallback_seconds: Re-check interval for schedules that follow live lux
+            horizon_days: How far ahead to search for the next edge
+        """
+        self.scheduling_service = scheduling_service
+        self.actuator_service = actuator_service
+        self.growth_service = growth_service
+        self.analytics_service = analytics_service
+        self.fallback_seconds = max(1.0, float(fallback_seconds))
+        self.horizon_days = max(1, int(horizon_days))
+
+        # Transition state (keyed by schedule_id / actuator_id)
+        self._schedule_last_state: dict[int, bool] = {}
+        self._actuator_last_command: dict[int, tuple[str, float | None]] = {}
+        self._actuator_last_schedule: dict[int, int | None] = {}
+
+        # Min-heap of (fire_at_epoch, seq, unit_id, schedule_id); an entry is live
+        # only while it matches _next_edge[schedule_id] == (fire_at_epoch, unit_id)
+        self._heap: list[tuple[float, int, int, int]] = []
+        self._next_edge: dict[int, tuple[float, int]] = {}
+        self._seq = itertools.count()
+        self._dirty: dict[int, set[int] | None] = {}  # unit_id -> changed schedule ids (None = all)
+
+        self._cond = threading.Condition()
+        self._eval_lock = threading.RLock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+
+        self._stats = {"edges_fired": 0, "transitions": 0, "reconciles": 0, "changes_applied": 0}
+
+        scheduling_service.register_change_callback(self.on_schedule_changed)
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """Adopt startup-sync state, build the heap and start the edge thread."""
+        if self._running:
+            return
+        with self._eval_lock:
+            self._schedule_last_state = self.scheduling_service.get_last_execution_states()
+            self._actuator_last_command = {}
+            self._actuator_last_schedule = {}
+        self.reconcile()
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="schedule-transitions", daemon=True)
+        self._thread.start()
+        logger.info("ScheduleTransitionEngine started (%s schedules queued)", len(self._next_edge))
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the edge thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    # ==================== Public API ====================
+
+    def on_schedule_changed(self, unit_id: int, schedule_id: int | None = None) -> None:
+        """SchedulingService callback: re-evaluate the unit and re-plan the changed schedule(s)."""
+        with self._cond:
+            if schedule_id is None:
+                self._dirty[unit_id] = None
+            elif unit_id not in self._dirty:
+                self._dirty[unit_id] = {schedule_id}
+            elif self._dirty[unit_id] is not None:
+                self._dirty[unit_id].add(schedule_id)
+            self._cond.notify_all()
+
+    def reconcile(self) -> dict[str, Any]:
+        """
+        Evaluate every active unit and rebuild the edge heap.
+
+        Returns:
+            Summary with units_checked, schedules_checked, transitions and errors
+        """
+        results = self._new_results()
+        with self._cond:
+            self._heap = []
+            self._next_edge = {}
+        for unit_id in get_active_unit_ids(self.growth_service):
+            schedules = self.evaluate_unit(unit_id, results)
+            self._plan(unit_id, schedules, None)
+        self._stats["reconciles"] += 1
+        self._stats["transitions"] += results["transitions"]
+        return results
+
+    def evaluate_unit(
+        self,
+        unit_id: int,
+        results: dict[str, Any] | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> list[Schedule]:
+        """
+        Evaluate a unit's enabled schedules and switch actuators on state edges.
+
+        Returns:
+            The enabled schedules that were evaluated
+        """
+        results = results if results is not None else self._new_results()
+        results["units_checked"] += 1
+        with self._eval_lock:
+            try:
+                return self._evaluate_unit(unit_id, results, now)
+            except TRANSITION_ERRORS as e:
+                error_msg = f"Unit {unit_id}: {e}"
+                results["errors"].append(error_msg)
+                logger.error("Error processing unit schedules: %s", error_msg)
+                return []
+
+    def get_status(self) -> dict[str, Any]:
+        """Engine status for health endpoints."""
+        with self._cond:
+            next_fire = self._heap[0][0] if self._heap else None
+            queued = len(self._next_edge)
+        return {
+            "running": self._running,
+            "queued_schedules": queued,
+            "next_transition": datetime.fromtimestamp(next_fire).isoformat() if next_fire else None,
+            **self._stats,
+        }
+
+    # ==================== Edge Loop ====================
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._dirty:
+                    timeout = self._heap[0][0] - time.time() if self._heap else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+                dirty, self._dirty = self._dirty, {}
+                due = self._pop_due(time.time())
+
+            try:
+                for unit_id, schedule_ids in dirty.items():
+                    self._stats["changes_applied"] += 1
+                    self._replan_unit(unit_id, schedule_ids)
+                for unit_id, schedule_ids in due.items():
+                    self._stats["edges_fired"] += len(schedule_ids)
+                    self._replan_unit(unit_id, schedule_ids)
+            except Exception as e:
+                # Keep the engine alive; the periodic reconcile repairs the heap
+                logger.exception("Schedule transition loop error: %s", e)
+
+    def _pop_due(self, now_ts: float) -> dict[int, set[int]]:
+        due: dict[int, set[int]] = {}
+        while self._heap and self._heap[0][0] <= now_ts:
+            fire_at, _seq, unit_id, schedule_id = heapq.heappop(self._heap)
+            if self._next_edge.get(schedule_id) != (fire_at, unit_id):
+                continue  # superseded by a later plan
+            del self._next_edge[schedule_id]
+            due.setdefault(unit_id, set()).add(schedule_id)
+        return due
+
+    def _replan_unit(self, unit_id: int, schedule_ids: set[int] | None) -> None:
+        """Evaluate a unit and re-plan ``schedule_ids`` (all of the unit's schedules when None)."""
+        with self._cond:
+            for sid in [
+                sid
+                for sid, (_fire_at, entry_unit) in self._next_edge.items()
+                if entry_unit == unit_id and (schedule_ids is None or sid in schedule_ids)
+            ]:
+                del self._next_edge[sid]
+        if unit_id not in get_active_unit_ids(self.growth_service):
+            return  # unit stopped; re-planned when its schedules are loaded again
+
+        results = self._new_results()
+        schedules = self.evaluate_unit(unit_id, results)
+        self._stats["transitions"] += results["transitions"]
+        self._plan(unit_id, schedules, schedule_ids)
+
+    def _plan(self, unit_id: int, schedules: list[Schedule], only: set[int] | None) -> None:
+        """Queue the next edge of each schedule (restricted to ``only`` when given)."""
+        unit_timezone = get_unit_timezone(self.growth_service, unit_id)
+        entries: list[tuple[int, float]] = []
+        for schedule in schedules:
+            sid = schedule.schedule_id
+            if sid is None or (only is not None and sid not in only):
+                continue
+            if self.scheduling_service.depends_on_live_light(schedule):
+                fire_at = time.time() + self.fallback_seconds
+            else:
+                try:
+                    edge = self.scheduling_service.next_transition_time(
+                        schedule,
+                        unit_timezone=unit_timezone,
+                        horizon_days=self.horizon_days,
+                    )
+                except TRANSITION_ERRORS as e:
+                    logger.warning("Could not plan schedule %s: %s", sid, e)
+                    edge = None
+                # No edge within the horizon: look again once the horizon has passed
+                fire_at = edge.timestamp() if edge else time.time() + self.horizon_days * 86400
+            entries.append((sid, fire_at))
+
+        with self._cond:
+            for sid, fire_at in entries:
+                self._next_edge[sid] = (fire_at, unit_id)
+                heapq.heappush(self._heap, (fire_at, next(self._seq), unit_id, sid))
+            self._cond.notify_all()
+
+    # ==================== Evaluation ====================
+
+    @staticmethod
+    def _new_results() -> dict[str, Any]:
+        return {"units_checked": 0, "schedules_checked": 0, "transitions": 0, "errors": []}
+
+    def _evaluate_unit(self, unit_id: int, results: dict[str, Any], now: datetime | None) -> list[Schedule]:
+        scheduling_service = self.scheduling_service
+        actuator_service = self.actuator_service
+
+        unit_timezone = get_unit_timezone(self.growth_service, unit_id)
+        tz = Schedule._resolve_timezone(unit_timezone)
+        if now is None:
+            now = datetime.now(tz) if tz else datetime.now()
+
+        # Get enabled schedules for this unit
+        schedules = scheduling_service.get_schedules_for_unit(unit_id, enabled_only=True)
+        if not schedules:
+            return []
+
+        lux_reading = None
+        if any(s.device_type == "light" and s.photoperiod for s in schedules):
+            lux_reading = get_lux_reading(self.analytics_service, unit_id)
+
+        schedule_by_id: dict[int, Schedule] = {}
+        actuator_schedules: dict[int, list[Schedule]] = {}
+        active_schedules_by_actuator: dict[int, list[Schedule]] = {}
+
+        for schedule in schedules:
+            results["schedules_checked"] += 1
+            schedule_key = schedule.schedule_id
+            if schedule_key is None:
+                continue
+            schedule_by_id[schedule_key] = schedule
+
+            try:
+                is_active = scheduling_service.is_schedule_active(
+                    schedule=schedule,
+                    unit_id=unit_id,
+                    check_time=now,
+                    lux_reading=lux_reading,
+                    unit_timezone=unit_timezone,
+                )
+                was_active = scheduling_service.get_last_execution_state(schedule_key)
+                if was_active is None:
+                    was_active = self._schedule_last_state.get(schedule_key)
+
+                # Execution log for schedules without linked actuators
+                if not schedule.actuator_id:
+                    if is_active and was_active is False:
+                        scheduling_service.record_execution(
+                            schedule=schedule,
+                            action="activate",
+                            success=True,
+                            source="system",
+                        )
+                    elif not is_active and was_active is True:
+                        scheduling_service.record_execution(
+                            schedule=schedule,
+                            action="deactivate",
+                            success=True,
+                            source="system",
+                        )
+                    self._schedule_last_state[schedule_key] = is_active
+                    scheduling_service.set_last_execution_state(schedule_key, is_active)
+                    continue
+
+                actuator_id = schedule.actuator_id
+                actuator_schedules.setdefault(actuator_id, []).append(schedule)
+                if is_active:
+                    active_schedules_by_actuator.setdefault(actuator_id, []).append(schedule)
+
+                self._schedule_last_state[schedule_key] = is_active
+                scheduling_service.set_last_execution_state(schedule_key, is_active)
+            except TRANSITION_ERRORS as e:
+                error_msg = f"Schedule {schedule_key} ({schedule.device_type}): {e}"
+                results["errors"].append(error_msg)
+                logger.error("Error checking schedule: %s", error_msg)
+
+        for actuator_id in actuator_schedules:
+            active_for_actuator = active_schedules_by_actuator.get(actuator_id, [])
+            selected = scheduling_service.select_effective_schedule(active_for_actuator)
+
+            if selected is None:
+                desired_command: tuple[str, float | None] = ("off", None)
+            elif selected.value is not None:
+                desired_command = ("level", float(selected.value))
+            elif selected.state_when_active == ScheduleState.ON:
+                desired_command = ("on", None)
+            else:
+                desired_command = ("off", None)
+
+            previous_command = self._actuator_last_command.get(actuator_id)
+            if previous_command is None:
+                current_state = actuator_service.get_actuator_state(actuator_id)
+                if current_state is True:
+                    previous_command = ("on", None)
+                elif current_state is False:
+                    previous_command = ("off", None)
+                else:
+                    previous_command = desired_command
+
+            if desired_command == previous_command:
+                self._actuator_last_schedule[actuator_id] = selected.schedule_id if selected else None
+                continue
+
+            transition_ok = False
+            if selected is not None:
+                transition_ok = self._handle_activation(selected, actuator_id, results)
+            else:
+                previous_schedule_id = self._actuator_last_schedule.get(actuator_id)
+                previous_schedule = schedule_by_id.get(previous_schedule_id) if previous_schedule_id else None
+                if previous_schedule is not None:
+                    transition_ok = self._handle_deactivation(previous_schedule, actuator_id, results)
+                else:
+                    try:
+                        actuator_service.turn_off(actuator_id)
+                        results["transitions"] += 1
+                        transition_ok = True
+                    except TRANSITION_ERRORS as e:
+                        results["errors"].append(f"Actuator {actuator_id} off: {e!s}")
+                        logger.error(
+                            "Failed to deactivate actuator %s without schedule context: %s",
+                            actuator_id,
+                            e,
+                        )
+
+            if transition_ok:
+                self._actuator_last_command[actuator_id] = desired_command
+                self._actuator_last_schedule[actuator_id] = selected.schedule_id if selected else None
+
+        return schedules
+
+    def _handle_activation(self, schedule: Schedule, actuator_id: int, results: dict) -> bool:
+        """Handle transition from inactive to active state."""
+        try:
+            result = self.scheduling_service.execute_with_retry(
+                schedule,
+                activate=True,
+                actuator_manager=self.actuator_service,
+            )
+            if result.success:
+                results["transitions"] += 1
+                logger.info(
+                    "Schedule %s (%s) activated -> actuator %s",
+                    schedule.schedule_id,
+                    schedule.device_type,
+                    actuator_id,
+                )
+                return True
+            results["errors"].append(f"Actuator {actuator_id} on: {result.error_message}")
+            return False
+        except TRANSITION_ERRORS as e:
+            results["errors"].append(f"Actuator {actuator_id} on: {e!s}")
+            logger.error("Failed to activate schedule for actuator %s: %s", actuator_id, e)
+            return False
+
+    def _handle_deactivation(self, schedule: Schedule, actuator_id: int, results: dict) -> bool:
+        """Handle transition from active to inactive state."""
+        try:
+            result = self.scheduling_service.execute_with_retry(
+                schedule,
+                activate=False,
+                actuator_manager=self.actuator_service,
+            )
+            if result.success:
+                results["transitions"] += 1
+                logger.info(
+                    "Schedule %s (%s) deactivated -> actuator %s OFF",
+                    schedule.schedule_id,
+                    schedule.device_type,
+                    actuator_id,
+                )
+                return True
+            results["errors"].append(f"Actuator {actuator_id} off: {result.error_message}")
+            return False
+        except TRANSITION_ERRORS as e:
+            results["errors"].append(f"Actuator {actuator_id} off: {e!s}")
+            logger.error("Failed to deactivate schedule for actuator %s: %s", actuator_id, e)
+            return False
+
+
+__all__ = ["ScheduleTransitionEngine"]
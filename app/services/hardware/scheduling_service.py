@@ -164,6 +164,9 @@ class SchedulingService:
         # Optional unified scheduler for interval task registration
         self._scheduler: "UnifiedScheduler" | None = None
 
+        # Listeners for in-memory schedule changes: callback(unit_id, schedule_id | None)
+        self._change_callbacks: list[Callable[[int, int | None], None]] = []
+
         logger.info("SchedulingService initialized with memory-first storage")
 
     def set_scheduler(self, scheduler: "UnifiedScheduler") -> None:
@@ -195,6 +198,23 @@ class SchedulingService:
             start_immediately=start_immediately,
         )
 
+    def register_change_callback(self, callback: Callable[[int, int | None], None]) -> None:
+        """
+        Register a listener for schedule changes.
+
+        Called with (unit_id, schedule_id) after a schedule is added, updated,
+        removed or toggled in memory, and with (unit_id, None) when a unit's
+        schedules are reloaded or cleared.
+        """
+        self._change_callbacks.append(callback)
+
+    def _notify_change(self, unit_id: int, schedule_id: int | None = None) -> None:
+        for callback in self._change_callbacks:
+            try:
+                callback(unit_id, schedule_id)
+            except SCHEDULING_RECOVERABLE_ERRORS as e:
+                logger.error("Schedule change callback failed for unit %s: %s", unit_id, e)
+
     # ==================== In-Memory Schedule Management ====================
 
     def _get_unit_schedules(self, unit_id: int) -> dict[int, Schedule]:
@@ -238,6 +258,7 @@ class SchedulingService:
                 schedule.name,
                 unit_id,
             )
+        self._notify_change(unit_id, schedule.schedule_id)
 
     def _remove_schedule_from_memory(self, unit_id: int, schedule_id: int) -> Schedule | None:
         """
@@ -257,7 +278,9 @@ class SchedulingService:
             removed = unit_schedules.pop(schedule_id, None)
             if removed:
                 logger.debug("Removed schedule %s from memory for unit %s", schedule_id, unit_id)
-            return removed
+        if removed:
+            self._notify_change(unit_id, schedule_id)
+        return removed
 
     def _update_schedule_in_memory(self, schedule: Schedule) -> bool:
         """
@@ -280,7 +303,8 @@ class SchedulingService:
                 return False
             unit_schedules[schedule.schedule_id] = schedule
             logger.debug("Updated schedule %s in memory for unit %s", schedule.schedule_id, schedule.unit_id)
-            return True
+        self._notify_change(schedule.unit_id, schedule.schedule_id)
+        return True
 
     def get_schedule_from_memory(self, unit_id: int, schedule_id: int) -> Schedule | None:
         """
@@ -329,6 +353,7 @@ class SchedulingService:
             self._loaded_units.discard(unit_id)
             if removed_count > 0:
                 logger.debug("Cleared %d schedules from memory for unit %s", removed_count, unit_id)
+        self._notify_change(unit_id)
 
     def is_unit_loaded(self, unit_id: int) -> bool:
         """
@@ -394,6 +419,7 @@ class SchedulingService:
                 self._loaded_units.add(unit_id)
 
             logger.info("Loaded %d schedules for unit %s", len(schedules), unit_id)
+            self._notify_change(unit_id)
             return len(schedules)
 
         except SCHEDULING_RECOVERABLE_ERRORS as e:
@@ -832,6 +858,8 @@ class SchedulingService:
                     previous_enabled = memory_schedule.enabled
                     memory_schedule.enabled = enabled
                     schedule.enabled = enabled
+        if memory_schedule is not None:
+            self._notify_change(unit_id, schedule_id)
 
         # Persist to repository
         if not self.repository:
@@ -853,12 +881,14 @@ class SchedulingService:
 
             if memory_schedule is not None:
                 memory_schedule.enabled = previous_enabled
+                self._notify_change(unit_id, schedule_id)
             schedule.enabled = previous_enabled
             return success
         except SCHEDULING_RECOVERABLE_ERRORS as e:
             logger.error("Failed to set schedule %s enabled=%s: %s", schedule_id, enabled, e)
             if memory_schedule is not None:
                 memory_schedule.enabled = previous_enabled
+                self._notify_change(unit_id, schedule_id)
             schedule.enabled = previous_enabled
             return False
 
@@ -1291,6 +1321,103 @@ class SchedulingService:
             use_civil_twilight=sun_config.use_civil_twilight if sun_config else False,
         )
 
+    # ==================== Transition Prediction ====================
+
+    @staticmethod
+    def depends_on_live_light(schedule: Schedule) -> bool:
+        """True if the schedule's state follows live lux readings and cannot be predicted."""
+        if schedule.device_type != "light" or not schedule.photoperiod:
+            return False
+        pp = schedule.photoperiod
+        return pp.source == PhotoperiodSource.SENSOR or (pp.source == PhotoperiodSource.HYBRID and pp.prefer_sensor)
+
+    def next_transition_time(
+        self,
+        schedule: Schedule,
+        after: datetime | None = None,
+        *,
+        unit_timezone: str | None = None,
+        horizon_days: int = 8,
+    ) -> datetime | None:
+        """
+        First instant after ``after`` at which is_schedule_active() flips.
+
+        Candidates are the schedule's own breakpoints (window start/end,
+        interval cycle boundaries) and, for sun-based photoperiods,
+        sunrise/sunset; each is checked with is_schedule_active() so the
+        prediction matches evaluation exactly.
+
+        Returns:
+            The transition time, or None if the schedule depends on live lux
+            readings or does not change state within ``horizon_days``.
+        """
+        if not schedule.enabled or self.depends_on_live_light(schedule):
+            return None
+
+        start = Schedule._normalize_check_time(after, unit_timezone)
+        current = self.is_schedule_active(schedule, schedule.unit_id, start, unit_timezone=unit_timezone)
+        for candidate in self._transition_candidates(schedule, start, horizon_days):
+            if self.is_schedule_active(schedule, schedule.unit_id, candidate, unit_timezone=unit_timezone) != current:
+                return candidate
+        return None
+
+    def _transition_candidates(self, schedule: Schedule, start: datetime, horizon_days: int) -> list[datetime]:
+        """Sorted instants after ``start`` where the schedule's state may change."""
+        try:
+            start_minutes = self._time_to_minutes(schedule.start_time)
+            end_minutes = self._time_to_minutes(schedule.end_time)
+        except (ValueError, IndexError):
+            return []
+
+        window = (end_minutes - start_minutes) % (24 * 60) or 24 * 60
+        offsets = {0, window}
+        if schedule.schedule_type == ScheduleType.INTERVAL:
+            try:
+                interval = int(schedule.interval_minutes or 0)
+                duration = int(schedule.duration_minutes or 0)
+            except (TypeError, ValueError):
+                interval = duration = 0
+            if interval > 0:
+                for cycle_start in range(0, window, interval):
+                    offsets.add(cycle_start)
+                    offsets.add(min(cycle_start + duration, window))
+        minute_marks = sorted(start_minutes + offset for offset in offsets)
+
+        sun_based = bool(
+            self.sun_times_service
+            and schedule.device_type == "light"
+            and schedule.photoperiod
+            and schedule.photoperiod.source == PhotoperiodSource.SUN_API
+        )
+        sun_config = schedule.photoperiod.sun_times if sun_based else None
+
+        midnight = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        candidates: set[datetime] = set()
+        # Start a day early so windows spanning midnight are covered
+        for day in range(-1, horizon_days + 1):
+            day_start = midnight + timedelta(days=day)
+            for minutes in minute_marks:
+                candidates.add(day_start + timedelta(minutes=minutes))
+            # The next sunrise/sunset is never more than a day away; avoid fetching a week of sun times
+            if not sun_based or day > 1:
+                continue
+            sun_times = self.sun_times_service.get_sun_times(
+                target_date=day_start.date(),
+                latitude=sun_config.latitude if sun_config else None,
+                longitude=sun_config.longitude if sun_config else None,
+            )
+            if not sun_times:
+                continue
+            for mark in (
+                sun_times.sunrise,
+                sun_times.sunset,
+                sun_times.civil_twilight_begin,
+                sun_times.civil_twilight_end,
+            ):
+                if mark is not None:
+                    candidates.add(day_start + timedelta(hours=mark.hour, minutes=mark.minute))
+        return sorted(c for c in candidates if c > start)
+
     # ==================== Schedule Preview ====================
 
     def preview_schedules(
@@ -1868,6 +1995,10 @@ class SchedulingService:
         """Get the last known execution state for a schedule."""
         return self._last_execution_state.get(schedule_id)
 
+    def get_last_execution_states(self) -> dict[int, bool]:
+        """Snapshot of the last known execution state of every schedule."""
+        return dict(self._last_execution_state)
+
     def set_last_execution_state(self, schedule_id: int, was_active: bool):
         """Set the last known execution state for a schedule."""
         self._last_execution_state[schedule_id] = was_active
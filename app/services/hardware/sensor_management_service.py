@@ -105,6 +105,7 @@ class SensorManagementService:
         zigbee_service: "ZigbeeManagementService" | None = None,
         cache_ttl_seconds: int = 60,
         cache_maxsize: int = 256,
+        poll_workers: int = 2,
     ):
         """
         Initialize sensor management service.
@@ -119,6 +120,7 @@ class SensorManagementService:
             zigbee_service: Zigbee management service for discovery
             cache_ttl_seconds: TTL for sensor metadata cache (default 60s)
             cache_maxsize: Maximum cached sensors (default 256)
+            poll_workers: Threads reading independent hardware buses concurrently
         """
         self.repository = repository
         self.emitter = emitter
@@ -159,6 +161,7 @@ class SensorManagementService:
             sensor_manager=self,  # Pass self instead of SensorManager
             emitter=emitter,
             processor=processor,
+            max_workers=poll_workers,
         )
 
         # Memory cache for sensor metadata (reduces DB queries)
@@ -6,6 +6,9 @@ Periodically polls GPIO/I2C/SPI/ADC sensors with data processing pipeline.
 
 Features:
 - Periodic polling of local hardware sensors (I2C, ADC, SPI, OneWire)
+- Per-sensor cadence on a timer wheel; sensors on independent buses are read
+  concurrently, sensors sharing a bus are read one at a time
+- Per-sensor read latency histograms and missed-deadline counters
 - Data processor pipeline integration (Standardization -> Validation -> Calibration -> Transformation)
 - EmitterService integration for WebSocket emission
 - EventBus dispatch for automation and persistence
@@ -14,9 +17,12 @@ Features:
 Note: MQTT-based sensors (Zigbee/ESP32) are handled by MQTTSensorService.
 """
 
+import dataclasses
 import logging
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -29,6 +35,85 @@ from app.utils.time import utc_now
 
 logger = logging.getLogger(__name__)
 
+LOCAL_PROTOCOLS = frozenset({"GPIO", "I2C", "ADC", "SPI", "ONEWIRE"})
+
+# Upper bounds (ms) of the read latency histogram buckets; slower reads land in "+inf"
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of hardware read latencies."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        count = sum(self.counts)
+        labels = [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + ["+inf"]
+        return {
+            "count": count,
+            "mean_ms": round(self.total_ms / count, 2) if count else None,
+            "max_ms": round(self.max_ms, 2),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel keyed by sensor ID.
+
+    Scheduling is O(1); each tick only inspects the slots that elapsed.
+    Deadlines further out than one rotation stay in their slot until a later
+    pass finds them due.
+    """
+
+    def __init__(self, tick_s: float = 0.25, slots: int = 256):
+        self.tick_s = tick_s
+        self._slots: list[list[tuple[float, int]]] = [[] for _ in range(slots)]
+        self._cursor: int | None = None
+
+    def _tick(self, at: float) -> int:
+        return int(at / self.tick_s)
+
+    def schedule(self, key: int, due: float) -> None:
+        tick = self._tick(due)
+        if self._cursor is not None and tick < self._cursor:
+            tick = self._cursor  # already overdue: fire on the next pass
+        self._slots[tick % len(self._slots)].append((due, key))
+
+    def advance(self, now: float) -> list[tuple[int, float]]:
+        """Pop every (key, due) whose deadline is <= now."""
+        current = self._tick(now)
+        start = current if self._cursor is None else self._cursor
+        # A full rotation visits every slot once
+        start = max(start, current - len(self._slots) + 1)
+        fired: list[tuple[int, float]] = []
+        for tick in range(start, current + 1):
+            slot = self._slots[tick % len(self._slots)]
+            if not slot:
+                continue
+            keep = []
+            for due, key in slot:
+                if due <= now:
+                    fired.append((key, due))
+                else:
+                    keep.append((due, key))
+            slot[:] = keep
+        self._cursor = current
+        return fired
+
 
 class SensorHealth:
     """Tracks the operational state of a hardware sensor."""
@@ -57,6 +142,12 @@ class SensorPollingService:
 
     This service manages the lifecycle of polling threads and orchestrates
     the flow from raw hardware voltage/data to processed engineering units.
+
+    A scheduler thread fires each sensor on its own cadence from a timer
+    wheel. Due sensors are queued on their physical bus (I2C bus, SPI bus,
+    ADC chip, GPIO pin) and each bus is drained by one worker from a small
+    pool, so a slow DHT retry or ADC conversion only delays sensors that
+    share its bus. Processing and dispatch stay serialized.
     """
 
     def __init__(
@@ -66,20 +157,37 @@ class SensorPollingService:
         processor: IDataProcessor,
         poll_interval_s: int = 10,
         event_bus: EventBus | None = None,
+        max_workers: int = 2,
     ):
         self.sensor_manager = sensor_manager
         self.emitter = emitter
         self.processor = processor
         self.poll_interval_s = max(1, int(poll_interval_s))
         self.event_bus = event_bus or EventBus()
+        self.max_workers = max(1, int(max_workers))
 
         # State tracking
         self._health: dict[int, SensorHealth] = {}
         self._last_readings: dict[int, SensorReading] = {}
+        self._latency: dict[int, LatencyHistogram] = {}
+        self._missed_deadlines: dict[int, int] = {}
+
+        # Scheduling: sensor_id -> cadence / bus; bus -> queued (sensor_id, due)
+        self._wheel = TimerWheel()
+        self._intervals: dict[int, float] = {}
+        self._next_due: dict[int, float] = {}
+        self._sensor_bus: dict[int, str] = {}
+        self._bus_queues: dict[str, deque[tuple[int, float]]] = {}
+        self._busy_buses: set[str] = set()
+        self._queued: set[int] = set()
+        self._last_sync = 0.0
 
         # Concurrency control
+        self._lock = threading.Lock()
+        self._pipeline_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._worker_thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
         self._is_running = False
 
         # Configuration for stability
@@ -104,6 +212,7 @@ class SensorPollingService:
             return False
 
         self._stop_event.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="HwSensorBus")
         self._worker_thread = threading.Thread(target=self._polling_loop, name="HwSensorPoller", daemon=True)
         self._worker_thread.start()
         self._is_running = True
@@ -120,6 +229,19 @@ class SensorPollingService:
         self._stop_event.set()
         if self._worker_thread:
             self._worker_thread.join(timeout=5.0)
+        if self._executor:
+            # In-flight reads finish on their own; queued buses see the stop flag
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._lock:
+            self._bus_queues.clear()
+            self._busy_buses.clear()
+            self._queued.clear()
+            self._intervals.clear()
+            self._sensor_bus.clear()
+            self._next_due.clear()
+            self._wheel = TimerWheel()
+            self._last_sync = 0.0
 
         self._is_running = False
         logger.info("Hardware sensor polling stopped")
@@ -129,24 +251,97 @@ class SensorPollingService:
     # -------------------------------------------------------------------------
 
     def _polling_loop(self) -> None:
-        """Periodic loop that sweeps all registered local sensors."""
+        """Scheduler loop: fires due sensors from the timer wheel onto their bus queues."""
         while not self._stop_event.is_set():
-            t_start = time.perf_counter()
-
             try:
-                sensor_ids = self._get_local_sensors()
-                for sid in sensor_ids:
-                    if self._stop_event.is_set():
-                        break
-
-                    self._process_single_sensor(sid)
+                now = time.monotonic()
+                if now - self._last_sync >= self.poll_interval_s:
+                    self._sync_schedule(now)
+                with self._lock:
+                    fired = self._wheel.advance(now)
+                for sensor_id, due in fired:
+                    self._enqueue_due(sensor_id, due)
             except Exception as exc:
                 logger.exception("Hardware polling loop encountered critical error: %s", exc)
 
-            # Calculate remaining sleep to maintain consistent interval
-            elapsed = time.perf_counter() - t_start
-            sleep_time = max(0.1, self.poll_interval_s - elapsed)
-            self._stop_event.wait(sleep_time)
+            self._stop_event.wait(self._wheel.tick_s)
+
+    def _sync_schedule(self, now: float) -> None:
+        """Pick up added/removed sensors and cadence or bus changes."""
+        self._last_sync = now
+        sensors = self._get_local_sensor_entities()
+        with self._lock:
+            current = {s.id for s in sensors}
+            for sensor_id in list(self._intervals):
+                if sensor_id not in current:
+                    # Its wheel entry is ignored once it no longer matches _next_due
+                    del self._intervals[sensor_id]
+                    self._next_due.pop(sensor_id, None)
+                    self._sensor_bus.pop(sensor_id, None)
+            for sensor in sensors:
+                self._sensor_bus[sensor.id] = self._bus_key(sensor)
+                self._intervals[sensor.id] = self._sensor_interval(sensor)
+                if sensor.id not in self._next_due and sensor.id not in self._queued:
+                    self._schedule_locked(sensor.id, now)
+
+    def _schedule_locked(self, sensor_id: int, due: float) -> None:
+        self._next_due[sensor_id] = due
+        self._wheel.schedule(sensor_id, due)
+
+    def _enqueue_due(self, sensor_id: int, due: float) -> None:
+        """Queue a due sensor on its bus and start a worker for the bus if idle."""
+        with self._lock:
+            if self._next_due.get(sensor_id) != due:
+                return  # superseded entry (sensor removed or re-added)
+            del self._next_due[sensor_id]
+            bus = self._sensor_bus.get(sensor_id, f"sensor:{sensor_id}")
+            self._queued.add(sensor_id)
+            self._bus_queues.setdefault(bus, deque()).append((sensor_id, due))
+            if bus in self._busy_buses or self._executor is None:
+                return
+            self._busy_buses.add(bus)
+            executor = self._executor
+        try:
+            executor.submit(self._drain_bus, bus)
+        except RuntimeError:
+            # Executor shut down while stopping
+            with self._lock:
+                self._busy_buses.discard(bus)
+
+    def _drain_bus(self, bus: str) -> None:
+        """Read the sensors queued on one bus, one at a time."""
+        while not self._stop_event.is_set():
+            with self._lock:
+                queue = self._bus_queues.get(bus)
+                if not queue:
+                    self._busy_buses.discard(bus)
+                    return
+                sensor_id, due = queue.popleft()
+
+            try:
+                self._process_single_sensor(sensor_id)
+            except Exception as exc:
+                logger.exception("Unhandled error polling sensor %s: %s", sensor_id, exc)
+            finally:
+                self._reschedule(sensor_id, due)
+        with self._lock:
+            self._busy_buses.discard(bus)
+
+    def _reschedule(self, sensor_id: int, due: float) -> None:
+        """Schedule the next fixed-rate slot, counting slots that already passed."""
+        now = time.monotonic()
+        with self._lock:
+            self._queued.discard(sensor_id)
+            interval = self._intervals.get(sensor_id)
+            if interval is None:
+                return
+            next_due = due + interval
+            if next_due <= now:
+                # The read overran its slot(s): skip ahead instead of bursting to catch up
+                missed = int((now - next_due) // interval) + 1
+                self._missed_deadlines[sensor_id] = self._missed_deadlines.get(sensor_id, 0) + missed
+                next_due += missed * interval
+            self._schedule_locked(sensor_id, next_due)
 
     def _process_single_sensor(self, sensor_id: int) -> None:
         """Reads, processes, and dispatches data for one sensor."""
@@ -162,22 +357,27 @@ class SensorPollingService:
             if not sensor:
                 return
 
-            raw_reading = self.sensor_manager.read_sensor(sensor_id)
+            started = time.perf_counter()
+            try:
+                raw_reading = self.sensor_manager.read_sensor(sensor_id)
+            finally:
+                self._record_latency(sensor_id, (time.perf_counter() - started) * 1000.0)
             if not raw_reading or not raw_reading.data:
                 raise ValueError("No data returned from hardware layer")
 
             # 2. Pipeline Processing (Clean/Validate/Calibrate/Enrich)
-            # We assume CompositeProcessor usage here
-            reading = self.processor.process(sensor, raw_reading.data)
+            # We assume CompositeProcessor usage here; bus workers share it, so one at a time
+            with self._pipeline_lock:
+                reading = self.processor.process(sensor, raw_reading.data)
 
-            # Preserve hardware-layer timestamp for accuracy
-            if hasattr(raw_reading, "timestamp"):
-                reading.timestamp = raw_reading.timestamp
+                # Preserve hardware-layer timestamp for accuracy (SensorReading is frozen)
+                if getattr(raw_reading, "timestamp", None):
+                    reading = dataclasses.replace(reading, timestamp=raw_reading.timestamp)
 
-            # 3. Payload Construction & Dispatch
-            prepared = self.processor.build_payloads(sensor=sensor, reading=reading)
-            if prepared:
-                self._dispatch_results(prepared)
+                # 3. Payload Construction & Dispatch
+                prepared = self.processor.build_payloads(sensor=sensor, reading=reading)
+                if prepared:
+                    self._dispatch_results(prepared)
 
             # 4. State Update
             health.status = SensorState.HEALTHY
@@ -214,21 +414,64 @@ class SensorPollingService:
 
     def _get_local_sensors(self) -> list[int]:
         """Returns IDs of sensors requiring local polling."""
-        local_protocols = {"GPIO", "I2C", "ADC", "SPI", "ONEWIRE"}
+        return [s.id for s in self._get_local_sensor_entities()]
+
+    def _get_local_sensor_entities(self) -> list[Any]:
         try:
             return [
-                s.id
+                s
                 for s in self.sensor_manager.get_all_sensors()
-                if str(getattr(s.protocol, "value", s.protocol)).upper() in local_protocols
+                if str(getattr(s.protocol, "value", s.protocol)).upper() in LOCAL_PROTOCOLS
             ]
         except Exception:
             return []
 
+    @staticmethod
+    def _bus_key(sensor: Any) -> str:
+        """
+        Physical bus a sensor's reads contend on.
+
+        Sensors on the same I2C/SPI bus or ADC chip are read one at a time;
+        GPIO sensors are bit-banged on their own pin and are independent.
+        """
+        protocol = str(getattr(sensor.protocol, "value", sensor.protocol)).upper()
+        config = getattr(sensor, "config", None)
+        extra = getattr(config, "extra_config", None) or {}
+        if protocol == "I2C":
+            return f"i2c:{getattr(config, 'i2c_bus', None) or 1}"
+        if protocol == "ADC":
+            # ADS1115-style converters: channels of one chip share a conversion
+            return f"adc:{getattr(config, 'i2c_address', None) or 'default'}"
+        if protocol == "SPI":
+            return f"spi:{extra.get('spi_bus', 0)}"
+        if protocol == "GPIO":
+            pin = getattr(config, "gpio_pin", None)
+            return f"gpio:{pin}" if pin is not None else f"sensor:{sensor.id}"
+        return protocol.lower()
+
+    def _sensor_interval(self, sensor: Any) -> float:
+        """Per-sensor cadence: ``extra_config['poll_interval_s']``, else the service default."""
+        config = getattr(sensor, "config", None)
+        extra = getattr(config, "extra_config", None) or {}
+        try:
+            return max(1.0, float(extra.get("poll_interval_s", self.poll_interval_s)))
+        except (TypeError, ValueError):
+            return float(self.poll_interval_s)
+
+    def _record_latency(self, sensor_id: int, latency_ms: float) -> None:
+        histogram = self._latency.get(sensor_id)
+        if histogram is None:
+            with self._lock:
+                histogram = self._latency.setdefault(sensor_id, LatencyHistogram())
+        histogram.observe(latency_ms)
+
     def _get_health(self, sensor_id: int) -> SensorHealth:
         """Get or create health tracker for a sensor."""
-        if sensor_id not in self._health:
-            self._health[sensor_id] = SensorHealth(sensor_id)
-        return self._health[sensor_id]
+        health = self._health.get(sensor_id)
+        if health is None:
+            with self._lock:
+                health = self._health.setdefault(sensor_id, SensorHealth(sensor_id))
+        return health
 
     def _handle_failure(self, health: SensorHealth, error_msg: str) -> None:
         """Updates health state and calculates backoff timer."""
@@ -250,12 +493,14 @@ class SensorPollingService:
 
     def get_service_status(self) -> dict[str, Any]:
         """Returns comprehensive status for API/Dashboards."""
+        with self._lock:
+            health = dict(self._health)
         return {
             "is_running": self._is_running,
             "poll_interval": self.poll_interval_s,
-            "sensor_count": len(self._health),
-            "healthy_count": sum(1 for h in self._health.values() if h.status == SensorState.HEALTHY),
-            "sensors": {sid: h.to_dict() for sid, h in self._health.items()},
+            "sensor_count": len(health),
+            "healthy_count": sum(1 for h in health.values() if h.status == SensorState.HEALTHY),
+            "sensors": {sid: h.to_dict() for sid, h in health.items()},
         }
 
     def get_health_status(self, sensor_id: int) -> dict[str, Any] | None:
@@ -263,5 +508,31 @@ class SensorPollingService:
         health = self._health.get(sensor_id)
         return health.to_dict() if health else None
 
+    def get_health_snapshot(self) -> dict[str, Any]:
+        """Polling health for the health API: per-sensor state, backoff, latency and deadlines."""
+        now = time.time()
+        with self._lock:
+            buses: dict[str, list[int]] = {}
+            for sensor_id, bus in self._sensor_bus.items():
+                buses.setdefault(bus, []).append(sensor_id)
+            intervals = dict(self._intervals)
+            missed = dict(self._missed_deadlines)
+            health = dict(self._health)
+            latency = dict(self._latency)
+        return {
+            "is_running": self._is_running,
+            "workers": self.max_workers,
+            "buses": buses,
+            "sensor_health": {sid: h.to_dict() for sid, h in health.items()},
+            "backoff_seconds_remaining": {
+                sid: round(h.backoff_until - now, 1)
+                for sid, h in health.items()
+                if h.backoff_until and h.backoff_until > now
+            },
+            "poll_intervals": intervals,
+            "missed_deadlines": missed,
+            "read_latency_ms": {sid: hist.to_dict() for sid, hist in latency.items()},
+        }
+
 
 __all__ = ["SensorPollingService"]
@@ -8,18 +8,26 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections import deque
+import os
+import threading
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from app.domain.anomaly import Anomaly
 from app.enums import AnomalyType
+from app.utils.persistent_store import load_json, save_json
+from app.utils.sliding_window_stats import SlidingWindowStats
 
 if TYPE_CHECKING:
     from infrastructure.database.repositories.sensor_anomaly import SensorAnomalyRepository
 
 logger = logging.getLogger(__name__)
 
+ANOMALY_WINDOWS_FILE = "anomaly_windows.json"
+# Saved windows older than this are dropped on restore rather than trusted
+STATE_MAX_AGE_SECONDS = 3600
+
 
 class AnomalyDetectionService:
     """
@@ -33,12 +41,17 @@ class AnomalyDetectionService:
 
     Optionally persists detected anomalies to the database when a
     ``SensorAnomalyRepository`` is provided.
+
+    Per-sensor windows keep their statistics incrementally, so every check
+    is O(1) per reading. ``save_state``/``load_state`` carry the windows
+    across restarts.
     """
 
     def __init__(
         self,
         history_size: int = 100,
         anomaly_repo: SensorAnomalyRepository | None = None,
+        state_path: str | None = None,
     ):
         """
         Initialize anomaly detection service.
@@ -46,11 +59,15 @@ class AnomalyDetectionService:
         Args:
             history_size: Number of readings to keep in history
             anomaly_repo: Optional repository for persisting anomalies
+            state_path: File for ``save_state``/``load_state`` (defaults to
+                ``ANOMALY_WINDOWS_FILE`` under ``var/``)
         """
         self.history_size = history_size
         self._anomaly_repo = anomaly_repo
-        self._sensor_history: dict[int, deque] = {}  # sensor_id -> deque of (timestamp, value)
+        self.state_path = state_path
+        self._sensor_history: dict[int, SlidingWindowStats] = {}  # sensor_id -> window of (epoch, value)
         self._sensor_stats: dict[int, dict] = {}  # sensor_id -> statistics
+        self._lock = threading.Lock()
 
     def detect_anomaly(
         self,
@@ -97,13 +114,28 @@ class AnomalyDetectionService:
             Anomaly if detected, None otherwise
         """
         timestamp = datetime.now()
+        with self._lock:
+            detected = self._check_reading(sensor_id, value, field_name, expected_range, timestamp)
 
+        if detected is not None:
+            logger.warning("Anomaly detected for sensor %s: %s", sensor_id, detected.description)
+            self._persist_anomaly(detected)
+        return detected
+
+    def _check_reading(
+        self,
+        sensor_id: int,
+        value: float,
+        field_name: str,
+        expected_range: tuple[float, float] | None,
+        timestamp: datetime,
+    ) -> Anomaly | None:
         # Initialize history if needed
-        if sensor_id not in self._sensor_history:
-            self._sensor_history[sensor_id] = deque(maxlen=self.history_size)
+        history = self._sensor_history.get(sensor_id)
+        if history is None:
+            history = self._sensor_history[sensor_id] = SlidingWindowStats(self.history_size)
             self._sensor_stats[sensor_id] = {}
 
-        history = self._sensor_history[sensor_id]
         detected: Anomaly | None = None
 
         # Check range first
@@ -134,16 +166,12 @@ class AnomalyDetectionService:
                 detected = self._check_statistical_outlier(sensor_id, value, field_name, history)
 
         # Always append to history
-        history.append((timestamp, value))
-
-        if detected is not None:
-            logger.warning("Anomaly detected for sensor %s: %s", sensor_id, detected.description)
-            self._persist_anomaly(detected)
-            return detected
+        history.add(timestamp.timestamp(), value)
 
         # Update statistics (only when no anomaly)
-        self._update_statistics(sensor_id)
-        return None
+        if detected is None:
+            self._update_statistics(sensor_id)
+        return detected
 
     # ------------------------------------------------------------------
     # Persistence helpers
@@ -196,15 +224,13 @@ class AnomalyDetectionService:
             return 0
         return self._anomaly_repo.count_active(sensor_id=sensor_id)
 
-    def _check_stuck_value(self, sensor_id: int, value: float, field_name: str, history: deque) -> Anomaly | None:
+    def _check_stuck_value(
+        self, sensor_id: int, value: float, field_name: str, history: SlidingWindowStats
+    ) -> Anomaly | None:
         """Check if value is stuck (not changing)"""
 
-        # Check last N values
-        check_count = min(5, len(history))
-        recent_values = [v for _, v in list(history)[-check_count:]]
-
-        # All values identical (with small tolerance for float comparison)
-        if all(abs(v - value) < 0.001 for v in recent_values):
+        # Last N values all identical (with small tolerance for float comparison)
+        if all(abs(v - value) < 0.001 for v in history.recent_values(5)):
             return Anomaly(
                 sensor_id=sensor_id,
                 timestamp=datetime.now(),
@@ -218,37 +244,28 @@ class AnomalyDetectionService:
         return None
 
     def _check_rate_of_change(
-        self, sensor_id: int, value: float, field_name: str, timestamp: datetime, history: deque
+        self, sensor_id: int, value: float, field_name: str, timestamp: datetime, history: SlidingWindowStats
     ) -> Anomaly | None:
         """Check if value is changing too rapidly"""
 
-        last_timestamp, last_value = history[-1]
+        last_timestamp, last_value = history.last
 
         # Calculate rate of change
-        time_diff = (timestamp - last_timestamp).total_seconds()
+        time_diff = timestamp.timestamp() - last_timestamp
         if time_diff == 0:
             return None
 
         value_diff = abs(value - last_value)
         rate = value_diff / time_diff
 
-        # Calculate typical rate from history
+        # Typical rate over the window
         if len(history) < 5:
             return None
 
-        rates = []
-        for i in range(len(history) - 1):
-            t1, v1 = history[i]
-            t2, v2 = history[i + 1]
-            td = (t2 - t1).total_seconds()
-            if td > 0:
-                rates.append(abs(v2 - v1) / td)
-
-        if not rates:
+        avg_rate = history.mean_rate
+        if avg_rate is None:
             return None
 
-        avg_rate = sum(rates) / len(rates)
-
         # Spike if rate is 5x typical
         if rate > avg_rate * 5 and value_diff > 1.0:  # Also require significant absolute change
             anomaly_type = AnomalyType.SPIKE if value > last_value else AnomalyType.DROP
@@ -266,17 +283,12 @@ class AnomalyDetectionService:
         return None
 
     def _check_statistical_outlier(
-        self, sensor_id: int, value: float, field_name: str, history: deque
+        self, sensor_id: int, value: float, field_name: str, history: SlidingWindowStats
     ) -> Anomaly | None:
         """Check if value is a statistical outlier using z-score"""
 
-        # Get values from history
-        values = [v for _, v in history]
-
-        # Calculate mean and std
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std = variance**0.5
+        mean = history.mean
+        std = history.std
 
         # Avoid division by zero
         if std < 0.001:
@@ -316,21 +328,15 @@ class AnomalyDetectionService:
     def _update_statistics(self, sensor_id: int):
         """Update running statistics for sensor"""
         history = self._sensor_history[sensor_id]
-        values = [v for _, v in history]
-
-        if len(values) < 2:
+        if len(history) < 2:
             return
 
-        mean = sum(values) / len(values)
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std = variance**0.5
-
         self._sensor_stats[sensor_id] = {
-            "mean": mean,
-            "std": std,
-            "min": min(values),
-            "max": max(values),
-            "count": len(values),
+            "mean": history.mean,
+            "std": history.std,
+            "min": history.min,
+            "max": history.max,
+            "count": len(history),
         }
 
     def get_statistics(self, sensor_id: int) -> dict:
@@ -363,9 +369,54 @@ class AnomalyDetectionService:
         Args:
             sensor_id: Sensor ID
         """
-        if sensor_id in self._sensor_history:
-            del self._sensor_history[sensor_id]
-        if sensor_id in self._sensor_stats:
-            del self._sensor_stats[sensor_id]
+        with self._lock:
+            self._sensor_history.pop(sensor_id, None)
+            self._sensor_stats.pop(sensor_id, None)
 
         logger.info("Reset anomaly detection for sensor %s", sensor_id)
+
+    # ------------------------------------------------------------------
+    # Warm restart
+    # ------------------------------------------------------------------
+
+    def _state_file(self) -> str:
+        return os.path.abspath(self.state_path) if self.state_path else ANOMALY_WINDOWS_FILE
+
+    def save_state(self) -> None:
+        """Persist every sensor window so detection is warm after a restart."""
+        with self._lock:
+            windows = {str(sensor_id): window.samples() for sensor_id, window in self._sensor_history.items()}
+        save_json(self._state_file(), {"saved_at": time.time(), "history_size": self.history_size, "windows": windows})
+        logger.info("Saved anomaly detection windows for %d sensors", len(windows))
+
+    def load_state(self) -> int:
+        """
+        Restore sensor windows saved by ``save_state``.
+
+        Windows are skipped if their newest sample is older than
+        ``STATE_MAX_AGE_SECONDS``.
+
+        Returns:
+            Number of sensors restored
+        """
+        state = load_json(self._state_file())
+        cutoff = time.time() - STATE_MAX_AGE_SECONDS
+        restored = 0
+        with self._lock:
+            for key, samples in (state.get("windows") or {}).items():
+                try:
+                    sensor_id = int(key)
+                    samples = [(float(ts), float(value)) for ts, value in samples]
+                except (TypeError, ValueError):
+                    continue
+                if not samples or samples[-1][0] < cutoff or sensor_id in self._sensor_history:
+                    continue
+                window = SlidingWindowStats(self.history_size)
+                window.extend(samples)
+                self._sensor_history[sensor_id] = window
+                self._sensor_stats[sensor_id] = {}
+                self._update_statistics(sensor_id)
+                restored += 1
+        if restored:
+            logger.info("Restored anomaly detection windows for %d sensors", restored)
+        return restored
@@ -16,7 +16,7 @@ EmitterService; these handlers focus on room membership and lifecycle.
 
 import logging
 
-from flask import request, session
+from flask import current_app, request, session
 from flask_socketio import join_room, leave_room
 
 from app.extensions import socketio
@@ -32,19 +32,25 @@ from app.utils.emitters import (
 logger = logging.getLogger(__name__)
 
 
-def _auto_join_unit_room(namespace_label: str) -> None:
-    """Best-effort auto-join the unit room based on session.selected_unit."""
+def _auto_join_unit_room(namespace_label: str) -> int | None:
+    """Best-effort auto-join the unit room based on session.selected_unit.
+
+    Returns:
+        The joined unit_id, or None if no room was joined.
+    """
     try:
         selected_unit = session.get("selected_unit")
         if selected_unit is None:
             logger.info("⚠️  Client %s connected to %s with no selected_unit in session", request.sid, namespace_label)
-            return
+            return None
 
         unit_id = int(selected_unit)
         join_room(f"unit_{unit_id}")
         logger.info("✅ Client %s auto-joined room unit_%s (%s)", request.sid, unit_id, namespace_label)
+        return unit_id
     except Exception as e:
         logger.warning("Failed to auto-join unit room for client %s (%s): %s", request.sid, namespace_label, e)
+        return None
 
 
 def _auto_join_user_room(namespace_label: str) -> None:
@@ -66,13 +72,17 @@ def _auto_join_user_room(namespace_label: str) -> None:
         logger.warning("Failed to auto-join user room for client %s (%s): %s", request.sid, namespace_label, e)
 
 
-def _join_unit_from_payload(data) -> None:
-    """Explicitly join a unit room (best-effort), respecting session as source of truth."""
+def _join_unit_from_payload(data) -> int | None:
+    """Explicitly join a unit room (best-effort), respecting session as source of truth.
+
+    Returns:
+        The joined unit_id, or None if no room was joined.
+    """
     try:
         unit_id = data.get("unit_id") if isinstance(data, dict) else None
         if unit_id is None:
             logger.warning("Client %s sent join_unit without unit_id", request.sid)
-            return
+            return None
 
         unit_id = int(unit_id)
 
@@ -84,7 +94,7 @@ def _join_unit_from_payload(data) -> None:
                     logger.warning(
                         f"Client {request.sid} requested join_unit={unit_id} but session selected_unit={selected_unit_id}; ignoring"
                     )
-                    return
+                    return None
             except Exception:
                 logger.warning(
                     f"Client {request.sid} has invalid session selected_unit={selected_unit}; allowing join_unit={unit_id}"
@@ -92,8 +102,27 @@ def _join_unit_from_payload(data) -> None:
 
         join_room(f"unit_{unit_id}")
         logger.info("✅ Client %s joined room unit_%s", request.sid, unit_id)
+        return unit_id
     except Exception as e:
         logger.error("Error joining unit room: %s", e, exc_info=True)
+        return None
+
+
+def _request_dashboard_keyframe(unit_id: int | None) -> None:
+    """Ask the emitter to send the unit's next dashboard frame as a full snapshot.
+
+    Dashboard updates are deltas between keyframes, so a client that just
+    joined (or missed a frame) needs a keyframe to resync.
+    """
+    if unit_id is None:
+        return
+    try:
+        container = current_app.config.get("CONTAINER")
+        emitter = getattr(container, "emitter_service", None) if container else None
+        if emitter is not None:
+            emitter.request_dashboard_keyframe(unit_id)
+    except Exception as e:
+        logger.warning("Failed to request dashboard keyframe for unit %s: %s", unit_id, e)
 
 
 def _leave_unit_from_payload(data) -> None:
@@ -120,12 +149,22 @@ def _leave_unit_from_payload(data) -> None:
 def handle_dashboard_connect():
     """Handle client connection to /dashboard namespace"""
     logger.info("Client connected to /dashboard namespace: %s", request.sid)
-    _auto_join_unit_room("/dashboard")
+    _request_dashboard_keyframe(_auto_join_unit_room("/dashboard"))
 
 
 @socketio.on("join_unit", namespace=SOCKETIO_NAMESPACE_DASHBOARD)
 def handle_dashboard_join_unit(data):
-    _join_unit_from_payload(data)
+    _request_dashboard_keyframe(_join_unit_from_payload(data))
+
+
+@socketio.on("resync", namespace=SOCKETIO_NAMESPACE_DASHBOARD)
+def handle_dashboard_resync(data):
+    """Client detected a gap in dashboard frame sequence numbers."""
+    try:
+        unit_id = data.get("unit_id") if isinstance(data, dict) else None
+        _request_dashboard_keyframe(int(unit_id) if unit_id is not None else None)
+    except (TypeError, ValueError):
+        logger.warning("Client %s sent resync with invalid unit_id", request.sid)
 
 
 @socketio.on("leave_unit", namespace=SOCKETIO_NAMESPACE_DASHBOARD)
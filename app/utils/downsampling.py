@@ -0,0 +1,204 @@
+"""
+Time-series Downsampling
+========================
+
+Shape-preserving reduction of sensor history for charts.
+
+Both strategies split the requested window into equal time buckets and
+work per series (sensor + metric) in a single pass over time-ordered rows,
+holding at most two buckets of points per series:
+
+- ``lttb``: Largest-Triangle-Three-Buckets, one visually significant point
+  per bucket (plus the first and last point of each series).
+- ``minmax``: the minimum and maximum point of every bucket, so spikes are
+  never dropped.
+
+Because buckets are laid over the whole window rather than over the first
+N rows, long windows are covered end to end.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from app.utils.time import coerce_datetime
+
+DOWNSAMPLE_MODES: tuple[str, ...] = ("lttb", "minmax")
+
+# Row keys that are identifiers or bookkeeping, never plotted values.
+_NON_METRIC_KEYS = frozenset(
+    {"timestamp", "sensor_id", "unit_id", "sensor_name", "quality_score", "reading_id", "reading_count"}
+)
+
+_Point = tuple[float, float, int]  # (epoch seconds, value, row index)
+
+
+class _LTTBSeries:
+    """Streaming LTTB for one series; selection lags one bucket behind input."""
+
+    def __init__(self) -> None:
+        self.selected: list[int] = []
+        self._anchor: _Point | None = None
+        self._pending: list[_Point] = []
+        self._filling: list[_Point] = []
+        self._filling_bucket = -1
+        self._last: _Point | None = None
+
+    def add(self, bucket: int, point: _Point) -> None:
+        self._last = point
+        if self._anchor is None:
+            self._anchor = point
+            self.selected.append(point[2])
+            return
+        if bucket != self._filling_bucket and self._filling:
+            self._flush(_centroid(self._filling))
+            self._pending = self._filling
+            self._filling = []
+        self._filling_bucket = bucket
+        self._filling.append(point)
+
+    def finish(self) -> list[int]:
+        last = self._last
+        if last is None or last is self._anchor:
+            return self.selected
+        # The final point is always kept; it anchors the last two buckets.
+        if self._filling and self._filling[-1] is last:
+            self._filling.pop()
+        if self._filling:
+            self._flush(_centroid(self._filling))
+            self._pending = self._filling
+            self._filling = []
+        self._flush((last[0], last[1]))
+        self.selected.append(last[2])
+        return self.selected
+
+    def _flush(self, next_centroid: tuple[float, float]) -> None:
+        if not self._pending or self._anchor is None:
+            return
+        ax, ay, _ = self._anchor
+        cx, cy = next_centroid
+        best = max(self._pending, key=lambda p: abs((ax - cx) * (p[1] - ay) - (ax - p[0]) * (cy - ay)))
+        self.selected.append(best[2])
+        self._anchor = best
+        self._pending = []
+
+
+class _MinMaxSeries:
+    """Streaming per-bucket min/max for one series."""
+
+    def __init__(self) -> None:
+        self.selected: list[int] = []
+        self._bucket = -1
+        self._low: _Point | None = None
+        self._high: _Point | None = None
+
+    def add(self, bucket: int, point: _Point) -> None:
+        if bucket != self._bucket:
+            self._flush()
+            self._bucket = bucket
+        if self._low is None or point[1] < self._low[1]:
+            self._low = point
+        if self._high is None or point[1] > self._high[1]:
+            self._high = point
+
+    def finish(self) -> list[int]:
+        self._flush()
+        return self.selected
+
+    def _flush(self) -> None:
+        if self._low is None or self._high is None:
+            return
+        self.selected.extend(sorted({self._low[2], self._high[2]}))
+        self._low = self._high = None
+
+
+def _centroid(points: list[_Point]) -> tuple[float, float]:
+    return (sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points))
+
+
+def _is_metric_value(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def downsample_rows(
+    rows: Iterable[dict[str, Any]],
+    *,
+    start_epoch: float,
+    end_epoch: float,
+    target: int,
+    mode: str = "lttb",
+) -> list[dict[str, Any]]:
+    """
+    Reduce time-ordered history rows to about ``target`` points per series.
+
+    Args:
+        rows: Rows ordered by ``timestamp`` (may be a streaming iterator)
+        start_epoch: Window start (epoch seconds)
+        end_epoch: Window end (epoch seconds)
+        target: Point budget per series (sensor + metric)
+        mode: ``"lttb"`` or ``"minmax"``
+
+    Returns:
+        The selected rows, in their original order. Rows are kept whole, so a
+        row picked for one metric still carries its other metric values.
+    """
+    if mode not in DOWNSAMPLE_MODES:
+        raise ValueError(f"Unknown downsample mode '{mode}' (expected one of {', '.join(DOWNSAMPLE_MODES)})")
+
+    if mode == "lttb":
+        buckets = max(target - 2, 1)
+        series_factory: type[_LTTBSeries] | type[_MinMaxSeries] = _LTTBSeries
+    else:
+        buckets = max(target // 2, 1)
+        series_factory = _MinMaxSeries
+    width = max(end_epoch - start_epoch, 1e-9) / buckets
+
+    series: dict[tuple[Any, str], _LTTBSeries | _MinMaxSeries] = {}
+    # Only rows some series may still select are held in memory.
+    candidates: dict[int, dict[str, Any]] = {}
+    for index, row in enumerate(rows):
+        parsed = coerce_datetime(row.get("timestamp"))
+        if parsed is None:
+            continue
+        epoch = parsed.timestamp()
+        bucket = min(max(int((epoch - start_epoch) // width), 0), buckets - 1)
+        for key, value in row.items():
+            if key in _NON_METRIC_KEYS or not _is_metric_value(value):
+                continue
+            stream = series.get((row.get("sensor_id"), key))
+            if stream is None:
+                stream = series[(row.get("sensor_id"), key)] = series_factory()
+            stream.add(bucket, (epoch, float(value), index))
+            candidates[index] = row
+        if index % 1024 == 1023:
+            _prune_candidates(candidates, series.values())
+
+    keep: set[int] = set()
+    for stream in series.values():
+        keep.update(stream.finish())
+    return [candidates[index] for index in sorted(keep)]
+
+
+def _prune_candidates(candidates: dict[int, dict[str, Any]], streams: Iterable[Any]) -> None:
+    """Drop rows no series has selected or still holds in a bucket."""
+    live: set[int] = set()
+    for stream in streams:
+        live.update(stream.selected)
+        live.update(point[2] for point in _held_points(stream))
+    for index in [i for i in candidates if i not in live]:
+        del candidates[index]
+
+
+def _held_points(stream: Any) -> Iterator[_Point]:
+    if isinstance(stream, _LTTBSeries):
+        yield from stream._pending
+        yield from stream._filling
+        if stream._last is not None:
+            yield stream._last
+    else:
+        if stream._low is not None:
+            yield stream._low
+        if stream._high is not None:
+            yield stream._high
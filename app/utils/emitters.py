@@ -24,15 +24,27 @@ Created:
 
 Updated:
     December 2025 - Added sensor reading emission support
+
+Emission scheduling:
+    Sensor-driven events (device readings, dashboard frames, unregistered
+    sensor data) go through a per-room scheduler. With ``emit_rate_hz > 0``
+    pending payloads are coalesced per (namespace, room, event, key), so only
+    the latest payload per sensor/unit survives, and flushed at that frame
+    rate. Rooms with no connected clients are skipped. Notifications,
+    alerts and session events are always emitted immediately.
 """
 
 import logging
-from typing import Any, Iterable
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Hashable, Iterable
 
 from flask_socketio import SocketIO
 
 from app.enums.events import WebSocketEvent
 from app.schemas.events import (
+    DashboardDeltaPayload,
     DashboardSnapshotPayload,
     DeviceSensorReadingPayload,
     NotificationPayload,
@@ -45,6 +57,7 @@ logger = logging.getLogger("emitters")
 # WebSocket event names (single source of truth)
 WS_EVENT_DEVICE_READING = WebSocketEvent.DEVICE_SENSOR_READING.value
 WS_EVENT_DASHBOARD_SNAPSHOT = WebSocketEvent.DASHBOARD_SNAPSHOT.value
+WS_EVENT_DASHBOARD_DELTA = WebSocketEvent.DASHBOARD_DELTA.value
 WS_EVENT_UNREGISTERED = WebSocketEvent.UNREGISTERED_SENSOR_DATA.value
 
 # Socket.IO Namespace Constants
@@ -62,15 +75,38 @@ class EmitterService:
 
     Attributes:
         sio: The Socket.IO SocketIO instance for emitting events.
+        dashboard_keyframe_seconds: Max interval between full dashboard
+            snapshots; frames in between are deltas.
+        emit_rate_hz: Flush rate for scheduled sensor events. 0 emits them
+            immediately (still skipping rooms with no clients).
     """
 
     def __init__(
         self,
         sio: SocketIO,
         replay_maxlen: int,
+        dashboard_keyframe_seconds: float = 30.0,
+        emit_rate_hz: float = 0.0,
     ):
         self.sio = sio
         self.replay_maxlen = replay_maxlen
+        self.dashboard_keyframe_seconds = float(dashboard_keyframe_seconds)
+        self.emit_rate_hz = max(0.0, float(emit_rate_hz))
+
+        # Scheduled emissions: (namespace, room, event, key) -> send callable.
+        # A newer payload for the same key replaces the pending one.
+        self._pending: dict[tuple[str, str | None, str, Hashable], Callable[[], None]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_thread: threading.Thread | None = None
+        self._flush_stop = threading.Event()
+        self._emit_stats = {"emitted": 0, "coalesced": 0, "skipped_no_clients": 0}
+
+        # Per-unit dashboard frame state: sequence number, last metrics sent
+        # (as dumped dicts) and when the last keyframe went out (monotonic).
+        self._dashboard_lock = threading.Lock()
+        self._dashboard_seq: dict[int, int] = {}
+        self._dashboard_sent: dict[int, dict[str, Any]] = {}
+        self._dashboard_keyframe_at: dict[int, float] = {}
 
     def emit(
         self,
@@ -89,9 +125,8 @@ class EmitterService:
             namespace (str): Socket.IO namespace to emit under (default "/").
         """
         try:
-            logger.info("📡 Emitting event='%s' to namespace='%s' room='%s'", event, namespace, room or "broadcast")
+            logger.debug("📡 Emitting event='%s' to namespace='%s' room='%s'", event, namespace, room or "broadcast")
             self.sio.emit(event, payload, room=room, namespace=namespace)
-            logger.info("   ✓ Emit successful")
         except Exception as e:
             logger.exception("[Emitter] Failed to emit event '%s' to room '%s': %s", event, room, e)
 
@@ -196,32 +231,212 @@ class EmitterService:
 
     def emit_device_sensor_reading(self, payload: DeviceSensorReadingPayload) -> None:
         """Emit a per-sensor payload to the Devices namespace."""
-        self.emit(
+        self.schedule(
             event=WS_EVENT_DEVICE_READING,
             payload=payload.model_dump(),
             room=f"unit_{payload.unit_id}",
             namespace=SOCKETIO_NAMESPACE_DEVICES,
+            key=payload.sensor_id,
         )
 
     def emit_dashboard_snapshot(self, payload: DashboardSnapshotPayload) -> None:
-        """Emit an aggregated per-unit snapshot to the Dashboard namespace."""
+        """Emit an aggregated per-unit snapshot to the Dashboard namespace.
+
+        The first frame for a unit, and one every ``dashboard_keyframe_seconds``,
+        is the full snapshot (``dashboard_snapshot``). Frames in between are
+        ``dashboard_delta`` events carrying only the metrics that changed.
+        Both carry a per-unit ``seq`` so clients can detect a missed frame and
+        wait for (or request) the next keyframe.
+
+        Snapshots are coalesced before delta encoding, so a scheduled flush
+        never breaks the sequence.
+        """
+        self._schedule_send(
+            SOCKETIO_NAMESPACE_DASHBOARD,
+            f"unit_{payload.unit_id}",
+            WS_EVENT_DASHBOARD_SNAPSHOT,
+            None,
+            partial(self._send_dashboard_frame, payload),
+        )
+
+    def _send_dashboard_frame(self, payload: DashboardSnapshotPayload) -> None:
+        unit_id = int(payload.unit_id)
+        data = payload.model_dump()
+        metrics = data.get("metrics") or {}
+        now = time.monotonic()
+
+        with self._dashboard_lock:
+            previous = self._dashboard_sent.get(unit_id)
+            keyframe_at = self._dashboard_keyframe_at.get(unit_id)
+            keyframe = previous is None or keyframe_at is None or now - keyframe_at >= self.dashboard_keyframe_seconds
+
+            if keyframe:
+                changed = metrics
+                removed: list[str] = []
+            else:
+                changed = {name: value for name, value in metrics.items() if previous.get(name) != value}
+                removed = [name for name in previous if name not in metrics]
+                if not changed and not removed:
+                    return
+
+            seq = self._dashboard_seq.get(unit_id, 0) + 1
+            self._dashboard_seq[unit_id] = seq
+            self._dashboard_sent[unit_id] = metrics
+            if keyframe:
+                self._dashboard_keyframe_at[unit_id] = now
+
+        if keyframe:
+            data["seq"] = seq
+            event = WS_EVENT_DASHBOARD_SNAPSHOT
+        else:
+            data = DashboardDeltaPayload(
+                schema_version=payload.schema_version,
+                unit_id=unit_id,
+                seq=seq,
+                timestamp=payload.timestamp,
+                metrics=changed,
+                removed=removed,
+            ).model_dump()
+            event = WS_EVENT_DASHBOARD_DELTA
+
         self.emit(
-            event=WS_EVENT_DASHBOARD_SNAPSHOT,
-            payload=payload.model_dump(),
-            room=f"unit_{payload.unit_id}",
+            event=event,
+            payload=data,
+            room=f"unit_{unit_id}",
             namespace=SOCKETIO_NAMESPACE_DASHBOARD,
         )
 
+    def request_dashboard_keyframe(self, unit_id: int) -> None:
+        """Send the next dashboard frame for a unit as a full snapshot."""
+        with self._dashboard_lock:
+            self._dashboard_keyframe_at.pop(int(unit_id), None)
+
     def emit_unregistered_sensor_data(self, payload: UnregisteredSensorPayload) -> None:
         """Emit unregistered sensor payload to the Devices namespace."""
         room = f"unit_{payload.unit_id}" if getattr(payload, "unit_id", None) else None
-        self.emit(
+        self.schedule(
             event=WS_EVENT_UNREGISTERED,
             payload=payload.model_dump(),
             room=room,
             namespace=SOCKETIO_NAMESPACE_DEVICES,
+            key=payload.publisher_id,
         )
 
+    # ---------------------------------------------------------------------
+    # Emission scheduler
+    # ---------------------------------------------------------------------
+
+    def schedule(
+        self,
+        event: str,
+        payload: dict,
+        room: str | None = None,
+        namespace: str = "/",
+        key: Hashable = None,
+    ) -> None:
+        """
+        Emit a high-rate event through the scheduler.
+
+        Pending payloads with the same (namespace, room, event, key) are
+        coalesced: only the latest one is sent at the next flush.
+
+        Args:
+            event (str): Event name.
+            payload (dict): JSON serializable data to send.
+            room (Optional[str]): Socket.IO room identifier. Broadcasts if None.
+            namespace (str): Socket.IO namespace to emit under (default "/").
+            key: Coalescing key within the room (e.g. sensor_id).
+        """
+        self._schedule_send(
+            namespace,
+            room,
+            event,
+            key,
+            partial(self.emit, event=event, payload=payload, room=room, namespace=namespace),
+        )
+
+    def flush(self) -> int:
+        """Send all pending scheduled emissions now. Returns the number sent."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+
+        sent = 0
+        for (namespace, room, _event, _key), send in pending.items():
+            if not self._room_has_clients(namespace, room):
+                self._count("skipped_no_clients")
+                continue
+            send()
+            sent += 1
+        if sent:
+            self._count("emitted", sent)
+        return sent
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Scheduler counters for the health endpoint."""
+        with self._pending_lock:
+            return {
+                **self._emit_stats,
+                "pending": len(self._pending),
+                "emit_rate_hz": self.emit_rate_hz,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the flush thread after sending whatever is pending."""
+        self._flush_stop.set()
+        thread = self._flush_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=2.0)
+        self.flush()
+
+    def _schedule_send(
+        self,
+        namespace: str,
+        room: str | None,
+        event: str,
+        key: Hashable,
+        send: Callable[[], None],
+    ) -> None:
+        if self.emit_rate_hz <= 0:
+            if self._room_has_clients(namespace, room):
+                send()
+                self._count("emitted")
+            else:
+                self._count("skipped_no_clients")
+            return
+
+        with self._pending_lock:
+            slot = (namespace, room, event, key)
+            if slot in self._pending:
+                self._emit_stats["coalesced"] += 1
+            self._pending[slot] = send
+            if self._flush_thread is None and not self._flush_stop.is_set():
+                self._flush_thread = threading.Thread(target=self._flush_loop, name="emitter-flush", daemon=True)
+                self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        interval = 1.0 / self.emit_rate_hz
+        while not self._flush_stop.wait(interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.exception("[Emitter] Scheduled flush failed: %s", e)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._pending_lock:
+            self._emit_stats[name] += amount
+
+    def _room_has_clients(self, namespace: str, room: str | None) -> bool:
+        """Return False only when the server reports no clients in the room."""
+        manager = getattr(getattr(self.sio, "server", None), "manager", None)
+        rooms = getattr(manager, "rooms", None)
+        if not isinstance(rooms, dict):
+            # Server not initialised or not introspectable: assume listeners.
+            return True
+        try:
+            return bool(rooms.get(namespace, {}).get(room))
+        except Exception:
+            return True
+
     def emit_sensor_reading(
         self,
         sensor_id: int,
@@ -244,13 +459,13 @@ class EmitterService:
             - Multi-value sensors: expanded format with all readings
         """
         try:
-            logger.info("🎯 EmitterService.emit_sensor_reading: sensor_id=%s namespace=%s", sensor_id, namespace)
+            logger.debug("🎯 EmitterService.emit_sensor_reading: sensor_id=%s namespace=%s", sensor_id, namespace)
             raw_readings = (
                 readings_override if isinstance(readings_override, dict) else (getattr(reading, "data", None) or {})
             )
-            logger.info("   Raw readings: %s", list(raw_readings.keys()))
+            logger.debug("   Raw readings: %s", list(raw_readings.keys()))
             numeric_readings = self._coerce_numeric_readings(raw_readings)
-            logger.info("   Numeric readings: %s", list(numeric_readings.keys()))
+            logger.debug("   Numeric readings: %s", list(numeric_readings.keys()))
 
             if allowed_types is not None:
                 allowed = set(str(x) for x in allowed_types)
@@ -307,19 +522,19 @@ class EmitterService:
                 calibration_applied=bool(getattr(reading, "calibration_applied", False)),
             )
 
-            logger.info("   📦 Payload created: %s", payload.model_dump())
+            logger.debug("   📦 Payload created: %s", payload.model_dump())
 
             # Emit ONE consolidated event per call
-            logger.info(
-                f"   📤 Emitting consolidated '{WS_EVENT_DEVICE_READING}' to namespace={namespace} room=unit_{payload.unit_id}"
+            logger.debug(
+                f"   📤 Scheduling consolidated '{WS_EVENT_DEVICE_READING}' to namespace={namespace} room=unit_{payload.unit_id}"
             )
-            self.emit(
+            self.schedule(
                 event=WS_EVENT_DEVICE_READING,
                 payload=payload.model_dump(),
                 room=f"unit_{payload.unit_id}",
                 namespace=namespace,
+                key=payload.sensor_id,
             )
-            logger.info("   ✅ Emitted consolidated device_sensor_reading event")
 
             logger.debug(
                 f"[Emitter] Sensor reading emitted: sensor_id={sensor_id}, "
@@ -5,6 +5,22 @@ Key invariants (enforced by call sites + tests):
   - Event topics come from enums in app.enums.events (EventType).
   - Payloads are typed dataclasses / Pydantic models in app.schemas.events.
   - Subscribers always receive a plain dict payload.
+
+Partitioned delivery:
+  - ``subscribe(..., partition_key=unit_id)`` (or ``(unit_id, sensor_id)``)
+    only receives events whose payload matches that key, so per-unit
+    controllers are no longer handed every other unit's readings.
+  - Each partition has its own bounded queue, drained one event at a time in
+    round-robin order, so a slow or flooded unit cannot starve the others.
+
+Delivery modes (``subscribe(..., delivery=EventDelivery.X)``):
+  - ``FIFO`` (default): unpartitioned callbacks run on the shared worker pool.
+  - ``ORDERED``: events are routed to the lane of their most specific payload
+    key (``(unit_id, sensor_id)``, else ``unit_id``, else the topic), so one
+    sensor's readings are delivered in publish order.
+  - ``LATEST``: ordered, and while an event for the same (topic, callback,
+    key) is still pending, a newer one replaces its payload instead of
+    queueing behind it. Bursts collapse to the newest reading.
 """
 
 from __future__ import annotations
@@ -12,22 +28,57 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import asdict, is_dataclass
 from enum import Enum
-from queue import Full, Queue
+from queue import Queue
 from typing import Any, Callable, Hashable, Iterable
 
 from pydantic import BaseModel
 
 from app.config import load_config
-from app.enums.events import EventType
+from app.enums.events import EventDelivery, EventType
 
 # Drop warning configuration
 _DROP_WARNING_THRESHOLD = 10  # Log summary every N drops
 _DROP_WARNING_INTERVAL_SECONDS = 60  # Minimum seconds between drop summaries
 
 
+class _PartitionLane:
+    """Bounded FIFO of pending deliveries for one partition key."""
+
+    __slots__ = ("items", "key", "lock", "pending_latest", "scheduled")
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+        # Entries are [event_name, callback, payload, coalesce_key]; lists so a
+        # LATEST delivery can swap in a newer payload without moving the entry.
+        self.items: deque[list[Any]] = deque()
+        self.pending_latest: dict[Hashable, list[Any]] = {}
+        self.scheduled = False
+        self.lock = threading.Lock()
+
+
+def _payload_partition_keys(payload: Any) -> tuple[Hashable, ...]:
+    """Partition keys an event payload can match: ``unit_id`` and ``(unit_id, sensor_id)``."""
+    if not isinstance(payload, dict):
+        return ()
+    try:
+        unit_id = payload.get("unit_id")
+        if unit_id is None:
+            return ()
+        unit_id = int(unit_id)
+    except (TypeError, ValueError):
+        return ()
+    sensor_id = payload.get("sensor_id")
+    if sensor_id is None:
+        return (unit_id,)
+    try:
+        return (unit_id, (unit_id, int(sensor_id)))
+    except (TypeError, ValueError):
+        return (unit_id,)
+
+
 class EventBus:
     """
     Handles event-driven communication across modules.
@@ -43,13 +94,22 @@ class EventBus:
             with cls._lock:
                 if cls._instance is None:
                     instance = super().__new__(cls)
+                    config = load_config()
                     instance.subscribers = defaultdict(list)
-                    instance._queue_size = load_config().eventbus_queue_size
-                    instance._queue = Queue(maxsize=instance._queue_size)
-                    instance._worker_pool_size = load_config().eventbus_worker_count
+                    instance._partitioned = defaultdict(lambda: defaultdict(list))
+                    instance._ordered = defaultdict(list)
+                    instance._lanes = {}
+                    instance._queue_size = config.eventbus_queue_size
+                    instance._partition_queue_size = config.eventbus_partition_queue_size
+                    # Shared deliveries are bounded by _queue_size; lane tokens never block.
+                    instance._queue = Queue()
+                    instance._shared_pending = 0
+                    instance._pending_lock = threading.Lock()
+                    instance._worker_pool_size = config.eventbus_worker_count
                     instance._workers_started = False
                     instance._dropped_events = 0
                     instance._drops_by_event = defaultdict(int)
+                    instance._coalesced_by_event = defaultdict(int)
                     instance._drops_since_last_warning = 0
                     instance._last_drop_warning_time = 0.0
                     cls._instance = instance
@@ -61,6 +121,12 @@ class EventBus:
         """
         if not hasattr(self, "subscribers"):
             self.subscribers: dict[Hashable, list[Callable[[Any], None]]] = defaultdict(list)
+        if not hasattr(self, "_partitioned"):
+            self._partitioned: dict[str, dict[Hashable, list[tuple[Callable[[Any], None], bool]]]] = defaultdict(
+                lambda: defaultdict(list)
+            )
+        if not hasattr(self, "_ordered"):
+            self._ordered: dict[str, list[tuple[Callable[[Any], None], bool]]] = defaultdict(list)
         self.lock = threading.Lock()
         if not getattr(self, "_workers_started", False):
             self._start_workers()
@@ -82,41 +148,96 @@ class EventBus:
                 self._queue_size,
             )
 
-    def subscribe(self, event_name: EventType | str, callback: Callable[[Any], None]) -> Callable[[], None]:
+    def subscribe(
+        self,
+        event_name: EventType | str,
+        callback: Callable[[Any], None],
+        *,
+        partition_key: Hashable | None = None,
+        delivery: EventDelivery | str = EventDelivery.FIFO,
+    ) -> Callable[[], None]:
         """
         Subscribes a callback function to an event.
 
         Args:
             event_name: The enum topic (preferred) or raw string.
             callback: Function to call when the event occurs.
+            partition_key: Optional ``unit_id`` or ``(unit_id, sensor_id)``. When
+                set, the callback only receives events whose payload matches the
+                key, delivered through that partition's own queue.
+            delivery: ``FIFO``, ``ORDERED`` or ``LATEST`` (see module docstring).
+                Partitioned subscriptions are always ordered; ``LATEST`` adds
+                coalescing of pending events per sensor.
         """
         name = event_name.value if isinstance(event_name, Enum) else event_name
+        mode = EventDelivery(delivery)
+        entry = (callback, mode is EventDelivery.LATEST)
         with self.lock:
-            if name not in self.subscribers:
-                self.subscribers[name] = []
-            self.subscribers[name].append(callback)
+            if partition_key is not None:
+                self._partitioned[name][partition_key].append(entry)
+            elif mode is EventDelivery.FIFO:
+                if name not in self.subscribers:
+                    self.subscribers[name] = []
+                self.subscribers[name].append(callback)
+            else:
+                self._ordered[name].append(entry)
 
         def unsubscribe() -> None:
             with self.lock:
-                callbacks = self.subscribers.get(name, [])
+                if partition_key is not None:
+                    callbacks: list[Any] = self._partitioned.get(name, {}).get(partition_key, [])
+                    target: Any = entry
+                elif mode is EventDelivery.FIFO:
+                    callbacks, target = self.subscribers.get(name, []), callback
+                else:
+                    callbacks, target = self._ordered.get(name, []), entry
                 try:
-                    callbacks.remove(callback)
+                    callbacks.remove(target)
                 except ValueError:
                     return
+                if partition_key is not None and not callbacks:
+                    del self._partitioned[name][partition_key]
 
         return unsubscribe
 
     def _worker_loop(self) -> None:
-        """Worker thread loop to process events from the queue."""
+        """Worker thread loop: run shared deliveries and drain partition lanes."""
         while True:
-            event_name, callback, payload = self._queue.get()
+            item = self._queue.get()
             try:
-                callback(payload)
-            except Exception as exc:  # pragma: no cover - defensive
-                logging.error("Error in callback for event %s: %s", event_name, exc)
+                if isinstance(item, _PartitionLane):
+                    self._run_lane(item)
+                else:
+                    event_name, callback, payload = item
+                    with self._pending_lock:
+                        self._shared_pending -= 1
+                    self._invoke(event_name, callback, payload)
             finally:
                 self._queue.task_done()
 
+    def _run_lane(self, lane: _PartitionLane) -> None:
+        """Deliver one event from a lane, then requeue it behind other ready work."""
+        with lane.lock:
+            if not lane.items:
+                lane.scheduled = False
+                return
+            event_name, callback, payload, coalesce_key = lane.items.popleft()
+            if coalesce_key is not None:
+                lane.pending_latest.pop(coalesce_key, None)
+        self._invoke(event_name, callback, payload)
+        with lane.lock:
+            if lane.items:
+                self._queue.put(lane)
+            else:
+                lane.scheduled = False
+
+    @staticmethod
+    def _invoke(event_name: str, callback: Callable[[Any], None], payload: Any) -> None:
+        try:
+            callback(payload)
+        except Exception as exc:  # pragma: no cover - defensive
+            logging.error("Error in callback for event %s: %s", event_name, exc)
+
     def publish(self, event_name: EventType | str, data: Any | None = None) -> None:
         """
         Publishes an event, calling all subscribed callback functions.
@@ -135,21 +256,80 @@ class EventBus:
         else:
             payload = data
 
+        laned: list[tuple[Hashable, Callable[[Any], None], bool]] = []
+        keys: tuple[Hashable, ...] = ()
         with self.lock:
             callbacks: Iterable[Callable[[Any], None]] = self.subscribers.get(name, [])
             callbacks = list(callbacks)
+            by_key = self._partitioned.get(name)
+            ordered = self._ordered.get(name)
+            if by_key or ordered:
+                keys = _payload_partition_keys(payload)
+                if by_key:
+                    for key in keys:
+                        laned.extend((key, callback, latest) for callback, latest in by_key.get(key, ()))
+                if ordered:
+                    lane_key = keys[-1] if keys else ("topic", name)
+                    laned.extend((lane_key, callback, latest) for callback, latest in ordered)
         for callback in callbacks:
-            try:
-                self._queue.put_nowait((name, callback, payload))
-            except Full:
+            with self._pending_lock:
+                if self._shared_pending >= self._queue_size:
+                    full = True
+                else:
+                    full = False
+                    self._shared_pending += 1
+            if full:
                 self._record_drop(name)
                 break
+            self._queue.put((name, callback, payload))
+        if laned:
+            # Coalesce per sensor even on unit lanes, so one sensor's burst
+            # never replaces another sensor's pending reading.
+            sensor_key = keys[-1] if keys else None
+            for key, callback, latest in laned:
+                coalesce_key = (name, callback, sensor_key) if latest else None
+                self._enqueue_partitioned(key, name, callback, payload, coalesce_key)
+
+    def _enqueue_partitioned(
+        self,
+        key: Hashable,
+        event_name: str,
+        callback: Callable[[Any], None],
+        payload: Any,
+        coalesce_key: Hashable | None = None,
+    ) -> None:
+        lane = self._lanes.get(key)
+        if lane is None:
+            with self.lock:
+                lane = self._lanes.setdefault(key, _PartitionLane(key))
+        coalesced = dropped = False
+        with lane.lock:
+            pending = lane.pending_latest.get(coalesce_key) if coalesce_key is not None else None
+            if pending is not None:
+                pending[2] = payload
+                coalesced = True
+            elif len(lane.items) >= self._partition_queue_size:
+                dropped = True
+            else:
+                entry = [event_name, callback, payload, coalesce_key]
+                lane.items.append(entry)
+                if coalesce_key is not None:
+                    lane.pending_latest[coalesce_key] = entry
+                if not lane.scheduled:
+                    lane.scheduled = True
+                    self._queue.put(lane)
+        if coalesced:
+            with self._pending_lock:
+                self._coalesced_by_event[event_name] += 1
+        elif dropped:
+            self._record_drop(event_name)
 
     def _record_drop(self, event_name: str) -> None:
-        """Record a dropped event and log periodic warnings."""
-        self._dropped_events += 1
-        self._drops_by_event[event_name] += 1
-        self._drops_since_last_warning += 1
+        """Record a dropped event (per topic) and log periodic warnings."""
+        with self._pending_lock:
+            self._dropped_events += 1
+            self._drops_by_event[event_name] += 1
+            self._drops_since_last_warning += 1
 
         # Check if we should log a summary warning
         now = time.time()
@@ -191,21 +371,33 @@ class EventBus:
 
     def get_metrics(self) -> dict[str, Any]:
         """Return lightweight metrics for health endpoints/logging."""
-        try:
-            queue_depth = self._queue.qsize()
-        except Exception:
-            queue_depth = 0
+        lanes = list(getattr(self, "_lanes", {}).values())
+        partition_depths = {str(lane.key): len(lane.items) for lane in lanes if lane.items}
+        shared_depth = getattr(self, "_shared_pending", 0)
 
         # Get top 5 dropped event types for diagnostics
-        drops_by_event = getattr(self, "_drops_by_event", {})
+        drops_by_event = dict(getattr(self, "_drops_by_event", {}))
         top_dropped = dict(sorted(drops_by_event.items(), key=lambda x: x[1], reverse=True)[:5])
+        partitioned_subscribers = sum(
+            len(callbacks) for by_key in getattr(self, "_partitioned", {}).values() for callbacks in by_key.values()
+        )
+        ordered_subscribers = sum(len(entries) for entries in getattr(self, "_ordered", {}).values())
+        coalesced_by_event = dict(getattr(self, "_coalesced_by_event", {}))
 
         return {
-            "queue_depth": queue_depth,
+            "queue_depth": shared_depth + sum(partition_depths.values()),
             "queue_size": getattr(self, "_queue_size", 0),
+            "partition_queue_size": getattr(self, "_partition_queue_size", 0),
+            "partitions": len(lanes),
+            "partition_depths": partition_depths,
             "dropped_events": getattr(self, "_dropped_events", 0),
             "drops_by_event_top5": top_dropped,
-            "subscribers": sum(len(values) for values in self.subscribers.values()),
+            "drops_by_topic": drops_by_event,
+            "coalesced_events": sum(coalesced_by_event.values()),
+            "coalesced_by_topic": coalesced_by_event,
+            "subscribers": (
+                sum(len(values) for values in self.subscribers.values()) + partitioned_subscribers + ordered_subscribers
+            ),
             "is_dropping": getattr(self, "_drops_since_last_warning", 0) > 0,
         }
 
@@ -21,7 +21,8 @@ os.makedirs(_VAR_DIR, exist_ok=True)
 
 
 def _path(name: str) -> str:
-    return os.path.join(_VAR_DIR, name)
+    # Bare names live under var/; absolute paths are used as given
+    return name if os.path.isabs(name) else os.path.join(_VAR_DIR, name)
 
 
 class FileLock:
@@ -87,6 +88,7 @@ def save_json(name: str, data: dict[str, Any]) -> None:
     path = _path(name)
     lock = path + ".lock"
     try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
         with FileLock(lock):
             tmp = path + ".tmp"
             with open(tmp, "w", encoding="utf-8") as fh:
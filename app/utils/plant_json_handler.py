@@ -1,16 +1,197 @@
+import contextlib
 import json
 import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 # Point to the authoritative plants_info.json in the backend root directory
 _DEFAULT_DATASET = Path(__file__).resolve().parent.parent.parent / "plants_info.json"
 
+# Stage names that fall back to another stage's lighting settings
+_LIGHTING_STAGE_ALIASES = {
+    "germination": "seedling",
+    "veg": "vegetative",
+    "flower": "flowering",
+    "bloom": "flowering",
+    "fruit": "fruiting",
+    "fruit development": "fruiting",
+    "harvest": "fruiting",  # Default to fruiting settings for harvest
+}
+
+
+def _normalize(name: Any) -> str | None:
+    return name.strip().lower() if isinstance(name, str) and name.strip() else None
+
+
+@dataclass
+class _CatalogEntry:
+    """A plant entry with its precompiled per-stage tables."""
+
+    plant: dict[str, Any]
+    stages: dict[str, dict[str, Any]] = field(default_factory=dict)
+    lighting: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, plant: dict[str, Any]) -> "_CatalogEntry":
+        entry = cls(plant)
+        for stage in plant.get("growth_stages") or []:
+            key = _normalize(stage.get("stage")) if isinstance(stage, dict) else None
+            if key:
+                entry.stages.setdefault(key, stage)
+
+        automation = plant.get("automation") or {}
+        schedule = automation.get("lighting_schedule") if isinstance(automation, dict) else None
+        if isinstance(schedule, dict):
+            entry.lighting = {str(stage).lower(): settings for stage, settings in schedule.items()}
+            for alias, target in _LIGHTING_STAGE_ALIASES.items():
+                if alias not in entry.lighting and target in entry.lighting:
+                    entry.lighting[alias] = entry.lighting[target]
+        return entry
+
+
+class _PlantCatalog:
+    """
+    Parsed plant dataset shared by every handler for the same file.
+
+    Lookups go through dictionaries built once per load: by id, by
+    normalized common name, and by any name a plant answers to (common
+    name, species, scientific name, aliases). The file is re-read only
+    when its mtime or size changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.data: dict[str, Any] = {"plants_info": []}
+        self.by_id: dict[Any, dict[str, Any]] = {}
+        self.by_common_name: dict[str, dict[str, Any]] = {}
+        self.by_name: dict[str, _CatalogEntry] = {}
+        self.by_difficulty: dict[str, list[dict[str, Any]]] = {}
+        self._signature: tuple[int, int] | None = None
+        self._loaded = False
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> None:
+        """Reload from disk if the file changed since the last load or save."""
+        signature = self._stat()
+        if self._loaded and signature == self._signature:
+            return
+        with self.lock:
+            signature = self._stat()
+            if self._loaded and signature == self._signature:
+                return
+            self.data = self._load()
+            self._signature = signature
+            self._loaded = True
+            self.reindex()
+
+    def _load(self) -> dict[str, Any]:
+        """Loads the JSON file. Creates a new structure if missing or invalid."""
+        if not self.path.exists():
+            logging.info("%s not found. Initialising empty dataset.", self.path)
+            return {"plants_info": []}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except json.JSONDecodeError:
+            logging.error("Failed to parse %s. Falling back to empty dataset.", self.path)
+            return {"plants_info": []}
+
+        if "plants_info" not in data or not isinstance(data["plants_info"], list):
+            logging.warning("Invalid plant dataset format. Resetting file.")
+            return {"plants_info": []}
+        return data
+
+    def reindex(self) -> None:
+        """Rebuild the lookup tables; the first plant claiming a key wins, as a linear scan would."""
+        by_id: dict[Any, dict[str, Any]] = {}
+        by_common_name: dict[str, dict[str, Any]] = {}
+        by_name: dict[str, _CatalogEntry] = {}
+        by_difficulty: dict[str, list[dict[str, Any]]] = {}
+
+        for plant in self.data["plants_info"]:
+            if "id" in plant:
+                by_id.setdefault(plant["id"], plant)
+            common = _normalize(plant.get("common_name"))
+            if common:
+                by_common_name.setdefault(common, plant)
+
+            entry = _CatalogEntry.build(plant)
+            names = [plant.get("common_name"), plant.get("species"), plant.get("scientific_name")]
+            if isinstance(plant.get("aliases"), list):
+                names.extend(plant["aliases"])
+            for name in names:
+                key = _normalize(name)
+                if key:
+                    by_name.setdefault(key, entry)
+
+            difficulty = (plant.get("yield_data") or {}).get("difficulty_level")
+            if isinstance(difficulty, str):
+                by_difficulty.setdefault(difficulty.lower(), []).append(plant)
+
+        self.by_id = by_id
+        self.by_common_name = by_common_name
+        self.by_name = by_name
+        self.by_difficulty = by_difficulty
+
+    def save(self) -> bool:
+        """Write the dataset atomically (temp file + rename) and reindex it."""
+        with self.lock:
+            self.reindex()
+            tmp_path = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent)
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(self.data, handle, indent=4)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                os.replace(tmp_path, self.path)
+                tmp_path = None
+            except (OSError, TypeError, ValueError) as exc:
+                logging.error("Failed to write plant dataset: %s", exc)
+                return False
+            finally:
+                if tmp_path:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
+            self._signature = self._stat()
+            logging.info("Plant dataset persisted to %s.", self.path)
+            return True
+
+
+_catalogs: dict[Path, _PlantCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def _shared_catalog(path: Path) -> _PlantCatalog:
+    key = path.resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = _PlantCatalog(key)
+    return catalog
+
 
 class PlantJsonHandler:
     """
     Handles reading, writing, and updating the plant JSON dataset.
     Supports all enhanced fields: automation, common_issues, companion_plants, harvest_guide.
+
+    Handlers are cheap views over a process-wide catalog per file, so
+    constructing one does not re-read the dataset and writes through any
+    handler are visible to all of them.
     """
 
     # Required fields for complete plant validation
@@ -36,36 +217,26 @@ class PlantJsonHandler:
 
     def __init__(self, json_file: str | Path | None = None):
         self.json_path = Path(json_file) if json_file else _DEFAULT_DATASET
-        self.data = self._load_json()
+        self._catalog = _shared_catalog(self.json_path)
+        self._catalog.refresh()
 
-    def _load_json(self) -> dict[str, Any]:
-        """Loads the JSON file. Creates a new structure if missing or invalid."""
-        if not self.json_path.exists():
-            logging.info("%s not found. Initialising empty dataset.", self.json_path)
-            return {"plants_info": []}
-
-        try:
-            with self.json_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except json.JSONDecodeError:
-            logging.error("Failed to parse %s. Falling back to empty dataset.", self.json_path)
-            return {"plants_info": []}
+    @property
+    def data(self) -> dict[str, Any]:
+        """The shared dataset, reloaded first if the file changed on disk."""
+        self._catalog.refresh()
+        return self._catalog.data
 
-        if "plants_info" not in data or not isinstance(data["plants_info"], list):
-            logging.warning("Invalid plant dataset format. Resetting file.")
-            return {"plants_info": []}
-        return data
+    def _indexed(self) -> _PlantCatalog:
+        self._catalog.refresh()
+        return self._catalog
 
     def save_json(self) -> bool:
         """Saves the current dataset to disk."""
-        try:
-            with self.json_path.open("w", encoding="utf-8") as handle:
-                json.dump(self.data, handle, indent=4)
-            logging.info("Plant dataset persisted to %s.", self.json_path)
-            return True
-        except OSError as exc:
-            logging.error("Failed to write plant dataset: %s", exc)
-            return False
+        return self._catalog.save()
+
+    def _lookup(self, plant_name: str) -> _CatalogEntry | None:
+        key = _normalize(plant_name)
+        return self._indexed().by_name.get(key) if key else None
 
     def get_growth_stages(self, plant_name: str) -> list[dict[str, Any]]:
         """
@@ -77,19 +248,9 @@ class PlantJsonHandler:
         Returns:
             Growth stages if found, otherwise an empty list.
         """
-        target = plant_name.strip().lower()
-        for entry in self.data["plants_info"]:
-            candidates: list[str | None] = [
-                entry.get("common_name"),
-                entry.get("species"),
-                entry.get("scientific_name"),
-            ]
-            # Support aliases if present in the dataset
-            if "aliases" in entry and isinstance(entry["aliases"], list):
-                candidates.extend(entry["aliases"])
-
-            if any(name and name.lower() == target for name in candidates):
-                return entry.get("growth_stages", [])
+        entry = self._lookup(plant_name)
+        if entry:
+            return entry.plant.get("growth_stages", [])
 
         logging.warning("Growth stages for '%s' not found in dataset.", plant_name)
         return []
@@ -104,35 +265,24 @@ class PlantJsonHandler:
 
         Returns None when unavailable.
         """
-        target = plant_name.strip().lower()
-        for entry in self.data["plants_info"]:
-            candidates: list[str | None] = [
-                entry.get("common_name"),
-                entry.get("species"),
-                entry.get("scientific_name"),
-            ]
-            if "aliases" in entry and isinstance(entry["aliases"], list):
-                candidates.extend(entry["aliases"])
-
-            if not any(name and name.lower() == target for name in candidates):
-                continue
-
-            raw = entry.get("gdd_base_temp_c")
-            if raw is None:
-                thermal = entry.get("thermal_time") or {}
-                if isinstance(thermal, dict):
-                    raw = thermal.get("base_temp_c")
+        entry = self._find_plant_entry(plant_name)
+        if not entry:
+            return None
 
-            if raw is None:
-                return None
+        raw = entry.get("gdd_base_temp_c")
+        if raw is None:
+            thermal = entry.get("thermal_time") or {}
+            if isinstance(thermal, dict):
+                raw = thermal.get("base_temp_c")
 
-            try:
-                return float(raw)
-            except (TypeError, ValueError):
-                logging.warning("Invalid gdd_base_temp_c for '%s': %r", plant_name, raw)
-                return None
+        if raw is None:
+            return None
 
-        return None
+        try:
+            return float(raw)
+        except (TypeError, ValueError):
+            logging.warning("Invalid gdd_base_temp_c for '%s': %r", plant_name, raw)
+            return None
 
     def _find_plant_entry(self, plant_name: str) -> dict[str, Any] | None:
         """
@@ -144,19 +294,8 @@ class PlantJsonHandler:
         Returns:
             Plant entry dict if found, None otherwise.
         """
-        target = plant_name.strip().lower()
-        for entry in self.data["plants_info"]:
-            candidates: list[str | None] = [
-                entry.get("common_name"),
-                entry.get("species"),
-                entry.get("scientific_name"),
-            ]
-            if "aliases" in entry and isinstance(entry["aliases"], list):
-                candidates.extend(entry["aliases"])
-
-            if any(name and name.lower() == target for name in candidates):
-                return entry
-        return None
+        entry = self._lookup(plant_name)
+        return entry.plant if entry else None
 
     def get_lighting_schedule(self, plant_name: str) -> dict[str, dict[str, Any]]:
         """
@@ -204,40 +343,44 @@ class PlantJsonHandler:
             Lighting settings for the stage: {"hours": 16, "intensity": 80}
             Returns None if plant/stage not found.
         """
-        lighting_schedule = self.get_lighting_schedule(plant_name)
-        if not lighting_schedule:
+        entry = self._lookup(plant_name)
+        if not entry:
+            logging.warning("Lighting schedule for '%s' not found in dataset.", plant_name)
+            return None
+        if not entry.lighting:
+            logging.debug("No lighting schedule defined for '%s'.", plant_name)
             return None
 
-        # Normalize stage name for lookup (lowercase, handle variations)
-        stage_lower = stage.strip().lower()
-
-        # Direct match
-        if stage_lower in lighting_schedule:
-            return lighting_schedule[stage_lower]
-
-        # Try common variations
-        stage_mappings = {
-            "germination": "seedling",
-            "veg": "vegetative",
-            "flower": "flowering",
-            "bloom": "flowering",
-            "fruit": "fruiting",
-            "fruit development": "fruiting",
-            "harvest": "fruiting",  # Default to fruiting settings for harvest
-        }
-
-        mapped_stage = stage_mappings.get(stage_lower)
-        if mapped_stage and mapped_stage in lighting_schedule:
-            return lighting_schedule[mapped_stage]
+        # Stage variations (veg, bloom, ...) are resolved when the catalog is indexed
+        settings = entry.lighting.get(stage.strip().lower())
+        if settings is not None:
+            return settings
 
         logging.debug(
             "No lighting settings for stage '%s' in plant '%s'. Available stages: %s",
             stage,
             plant_name,
-            list(lighting_schedule.keys()),
+            list((entry.plant.get("automation") or {}).get("lighting_schedule") or {}),
         )
         return None
 
+    def get_growth_stage(self, plant_name: str, stage: str) -> dict[str, Any] | None:
+        """
+        Retrieves a single growth stage (conditions, sensor targets, duration).
+
+        Args:
+            plant_name: Name of the plant (common name, species, or alias).
+            stage: Growth stage name, case-insensitive.
+
+        Returns:
+            The stage entry, or None if plant/stage not found.
+        """
+        entry = self._lookup(plant_name)
+        key = _normalize(stage)
+        if not entry or not key:
+            return None
+        return entry.stages.get(key)
+
     def get_automation_settings(self, plant_name: str) -> dict[str, Any]:
         """
         Retrieves all automation settings for a plant.
@@ -349,25 +492,26 @@ class PlantJsonHandler:
 
     def add_plant(self, new_plant: dict[str, Any]) -> bool:
         """Adds a new plant to the dataset if it doesn't already exist."""
-        target = new_plant.get("common_name", "").strip().lower()
+        target = _normalize(new_plant.get("common_name", ""))
         if not target:
             logging.warning("Cannot add plant without a common name.")
             return False
 
-        for plant in self.data["plants_info"]:
-            if plant.get("common_name", "").strip().lower() == target:
+        catalog = self._indexed()
+        with catalog.lock:
+            if target in catalog.by_common_name:
                 logging.warning("Plant '%s' already exists in dataset.", new_plant["common_name"])
                 return False
 
-        next_id = max((p.get("id", 0) for p in self.data["plants_info"]), default=0) + 1
-        new_plant["id"] = next_id
-        self.data["plants_info"].append(new_plant)
-        return self.save_json()
+            next_id = max((p.get("id", 0) for p in catalog.data["plants_info"]), default=0) + 1
+            new_plant["id"] = next_id
+            catalog.data["plants_info"].append(new_plant)
+            return self.save_json()
 
     def plant_exists(self, plant_name: str) -> bool:
         """Checks if a plant exists in the dataset."""
-        target = plant_name.strip().lower()
-        return any(plant.get("common_name", "").strip().lower() == target for plant in self.data["plants_info"])
+        target = _normalize(plant_name)
+        return bool(target) and target in self._indexed().by_common_name
 
     def list_plants(self) -> list[str]:
         """Returns a list of all plant names in the dataset."""
@@ -385,11 +529,10 @@ class PlantJsonHandler:
         Returns:
             Plant data if found, None otherwise.
         """
-        for plant in self.data["plants_info"]:
-            if plant.get("id") == plant_id:
-                return plant
-        logging.warning("Plant with ID %d not found.", plant_id)
-        return None
+        plant = self._indexed().by_id.get(plant_id)
+        if plant is None:
+            logging.warning("Plant with ID %d not found.", plant_id)
+        return plant
 
     def update_plant(self, plant_id: int, updated_data: dict[str, Any], validate: bool = True) -> bool:
         """
@@ -403,19 +546,20 @@ class PlantJsonHandler:
         Returns:
             True if update successful, False otherwise.
         """
-        plant = self.get_plant_by_id(plant_id)
-        if not plant:
-            logging.error("Cannot update: Plant ID %d not found.", plant_id)
-            return False
+        with self._indexed().lock:
+            plant = self.get_plant_by_id(plant_id)
+            if not plant:
+                logging.error("Cannot update: Plant ID %d not found.", plant_id)
+                return False
 
-        # Update fields
-        plant.update(updated_data)
+            # Update fields
+            plant.update(updated_data)
 
-        # Validate structure if requested
-        if validate and not self.validate_plant_structure(plant):
-            logging.warning("Plant ID %d updated but validation warnings exist.", plant_id)
+            # Validate structure if requested
+            if validate and not self.validate_plant_structure(plant):
+                logging.warning("Plant ID %d updated but validation warnings exist.", plant_id)
 
-        return self.save_json()
+            return self.save_json()
 
     def validate_plant_structure(self, plant_data: dict[str, Any], strict: bool = False) -> bool:
         """
@@ -450,12 +594,14 @@ class PlantJsonHandler:
         Returns:
             True if deleted, False if not found.
         """
-        initial_count = len(self.data["plants_info"])
-        self.data["plants_info"] = [p for p in self.data["plants_info"] if p.get("id") != plant_id]
+        catalog = self._indexed()
+        with catalog.lock:
+            initial_count = len(catalog.data["plants_info"])
+            catalog.data["plants_info"] = [p for p in catalog.data["plants_info"] if p.get("id") != plant_id]
 
-        if len(self.data["plants_info"]) < initial_count:
-            logging.info("Deleted plant ID %d.", plant_id)
-            return self.save_json()
+            if len(catalog.data["plants_info"]) < initial_count:
+                logging.info("Deleted plant ID %d.", plant_id)
+                return self.save_json()
 
         logging.warning("Plant ID %d not found for deletion.", plant_id)
         return False
@@ -473,15 +619,16 @@ class PlantJsonHandler:
         Returns:
             True if successful, False otherwise.
         """
-        plant = self.get_plant_by_id(plant_id)
-        if not plant:
-            return False
+        with self._indexed().lock:
+            plant = self.get_plant_by_id(plant_id)
+            if not plant:
+                return False
 
-        if "automation" not in plant:
-            plant["automation"] = {}
+            if "automation" not in plant:
+                plant["automation"] = {}
 
-        plant["automation"].update(automation_data)
-        return self.save_json()
+            plant["automation"].update(automation_data)
+            return self.save_json()
 
     def update_common_issues(self, plant_id: int, issues: list[dict[str, Any]]) -> bool:
         """
@@ -494,12 +641,13 @@ class PlantJsonHandler:
         Returns:
             True if successful, False otherwise.
         """
-        plant = self.get_plant_by_id(plant_id)
-        if not plant:
-            return False
+        with self._indexed().lock:
+            plant = self.get_plant_by_id(plant_id)
+            if not plant:
+                return False
 
-        plant["common_issues"] = issues
-        return self.save_json()
+            plant["common_issues"] = issues
+            return self.save_json()
 
     def add_companion_plant(self, plant_id: int, companion_data: dict[str, Any]) -> bool:
         """
@@ -512,20 +660,21 @@ class PlantJsonHandler:
         Returns:
             True if successful, False otherwise.
         """
-        plant = self.get_plant_by_id(plant_id)
-        if not plant:
-            return False
+        with self._indexed().lock:
+            plant = self.get_plant_by_id(plant_id)
+            if not plant:
+                return False
 
-        if "companion_plants" not in plant:
-            plant["companion_plants"] = {"beneficial": [], "plants_to_avoid": []}
+            if "companion_plants" not in plant:
+                plant["companion_plants"] = {"beneficial": [], "plants_to_avoid": []}
 
-        if "beneficial" in companion_data:
-            plant["companion_plants"]["beneficial"].extend(companion_data["beneficial"])
+            if "beneficial" in companion_data:
+                plant["companion_plants"]["beneficial"].extend(companion_data["beneficial"])
 
-        if "plants_to_avoid" in companion_data:
-            plant["companion_plants"]["plants_to_avoid"].extend(companion_data["plants_to_avoid"])
+            if "plants_to_avoid" in companion_data:
+                plant["companion_plants"]["plants_to_avoid"].extend(companion_data["plants_to_avoid"])
 
-        return self.save_json()
+            return self.save_json()
 
     def update_harvest_guide(self, plant_id: int, guide_data: dict[str, Any]) -> bool:
         """
@@ -538,15 +687,16 @@ class PlantJsonHandler:
         Returns:
             True if successful, False otherwise.
         """
-        plant = self.get_plant_by_id(plant_id)
-        if not plant:
-            return False
+        with self._indexed().lock:
+            plant = self.get_plant_by_id(plant_id)
+            if not plant:
+                return False
 
-        if "harvest_guide" not in plant:
-            plant["harvest_guide"] = {}
+            if "harvest_guide" not in plant:
+                plant["harvest_guide"] = {}
 
-        plant["harvest_guide"].update(guide_data)
-        return self.save_json()
+            plant["harvest_guide"].update(guide_data)
+            return self.save_json()
 
     # Search and Filter Methods
 
@@ -560,8 +710,15 @@ class PlantJsonHandler:
         Returns:
             List of plants matching all criteria.
         """
+        catalog = self._indexed()
+        candidates = catalog.data["plants_info"]
+        if "common_name" in criteria:
+            # Common names are unique in the catalog, so the index narrows this to one plant
+            plant = catalog.by_common_name.get(_normalize(str(criteria["common_name"])) or "")
+            candidates = [plant] if plant is not None else []
+
         results = []
-        for plant in self.data["plants_info"]:
+        for plant in candidates:
             matches = all(plant.get(key, "").lower() == str(value).lower() for key, value in criteria.items())
             if matches:
                 results.append(plant)
@@ -578,15 +735,7 @@ class PlantJsonHandler:
         Returns:
             List of plants matching the difficulty level.
         """
-        results = []
-        target = difficulty_level.lower()
-
-        for plant in self.data["plants_info"]:
-            plant_difficulty = plant.get("yield_data", {}).get("difficulty_level", "").lower()
-            if plant_difficulty == target:
-                results.append(plant)
-
-        return results
+        return list(self._indexed().by_difficulty.get(difficulty_level.lower(), []))
 
     def get_plants_requiring_automation(self) -> list[dict[str, Any]]:
         """
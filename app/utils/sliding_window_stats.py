@@ -0,0 +1,141 @@
+"""Fixed-size sliding window of timestamped samples with O(1) running statistics."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator
+
+
+class SlidingWindowStats:
+    """
+    Keeps the last ``size`` (timestamp, value) samples and their statistics.
+
+    Mean and variance use Welford's update with a matching removal step,
+    min/max use monotonic deques, and the mean absolute rate of change
+    between consecutive samples is a running sum. Adding a sample is
+    amortized O(1); the running sums are recomputed exactly once per
+    ``size`` evictions to stop floating-point drift.
+    """
+
+    def __init__(self, size: int):
+        self.size = max(1, int(size))
+        # (timestamp, value, rate from the previous sample or None)
+        self._samples: deque[tuple[float, float, float | None]] = deque()
+        self._seq = 0  # sequence number of the next sample
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._rate_sum = 0.0
+        self._rate_count = 0
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def last(self) -> tuple[float, float]:
+        """Timestamp and value of the newest sample."""
+        ts, value, _ = self._samples[-1]
+        return ts, value
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window."""
+        n = len(self._samples)
+        return (max(self._m2, 0.0) / n) ** 0.5 if n else 0.0
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1]
+
+    @property
+    def mean_rate(self) -> float | None:
+        """Mean absolute change per second between consecutive samples, or None."""
+        return self._rate_sum / self._rate_count if self._rate_count else None
+
+    def recent_values(self, count: int) -> Iterator[float]:
+        """Up to ``count`` newest values, newest first."""
+        return (value for _, value, _ in islice(reversed(self._samples), count))
+
+    def samples(self) -> list[tuple[float, float]]:
+        """Window contents as (timestamp, value) pairs, oldest first."""
+        return [(ts, value) for ts, value, _ in self._samples]
+
+    def extend(self, samples: Iterable[tuple[float, float]]) -> None:
+        for ts, value in samples:
+            self.add(ts, value)
+
+    def add(self, ts: float, value: float) -> None:
+        """Append a sample, evicting the oldest when the window is full."""
+        if len(self._samples) >= self.size:
+            self._evict()
+
+        rate = None
+        if self._samples:
+            prev_ts, prev_value, _ = self._samples[-1]
+            elapsed = ts - prev_ts
+            if elapsed > 0:
+                rate = abs(value - prev_value) / elapsed
+                self._rate_sum += rate
+                self._rate_count += 1
+        self._samples.append((ts, value, rate))
+
+        n = len(self._samples)
+        delta = value - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (value - self._mean)
+
+        seq = self._seq
+        self._seq += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+    def _evict(self) -> None:
+        _, value, _ = self._samples.popleft()
+        evicted_seq = self._seq - len(self._samples) - 1
+
+        n = len(self._samples)
+        if n:
+            delta = value - self._mean
+            self._mean -= delta / n
+            self._m2 -= delta * (value - self._mean)
+            # The new oldest sample's rate referred to the evicted one
+            rate = self._samples[0][2]
+            if rate is not None:
+                self._rate_sum -= rate
+                self._rate_count -= 1
+        else:
+            self._mean = self._m2 = self._rate_sum = 0.0
+            self._rate_count = 0
+
+        if self._min and self._min[0][0] <= evicted_seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] <= evicted_seq:
+            self._max.popleft()
+
+        self._evictions += 1
+        if self._evictions % self.size == 0:
+            self._recompute()
+
+    def _recompute(self) -> None:
+        values = [value for _, value, _ in self._samples]
+        n = len(values)
+        self._mean = sum(values) / n if n else 0.0
+        self._m2 = sum((v - self._mean) ** 2 for v in values)
+        rates = [rate for _, _, rate in islice(self._samples, 1, None) if rate is not None]
+        self._rate_sum = sum(rates)
+        self._rate_count = len(rates)
@@ -31,9 +31,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from functools import wraps
 from typing import TYPE_CHECKING, Any
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from app.enums import ScheduleState
+from app.services.hardware.schedule_transition_engine import get_active_unit_ids, get_unit_timezone
 
 if TYPE_CHECKING:
     from app.services.container import ServiceContainer
@@ -280,30 +279,20 @@ def plant_health_check_task(container: "ServiceContainer") -> dict[str, Any]:
 
 # ==================== Actuator Namespace Tasks ====================
 
-# State tracking for schedule transitions (keyed by schedule_id)
-_schedule_last_state: dict[int, bool] = {}
-# Effective actuator command state (keyed by actuator_id)
-_actuator_last_command: dict[int, tuple[str, float | None]] = {}
-# Last schedule that drove each actuator command
-_actuator_last_schedule: dict[int, int | None] = {}
-
 
 def actuator_startup_sync_task(container: "ServiceContainer") -> dict[str, Any]:
     """
     Synchronize actuator states with active schedules at system startup.
 
     This task runs once at startup to ensure actuators are in the correct
-    state based on currently active schedules, rather than waiting for the
-    next scheduled check.
+    state based on currently active schedules, then starts the schedule
+    transition engine which takes over from there.
 
     Celery name: actuator.startup_sync
     """
     actuator_service = getattr(container, "actuator_management_service", None)
     growth_service = getattr(container, "growth_service", None)
 
-    global _actuator_last_command
-    global _actuator_last_schedule
-
     results = {
         "units_synced": 0,
         "actuators_synced": 0,
@@ -320,58 +309,56 @@ def actuator_startup_sync_task(container: "ServiceContainer") -> dict[str, Any]:
             return results
 
         # Get all unit IDs
-        unit_ids = _get_active_unit_ids(growth_service)
-        if not unit_ids:
-            return results
-
-        # Resolve per-unit timezones (if available)
-        unit_timezones = {unit_id: _get_unit_timezone(growth_service, unit_id) for unit_id in unit_ids}
-
-        # Perform startup sync - actuator_service now has all manager methods
-        sync_results = scheduling_service.sync_actuator_states_at_startup(
-            unit_ids=unit_ids,
-            actuator_manager=actuator_service,
-            unit_timezones=unit_timezones,
-        )
-
-        # Initialize _schedule_last_state from service's execution state
-        for schedule_id, was_active in scheduling_service._last_execution_state.items():
-            _schedule_last_state[schedule_id] = was_active
-        _actuator_last_command = {}
-        _actuator_last_schedule = {}
-
-        results.update(sync_results)
-        logger.info(
-            "Startup sync completed: %s units, %s actuators synchronized",
-            results["units_synced"],
-            results["actuators_synced"],
-        )
+        unit_ids = get_active_unit_ids(growth_service)
+        if unit_ids:
+            # Resolve per-unit timezones (if available)
+            unit_timezones = {unit_id: get_unit_timezone(growth_service, unit_id) for unit_id in unit_ids}
+
+            # Perform startup sync - actuator_service now has all manager methods
+            sync_results = scheduling_service.sync_actuator_states_at_startup(
+                unit_ids=unit_ids,
+                actuator_manager=actuator_service,
+                unit_timezones=unit_timezones,
+            )
+            results.update(sync_results)
+            logger.info(
+                "Startup sync completed: %s units, %s actuators synchronized",
+                results["units_synced"],
+                results["actuators_synced"],
+            )
 
     except TASK_SOFT_ERRORS as e:
         logger.error("Startup sync failed: %s", e, exc_info=True)
         results["errors"].append(str(e))
+    finally:
+        # Engine adopts whatever execution state the sync produced and fires on schedule
+        # edges from here on; it must run even when the sync failed
+        _ensure_transition_engine_running(container)
 
     return results
 
 
+def _ensure_transition_engine_running(container: "ServiceContainer") -> None:
+    engine = getattr(container, "schedule_transition_engine", None)
+    if not engine or engine.is_running:
+        return
+    try:
+        engine.start()
+    except TASK_SOFT_ERRORS as e:
+        logger.error("Schedule transition engine failed to start: %s", e, exc_info=True)
+
+
 def actuator_schedule_check_task(container: "ServiceContainer") -> dict[str, Any]:
     """
-    Check and execute actuator schedules from the centralized DeviceSchedules table.
+    Reconcile actuators with the centralized DeviceSchedules table.
 
-    This task runs every 30 seconds to:
-    - Fetch enabled schedules for all units (memory-first)
-    - Evaluate each schedule (with photoperiod support for lights)
-    - Turn actuators on/off based on schedule transitions
+    Schedule transitions are fired at their edges by ScheduleTransitionEngine;
+    this task is the periodic safety net that re-evaluates every unit and
+    rebuilds the engine's edge queue (e.g. after clock changes).
 
     Celery name: actuator.schedule_check
     """
-    global _schedule_last_state
-    global _actuator_last_command
-    global _actuator_last_schedule
-
-    actuator_service = getattr(container, "actuator_management_service", None)
-    analytics_service = getattr(container, "analytics_service", None)
-    growth_service = getattr(container, "growth_service", None)
+    engine = getattr(container, "schedule_transition_engine", None)
 
     results = {
         "units_checked": 0,
@@ -380,174 +367,18 @@ def actuator_schedule_check_task(container: "ServiceContainer") -> dict[str, Any
         "errors": [],
     }
 
-    if not actuator_service:
+    if not engine:
         return results
 
-    try:
-        # ActuatorManagementService now contains scheduling_service directly
-        scheduling_service = getattr(actuator_service, "scheduling_service", None)
-        if not scheduling_service:
-            return results
-
-        # Get all unit IDs to iterate
-        unit_ids = _get_active_unit_ids(growth_service)
-        if not unit_ids:
-            return results
-
-        for unit_id in unit_ids:
-            results["units_checked"] += 1
-
-            try:
-                unit_timezone = _get_unit_timezone(growth_service, unit_id)
-                tz = None
-                if unit_timezone:
-                    try:
-                        tz = ZoneInfo(unit_timezone)
-                    except (TypeError, ValueError, ZoneInfoNotFoundError):
-                        logger.warning(
-                            "Invalid timezone '%s' for unit %s; using system time",
-                            unit_timezone,
-                            unit_id,
-                        )
-                now = datetime.now(tz) if tz else datetime.now()
-
-                # Get enabled schedules for this unit
-                schedules = scheduling_service.get_schedules_for_unit(unit_id, enabled_only=True)
-
-                if not schedules:
-                    continue
-
-                lux_reading = None
-                if any(s.device_type == "light" and s.photoperiod for s in schedules):
-                    lux_reading = _get_lux_reading(analytics_service, unit_id)
-
-                schedule_by_id: dict[int, Any] = {}
-                actuator_schedules: dict[int, list] = {}
-                active_schedules_by_actuator: dict[int, list] = {}
-
-                for schedule in schedules:
-                    results["schedules_checked"] += 1
-                    schedule_key = schedule.schedule_id
-                    if schedule_key is None:
-                        continue
-                    schedule_by_id[schedule_key] = schedule
-
-                    try:
-                        is_active = scheduling_service.is_schedule_active(
-                            schedule=schedule,
-                            unit_id=unit_id,
-                            check_time=now,
-                            lux_reading=lux_reading,
-                            unit_timezone=unit_timezone,
-                        )
-                        was_active = scheduling_service.get_last_execution_state(schedule_key)
-                        if was_active is None:
-                            was_active = _schedule_last_state.get(schedule_key)
-
-                        # Execution log for schedules without linked actuators
-                        if not schedule.actuator_id:
-                            if is_active and was_active is False:
-                                scheduling_service.record_execution(
-                                    schedule=schedule,
-                                    action="activate",
-                                    success=True,
-                                    source="system",
-                                )
-                            elif not is_active and was_active is True:
-                                scheduling_service.record_execution(
-                                    schedule=schedule,
-                                    action="deactivate",
-                                    success=True,
-                                    source="system",
-                                )
-                            _schedule_last_state[schedule_key] = is_active
-                            scheduling_service.set_last_execution_state(schedule_key, is_active)
-                            continue
-
-                        actuator_id = schedule.actuator_id
-                        actuator_schedules.setdefault(actuator_id, []).append(schedule)
-                        if is_active:
-                            active_schedules_by_actuator.setdefault(actuator_id, []).append(schedule)
-
-                        _schedule_last_state[schedule_key] = is_active
-                        scheduling_service.set_last_execution_state(schedule_key, is_active)
-                    except TASK_SOFT_ERRORS as e:
-                        error_msg = f"Schedule {schedule_key} ({schedule.device_type}): {e}"
-                        results["errors"].append(error_msg)
-                        logger.error("Error checking schedule: %s", error_msg)
-
-                for actuator_id, _all_for_actuator in actuator_schedules.items():
-                    active_for_actuator = active_schedules_by_actuator.get(actuator_id, [])
-                    selected = scheduling_service.select_effective_schedule(active_for_actuator)
-
-                    if selected is None:
-                        desired_command: tuple[str, float | None] = ("off", None)
-                    elif selected.value is not None:
-                        desired_command = ("level", float(selected.value))
-                    elif selected.state_when_active == ScheduleState.ON:
-                        desired_command = ("on", None)
-                    else:
-                        desired_command = ("off", None)
-
-                    previous_command = _actuator_last_command.get(actuator_id)
-                    if previous_command is None:
-                        current_state = actuator_service.get_actuator_state(actuator_id)
-                        if current_state is True:
-                            previous_command = ("on", None)
-                        elif current_state is False:
-                            previous_command = ("off", None)
-                        else:
-                            previous_command = desired_command
-
-                    if desired_command == previous_command:
-                        _actuator_last_schedule[actuator_id] = selected.schedule_id if selected else None
-                        continue
-
-                    transition_ok = False
-                    if selected is not None:
-                        transition_ok = _handle_schedule_activation(
-                            scheduling_service,
-                            actuator_service,
-                            selected,
-                            actuator_id,
-                            results,
-                        )
-                    else:
-                        previous_schedule_id = _actuator_last_schedule.get(actuator_id)
-                        previous_schedule = schedule_by_id.get(previous_schedule_id) if previous_schedule_id else None
-                        if previous_schedule is not None:
-                            transition_ok = _handle_schedule_deactivation(
-                                scheduling_service,
-                                actuator_service,
-                                previous_schedule,
-                                actuator_id,
-                                results,
-                            )
-                        else:
-                            try:
-                                actuator_service.turn_off(actuator_id)
-                                results["transitions"] += 1
-                                transition_ok = True
-                            except TASK_SOFT_ERRORS as e:
-                                results["errors"].append(f"Actuator {actuator_id} off: {e!s}")
-                                logger.error(
-                                    "Failed to deactivate actuator %s without schedule context: %s",
-                                    actuator_id,
-                                    e,
-                                )
-
-                    if transition_ok:
-                        _actuator_last_command[actuator_id] = desired_command
-                        _actuator_last_schedule[actuator_id] = selected.schedule_id if selected else None
-
-            except TASK_SOFT_ERRORS as e:
-                error_msg = f"Unit {unit_id}: {e}"
-                results["errors"].append(error_msg)
-                logger.error("Error processing unit schedules: %s", error_msg)
+    if not engine.is_running:
+        logger.warning("Schedule transition engine is not running; starting it")
+        _ensure_transition_engine_running(container)
 
+    try:
+        results = engine.reconcile()
         if results["transitions"] > 0:
-            logger.debug(
-                "Schedule check: %s units, %s schedules, %s transitions",
+            logger.info(
+                "Schedule reconcile: %s units, %s schedules, %s transitions",
                 results["units_checked"],
                 results["schedules_checked"],
                 results["transitions"],
@@ -560,148 +391,6 @@ def actuator_schedule_check_task(container: "ServiceContainer") -> dict[str, Any
     return results
 
 
-def _get_active_unit_ids(growth_service) -> list:
-    """Get list of active unit IDs from growth service."""
-    if not growth_service:
-        return []
-
-    try:
-        # Try to get unit runtimes (preferred - only active units)
-        runtimes = getattr(growth_service, "get_unit_runtimes", None)
-        if runtimes:
-            return list(runtimes().keys())
-
-        # Fall back to listing all units
-        units = growth_service.list_units()
-        return [u.get("unit_id") or u.get("id") for u in units if u]
-
-    except TASK_SOFT_ERRORS as e:
-        logger.warning("Failed to get unit IDs: %s", e)
-        return []
-
-
-def _get_unit_timezone(growth_service, unit_id: int) -> str | None:
-    """Resolve the timezone string for a unit (if configured)."""
-    if not growth_service:
-        return None
-    try:
-        runtime = growth_service.get_unit_runtime(unit_id)
-        settings = getattr(runtime, "settings", None) if runtime else None
-        return getattr(settings, "timezone", None) if settings else None
-    except TASK_SOFT_ERRORS as exc:
-        logger.debug("Could not resolve timezone for unit %s: %s", unit_id, exc)
-        return None
-
-
-def _get_lux_reading(analytics_service, unit_id: int) -> float | None:
-    """Get current lux reading for a unit from analytics service."""
-    if not analytics_service:
-        return None
-
-    try:
-        reading = analytics_service.get_latest_sensor_reading(unit_id=unit_id)
-        if not reading:
-            return None
-        val = reading.get("lux")
-        if val is not None:
-            return float(val)
-
-        return None
-
-    except TASK_SOFT_ERRORS as e:
-        logger.debug("Could not get lux reading for unit %s: %s", unit_id, e)
-        return None
-
-
-def _handle_schedule_activation(
-    scheduling_service,
-    actuator_service,
-    schedule,
-    actuator_id: int,
-    results: dict,
-) -> bool:
-    """Handle transition from inactive to active state."""
-    try:
-        if scheduling_service:
-            result = scheduling_service.execute_with_retry(
-                schedule,
-                activate=True,
-                actuator_manager=actuator_service,
-            )
-            if result.success:
-                results["transitions"] += 1
-                logger.info(
-                    "Schedule %s (%s) activated -> actuator %s",
-                    schedule.schedule_id,
-                    schedule.device_type,
-                    actuator_id,
-                )
-                return True
-            else:
-                results["errors"].append(f"Actuator {actuator_id} on: {result.error_message}")
-            return False
-
-        if schedule.value is not None:
-            actuator_service.set_level(actuator_id, float(schedule.value))
-        elif schedule.state_when_active.value == "on":
-            actuator_service.turn_on(actuator_id)
-        else:
-            actuator_service.turn_off(actuator_id)
-
-        results["transitions"] += 1
-        logger.info(
-            "Schedule %s (%s) activated -> actuator %s", schedule.schedule_id, schedule.device_type, actuator_id
-        )
-        return True
-    except TASK_SOFT_ERRORS as e:
-        results["errors"].append(f"Actuator {actuator_id} on: {e!s}")
-        logger.error("Failed to activate schedule for actuator %s: %s", actuator_id, e)
-        return False
-
-
-def _handle_schedule_deactivation(
-    scheduling_service,
-    actuator_service,
-    schedule,
-    actuator_id: int,
-    results: dict,
-) -> bool:
-    """Handle transition from active to inactive state."""
-    try:
-        if scheduling_service:
-            result = scheduling_service.execute_with_retry(
-                schedule,
-                activate=False,
-                actuator_manager=actuator_service,
-            )
-            if result.success:
-                results["transitions"] += 1
-                logger.info(
-                    "Schedule %s (%s) deactivated -> actuator %s OFF",
-                    schedule.schedule_id,
-                    schedule.device_type,
-                    actuator_id,
-                )
-                return True
-            else:
-                results["errors"].append(f"Actuator {actuator_id} off: {result.error_message}")
-            return False
-
-        actuator_service.turn_off(actuator_id)
-        results["transitions"] += 1
-        logger.info(
-            "Schedule %s (%s) deactivated -> actuator %s OFF",
-            schedule.schedule_id,
-            schedule.device_type,
-            actuator_id,
-        )
-        return True
-    except TASK_SOFT_ERRORS as e:
-        results["errors"].append(f"Actuator {actuator_id} off: {e!s}")
-        logger.error("Failed to deactivate schedule for actuator %s: %s", actuator_id, e)
-        return False
-
-
 # ==================== ML Namespace Tasks ====================
 
 
@@ -986,8 +675,9 @@ def maintenance_aggregate_sensor_data_task(container: "ServiceContainer") -> dic
     Aggregate old sensor readings before they are pruned.
 
     This task runs daily at 02:30 (BEFORE the 03:00 prune task) to:
-    - Create daily summaries (min, max, avg, count, stddev) for sensor readings
+    - Create hourly/daily/weekly summaries (min, max, avg, count, stddev) in one pass
     - Target readings older than 25 days (will be pruned at 30 days)
+    - Only touch readings newer than each sensor's summary watermark
     - Store summaries in SensorReadingSummary table
     - These summaries are preserved for harvest reports
 
@@ -1083,6 +773,7 @@ def maintenance_prune_old_data_task(container: "ServiceContainer") -> dict[str,
 
     This task runs daily at 03:00 to:
     - Delete sensor readings older than sensor_retention_days (default 30 days)
+    - Delete sensor rollup buckets past their tier retention (1m: 7d, 15m: 90d, 1h: 2y)
     - Delete actuator state history older than actuator_state_retention_days (default 90 days)
     - Run VACUUM weekly (on Sundays) to reclaim disk space
 
@@ -1092,6 +783,7 @@ def maintenance_prune_old_data_task(container: "ServiceContainer") -> dict[str,
     """
     results = {
         "sensor_readings_deleted": 0,
+        "sensor_rollups_deleted": 0,
         "actuator_states_deleted": 0,
         "errors": [],
     }
@@ -1117,6 +809,13 @@ def maintenance_prune_old_data_task(container: "ServiceContainer") -> dict[str,
             if deleted:
                 logger.info("Pruned %s sensor readings older than %s days", deleted, sensor_retention_days)
 
+        # Prune chart rollup tiers (per-tier retention, longer than raw readings)
+        if hasattr(device_repo, "prune_sensor_rollups"):
+            deleted = device_repo.prune_sensor_rollups()
+            results["sensor_rollups_deleted"] = deleted or 0
+            if deleted:
+                logger.info("Pruned %s sensor rollup buckets past retention", deleted)
+
         # Prune actuator state history
         if hasattr(device_repo, "prune_actuator_state_history"):
             deleted = device_repo.prune_actuator_state_history(actuator_retention_days)
@@ -1436,10 +1135,10 @@ def schedule_default_jobs(scheduler: "UnifiedScheduler") -> None:
     # Actuator namespace - startup sync runs once at startup
     scheduler.run_now("actuator.startup_sync")
 
-    # Actuator namespace - schedule check every 30 seconds
+    # Actuator namespace - transitions are event-driven; reconcile every 15 minutes as a safety net
     scheduler.schedule_interval(
         "actuator.schedule_check",
-        interval_seconds=30,
+        interval_seconds=900,
         job_id="actuator_schedule_check",
         start_immediately=False,  # Startup sync handles initial state
     )
@@ -0,0 +1,189 @@
+"""
+Connection Lanes
+================
+
+Separate read and write paths for the SQLite handler.
+
+- ``ReadPool``: a small pool of ``PRAGMA query_only`` connections with a
+  larger prepared-statement cache, so long analytics reads never hold a
+  write transaction and can run side by side with ingest.
+- ``WriterLane``: a process-wide re-entrant lock that serializes writers,
+  so concurrent commits queue in Python instead of failing with
+  ``database is locked``.
+
+Both lanes record how long callers waited and how often they found the
+lane busy, exposed through ``get_stats()``.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_POOL_SIZE = 4
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+DEFAULT_READ_ACQUIRE_TIMEOUT = 5.0
+
+
+class _LaneStats:
+    """Acquisition counters for one lane (guarded by its own lock)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.lock_errors = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record(self, wait_ms: float, contended: bool) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_ms_total += wait_ms
+            if wait_ms > self.wait_ms_max:
+                self.wait_ms_max = wait_ms
+            if contended:
+                self.contended += 1
+
+    def record_error(self, exc: BaseException) -> None:
+        if isinstance(exc, sqlite3.OperationalError) and "locked" in str(exc).lower():
+            with self._lock:
+                self.lock_errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "lock_errors": self.lock_errors,
+                "wait_ms_total": round(self.wait_ms_total, 3),
+                "wait_ms_avg": round(self.wait_ms_total / self.acquisitions, 3) if self.acquisitions else 0.0,
+                "wait_ms_max": round(self.wait_ms_max, 3),
+            }
+
+
+class WriterLane:
+    """Re-entrant lock that serializes writers across threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._stats = _LaneStats()
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        started = time.perf_counter()
+        contended = not self._lock.acquire(blocking=False)
+        if contended:
+            self._lock.acquire()
+        self._stats.record((time.perf_counter() - started) * 1000.0, contended)
+        try:
+            yield
+        except BaseException as exc:
+            self._stats.record_error(exc)
+            raise
+        finally:
+            self._lock.release()
+
+    def get_stats(self) -> dict[str, Any]:
+        return self._stats.snapshot()
+
+
+class ReadPool:
+    """
+    Bounded pool of read-only connections, opened lazily up to ``size``.
+
+    A caller that waits longer than ``acquire_timeout`` for an idle
+    connection gets a temporary overflow connection, closed after use,
+    so a leaked or long-held reader cannot stall every request thread.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        size: int = DEFAULT_READ_POOL_SIZE,
+        acquire_timeout: float = DEFAULT_READ_ACQUIRE_TIMEOUT,
+    ) -> None:
+        self._connect = connect
+        self._size = max(1, int(size))
+        self._acquire_timeout = max(0.0, float(acquire_timeout))
+        self._overflow = 0
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._stats = _LaneStats()
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        started = time.perf_counter()
+        contended = overflow = False
+        conn = self._take()
+        if conn is None:
+            contended = True
+            try:
+                conn = self._idle.get(timeout=self._acquire_timeout)
+            except queue.Empty:
+                logger.warning(
+                    "Read pool exhausted for %.1fs (%d connections busy); opening an overflow connection",
+                    self._acquire_timeout,
+                    self._size,
+                )
+                conn = self._connect()
+                overflow = True
+                with self._lock:
+                    self._overflow += 1
+        self._stats.record((time.perf_counter() - started) * 1000.0, contended)
+        try:
+            yield conn
+        except BaseException as exc:
+            self._stats.record_error(exc)
+            raise
+        finally:
+            if overflow:
+                conn.close()
+            else:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle.put(conn)
+
+    def _take(self) -> sqlite3.Connection | None:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened >= self._size:
+                return None
+            self._opened += 1
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._opened -= 1
+            conn.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        stats = self._stats.snapshot()
+        with self._lock:
+            stats["open"] = self._opened
+            stats["overflow"] = self._overflow
+        stats["idle"] = self._idle.qsize()
+        stats["size"] = self._size
+        return stats
@@ -0,0 +1,111 @@
+"""Migration 062: Typed SensorMetricSample store for sensor readings.
+
+Creates the SensorMetricSample table (one REAL row per numeric metric of a
+SensorReading) together with the triggers that keep it in sync, then
+backfills samples for readings stored before the table existed.
+
+History, latest-value and aggregation queries read from this table instead
+of decoding the ``reading_data`` JSON blob for every row.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+# Readings are backfilled in reading_id windows so a large history does not
+# hold a single long write transaction on SD-card storage.
+BACKFILL_BATCH_SIZE = 5000
+
+
+def migrate(db_handler: "SQLiteDatabaseHandler") -> bool:
+    """Create SensorMetricSample (if missing) and backfill it from SensorReading."""
+    try:
+        db = db_handler.get_db()
+        cursor = db.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS SensorMetricSample (
+                reading_id INTEGER NOT NULL,
+                sensor_id INTEGER NOT NULL,
+                ts_epoch REAL NOT NULL,
+                metric VARCHAR(50) NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (reading_id, metric)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_sensor_reading_samples_insert
+            AFTER INSERT ON SensorReading
+            BEGIN
+                INSERT OR IGNORE INTO SensorMetricSample (reading_id, sensor_id, ts_epoch, metric, value)
+                SELECT NEW.reading_id,
+                       NEW.sensor_id,
+                       ROUND((COALESCE(julianday(NEW.timestamp), julianday('now')) - 2440587.5) * 86400.0, 3),
+                       je.key,
+                       je.value
+                FROM json_each(
+                    CASE WHEN json_valid(NEW.reading_data) AND json_type(NEW.reading_data) = 'object'
+                         THEN NEW.reading_data ELSE '{}' END
+                ) je
+                WHERE je.type IN ('integer', 'real');
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_sensor_reading_samples_delete
+            AFTER DELETE ON SensorReading
+            BEGIN
+                DELETE FROM SensorMetricSample WHERE reading_id = OLD.reading_id;
+            END
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_metric_sample_sensor_ts ON SensorMetricSample(sensor_id, ts_epoch)"
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_metric_sample_ts ON SensorMetricSample(ts_epoch)")
+        db.commit()
+
+        row = cursor.execute("SELECT MIN(reading_id), MAX(reading_id) FROM SensorReading").fetchone()
+        first_id, last_id = (row[0], row[1]) if row else (None, None)
+        backfilled = 0
+        if first_id is not None:
+            lower = int(first_id)
+            while lower <= int(last_id):
+                upper = lower + BACKFILL_BATCH_SIZE
+                cur = cursor.execute(
+                    """
+                    INSERT OR IGNORE INTO SensorMetricSample (reading_id, sensor_id, ts_epoch, metric, value)
+                    SELECT sr.reading_id,
+                           sr.sensor_id,
+                           ROUND((COALESCE(julianday(sr.timestamp), julianday('now')) - 2440587.5) * 86400.0, 3),
+                           je.key,
+                           je.value
+                    FROM SensorReading sr,
+                         json_each(
+                             CASE WHEN json_valid(sr.reading_data) AND json_type(sr.reading_data) = 'object'
+                                  THEN sr.reading_data ELSE '{}' END
+                         ) je
+                    WHERE sr.reading_id >= ? AND sr.reading_id < ?
+                      AND je.type IN ('integer', 'real')
+                    """,
+                    (lower, upper),
+                )
+                backfilled += max(cur.rowcount or 0, 0)
+                db.commit()
+                lower = upper
+
+        logger.info("Migration 062: SensorMetricSample ready (%d samples backfilled)", backfilled)
+        return True
+    except sqlite3.Error as exc:
+        logger.error("Migration 062 failed: %s", exc)
+        return False
@@ -0,0 +1,70 @@
+"""Migration 063: SensorMetricRollup tiers for chart queries.
+
+Creates the SensorMetricRollup table (1-minute, 15-minute and 1-hour
+buckets per sensor and metric) plus the trigger that maintains it from
+SensorMetricSample, then rebuilds every tier from the samples already
+stored so long-range charts work immediately after upgrade.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+from infrastructure.database.ops.analytics import SENSOR_ROLLUP_TIERS, SENSOR_ROLLUP_TRIGGER_SQL
+
+if TYPE_CHECKING:
+    from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+
+def migrate(db_handler: "SQLiteDatabaseHandler") -> bool:
+    """Create SensorMetricRollup (if missing) and rebuild it from SensorMetricSample."""
+    try:
+        db = db_handler.get_db()
+        cursor = db.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS SensorMetricRollup (
+                tier_seconds INTEGER NOT NULL,
+                sensor_id INTEGER NOT NULL,
+                metric VARCHAR(50) NOT NULL,
+                bucket_start INTEGER NOT NULL,
+                count_readings INTEGER NOT NULL DEFAULT 0,
+                min_value REAL,
+                max_value REAL,
+                sum_value REAL,
+                sum_squares REAL,
+                PRIMARY KEY (tier_seconds, sensor_id, metric, bucket_start)
+            )
+            """
+        )
+        cursor.execute(SENSOR_ROLLUP_TRIGGER_SQL)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_metric_rollup_tier_bucket ON SensorMetricRollup(tier_seconds, bucket_start)"
+        )
+
+        # Full groups over every stored sample, so REPLACE yields exact buckets.
+        for tier in SENSOR_ROLLUP_TIERS:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO SensorMetricRollup (
+                    tier_seconds, sensor_id, metric, bucket_start,
+                    count_readings, min_value, max_value, sum_value, sum_squares
+                )
+                SELECT ?, sensor_id, metric, CAST(ts_epoch / ? AS INTEGER) * ? AS bucket,
+                       COUNT(*), MIN(value), MAX(value), SUM(value), SUM(value * value)
+                FROM SensorMetricSample
+                GROUP BY sensor_id, metric, bucket
+                """,
+                (tier, tier, tier),
+            )
+            db.commit()
+
+        logger.info("Migration 063: SensorMetricRollup tiers rebuilt")
+        return True
+    except sqlite3.Error as exc:
+        logger.error("Migration 063 failed: %s", exc)
+        return False
@@ -0,0 +1,79 @@
+"""Migration 064: Per-plant environmental accumulators for harvest reports.
+
+Creates PlantEnvironmentAccumulator (lifetime count, sum, sum of squares,
+min and max of temperature/humidity per plant) and the trigger that keeps
+it current from SensorMetricSample. Rows are seeded lazily on the first
+harvest-report read, or up front with
+``scripts/backfill_plant_environment.py``.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+
+def migrate(db_handler: "SQLiteDatabaseHandler") -> bool:
+    """Create PlantEnvironmentAccumulator and its maintenance trigger (if missing)."""
+    try:
+        db = db_handler.get_db()
+        cursor = db.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS PlantEnvironmentAccumulator (
+                plant_id INTEGER NOT NULL,
+                metric VARCHAR(50) NOT NULL,
+                since_epoch REAL NOT NULL DEFAULT 0,
+                scope TEXT NOT NULL,
+                unit_id INTEGER,
+                linked_sensors INTEGER NOT NULL DEFAULT 0,
+                count_readings INTEGER NOT NULL DEFAULT 0,
+                min_value REAL,
+                max_value REAL,
+                sum_value REAL NOT NULL DEFAULT 0,
+                sum_squares REAL NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (plant_id, metric),
+                FOREIGN KEY (plant_id) REFERENCES Plants(plant_id) ON DELETE CASCADE
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_metric_sample_plant_environment
+            AFTER INSERT ON SensorMetricSample
+            WHEN NEW.metric IN ('temperature', 'humidity')
+            BEGIN
+                UPDATE PlantEnvironmentAccumulator
+                SET count_readings = count_readings + 1,
+                    min_value = MIN(COALESCE(min_value, NEW.value), NEW.value),
+                    max_value = MAX(COALESCE(max_value, NEW.value), NEW.value),
+                    sum_value = sum_value + NEW.value,
+                    sum_squares = sum_squares + NEW.value * NEW.value,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE metric = NEW.metric
+                  AND NEW.ts_epoch >= since_epoch
+                  AND CASE
+                        WHEN linked_sensors THEN EXISTS (
+                            SELECT 1 FROM PlantSensors ps
+                            WHERE ps.plant_id = PlantEnvironmentAccumulator.plant_id AND ps.sensor_id = NEW.sensor_id
+                        )
+                        ELSE unit_id = (SELECT s.unit_id FROM Sensor s WHERE s.sensor_id = NEW.sensor_id)
+                      END;
+            END
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_plant_sensors_sensor_id ON PlantSensors(sensor_id)")
+        db.commit()
+
+        logger.info("Migration 064: PlantEnvironmentAccumulator ready")
+        return True
+    except sqlite3.Error as exc:
+        logger.error("Migration 064 failed: %s", exc)
+        return False
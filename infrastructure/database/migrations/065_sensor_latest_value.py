@@ -0,0 +1,93 @@
+"""Migration 065: Maintained latest value per sensor metric.
+
+Creates SensorLatestValue (newest value, timestamp and reading per
+sensor/metric), the triggers that keep it current from SensorMetricSample,
+and backfills it from the samples already stored.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+
+def migrate(db_handler: "SQLiteDatabaseHandler") -> bool:
+    """Create and backfill SensorLatestValue with its maintenance triggers (if missing)."""
+    try:
+        db = db_handler.get_db()
+        cursor = db.cursor()
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS SensorLatestValue (
+                sensor_id INTEGER NOT NULL,
+                metric VARCHAR(50) NOT NULL,
+                value REAL NOT NULL,
+                ts_epoch REAL NOT NULL,
+                reading_id INTEGER NOT NULL,
+                PRIMARY KEY (sensor_id, metric)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_metric_sample_latest_value
+            AFTER INSERT ON SensorMetricSample
+            BEGIN
+                INSERT INTO SensorLatestValue (sensor_id, metric, value, ts_epoch, reading_id)
+                VALUES (NEW.sensor_id, NEW.metric, NEW.value, NEW.ts_epoch, NEW.reading_id)
+                ON CONFLICT (sensor_id, metric) DO UPDATE SET
+                    value = excluded.value,
+                    ts_epoch = excluded.ts_epoch,
+                    reading_id = excluded.reading_id
+                WHERE excluded.ts_epoch > SensorLatestValue.ts_epoch
+                   OR (excluded.ts_epoch = SensorLatestValue.ts_epoch
+                       AND excluded.reading_id > SensorLatestValue.reading_id);
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_metric_sample_latest_value_delete
+            AFTER DELETE ON SensorMetricSample
+            WHEN EXISTS (
+                SELECT 1 FROM SensorLatestValue
+                WHERE sensor_id = OLD.sensor_id AND metric = OLD.metric AND reading_id = OLD.reading_id
+            )
+            BEGIN
+                DELETE FROM SensorLatestValue WHERE sensor_id = OLD.sensor_id AND metric = OLD.metric;
+                INSERT INTO SensorLatestValue (sensor_id, metric, value, ts_epoch, reading_id)
+                SELECT sensor_id, metric, value, ts_epoch, reading_id
+                FROM SensorMetricSample
+                WHERE sensor_id = OLD.sensor_id AND metric = OLD.metric
+                ORDER BY ts_epoch DESC, reading_id DESC
+                LIMIT 1;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO SensorLatestValue (sensor_id, metric, value, ts_epoch, reading_id)
+            SELECT sensor_id, metric, value, ts_epoch, reading_id
+            FROM (
+                SELECT sensor_id, metric, value, ts_epoch, reading_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY sensor_id, metric ORDER BY ts_epoch DESC, reading_id DESC
+                       ) AS rn
+                FROM SensorMetricSample
+            )
+            WHERE rn = 1
+            """
+        )
+        db.commit()
+
+        logger.info("Migration 065: SensorLatestValue ready")
+        return True
+    except sqlite3.Error as exc:
+        logger.error("Migration 065 failed: %s", exc)
+        return False
@@ -0,0 +1,50 @@
+"""Migration 066: Seed plant environment accumulators eagerly.
+
+Adds the triggers that seed PlantEnvironmentAccumulator when a plant is
+created and reseed it when its planted date, unit or linked sensors change,
+then seeds every plant that has no accumulator rows yet. Before this, rows
+were only created on the first harvest-report read, by which time sensor
+retention may already have pruned the early samples.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+from infrastructure.database.ops.analytics import PLANT_ENVIRONMENT_SEED_TRIGGERS, plant_environment_seed_sql
+
+if TYPE_CHECKING:
+    from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+logger = logging.getLogger(__name__)
+
+
+def migrate(db_handler: "SQLiteDatabaseHandler") -> bool:
+    """Create the accumulator seed triggers and seed plants without rows."""
+    try:
+        db = db_handler.get_db()
+        cursor = db.cursor()
+        for trigger_sql in PLANT_ENVIRONMENT_SEED_TRIGGERS:
+            cursor.execute(trigger_sql)
+
+        plant_ids = [
+            row[0]
+            for row in cursor.execute(
+                """
+                SELECT p.plant_id FROM Plants p
+                WHERE NOT EXISTS (SELECT 1 FROM PlantEnvironmentAccumulator a WHERE a.plant_id = p.plant_id)
+                """
+            ).fetchall()
+        ]
+        for plant_id in plant_ids:
+            for statement in plant_environment_seed_sql(":plant_id"):
+                cursor.execute(statement, {"plant_id": plant_id})
+        db.commit()
+
+        logger.info("Migration 066: plant environment seed triggers ready (%d plants seeded)", len(plant_ids))
+        return True
+    except sqlite3.Error as exc:
+        logger.error("Migration 066 failed: %s", exc)
+        return False
@@ -4,29 +4,157 @@ import json
 import logging
 import math
 import sqlite3
+import time
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
+from itertools import islice
 from typing import Any
 
-from infrastructure.database.pagination import validate_pagination
+from infrastructure.database.ops.devices import SENSOR_ROLLUP_RETENTION_DAYS
+from infrastructure.database.pagination import KeysetCursor, validate_pagination
+from infrastructure.database.utils import to_epoch_seconds
 from infrastructure.utils.time import iso_now
 
 logger = logging.getLogger(__name__)
 
+# Bucket sizes (seconds) maintained in SensorMetricRollup, finest first.
+SENSOR_ROLLUP_TIERS: tuple[int, ...] = (60, 900, 3600)
+
+# Keeps every SensorMetricRollup tier current as samples arrive; built from
+# SENSOR_ROLLUP_TIERS so the tiers cannot drift from the trigger.
+SENSOR_ROLLUP_TRIGGER_SQL = f"""
+    CREATE TRIGGER IF NOT EXISTS trg_metric_sample_rollup
+    AFTER INSERT ON SensorMetricSample
+    BEGIN
+        INSERT INTO SensorMetricRollup (
+            tier_seconds, sensor_id, metric, bucket_start,
+            count_readings, min_value, max_value, sum_value, sum_squares
+        )
+        SELECT t.tier, NEW.sensor_id, NEW.metric, CAST(NEW.ts_epoch / t.tier AS INTEGER) * t.tier,
+               1, NEW.value, NEW.value, NEW.value, NEW.value * NEW.value
+        FROM ({" UNION ALL ".join(f"SELECT {int(tier)} AS tier" for tier in SENSOR_ROLLUP_TIERS)}) t
+        WHERE true
+        ON CONFLICT (tier_seconds, sensor_id, metric, bucket_start) DO UPDATE SET
+            count_readings = count_readings + 1,
+            min_value = MIN(min_value, excluded.min_value),
+            max_value = MAX(max_value, excluded.max_value),
+            sum_value = sum_value + excluded.sum_value,
+            sum_squares = sum_squares + excluded.sum_squares;
+    END
+"""
+
+# Metrics accumulated per plant in PlantEnvironmentAccumulator (must match the trigger).
+PLANT_ENVIRONMENT_METRICS: tuple[str, ...] = ("temperature", "humidity")
+
+
+def plant_environment_seed_sql(plant_id_expr: str) -> tuple[str, str]:
+    """Statements that rebuild one plant's PlantEnvironmentAccumulator rows.
+
+    ``plant_id_expr`` is spliced in verbatim: a bound parameter such as
+    ``:plant_id`` from Python, or ``NEW.plant_id`` inside a trigger. The scope
+    string and start time match ``_plant_environment_scope`` so the read path
+    accepts the rows as current.
+    """
+    metrics = " UNION ALL ".join(f"SELECT '{metric}' AS metric" for metric in PLANT_ENVIRONMENT_METRICS)
+    delete_sql = f"DELETE FROM PlantEnvironmentAccumulator WHERE plant_id = {plant_id_expr}"
+    insert_sql = f"""
+        INSERT OR REPLACE INTO PlantEnvironmentAccumulator (
+            plant_id, metric, since_epoch, scope, unit_id, linked_sensors,
+            count_readings, min_value, max_value, sum_value, sum_squares
+        )
+        SELECT sc.plant_id, m.metric, sc.since_epoch,
+               CASE WHEN sc.sensor_list IS NOT NULL THEN 'sensors:' || sc.sensor_list ELSE 'unit:' || sc.unit_id END,
+               CASE WHEN sc.sensor_list IS NULL THEN sc.unit_id END,
+               sc.sensor_list IS NOT NULL,
+               COUNT(s.value), MIN(s.value), MAX(s.value),
+               COALESCE(SUM(s.value), 0), COALESCE(SUM(s.value * s.value), 0)
+        FROM (
+            SELECT p.plant_id,
+                   COALESCE(
+                       ROUND((julianday(COALESCE(p.planted_date, p.created_at)) - 2440587.5) * 86400.0, 3), 0
+                   ) AS since_epoch,
+                   COALESCE(
+                       (SELECT gup.unit_id FROM GrowthUnitPlants gup WHERE gup.plant_id = p.plant_id LIMIT 1),
+                       p.unit_id
+                   ) AS unit_id,
+                   (
+                       SELECT group_concat(ids.sensor_id, ',')
+                       FROM (
+                           SELECT DISTINCT ps.sensor_id FROM PlantSensors ps
+                           WHERE ps.plant_id = p.plant_id AND ps.sensor_id IS NOT NULL
+                           ORDER BY ps.sensor_id
+                       ) ids
+                   ) AS sensor_list
+            FROM Plants p
+            WHERE p.plant_id = {plant_id_expr}
+        ) sc
+        CROSS JOIN ({metrics}) m
+        LEFT JOIN SensorMetricSample s
+          ON s.metric = m.metric
+         AND s.ts_epoch >= sc.since_epoch
+         AND s.sensor_id IN (
+                SELECT ps.sensor_id FROM PlantSensors ps WHERE ps.plant_id = sc.plant_id
+                UNION ALL
+                SELECT se.sensor_id FROM Sensor se WHERE sc.sensor_list IS NULL AND se.unit_id = sc.unit_id
+             )
+        WHERE sc.sensor_list IS NOT NULL OR sc.unit_id IS NOT NULL
+        GROUP BY sc.plant_id, m.metric
+    """
+    return delete_sql, insert_sql
+
+
+def _plant_environment_seed_trigger(name: str, event: str, plant_id_expr: str, when: str | None = None) -> str:
+    delete_sql, insert_sql = plant_environment_seed_sql(plant_id_expr)
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS {name}
+        {event}
+        {f"WHEN {when}" if when else ""}
+        BEGIN
+            {delete_sql};
+            {insert_sql};
+        END
+    """
+
+
+# Seed a plant's accumulator rows the moment it exists and reseed them whenever
+# its start date or sensor scope changes, so the rows never depend on raw
+# samples that retention may have pruned by the first harvest-report read.
+PLANT_ENVIRONMENT_SEED_TRIGGERS: tuple[str, ...] = (
+    _plant_environment_seed_trigger("trg_plant_environment_plant_insert", "AFTER INSERT ON Plants", "NEW.plant_id"),
+    _plant_environment_seed_trigger(
+        "trg_plant_environment_plant_update",
+        "AFTER UPDATE OF planted_date, created_at, unit_id ON Plants",
+        "NEW.plant_id",
+        when=(
+            "NEW.planted_date IS NOT OLD.planted_date OR NEW.created_at IS NOT OLD.created_at"
+            " OR NEW.unit_id IS NOT OLD.unit_id"
+        ),
+    ),
+    _plant_environment_seed_trigger(
+        "trg_plant_environment_sensor_link", "AFTER INSERT ON PlantSensors", "NEW.plant_id"
+    ),
+    _plant_environment_seed_trigger(
+        "trg_plant_environment_sensor_unlink", "AFTER DELETE ON PlantSensors", "OLD.plant_id"
+    ),
+    _plant_environment_seed_trigger(
+        "trg_plant_environment_unit_link", "AFTER INSERT ON GrowthUnitPlants", "NEW.plant_id"
+    ),
+    _plant_environment_seed_trigger(
+        "trg_plant_environment_unit_unlink", "AFTER DELETE ON GrowthUnitPlants", "OLD.plant_id"
+    ),
+    """
+        CREATE TRIGGER IF NOT EXISTS trg_plant_environment_plant_delete
+        AFTER DELETE ON Plants
+        BEGIN
+            DELETE FROM PlantEnvironmentAccumulator WHERE plant_id = OLD.plant_id;
+        END
+    """,
+)
+
 
 class AnalyticsOperations:
     """Aggregate and history helpers for sensors and plants."""
 
-    @staticmethod
-    def _timestamp_query_param(dt: datetime) -> str:
-        """Return ISO8601 timestamp suitable for lexical range filtering.
-
-        We strip timezone offsets to keep comparisons compatible with older rows
-        stored as naive ISO strings.
-        """
-        if dt.tzinfo is not None:
-            dt = dt.astimezone(UTC).replace(tzinfo=None)
-        return dt.isoformat()
-
     def _decode_reading_payload(self, row: dict[str, Any]) -> dict[str, Any]:
         """
         Decode a SensorReading row into a flat dict of metric keys.
@@ -68,7 +196,7 @@ class AnalyticsOperations:
         """
         stamp = timestamp or iso_now()
         try:
-            with self.connection() as db:
+            with self.write_connection() as db:
                 cursor = db.execute(
                     """
                     INSERT INTO SensorReading (sensor_id, timestamp, reading_data, quality_score)
@@ -81,6 +209,29 @@ class AnalyticsOperations:
             logging.error("Error inserting sensor reading (sensor_id=%s): %s", sensor_id, exc)
             return None
 
+    def enqueue_sensor_reading(
+        self,
+        *,
+        sensor_id: int,
+        reading_data: dict[str, Any],
+        quality_score: float = 1.0,
+        timestamp: str | None = None,
+    ) -> None:
+        """
+        Queue a sensor reading on the write-behind lane (group-committed).
+
+        Same arguments as :meth:`insert_sensor_reading`; the timestamp is
+        resolved now, not when the batch is committed.
+        """
+        stamp = timestamp or iso_now()
+        try:
+            self.defer_write(
+                "INSERT INTO SensorReading (sensor_id, timestamp, reading_data, quality_score) VALUES (?, ?, ?, ?)",
+                (sensor_id, stamp, json.dumps(reading_data), quality_score),
+            )
+        except sqlite3.Error as exc:
+            logging.error("Error queueing sensor reading (sensor_id=%s): %s", sensor_id, exc)
+
     # --- Sensor history -------------------------------------------------------
     def get_sensor_data(self, limit: int = 20, offset: int = 0) -> list[dict[str, Any]]:
         """
@@ -91,18 +242,18 @@ class AnalyticsOperations:
             offset: Number of rows to skip (for pagination).
         """
         try:
-            db = self.get_db()
-            cursor = db.execute(
-                """
-                SELECT reading_id, sensor_id, timestamp, reading_data, quality_score
-                FROM SensorReading
-                ORDER BY timestamp DESC
-                LIMIT ? OFFSET ?
-                """,
-                (limit, offset),
-            )
+            with self.read_connection() as db:
+                fetched = db.execute(
+                    """
+                    SELECT reading_id, sensor_id, timestamp, reading_data, quality_score
+                    FROM SensorReading
+                    ORDER BY timestamp DESC
+                    LIMIT ? OFFSET ?
+                    """,
+                    (limit, offset),
+                ).fetchall()
             rows = []
-            for row in cursor.fetchall():
+            for row in fetched:
                 as_dict = dict(row)
                 payload = self._decode_reading_payload(as_dict)
                 rows.append(
@@ -123,41 +274,26 @@ class AnalyticsOperations:
         """
         Retrieve the latest reading snapshot for a growth unit.
 
-        Scans recent SensorReading rows to populate the most recent value for
-        each metric. Returns None for any metric with no observed data.
+        Reads the trigger-maintained SensorLatestValue rows of the unit's
+        sensors; when several sensors report a metric the newest value wins.
+        Returns None for any metric with no observed data.
         """
         from app.domain.sensors.fields import SensorField
 
-        db = self.get_db()
-        keys = [f.value for f in SensorField]
+        # Bare columns with MAX() take their values from the row holding the max
         query = """
-            SELECT timestamp, reading_data
-            FROM SensorReading
-            WHERE sensor_id IN (
-                SELECT sensor_id
-                FROM Sensor
-                WHERE unit_id = ?
-            )
-            ORDER BY timestamp DESC
-            LIMIT ?
+            SELECT lv.metric, lv.value, MAX(lv.ts_epoch) AS ts_epoch
+            FROM SensorLatestValue lv
+            JOIN Sensor s ON s.sensor_id = lv.sensor_id
+            WHERE s.unit_id = ?
+            GROUP BY lv.metric
         """
-        rows = db.execute(query, (unit_id, 50)).fetchall()
-        if not rows:
-            return {k: None for k in keys}
-
-        latest_values = {k: None for k in keys}
-        remaining = set(keys)
+        latest_values: dict[str, float | None] = {f.value: None for f in SensorField}
 
-        for row in rows:
-            payload = self._decode_reading_payload(dict(row))
-            if not payload:
-                continue
-            for key in list(remaining):
-                if key in payload and payload[key] is not None:
-                    latest_values[key] = payload[key]
-                    remaining.remove(key)
-            if not remaining:
-                break
+        with self.read_connection() as db:
+            for row in db.execute(query, (unit_id,)):
+                if row["metric"] in latest_values:
+                    latest_values[row["metric"]] = row["value"]
 
         return latest_values
 
@@ -287,6 +423,55 @@ class AnalyticsOperations:
             logging.error(f"Error getting latest plant readings for {plant_id}: {exc}")
             return []
 
+    def get_latest_plant_readings_for_plants(
+        self,
+        plant_ids: list[int],
+        limit: int = 1,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Get the most recent PlantReadings for several plants in one query.
+
+        Args:
+            plant_ids: Plant IDs to fetch
+            limit: Maximum number of readings per plant
+
+        Returns:
+            Mapping of plant_id -> reading dictionaries ordered by newest first
+            (plants without readings are omitted)
+        """
+        ids = sorted({int(pid) for pid in plant_ids})
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" for _ in ids)
+        try:
+            db = self.get_db()
+            rows = db.execute(
+                f"""
+                SELECT *
+                FROM (
+                    SELECT *,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY plant_id ORDER BY timestamp DESC, reading_id DESC
+                           ) AS rn
+                    FROM PlantReadings
+                    WHERE plant_id IN ({placeholders})
+                )
+                WHERE rn <= ?
+                ORDER BY plant_id, rn
+                """,
+                (*ids, limit),
+            ).fetchall()
+        except sqlite3.Error as exc:
+            logging.error("Error getting latest plant readings for %d plants: %s", len(ids), exc)
+            return {}
+
+        readings: dict[int, list[dict[str, Any]]] = {}
+        for row in rows:
+            reading = dict(row)
+            reading.pop("rn", None)
+            readings.setdefault(int(reading["plant_id"]), []).append(reading)
+        return readings
+
     def get_plant_readings_in_window(
         self,
         plant_id: int,
@@ -539,19 +724,93 @@ class AnalyticsOperations:
             return 0.0
 
     def _get_average_environment_metric(self, plant_id: int, metric_key: str) -> float:
-        """Compute an environmental average from SensorReading payloads.
+        """Average of an environmental metric since the plant was planted.
+
+        Served from PlantEnvironmentAccumulator, so the cost does not grow
+        with the length of the grow.
+        """
+        stats = self.get_plant_environment_stats(plant_id, metric_key)
+        if not stats or not stats["count"]:
+            return 0.0
+        return stats["mean"]
+
+    def get_plant_environment_stats(self, plant_id: int, metric_key: str) -> dict[str, Any] | None:
+        """Lifetime count/mean/stddev/min/max of a metric for a plant.
 
-        PlantReadings no longer stores environmental values such as temperature
-        and humidity, so harvest analytics now derive those values from
-        SensorReading JSON payloads.
+        Covers readings since the plant's planted_date from the plant's linked
+        sensors, or every sensor in its unit when none are linked. The
+        PLANT_ENVIRONMENT_SEED_TRIGGERS seed the accumulator when the plant is
+        created and whenever its start date or sensor scope changes; a missing
+        or stale row (e.g. a database predating them) is reseeded here.
         """
+        if metric_key not in PLANT_ENVIRONMENT_METRICS:
+            return None
+
         db = self.get_db()
+        scope = self._plant_environment_scope(db, plant_id)
+        if scope is None:
+            return None
 
+        row = db.execute(
+            """
+            SELECT since_epoch, scope, count_readings, min_value, max_value, sum_value, sum_squares
+            FROM PlantEnvironmentAccumulator
+            WHERE plant_id = ? AND metric = ?
+            """,
+            (plant_id, metric_key),
+        ).fetchone()
+        if row is None or row["since_epoch"] != scope["since_epoch"] or row["scope"] != scope["scope"]:
+            self._seed_plant_environment(plant_id)
+            row = db.execute(
+                """
+                SELECT since_epoch, scope, count_readings, min_value, max_value, sum_value, sum_squares
+                FROM PlantEnvironmentAccumulator
+                WHERE plant_id = ? AND metric = ?
+                """,
+                (plant_id, metric_key),
+            ).fetchone()
+            if row is None:
+                return None
+
+        count = int(row["count_readings"] or 0)
+        mean = (row["sum_value"] / count) if count else 0.0
+        variance = (row["sum_squares"] / count - mean * mean) if count else 0.0
+        return {
+            "count": count,
+            "mean": mean,
+            "stddev": math.sqrt(max(variance, 0.0)),
+            "min": row["min_value"],
+            "max": row["max_value"],
+        }
+
+    def backfill_plant_environment_accumulators(self, plant_ids: list[int] | None = None) -> int:
+        """Seed PlantEnvironmentAccumulator for the given plants (all plants if None).
+
+        Returns:
+            Number of plants seeded.
+        """
+        db = self.get_db()
+        if plant_ids is None:
+            plant_ids = [row["plant_id"] for row in db.execute("SELECT plant_id FROM Plants").fetchall()]
+
+        seeded = 0
+        for plant_id in plant_ids:
+            scope = self._plant_environment_scope(db, plant_id)
+            if scope is None:
+                continue
+            self._seed_plant_environment(plant_id)
+            seeded += 1
+        return seeded
+
+    def _plant_environment_scope(self, db: sqlite3.Connection, plant_id: int) -> dict[str, Any] | None:
+        """Resolve which sensors and start time a plant's environment stats cover."""
         plant = db.execute(
             """
             SELECT
                 COALESCE(gup.unit_id, p.unit_id) AS unit_id,
-                COALESCE(p.planted_date, p.created_at) AS started_at
+                COALESCE(
+                    ROUND((julianday(COALESCE(p.planted_date, p.created_at)) - 2440587.5) * 86400.0, 3), 0
+                ) AS since_epoch
             FROM Plants p
             LEFT JOIN GrowthUnitPlants gup ON gup.plant_id = p.plant_id
             WHERE p.plant_id = ?
@@ -560,11 +819,9 @@ class AnalyticsOperations:
             (plant_id,),
         ).fetchone()
         if not plant:
-            return 0.0
+            return None
 
         unit_id = plant["unit_id"]
-        started_at = plant["started_at"]
-
         sensor_rows = db.execute(
             """
             SELECT sensor_id
@@ -573,51 +830,38 @@ class AnalyticsOperations:
             """,
             (plant_id,),
         ).fetchall()
-        sensor_ids = [row["sensor_id"] for row in sensor_rows if row["sensor_id"] is not None]
+        sensor_ids = sorted({row["sensor_id"] for row in sensor_rows if row["sensor_id"] is not None})
 
-        params: list[Any] = []
         if sensor_ids:
-            placeholders = ", ".join("?" for _ in sensor_ids)
-            query = f"""
-                SELECT sr.reading_data
-                FROM SensorReading sr
-                WHERE sr.sensor_id IN ({placeholders})
-            """
-            params.extend(sensor_ids)
-        elif unit_id is not None:
-            query = """
-                SELECT sr.reading_data
-                FROM SensorReading sr
-                JOIN Sensor s ON s.sensor_id = sr.sensor_id
-                WHERE s.unit_id = ?
-            """
-            params.append(unit_id)
-        else:
-            return 0.0
+            return {
+                "since_epoch": float(plant["since_epoch"]),
+                "scope": "sensors:" + ",".join(str(sid) for sid in sensor_ids),
+                "unit_id": None,
+                "linked_sensors": 1,
+                "sensor_ids": sensor_ids,
+            }
+        if unit_id is None:
+            return None
 
-        if started_at:
-            query += " AND sr.timestamp >= ?"
-            params.append(started_at)
+        unit_sensors = db.execute("SELECT sensor_id FROM Sensor WHERE unit_id = ?", (unit_id,)).fetchall()
+        return {
+            "since_epoch": float(plant["since_epoch"]),
+            "scope": f"unit:{unit_id}",
+            "unit_id": unit_id,
+            "linked_sensors": 0,
+            "sensor_ids": [row["sensor_id"] for row in unit_sensors],
+        }
 
-        total = 0.0
-        count = 0
-        for row in db.execute(query, params):
-            payload = self._decode_reading_payload(dict(row))
-            raw_value = payload.get(metric_key)
-            if raw_value is None or isinstance(raw_value, bool):
-                continue
-            try:
-                value = float(raw_value)
-            except (TypeError, ValueError):
-                continue
-            if not math.isfinite(value):
-                continue
-            total += value
-            count += 1
+    def _seed_plant_environment(self, plant_id: int) -> None:
+        """Rebuild a plant's accumulator rows from SensorMetricSample.
 
-        if count == 0:
-            return 0.0
-        return total / count
+        Runs on the writer lane so no sample can be inserted between the scan
+        and the replace; the triggers keep the rows current afterwards.
+        """
+        with self.write_connection() as db:
+            db.execute("BEGIN IMMEDIATE")
+            for statement in plant_environment_seed_sql(":plant_id"):
+                db.execute(statement, {"plant_id": plant_id})
 
     def get_total_light_hours(self, plant_id: int) -> float:
         try:
@@ -962,66 +1206,332 @@ class AnalyticsOperations:
         """
         Fetch sensor readings between start and end datetime, optionally filtered.
 
+        Metric values come from the typed SensorMetricSample table; each
+        reading's samples are folded back into one flat row.
+
         Args:
             start_dt: Start datetime for the range
             end_dt: End datetime for the range
             unit_id: Optional unit filter (via Sensor table)
             sensor_id: Optional sensor filter
-            limit: Optional row cap
+            limit: Optional row cap (number of readings)
         Returns:
             List of sensor readings ordered by timestamp
         """
+        rows = self.iter_sensor_history(start_dt, end_dt, unit_id=unit_id, sensor_id=sensor_id)
+        return list(islice(rows, limit) if limit is not None else rows)
+
+    def fetch_sensor_history_page(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        metrics: Sequence[str] | None = None,
+        after: KeysetCursor | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one keyset page of sensor readings ordered by (ts_epoch, reading_id).
+
+        Rows have the shape of :meth:`fetch_sensor_history` plus ``reading_id``
+        and ``ts_epoch`` (the page key). The page's readings are chosen first
+        with LIMIT, so cost is bounded by the page size rather than by how far
+        into the window ``after`` points.
+
+        Args:
+            start_dt: Start datetime for the range
+            end_dt: End datetime for the range
+            unit_id: Optional unit filter (via Sensor table)
+            sensor_id: Optional sensor filter
+            metrics: Optional metric names; readings without any are skipped
+            after: Resume strictly after this (ts_epoch, reading_id) position
+            limit: Maximum number of readings in the page
+        Returns:
+            List of sensor readings ordered by timestamp
+
+        Raises:
+            sqlite3.Error: If the page query fails
+        """
+        params: list[Any] = [to_epoch_seconds(start_dt), to_epoch_seconds(end_dt)]
+        filters: list[str] = ["m.ts_epoch BETWEEN ? AND ?"]
+        metric_filter = ""
+        metric_params: list[Any] = []
+
+        if after is not None:
+            clause, clause_params = after.to_sql_clause("m.ts_epoch", "m.reading_id")
+            filters.append(clause)
+            params.extend(clause_params)
+        if sensor_id is not None:
+            filters.append("m.sensor_id = ?")
+            params.append(sensor_id)
+        if unit_id is not None:
+            filters.append("m.sensor_id IN (SELECT sensor_id FROM Sensor WHERE unit_id = ?)")
+            params.append(unit_id)
+        if metrics:
+            placeholders = ", ".join("?" for _ in metrics)
+            filters.append(f"m.metric IN ({placeholders})")
+            params.extend(metrics)
+            metric_filter = f"AND m.metric IN ({placeholders})"
+            metric_params = list(metrics)
+
+        where_clause = " AND ".join(filters)
+        query = f"""
+            WITH page AS (
+                SELECT DISTINCT m.ts_epoch, m.reading_id
+                FROM SensorMetricSample m
+                WHERE {where_clause}
+                ORDER BY m.ts_epoch ASC, m.reading_id ASC
+                LIMIT ?
+            )
+            SELECT p.ts_epoch,
+                   p.reading_id,
+                   m.sensor_id,
+                   m.metric,
+                   m.value,
+                   sr.timestamp,
+                   sr.quality_score,
+                   s.unit_id AS sensor_unit_id,
+                   s.name AS sensor_name
+            FROM page p
+            JOIN SensorMetricSample m ON m.reading_id = p.reading_id {metric_filter}
+            JOIN SensorReading sr ON sr.reading_id = p.reading_id
+            LEFT JOIN Sensor s ON m.sensor_id = s.sensor_id
+            ORDER BY p.ts_epoch ASC, p.reading_id ASC
+        """
+        readings: list[dict[str, Any]] = []
         try:
-            db = self.get_db()
-            params: list[Any] = [
-                self._timestamp_query_param(start_dt),
-                self._timestamp_query_param(end_dt),
-            ]
-            filters: list[str] = ["sr.timestamp BETWEEN ? AND ?"]
+            with self.read_connection() as db:
+                for row in db.execute(query, (*params, limit, *metric_params)):
+                    if not readings or readings[-1]["reading_id"] != row["reading_id"]:
+                        readings.append(
+                            {
+                                "reading_id": row["reading_id"],
+                                "ts_epoch": row["ts_epoch"],
+                                "timestamp": row["timestamp"],
+                                "sensor_id": row["sensor_id"],
+                                "unit_id": row["sensor_unit_id"],
+                                "sensor_name": row["sensor_name"],
+                                "quality_score": row["quality_score"],
+                            }
+                        )
+                    readings[-1][row["metric"]] = row["value"]
+        except sqlite3.Error as exc:
+            # An empty page would end a streaming export as if it were complete
+            logging.error("Error fetching sensor history page: %s", exc)
+            raise
+        return readings
+
+    def iter_sensor_history(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream sensor readings between start and end datetime, ordered by timestamp.
+
+        Rows have the same shape as :meth:`fetch_sensor_history` but are
+        yielded straight off the cursor, so callers that reduce the window
+        (e.g. chart downsampling) never hold the full history in memory.
+        """
+        try:
+            params: list[Any] = [to_epoch_seconds(start_dt), to_epoch_seconds(end_dt)]
+            filters: list[str] = ["m.ts_epoch BETWEEN ? AND ?"]
 
             if sensor_id is not None:
-                filters.append("sr.sensor_id = ?")
+                filters.append("m.sensor_id = ?")
                 params.append(sensor_id)
             if unit_id is not None:
-                filters.append("sr.sensor_id IN (SELECT sensor_id FROM Sensor WHERE unit_id = ?)")
+                filters.append("m.sensor_id IN (SELECT sensor_id FROM Sensor WHERE unit_id = ?)")
                 params.append(unit_id)
 
-            limit_clause = ""
-            if limit is not None:
-                limit_clause = " LIMIT ?"
-                params.append(limit)
-
             where_clause = " AND ".join(filters)
             query = f"""
-                SELECT sr.sensor_id,
+                SELECT m.reading_id,
+                       m.sensor_id,
+                       m.metric,
+                       m.value,
                        sr.timestamp,
-                       sr.reading_data,
                        sr.quality_score,
                        s.unit_id AS sensor_unit_id,
                        s.name AS sensor_name
-                FROM SensorReading sr
-                LEFT JOIN Sensor s ON sr.sensor_id = s.sensor_id
+                FROM SensorMetricSample m
+                JOIN SensorReading sr ON sr.reading_id = m.reading_id
+                LEFT JOIN Sensor s ON m.sensor_id = s.sensor_id
                 WHERE {where_clause}
-                ORDER BY sr.timestamp ASC{limit_clause}
+                ORDER BY m.ts_epoch ASC, m.reading_id ASC
+            """
+            current_id: int | None = None
+            current: dict[str, Any] | None = None
+            with self.read_connection() as db:
+                for row in db.execute(query, params):
+                    if row["reading_id"] != current_id:
+                        if current is not None:
+                            yield current
+                        current_id = row["reading_id"]
+                        current = {
+                            "timestamp": row["timestamp"],
+                            "sensor_id": row["sensor_id"],
+                            "unit_id": row["sensor_unit_id"],
+                            "sensor_name": row["sensor_name"],
+                            "quality_score": row["quality_score"],
+                        }
+                    current[row["metric"]] = row["value"]
+            if current is not None:
+                yield current
+        except sqlite3.Error as exc:
+            logging.error("Error fetching sensor history: %s", exc)
+
+    def plan_sensor_history_resolution(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        max_points: int,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        raw_retention_days: int | None = None,
+    ) -> int:
+        """
+        Pick the cheapest source able to answer a chart query within ``max_points``.
+
+        Reading counts are estimated from the hourly rollup tier, so the
+        decision never scans raw samples. Sources that no longer hold the
+        start of the window are skipped: raw readings older than
+        ``raw_retention_days`` and tiers past SENSOR_ROLLUP_RETENTION_DAYS.
+
+        Returns:
+            0 when raw readings fit, otherwise the rollup tier (bucket seconds)
+            to read from: the finest retained tier whose bucket count fits.
+        """
+        try:
+            start_epoch = to_epoch_seconds(start_dt)
+            end_epoch = to_epoch_seconds(end_dt)
+            now_epoch = time.time()
+            coarsest = SENSOR_ROLLUP_TIERS[-1]
+            params: list[Any] = [coarsest, math.floor(start_epoch / coarsest) * coarsest, end_epoch]
+            filters = ["tier_seconds = ?", "bucket_start BETWEEN ? AND ?"]
+            if sensor_id is not None:
+                filters.append("sensor_id = ?")
+                params.append(sensor_id)
+            if unit_id is not None:
+                filters.append("sensor_id IN (SELECT sensor_id FROM Sensor WHERE unit_id = ?)")
+                params.append(unit_id)
+
+            # A raw row folds every metric of one reading, so a sensor's reading
+            # count is its busiest metric's count.
+            with self.read_connection() as db:
+                row = db.execute(
+                    f"""
+                    SELECT COUNT(*) AS sensors, COALESCE(SUM(readings), 0) AS readings
+                    FROM (
+                        SELECT sensor_id, MAX(total) AS readings
+                        FROM (
+                            SELECT sensor_id, metric, SUM(count_readings) AS total
+                            FROM SensorMetricRollup
+                            WHERE {" AND ".join(filters)}
+                            GROUP BY sensor_id, metric
+                        )
+                        GROUP BY sensor_id
+                    )
+                    """,
+                    params,
+                ).fetchone()
+            sensors, readings = int(row["sensors"] or 0), int(row["readings"] or 0)
+            raw_retained = raw_retention_days is None or start_epoch >= now_epoch - raw_retention_days * 86400
+            if raw_retained and readings <= max_points:
+                return 0
+
+            tiers = [
+                tier
+                for tier in SENSOR_ROLLUP_TIERS
+                if tier not in SENSOR_ROLLUP_RETENTION_DAYS
+                or start_epoch >= now_epoch - SENSOR_ROLLUP_RETENTION_DAYS[tier] * 86400
+            ] or [coarsest]
+            # A tier never returns more buckets than there are readings, so
+            # sparse sensors keep the finest retained tier.
+            window = max(end_epoch - start_epoch, 0.0)
+            for tier in tiers:
+                if min(readings, sensors * math.ceil(window / tier)) <= max_points:
+                    return tier
+            return tiers[-1]
+        except (sqlite3.Error, ValueError) as exc:
+            logging.error("Error planning sensor history resolution: %s", exc)
+            return 0
+
+    def fetch_sensor_rollup_history(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        tier_seconds: int,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch bucketed sensor history from the SensorMetricRollup tier.
+
+        Rows have the same shape as :meth:`fetch_sensor_history` (one row per
+        sensor and bucket, metrics as keys holding the bucket mean) plus
+        ``reading_count``; ``timestamp`` is the bucket start in UTC.
+        """
+        if tier_seconds not in SENSOR_ROLLUP_TIERS:
+            raise ValueError(f"Unknown rollup tier: {tier_seconds}")
+        try:
+            start_epoch = to_epoch_seconds(start_dt)
+            params: list[Any] = [
+                tier_seconds,
+                math.floor(start_epoch / tier_seconds) * tier_seconds,
+                to_epoch_seconds(end_dt),
+            ]
+            filters = ["r.tier_seconds = ?", "r.bucket_start BETWEEN ? AND ?"]
+            if sensor_id is not None:
+                filters.append("r.sensor_id = ?")
+                params.append(sensor_id)
+            if unit_id is not None:
+                filters.append("r.sensor_id IN (SELECT sensor_id FROM Sensor WHERE unit_id = ?)")
+                params.append(unit_id)
+
+            query = f"""
+                SELECT r.sensor_id,
+                       r.bucket_start,
+                       r.metric,
+                       r.count_readings,
+                       r.sum_value,
+                       s.unit_id AS sensor_unit_id,
+                       s.name AS sensor_name
+                FROM SensorMetricRollup r
+                LEFT JOIN Sensor s ON r.sensor_id = s.sensor_id
+                WHERE {" AND ".join(filters)}
+                ORDER BY r.bucket_start ASC, r.sensor_id ASC
             """
-            cursor = db.execute(query, params)
             rows: list[dict[str, Any]] = []
-            for row in cursor.fetchall():
-                as_dict = dict(row)
-                payload = self._decode_reading_payload(as_dict)
-                rows.append(
-                    {
-                        "timestamp": as_dict.get("timestamp"),
-                        "sensor_id": as_dict.get("sensor_id"),
-                        "unit_id": as_dict.get("sensor_unit_id"),
-                        "sensor_name": as_dict.get("sensor_name"),
-                        "quality_score": as_dict.get("quality_score"),
-                        **payload,
+            current_key: tuple[int, int] | None = None
+            current: dict[str, Any] = {}
+            with self.read_connection() as db:
+                fetched = db.execute(query, params).fetchall()
+            for row in fetched:
+                key = (row["bucket_start"], row["sensor_id"])
+                if key != current_key:
+                    current_key = key
+                    current = {
+                        "timestamp": datetime.fromtimestamp(row["bucket_start"], UTC).isoformat(),
+                        "sensor_id": row["sensor_id"],
+                        "unit_id": row["sensor_unit_id"],
+                        "sensor_name": row["sensor_name"],
+                        "reading_count": 0,
                     }
-                )
+                    rows.append(current)
+                count = row["count_readings"] or 0
+                current["reading_count"] = max(current["reading_count"], count)
+                current[row["metric"]] = row["sum_value"] / count if count else None
             return rows
         except sqlite3.Error as exc:
-            logging.error("Error fetching sensor history: %s", exc)
+            logging.error("Error fetching sensor rollup history: %s", exc)
             return []
 
     def get_plant_info(self, plant_id: int) -> dict[str, object] | None:
@@ -1461,6 +1971,12 @@ class AnalyticsOperations:
             logging.error("Error getting plant energy summary for %s: %s", plant_id, exc)
             return empty
 
-    # Placeholder for static analysers
+    # Placeholders for static analysers
     def get_db(self):  # pragma: no cover
         raise NotImplementedError
+
+    def read_connection(self):  # pragma: no cover
+        raise NotImplementedError
+
+    def write_connection(self):  # pragma: no cover
+        raise NotImplementedError
@@ -2,10 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import sqlite3
+import time
 from typing import Any
 
 from infrastructure.database.pagination import validate_pagination
+from infrastructure.database.utils import to_epoch_seconds
+
+SUMMARY_GRANULARITIES: tuple[str, ...] = ("hourly", "daily", "weekly")
+SUMMARY_BUCKET_SECONDS: dict[str, int] = {"hourly": 3600, "daily": 86400, "weekly": 7 * 86400}
+# 1970-01-01 was a Thursday; shift weekly buckets so they start on Monday.
+_WEEK_START_OFFSET = 4 * 86400
+# Days each SensorMetricRollup tier (bucket seconds) is kept before pruning.
+SENSOR_ROLLUP_RETENTION_DAYS: dict[int, int] = {60: 7, 900: 90, 3600: 730}
 
 
 class DeviceOperations:
@@ -625,29 +635,45 @@ class DeviceOperations:
     ) -> int | None:
         """Persist actuator state change (on/off/partial) to ActuatorStateHistory."""
         try:
-            db = self.get_db()
-            if timestamp:
-                cursor = db.execute(
-                    """
-                    INSERT INTO ActuatorStateHistory (actuator_id, state, value, timestamp)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (actuator_id, state, value, timestamp),
-                )
-            else:
-                cursor = db.execute(
-                    """
-                    INSERT INTO ActuatorStateHistory (actuator_id, state, value)
-                    VALUES (?, ?, ?)
-                    """,
-                    (actuator_id, state, value),
-                )
-            db.commit()
+            with self.write_connection() as db:
+                if timestamp:
+                    cursor = db.execute(
+                        """
+                        INSERT INTO ActuatorStateHistory (actuator_id, state, value, timestamp)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (actuator_id, state, value, timestamp),
+                    )
+                else:
+                    cursor = db.execute(
+                        """
+                        INSERT INTO ActuatorStateHistory (actuator_id, state, value)
+                        VALUES (?, ?, ?)
+                        """,
+                        (actuator_id, state, value),
+                    )
             return cursor.lastrowid
         except sqlite3.Error as exc:
             logging.error("Error saving actuator state: %s", exc)
             return None
 
+    def enqueue_actuator_state(
+        self,
+        actuator_id: int,
+        state: str,
+        value: float | None = None,
+        timestamp: str | None = None,
+    ) -> None:
+        """Queue an actuator state change on the write-behind lane (group-committed)."""
+        try:
+            self.defer_write(
+                "INSERT INTO ActuatorStateHistory (actuator_id, state, value, timestamp) "
+                "VALUES (?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))",
+                (actuator_id, state, value, timestamp),
+            )
+        except sqlite3.Error as exc:
+            logging.error("Error queueing actuator state: %s", exc)
+
     def get_actuator_state_history(
         self,
         actuator_id: int,
@@ -735,12 +761,11 @@ class DeviceOperations:
     def prune_actuator_state_history(self, days: int) -> int:
         """Delete state history rows older than N days. Returns rows deleted."""
         try:
-            db = self.get_db()
-            cur = db.execute(
-                "DELETE FROM ActuatorStateHistory WHERE timestamp < datetime('now', ?)",
-                (f"-{int(days)} days",),
-            )
-            db.commit()
+            with self.write_connection() as db:
+                cur = db.execute(
+                    "DELETE FROM ActuatorStateHistory WHERE timestamp < datetime('now', ?)",
+                    (f"-{int(days)} days",),
+                )
             return cur.rowcount or 0
         except sqlite3.Error as exc:
             logging.error("Error pruning actuator state history: %s", exc)
@@ -750,17 +775,34 @@ class DeviceOperations:
     def prune_sensor_readings(self, days: int) -> int:
         """Delete sensor reading rows older than N days. Returns rows deleted."""
         try:
-            db = self.get_db()
-            cur = db.execute(
-                "DELETE FROM SensorReading WHERE timestamp < datetime('now', ?)",
-                (f"-{int(days)} days",),
-            )
-            db.commit()
+            with self.write_connection() as db:
+                cur = db.execute(
+                    "DELETE FROM SensorReading WHERE timestamp < datetime('now', ?)",
+                    (f"-{int(days)} days",),
+                )
             return cur.rowcount or 0
         except sqlite3.Error as exc:
             logging.error("Error pruning sensor readings: %s", exc)
             return 0
 
+    def prune_sensor_rollups(self, retention_days: dict[int, int] | None = None) -> int:
+        """Delete SensorMetricRollup buckets past each tier's retention. Returns rows deleted."""
+        retention = retention_days or SENSOR_ROLLUP_RETENTION_DAYS
+        try:
+            with self.write_connection() as db:
+                now_epoch = time.time()
+                deleted = 0
+                for tier, days in retention.items():
+                    cur = db.execute(
+                        "DELETE FROM SensorMetricRollup WHERE tier_seconds = ? AND bucket_start < ?",
+                        (int(tier), now_epoch - int(days) * 86400),
+                    )
+                    deleted += cur.rowcount or 0
+            return deleted
+        except sqlite3.Error as exc:
+            logging.error("Error pruning sensor rollups: %s", exc)
+            return 0
+
     # --- Connectivity History -------------------------------------------------
     def save_connectivity_event(
         self,
@@ -776,48 +818,72 @@ class DeviceOperations:
     ) -> int | None:
         """Persist connectivity event in history table."""
         try:
-            db = self.get_db()
-            if timestamp:
-                cur = db.execute(
-                    """
-                    INSERT INTO DeviceConnectivityHistory
-                    (connection_type, status, endpoint, port, unit_id, device_id, details, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        connection_type,
-                        status,
-                        endpoint,
-                        port,
-                        unit_id,
-                        device_id,
-                        details,
-                        timestamp,
-                    ),
-                )
-            else:
-                cur = db.execute(
-                    """
-                    INSERT INTO DeviceConnectivityHistory
-                    (connection_type, status, endpoint, port, unit_id, device_id, details)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        connection_type,
-                        status,
-                        endpoint,
-                        port,
-                        unit_id,
-                        device_id,
-                        details,
-                    ),
-                )
-            db.commit()
+            with self.write_connection() as db:
+                if timestamp:
+                    cur = db.execute(
+                        """
+                        INSERT INTO DeviceConnectivityHistory
+                        (connection_type, status, endpoint, port, unit_id, device_id, details, timestamp)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            connection_type,
+                            status,
+                            endpoint,
+                            port,
+                            unit_id,
+                            device_id,
+                            details,
+                            timestamp,
+                        ),
+                    )
+                else:
+                    cur = db.execute(
+                        """
+                        INSERT INTO DeviceConnectivityHistory
+                        (connection_type, status, endpoint, port, unit_id, device_id, details)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            connection_type,
+                            status,
+                            endpoint,
+                            port,
+                            unit_id,
+                            device_id,
+                            details,
+                        ),
+                    )
             return cur.lastrowid
         except sqlite3.Error as exc:
             logging.error("Error saving connectivity event: %s", exc)
             return None
 
+    def enqueue_connectivity_event(
+        self,
+        connection_type: str,
+        status: str,
+        *,
+        endpoint: str | None = None,
+        port: int | None = None,
+        unit_id: int | None = None,
+        device_id: str | None = None,
+        details: str | None = None,
+        timestamp: str | None = None,
+    ) -> None:
+        """Queue a connectivity event on the write-behind lane (group-committed)."""
+        try:
+            self.defer_write(
+                """
+                INSERT INTO DeviceConnectivityHistory
+                (connection_type, status, endpoint, port, unit_id, device_id, details, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+                """,
+                (connection_type, status, endpoint, port, unit_id, device_id, details, timestamp),
+            )
+        except sqlite3.Error as exc:
+            logging.error("Error queueing connectivity event: %s", exc)
+
     def get_connectivity_history(
         self,
         *,
@@ -1179,6 +1245,96 @@ class DeviceOperations:
             logging.error("Error resolving actuator anomaly: %s", exc)
             return False
 
+    def get_actuator_failure_inputs(
+        self,
+        actuator_ids: list[int],
+        *,
+        history_limit: int = 30,
+        anomaly_limit: int = 100,
+    ) -> dict[int, dict[str, Any]]:
+        """Fetch failure-prediction inputs for many actuators in two queries.
+
+        Returns ``{actuator_id: {"health_history": [...], "unresolved_anomalies": n}}``
+        where ``health_history`` holds the latest ``history_limit`` snapshots
+        (newest first) and ``unresolved_anomalies`` counts unresolved rows among
+        the latest ``anomaly_limit`` anomalies. Actuators without health
+        snapshots are omitted.
+        """
+        if not actuator_ids:
+            return {}
+
+        placeholders = ",".join(["?"] * len(actuator_ids))
+        ids = tuple(int(a) for a in actuator_ids)
+        try:
+            with self.read_connection() as db:
+                health_rows = db.execute(
+                    f"""
+                    SELECT actuator_id, health_score, status, total_operations,
+                           failed_operations, average_response_time, recorded_at
+                    FROM (
+                        SELECT actuator_id, health_score, status, total_operations,
+                               failed_operations, average_response_time, recorded_at,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY actuator_id ORDER BY recorded_at DESC, history_id DESC
+                               ) AS rn
+                        FROM ActuatorHealthHistory
+                        WHERE actuator_id IN ({placeholders})
+                    )
+                    WHERE rn <= ?
+                    ORDER BY actuator_id, rn
+                    """,
+                    (*ids, history_limit),
+                ).fetchall()
+                anomaly_rows = db.execute(
+                    f"""
+                    SELECT actuator_id, SUM(resolved_at IS NULL) AS unresolved
+                    FROM (
+                        SELECT actuator_id, resolved_at,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY actuator_id ORDER BY detected_at DESC, anomaly_id DESC
+                               ) AS rn
+                        FROM ActuatorAnomaly
+                        WHERE actuator_id IN ({placeholders})
+                    )
+                    WHERE rn <= ?
+                    GROUP BY actuator_id
+                    """,
+                    (*ids, anomaly_limit),
+                ).fetchall()
+        except sqlite3.Error as exc:
+            logging.error("Error getting actuator failure inputs: %s", exc)
+            return {}
+
+        unresolved = {int(row["actuator_id"]): int(row["unresolved"] or 0) for row in anomaly_rows}
+        results: dict[int, dict[str, Any]] = {}
+        for row in health_rows:
+            actuator_id = int(row["actuator_id"])
+            entry = results.get(actuator_id)
+            if entry is None:
+                entry = results[actuator_id] = {
+                    "health_history": [],
+                    "unresolved_anomalies": unresolved.get(actuator_id, 0),
+                }
+            entry["health_history"].append(dict(row))
+        return results
+
+    def get_actuator_health_stamp(self) -> tuple[Any, ...]:
+        """Cheap fingerprint that changes when health snapshots or anomalies are written or resolved."""
+        try:
+            with self.read_connection() as db:
+                row = db.execute(
+                    """
+                    SELECT (SELECT MAX(history_id) FROM ActuatorHealthHistory),
+                           (SELECT MAX(anomaly_id) FROM ActuatorAnomaly),
+                           (SELECT COUNT(resolved_at) FROM ActuatorAnomaly),
+                           (SELECT MAX(resolved_at) FROM ActuatorAnomaly)
+                    """
+                ).fetchone()
+            return tuple(row) if row else ()
+        except sqlite3.Error as exc:
+            logging.error("Error reading actuator health stamp: %s", exc)
+            return ()
+
     # --- Actuator Power Readings -----------------------------------------------
     def save_actuator_power_reading(
         self,
@@ -1345,15 +1501,14 @@ class DeviceOperations:
     ) -> int | None:
         """Insert sensor reading with JSON data."""
         try:
-            db = self.get_db()
-            cursor = db.execute(
-                """
-                INSERT INTO SensorReading (sensor_id, reading_data, quality_score)
-                VALUES (?, ?, ?)
-                """,
-                (sensor_id, json.dumps(reading_data), quality_score),
-            )
-            db.commit()
+            with self.write_connection() as db:
+                cursor = db.execute(
+                    """
+                    INSERT INTO SensorReading (sensor_id, reading_data, quality_score)
+                    VALUES (?, ?, ?)
+                    """,
+                    (sensor_id, json.dumps(reading_data), quality_score),
+                )
             return cursor.lastrowid
         except sqlite3.Error as exc:
             logging.error("Error inserting sensor reading: %s", exc)
@@ -1378,13 +1533,12 @@ class DeviceOperations:
         if not readings:
             return 0
         try:
-            db = self.get_db()
-            rows = [(sid, json.dumps(data), qs) for sid, data, qs in readings]
-            db.executemany(
-                "INSERT INTO SensorReading (sensor_id, reading_data, quality_score) VALUES (?, ?, ?)",
-                rows,
-            )
-            db.commit()
+            with self.write_connection() as db:
+                rows = [(sid, json.dumps(data), qs) for sid, data, qs in readings]
+                db.executemany(
+                    "INSERT INTO SensorReading (sensor_id, reading_data, quality_score) VALUES (?, ?, ?)",
+                    rows,
+                )
             return len(rows)
         except sqlite3.Error as exc:
             logging.error("Error batch-inserting %d sensor readings: %s", len(readings), exc)
@@ -1401,6 +1555,7 @@ class DeviceOperations:
         Aggregate sensor readings for a time period and save to SensorReadingSummary.
 
         This should be run BEFORE pruning to preserve summarized data for harvest reports.
+        Existing summaries for the same period are replaced.
 
         Args:
             period_start: ISO timestamp for start of period (e.g., '2026-01-11 00:00:00')
@@ -1413,59 +1568,176 @@ class DeviceOperations:
         try:
             db = self.get_db()
 
-            # Get all sensors with readings in this period
-            sensors_query = """
-                SELECT DISTINCT
-                    sr.sensor_id,
+            agg_query = """
+                SELECT
+                    m.sensor_id,
                     s.unit_id,
-                    s.sensor_type
-                FROM SensorReading sr
-                JOIN Sensor s ON sr.sensor_id = s.sensor_id
-                WHERE sr.timestamp >= ? AND sr.timestamp < ?
+                    s.sensor_type,
+                    m.metric,
+                    COUNT(*) as count_readings,
+                    MIN(m.value) as min_value,
+                    MAX(m.value) as max_value,
+                    SUM(m.value) as sum_value,
+                    SUM(m.value * m.value) as sum_squares
+                FROM SensorMetricSample m
+                JOIN Sensor s ON m.sensor_id = s.sensor_id
+                WHERE m.ts_epoch >= ? AND m.ts_epoch < ?
+                GROUP BY m.sensor_id, m.metric
             """
-            sensors = db.execute(sensors_query, (period_start, period_end)).fetchall()
-
-            records_created = 0
-
-            for sensor_row in sensors:
-                sensor_id = sensor_row["sensor_id"]
-                unit_id = sensor_row["unit_id"]
-                sensor_type = sensor_row["sensor_type"]
-
-                # Calculate aggregates for this sensor using per-sensor JSON paths.
-                value_expr = self._sensor_value_expression(sensor_type)
-                agg_query = f"""
-                    SELECT
-                        COUNT(*) as count_readings,
-                        MIN(CAST({value_expr} AS REAL)) as min_value,
-                        MAX(CAST({value_expr} AS REAL)) as max_value,
-                        AVG(CAST({value_expr} AS REAL)) as avg_value,
-                        SUM(CAST({value_expr} AS REAL)) as sum_value
-                    FROM SensorReading
-                    WHERE sensor_id = ?
-                      AND timestamp >= ? AND timestamp < ?
-                      AND {value_expr} IS NOT NULL
-                """
-                agg_row = db.execute(agg_query, (sensor_id, period_start, period_end)).fetchone()
-
-                if not agg_row or agg_row["count_readings"] == 0:
-                    continue
+            rows = db.execute(agg_query, (to_epoch_seconds(period_start), to_epoch_seconds(period_end))).fetchall()
 
-                # Calculate standard deviation manually (SQLite doesn't have STDDEV)
-                stddev = self._calculate_stddev(
-                    db, sensor_id, period_start, period_end, agg_row["avg_value"], value_expr
+            summaries = [
+                (
+                    sensor_id,
+                    row["unit_id"],
+                    row["sensor_type"],
+                    period_start,
+                    period_end,
+                    granularity,
+                    *self._summary_values(
+                        [
+                            row["count_readings"],
+                            row["min_value"],
+                            row["max_value"],
+                            row["sum_value"],
+                            row["sum_squares"],
+                        ]
+                    ),
                 )
+                for sensor_id, sensor_rows in self._primary_metric_rows(rows).items()
+                for row in sensor_rows
+            ]
+            self._write_sensor_summaries(db, summaries)
+
+            db.commit()
+            logging.info("Aggregated %d sensor summaries for period %s to %s", len(summaries), period_start, period_end)
+            return len(summaries)
+
+        except (sqlite3.Error, ValueError) as exc:
+            logging.error("Error aggregating sensor readings: %s", exc)
+            return 0
 
-                # Insert or update summary (REPLACE handles duplicates via UNIQUE constraint)
-                insert_query = """
-                    INSERT OR REPLACE INTO SensorReadingSummary (
-                        sensor_id, unit_id, sensor_type, period_start, period_end,
-                        granularity, min_value, max_value, avg_value, sum_value,
-                        count_readings, stddev_value
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    def aggregate_pending_sensor_readings(
+        self,
+        until: str | None = None,
+        granularities: tuple[str, ...] = SUMMARY_GRANULARITIES,
+    ) -> int:
+        """
+        Incrementally summarize samples newer than each sensor's watermark.
+
+        One grouped pass over SensorMetricSample produces hourly
+        count/min/max/sum/sum-of-squares for every sensor; the hourly groups are
+        rolled up in Python into every requested granularity. Buckets that were
+        partially summarized by a previous run are merged rather than replaced,
+        and each sensor's watermark then advances to ``until``.
+
+        Samples stored with a timestamp older than the sensor's watermark (late
+        arrivals) are not picked up; use ``aggregate_sensor_readings_for_period``
+        to rebuild a specific period.
+
+        Args:
+            until: Exclusive ISO upper bound (defaults to now)
+            granularities: Subset of 'hourly', 'daily', 'weekly'
+
+        Returns:
+            Number of summary records written
+        """
+        import time
+
+        try:
+            db = self.get_db()
+            until_epoch = to_epoch_seconds(until) if until else time.time()
+
+            bound_row = db.execute(
                 """
-                db.execute(
-                    insert_query,
+                SELECT MIN(COALESCE(w.summarized_until, -1)) AS lower_bound
+                FROM Sensor s
+                LEFT JOIN SensorSummaryWatermark w ON w.sensor_id = s.sensor_id
+                WHERE w.sensor_id IS NOT NULL
+                   OR EXISTS (SELECT 1 FROM SensorMetricSample m WHERE m.sensor_id = s.sensor_id)
+                """
+            ).fetchone()
+            if not bound_row or bound_row["lower_bound"] is None or bound_row["lower_bound"] >= until_epoch:
+                return 0
+
+            rows = db.execute(
+                """
+                SELECT
+                    m.sensor_id,
+                    s.unit_id,
+                    s.sensor_type,
+                    m.metric,
+                    CAST(m.ts_epoch / 3600 AS INTEGER) * 3600 AS hour_start,
+                    COUNT(*) as count_readings,
+                    MIN(m.value) as min_value,
+                    MAX(m.value) as max_value,
+                    SUM(m.value) as sum_value,
+                    SUM(m.value * m.value) as sum_squares
+                FROM SensorMetricSample m
+                JOIN Sensor s ON m.sensor_id = s.sensor_id
+                LEFT JOIN SensorSummaryWatermark w ON w.sensor_id = m.sensor_id
+                WHERE m.ts_epoch >= ? AND m.ts_epoch < ?
+                  AND m.ts_epoch >= COALESCE(w.summarized_until, -1)
+                GROUP BY m.sensor_id, m.metric, hour_start
+                """,
+                (bound_row["lower_bound"], until_epoch),
+            ).fetchall()
+
+            watermarks = {
+                row["sensor_id"]: row["summarized_until"]
+                for row in db.execute("SELECT sensor_id, summarized_until FROM SensorSummaryWatermark")
+            }
+
+            # (sensor_id, granularity, bucket_start) -> [count, min, max, sum, sum_squares]
+            buckets: dict[tuple[int, str, int], list[float]] = {}
+            sensor_meta: dict[int, tuple[Any, str]] = {}
+            for sensor_id, sensor_rows in self._primary_metric_rows(rows).items():
+                for row in sensor_rows:
+                    sensor_meta[sensor_id] = (row["unit_id"], row["sensor_type"])
+                    stats = [
+                        row["count_readings"],
+                        row["min_value"],
+                        row["max_value"],
+                        row["sum_value"],
+                        row["sum_squares"],
+                    ]
+                    for granularity in granularities:
+                        bucket_start = self._summary_bucket_start(row["hour_start"], granularity)
+                        key = (sensor_id, granularity, bucket_start)
+                        buckets[key] = self._merge_summary_stats(buckets.get(key), stats)
+
+            summaries = []
+            for (sensor_id, granularity, bucket_start), stats in buckets.items():
+                period_start = self._summary_period_label(bucket_start)
+                period_end = self._summary_period_label(bucket_start + SUMMARY_BUCKET_SECONDS[granularity])
+                # Only a bucket straddling the previous watermark holds samples summarized by an
+                # earlier run; every later bucket is fully covered by this pass and is replaced.
+                existing = None
+                if bucket_start < watermarks.get(sensor_id, float("-inf")):
+                    existing = db.execute(
+                        """
+                        SELECT count_readings, min_value, max_value, avg_value, sum_value, stddev_value
+                        FROM SensorReadingSummary
+                        WHERE sensor_id = ? AND period_start = ? AND granularity = ?
+                        """,
+                        (sensor_id, period_start, granularity),
+                    ).fetchone()
+                if existing and existing["count_readings"]:
+                    count = existing["count_readings"]
+                    mean = existing["avg_value"] or 0.0
+                    stddev = existing["stddev_value"] or 0.0
+                    stats = self._merge_summary_stats(
+                        stats,
+                        [
+                            count,
+                            existing["min_value"],
+                            existing["max_value"],
+                            existing["sum_value"],
+                            count * (stddev * stddev + mean * mean),
+                        ],
+                    )
+                unit_id, sensor_type = sensor_meta[sensor_id]
+                summaries.append(
                     (
                         sensor_id,
                         unit_id,
@@ -1473,71 +1745,99 @@ class DeviceOperations:
                         period_start,
                         period_end,
                         granularity,
-                        agg_row["min_value"],
-                        agg_row["max_value"],
-                        agg_row["avg_value"],
-                        agg_row["sum_value"],
-                        agg_row["count_readings"],
-                        stddev,
-                    ),
+                        *self._summary_values(stats),
+                    )
                 )
-                records_created += 1
+            self._write_sensor_summaries(db, summaries)
 
-            db.commit()
-            logging.info(
-                "Aggregated %d sensor summaries for period %s to %s", records_created, period_start, period_end
+            db.executemany(
+                """
+                INSERT INTO SensorSummaryWatermark (sensor_id, summarized_until, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(sensor_id) DO UPDATE SET
+                    summarized_until = MAX(summarized_until, excluded.summarized_until),
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [(sensor_id, until_epoch) for sensor_id in sensor_meta],
             )
-            return records_created
+            db.commit()
+            logging.info("Wrote %d incremental sensor summaries for %d sensors", len(summaries), len(sensor_meta))
+            return len(summaries)
 
-        except sqlite3.Error as exc:
-            logging.error("Error aggregating sensor readings: %s", exc)
+        except (sqlite3.Error, ValueError) as exc:
+            logging.error("Error aggregating pending sensor readings: %s", exc)
             return 0
 
-    def _calculate_stddev(
-        self,
-        db,
-        sensor_id: int,
-        period_start: str,
-        period_end: str,
-        mean: float,
-        value_expr: str,
-    ) -> float | None:
-        """Calculate standard deviation manually (SQLite lacks STDDEV)."""
-        if mean is None:
-            return None
-        try:
-            query = f"""
-                SELECT AVG(
-                    (CAST({value_expr} AS REAL) - ?) *
-                    (CAST({value_expr} AS REAL) - ?)
-                ) as variance
-                FROM SensorReading
-                WHERE sensor_id = ?
-                  AND timestamp >= ? AND timestamp < ?
-                  AND {value_expr} IS NOT NULL
+    def _primary_metric_rows(self, rows: list[Any]) -> dict[int, list[Any]]:
+        """Group aggregate rows by sensor, keeping only the sensor type's primary metric."""
+        by_sensor: dict[int, dict[str, list[Any]]] = {}
+        for row in rows:
+            by_sensor.setdefault(row["sensor_id"], {}).setdefault(row["metric"], []).append(row)
+
+        selected: dict[int, list[Any]] = {}
+        for sensor_id, metrics in by_sensor.items():
+            sensor_type = next(iter(metrics.values()))[0]["sensor_type"]
+            key = next((k for k in self._sensor_value_keys(sensor_type) if k in metrics), None)
+            if key is not None:
+                selected[sensor_id] = metrics[key]
+        return selected
+
+    @staticmethod
+    def _merge_summary_stats(current: list[float] | None, other: list[float]) -> list[float]:
+        """Merge two [count, min, max, sum, sum_squares] accumulators."""
+        if current is None:
+            return list(other)
+        return [
+            current[0] + other[0],
+            min(current[1], other[1]),
+            max(current[2], other[2]),
+            current[3] + other[3],
+            current[4] + other[4],
+        ]
+
+    @staticmethod
+    def _summary_values(stats: list[float]) -> tuple[float, float, float, float, int, float]:
+        """Return (min, max, avg, sum, count, stddev) from a [count, min, max, sum, sum_squares] accumulator."""
+        count, min_value, max_value, sum_value, sum_squares = stats
+        avg_value = sum_value / count
+        # Population variance from running sums (SQLite lacks STDDEV)
+        variance = max(sum_squares / count - avg_value * avg_value, 0.0)
+        return min_value, max_value, avg_value, sum_value, count, math.sqrt(variance)
+
+    @staticmethod
+    def _summary_bucket_start(epoch: float, granularity: str) -> int:
+        """Align an epoch timestamp to the start of its summary bucket (UTC)."""
+        size = SUMMARY_BUCKET_SECONDS[granularity]
+        offset = _WEEK_START_OFFSET if granularity == "weekly" else 0
+        return int((epoch - offset) // size) * size + offset
+
+    @staticmethod
+    def _summary_period_label(epoch: float) -> str:
+        """Format a bucket boundary like the existing 'YYYY-MM-DD HH:MM:SS' period columns."""
+        from datetime import UTC, datetime
+
+        return datetime.fromtimestamp(epoch, UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+    @staticmethod
+    def _write_sensor_summaries(db, summaries: list[tuple]) -> None:
+        """Upsert summary tuples (REPLACE handles duplicates via the UNIQUE constraint)."""
+        db.executemany(
             """
-            row = db.execute(query, (mean, mean, sensor_id, period_start, period_end)).fetchone()
-            if row and row["variance"] is not None:
-                import math
-
-                return math.sqrt(row["variance"])
-            return None
-        except Exception:
-            return None
+            INSERT OR REPLACE INTO SensorReadingSummary (
+                sensor_id, unit_id, sensor_type, period_start, period_end,
+                granularity, min_value, max_value, avg_value, sum_value,
+                count_readings, stddev_value
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            summaries,
+        )
 
-    def _sensor_value_expression(self, sensor_type: str | None) -> str:
-        """Build a safe SQL expression to extract the primary sensor value."""
+    def _sensor_value_keys(self, sensor_type: str | None) -> list[str]:
+        """Return the metric keys holding the primary value for a sensor type, in priority order."""
         normalized = str(sensor_type or "").strip().lower()
         if normalized.endswith("_sensor"):
             normalized = normalized[: -len("_sensor")]
 
-        def coalesce(keys: list[str]) -> str:
-            # Move internal import here to avoid circular dependencies if any
-            parts = [f"json_extract(reading_data, '$.{key}')" for key in keys]
-            if len(parts) == 1:
-                return parts[0]
-            return f"COALESCE({', '.join(parts)})"
-
         from app.domain.sensors.fields import FIELD_ALIASES, SensorField
 
         # Build mapping based on standard fields
@@ -1591,15 +1891,16 @@ class DeviceOperations:
 
         for key, keys in value_keys.items():
             if normalized == key or normalized.startswith(key):
-                return coalesce(keys)
+                return keys
 
-        return "json_extract(reading_data, '$.value')"
+        return ["value"]
 
     def aggregate_readings_by_days_old(self, days_threshold: int) -> int:
         """
         Aggregate all readings older than N days that haven't been summarized yet.
 
-        This creates daily summaries for data that will soon be pruned.
+        Runs one incremental pass (see ``aggregate_pending_sensor_readings``) that
+        writes hourly, daily and weekly summaries for data that will soon be pruned.
 
         Args:
             days_threshold: Days threshold (e.g., 25 to aggregate before 30-day prune)
@@ -1607,59 +1908,10 @@ class DeviceOperations:
         Returns:
             Total summary records created
         """
-        from datetime import datetime, timedelta
-
-        try:
-            db = self.get_db()
-
-            # Find the date range for readings older than threshold
-            cutoff_date = datetime.now() - timedelta(days=days_threshold)
-
-            # Find the oldest reading date
-            oldest_query = """
-                SELECT MIN(DATE(timestamp)) as oldest_date
-                FROM SensorReading
-                WHERE timestamp < ?
-            """
-            oldest_row = db.execute(oldest_query, (cutoff_date.strftime("%Y-%m-%d %H:%M:%S"),)).fetchone()
-
-            if not oldest_row or not oldest_row["oldest_date"]:
-                logging.info("No old readings to aggregate")
-                return 0
-
-            oldest_date = datetime.strptime(oldest_row["oldest_date"], "%Y-%m-%d")
-            total_created = 0
+        from datetime import UTC, datetime, timedelta
 
-            # Process each day from oldest to cutoff
-            current_date = oldest_date
-            while current_date < cutoff_date:
-                period_start = current_date.strftime("%Y-%m-%d 00:00:00")
-                next_date = current_date + timedelta(days=1)
-                period_end = next_date.strftime("%Y-%m-%d 00:00:00")
-
-                # Check if already aggregated
-                check_query = """
-                    SELECT COUNT(*) as cnt FROM SensorReadingSummary
-                    WHERE period_start = ? AND granularity = 'daily'
-                """
-                check_row = db.execute(check_query, (period_start,)).fetchone()
-
-                if check_row and check_row["cnt"] > 0:
-                    # Already aggregated, skip
-                    current_date = next_date
-                    continue
-
-                # Aggregate this day
-                created = self.aggregate_sensor_readings_for_period(period_start, period_end, "daily")
-                total_created += created
-                current_date = next_date
-
-            logging.info("Total sensor summaries created: %d", total_created)
-            return total_created
-
-        except Exception as exc:
-            logging.error("Error in aggregate_readings_by_days_old: %s", exc)
-            return 0
+        cutoff = datetime.now(UTC) - timedelta(days=days_threshold)
+        return self.aggregate_pending_sensor_readings(until=cutoff.isoformat())
 
     def get_sensor_summaries_for_unit(
         self,
@@ -1668,6 +1920,7 @@ class DeviceOperations:
         end_date: str | None = None,
         sensor_type: str | None = None,
         limit: int = 1000,
+        granularity: str | None = "daily",
     ) -> list[dict[str, Any]]:
         """
         Get aggregated sensor summaries for a unit (used in harvest reports).
@@ -1678,6 +1931,7 @@ class DeviceOperations:
             end_date: Optional end date filter
             sensor_type: Optional filter by sensor type
             limit: Max records to return
+            granularity: Summary granularity ('hourly', 'daily', 'weekly'); None for all
 
         Returns:
             List of summary records
@@ -1704,6 +1958,9 @@ class DeviceOperations:
             if sensor_type:
                 query += " AND sensor_type = ?"
                 params.append(sensor_type)
+            if granularity:
+                query += " AND granularity = ?"
+                params.append(granularity)
 
             query += " ORDER BY period_start DESC LIMIT ?"
             params.append(limit)
@@ -1724,7 +1981,7 @@ class DeviceOperations:
         """
         Get aggregated statistics for a harvest report.
 
-        Combines all summaries in the period to provide overall stats by sensor type.
+        Combines all daily summaries in the period to provide overall stats by sensor type.
 
         Args:
             unit_id: Growth unit ID
@@ -1747,6 +2004,7 @@ class DeviceOperations:
                     COUNT(*) as summary_count
                 FROM SensorReadingSummary
                 WHERE unit_id = ?
+                  AND granularity = 'daily'
                   AND period_start >= ?
                   AND period_end <= ?
                 GROUP BY sensor_type
@@ -1769,6 +2027,12 @@ class DeviceOperations:
             logging.error("Error getting harvest summary stats: %s", exc)
             return {}
 
-    # Placeholder for static type checkers.
+    # Placeholders for static type checkers.
     def get_db(self):  # pragma: no cover
         raise NotImplementedError
+
+    def read_connection(self):  # pragma: no cover
+        raise NotImplementedError
+
+    def write_connection(self):  # pragma: no cover
+        raise NotImplementedError
@@ -9,10 +9,15 @@ Enforces Raspberry Pi-friendly pagination:
 - Minimum limit: 1
 - Minimum offset: 0
 
+KeysetCursor supports deep, resumable paging over time-ordered tables where
+OFFSET would rescan every skipped row.
+
 Author: SYSGrow Team
 Date: December 2025
 """
 
+import base64
+import binascii
 from dataclasses import dataclass
 from typing import Any
 
@@ -79,6 +84,48 @@ class PaginationParams:
         return f"LIMIT {self.limit} OFFSET {self.offset}"
 
 
+@dataclass(frozen=True)
+class KeysetCursor:
+    """
+    Opaque resume position for streams ordered by (timestamp, row id).
+
+    The next page starts strictly after this position, so pages stay cheap
+    however deep the client has read and resuming never repeats a row.
+    """
+
+    ts_epoch: float
+    row_id: int
+
+    def encode(self) -> str:
+        """Encode as a URL-safe token."""
+        raw = f"{self.ts_epoch!r}:{self.row_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "KeysetCursor":
+        """
+        Decode a token produced by :meth:`encode`.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            ts_part, _, id_part = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").partition(":")
+            return cls(ts_epoch=float(ts_part), row_id=int(id_part))
+        except (binascii.Error, UnicodeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
+    def to_sql_clause(self, ts_column: str, id_column: str) -> tuple[str, tuple[float, float, int]]:
+        """
+        Generate the "after this position" predicate and its parameters.
+
+        The leading ``ts_column >= ?`` term lets SQLite seek on a timestamp index.
+        """
+        clause = f"{ts_column} >= ? AND ({ts_column} > ? OR {id_column} > ?)"
+        return clause, (self.ts_epoch, self.ts_epoch, self.row_id)
+
+
 @dataclass
 class PaginatedResponse:
     """Standard paginated response structure."""
@@ -2218,6 +2218,30 @@ class AITrainingDataRepository:
             logger.error(f"Failed to save drift metric: {e}", exc_info=True)
             return None
 
+    def enqueue_drift_metric(
+        self,
+        model_name: str,
+        prediction: Any,
+        actual: Any = None,
+        confidence: float = None,
+        error: float = None,
+    ) -> None:
+        """
+        Queue a drift tracking metric for group commit.
+
+        Same arguments as ``save_drift_metric``; no metric ID is returned.
+        """
+        try:
+            self._backend.defer_write(
+                """
+                INSERT INTO DriftMetrics (model_name, prediction, actual, confidence, error)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (model_name, str(prediction), str(actual) if actual else None, confidence, error),
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue drift metric: {e}", exc_info=True)
+
     def get_drift_metrics(self, model_name: str, limit: int = 1000) -> list[dict[str, Any]]:
         """
         Get recent drift metrics for a model.
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import datetime
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from infrastructure.database.ops.analytics import AnalyticsOperations
+from infrastructure.database.pagination import KeysetCursor
 
 
 class AnalyticsRepository:
@@ -28,12 +30,32 @@ class AnalyticsRepository:
             timestamp=timestamp,
         )
 
+    def enqueue_sensor_reading(
+        self,
+        *,
+        sensor_id: int,
+        reading_data: dict[str, Any],
+        quality_score: float = 1.0,
+        timestamp: str | None = None,
+    ) -> None:
+        """Queue a sensor reading for group commit (no reading_id is returned)."""
+        self._backend.enqueue_sensor_reading(
+            sensor_id=sensor_id,
+            reading_data=reading_data,
+            quality_score=quality_score,
+            timestamp=timestamp,
+        )
+
     def list_sensor_readings(self, *, limit: int = 20, offset: int = 0) -> list[dict[str, object]]:
         return self._backend.get_sensor_data(limit=limit, offset=offset)
 
     def latest_readings_for_unit(self, unit_id: int) -> dict[str, float | None]:
         return self._backend.get_latest_sensor_readings(unit_id)
 
+    def get_latest_sensor_readings(self, unit_id: int) -> dict[str, float | None]:
+        """Latest value per metric for a unit (one indexed SensorLatestValue lookup)."""
+        return self._backend.get_latest_sensor_readings(unit_id)
+
     def get_plant_readings(self, *, limit: int | None = None, offset: int | None = None) -> list[dict[str, object]]:
         return self._backend.get_all_plant_readings(limit=limit, offset=offset)
 
@@ -41,6 +63,12 @@ class AnalyticsRepository:
         """Get most recent PlantReadings for a specific plant."""
         return self._backend.get_latest_plant_readings(plant_id, limit=limit)
 
+    def get_latest_plant_readings_for_plants(
+        self, plant_ids: list[int], limit: int = 1
+    ) -> dict[int, list[dict[str, object]]]:
+        """Get most recent PlantReadings for several plants, keyed by plant_id."""
+        return self._backend.get_latest_plant_readings_for_plants(plant_ids, limit=limit)
+
     def get_plant_readings_in_window(
         self,
         plant_id: int,
@@ -105,6 +133,12 @@ class AnalyticsRepository:
     def get_average_humidity(self, plant_id: int) -> float:
         return self._analytics.get_average_humidity(plant_id)
 
+    def get_plant_environment_stats(self, plant_id: int, metric: str) -> dict[str, Any] | None:
+        return self._analytics.get_plant_environment_stats(plant_id, metric)
+
+    def backfill_plant_environment_accumulators(self, plant_ids: list[int] | None = None) -> int:
+        return self._analytics.backfill_plant_environment_accumulators(plant_ids)
+
     def get_total_light_hours(self, plant_id: int) -> float:
         return self._analytics.get_total_light_hours(plant_id)
 
@@ -150,6 +184,130 @@ class AnalyticsRepository:
             limit=limit,
         )
 
+    def iter_sensor_history(
+        self,
+        start_dt: "datetime",
+        end_dt: "datetime",
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+    ) -> Iterator[dict[str, object]]:
+        """
+        Stream sensor readings between start and end datetime (no row cap).
+
+        Args:
+            start_dt: Start datetime for the range
+            end_dt: End datetime for the range
+            unit_id: Optional unit filter
+            sensor_id: Optional sensor filter
+
+        Returns:
+            Iterator of sensor readings ordered by timestamp
+        """
+        return self._backend.iter_sensor_history(start_dt, end_dt, unit_id=unit_id, sensor_id=sensor_id)
+
+    def fetch_sensor_history_page(
+        self,
+        start_dt: "datetime",
+        end_dt: "datetime",
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        metrics: Sequence[str] | None = None,
+        after: KeysetCursor | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, object]]:
+        """
+        Fetch one keyset page of sensor readings (for streaming exports).
+
+        Args:
+            start_dt: Start datetime for the range
+            end_dt: End datetime for the range
+            unit_id: Optional unit filter
+            sensor_id: Optional sensor filter
+            metrics: Optional metric name filter
+            after: Resume strictly after this cursor
+            limit: Maximum number of readings in the page
+
+        Returns:
+            Sensor readings ordered by timestamp, each with reading_id and ts_epoch
+
+        Raises:
+            sqlite3.Error: If the page query fails
+        """
+        return self._backend.fetch_sensor_history_page(
+            start_dt,
+            end_dt,
+            unit_id=unit_id,
+            sensor_id=sensor_id,
+            metrics=metrics,
+            after=after,
+            limit=limit,
+        )
+
+    def plan_sensor_history_resolution(
+        self,
+        start_dt: "datetime",
+        end_dt: "datetime",
+        max_points: int,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+        raw_retention_days: int | None = None,
+    ) -> int:
+        """
+        Choose raw readings (0) or a rollup tier (bucket seconds) for a chart window.
+
+        Args:
+            start_dt: Start datetime for the range
+            end_dt: End datetime for the range
+            max_points: Point budget the caller will render
+            unit_id: Optional unit filter
+            sensor_id: Optional sensor filter
+            raw_retention_days: Days raw readings are kept (None = never pruned)
+
+        Returns:
+            0 for raw readings, otherwise the rollup tier in seconds
+        """
+        return self._backend.plan_sensor_history_resolution(
+            start_dt,
+            end_dt,
+            max_points,
+            unit_id=unit_id,
+            sensor_id=sensor_id,
+            raw_retention_days=raw_retention_days,
+        )
+
+    def fetch_sensor_rollup_history(
+        self,
+        start_dt: "datetime",
+        end_dt: "datetime",
+        tier_seconds: int,
+        *,
+        unit_id: int | None = None,
+        sensor_id: int | None = None,
+    ) -> list[dict[str, object]]:
+        """
+        Fetch bucket means from a rollup tier, shaped like fetch_sensor_history rows.
+
+        Args:
+            start_dt: Start datetime for the range
+            end_dt: End datetime for the range
+            tier_seconds: Rollup bucket size (60, 900 or 3600)
+            unit_id: Optional unit filter
+            sensor_id: Optional sensor filter
+
+        Returns:
+            List of bucketed readings ordered by bucket start
+        """
+        return self._backend.fetch_sensor_rollup_history(
+            start_dt,
+            end_dt,
+            tier_seconds,
+            unit_id=unit_id,
+            sensor_id=sensor_id,
+        )
+
     def get_plant_info(self, plant_id: int) -> dict[str, object] | None:
         """Get plant information by plant ID."""
         return self._backend.get_plant_info(plant_id)
@@ -334,6 +334,22 @@ class DeviceRepository:
             timestamp=timestamp,
         )
 
+    def enqueue_actuator_state(
+        self,
+        actuator_id: int,
+        state: str,
+        *,
+        value: float | None = None,
+        timestamp: str | None = None,
+    ) -> None:
+        """Queue an actuator state transition for group commit."""
+        self._backend.enqueue_actuator_state(
+            actuator_id=actuator_id,
+            state=state,
+            value=value,
+            timestamp=timestamp,
+        )
+
     # Health Monitoring --------------------------------------------------------
     def save_health_snapshot(
         self,
@@ -445,6 +461,22 @@ class DeviceRepository:
         """Mark an actuator anomaly as resolved."""
         return self._backend.resolve_actuator_anomaly(anomaly_id)
 
+    def get_actuator_failure_inputs(
+        self,
+        actuator_ids: list[int],
+        *,
+        history_limit: int = 30,
+        anomaly_limit: int = 100,
+    ) -> dict[int, dict[str, Any]]:
+        """Latest health snapshots and unresolved anomaly counts for many actuators."""
+        return self._backend.get_actuator_failure_inputs(
+            actuator_ids, history_limit=history_limit, anomaly_limit=anomaly_limit
+        )
+
+    def get_actuator_health_stamp(self) -> tuple[Any, ...]:
+        """Fingerprint of actuator health/anomaly tables for cache invalidation."""
+        return self._backend.get_actuator_health_stamp()
+
     # Actuator Power Readings --------------------------------------------------
     def save_actuator_power_reading(
         self,
@@ -514,6 +546,10 @@ class DeviceRepository:
         """Delete sensor reading entries older than N days. Returns rows deleted."""
         return self._backend.prune_sensor_readings(days)
 
+    def prune_sensor_rollups(self) -> int:
+        """Delete rollup buckets older than each tier's retention. Returns rows deleted."""
+        return self._backend.prune_sensor_rollups()
+
     # Connectivity History ----------------------------------------------------
     def save_connectivity_event(
         self,
@@ -541,6 +577,33 @@ class DeviceRepository:
             timestamp=timestamp,
         )
 
+    def enqueue_connectivity_event(
+        self,
+        *,
+        connection_type: str,
+        status: str,
+        endpoint: str | None = None,
+        broker: str | None = None,
+        port: int | None = None,
+        unit_id: int | None = None,
+        device_id: str | None = None,
+        details: str | None = None,
+        timestamp: str | None = None,
+    ) -> None:
+        """Queue a connectivity event for group commit."""
+        if endpoint is None and broker:
+            endpoint = f"{broker}:{port}" if port else broker
+        self._backend.enqueue_connectivity_event(
+            connection_type,
+            status,
+            endpoint=endpoint,
+            port=port,
+            unit_id=unit_id,
+            device_id=device_id,
+            details=details,
+            timestamp=timestamp,
+        )
+
     def get_connectivity_history(
         self,
         *,
@@ -596,11 +659,28 @@ class DeviceRepository:
         """
         return self._backend.aggregate_sensor_readings_for_period(period_start, period_end, granularity)
 
+    def aggregate_pending_sensor_readings(
+        self,
+        until: str | None = None,
+        granularities: tuple[str, ...] = ("hourly", "daily", "weekly"),
+    ) -> int:
+        """
+        Incrementally summarize samples newer than each sensor's watermark.
+
+        Args:
+            until: Exclusive ISO upper bound (defaults to now)
+            granularities: Subset of 'hourly', 'daily', 'weekly'
+
+        Returns:
+            Number of summary records written
+        """
+        return self._backend.aggregate_pending_sensor_readings(until=until, granularities=granularities)
+
     def aggregate_readings_by_days_old(self, days_threshold: int) -> int:
         """
         Aggregate all readings older than N days that haven't been summarized yet.
 
-        This creates daily summaries for data that will soon be pruned.
+        This creates hourly/daily/weekly summaries for data that will soon be pruned.
 
         Args:
             days_threshold: Days threshold (e.g., 25 to aggregate before 30-day prune)
@@ -617,6 +697,7 @@ class DeviceRepository:
         end_date: str | None = None,
         sensor_type: str | None = None,
         limit: int = 1000,
+        granularity: str | None = "daily",
     ) -> list[dict[str, Any]]:
         """
         Get aggregated sensor summaries for a unit (used in harvest reports).
@@ -627,11 +708,14 @@ class DeviceRepository:
             end_date: Optional end date filter
             sensor_type: Optional filter by sensor type
             limit: Max records to return
+            granularity: Summary granularity ('hourly', 'daily', 'weekly'); None for all
 
         Returns:
             List of summary records
         """
-        return self._backend.get_sensor_summaries_for_unit(unit_id, start_date, end_date, sensor_type, limit)
+        return self._backend.get_sensor_summaries_for_unit(
+            unit_id, start_date, end_date, sensor_type, limit, granularity
+        )
 
     def get_sensor_summary_stats_for_harvest(
         self,
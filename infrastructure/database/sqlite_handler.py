@@ -9,9 +9,19 @@ from typing import Iterator
 
 from flask import Flask
 
+from infrastructure.database.connection_lanes import (
+    DEFAULT_READ_POOL_SIZE,
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    ReadPool,
+    WriterLane,
+)
 from infrastructure.database.ops.activity_log import ActivityOperations
 from infrastructure.database.ops.alerts import AlertOperations
-from infrastructure.database.ops.analytics import AnalyticsOperations
+from infrastructure.database.ops.analytics import (
+    PLANT_ENVIRONMENT_SEED_TRIGGERS,
+    SENSOR_ROLLUP_TRIGGER_SQL,
+    AnalyticsOperations,
+)
 from infrastructure.database.ops.camera import CameraOperations
 from infrastructure.database.ops.devices import DeviceOperations
 from infrastructure.database.ops.growth import GrowthOperations
@@ -20,6 +30,12 @@ from infrastructure.database.ops.maintenance import MaintenanceOperations
 from infrastructure.database.ops.notifications import NotificationOperations
 from infrastructure.database.ops.schedules import ScheduleOperations
 from infrastructure.database.ops.settings import SettingsOperations
+from infrastructure.database.write_behind import (
+    DEFAULT_MAX_BATCH,
+    DEFAULT_MAX_DELAY_SECONDS,
+    DEFAULT_MAX_PENDING,
+    WriteBehindBuffer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,11 +60,31 @@ class SQLiteDatabaseHandler(
         database_path: str,
         cache_size_kb: int = 8_000,
         mmap_size_bytes: int = 33_554_432,
+        write_batch_size: int = DEFAULT_MAX_BATCH,
+        write_flush_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        write_queue_size: int = DEFAULT_MAX_PENDING,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        busy_timeout_ms: int = 5_000,
     ) -> None:
         self._database_path = database_path
         self._cache_size_kb = cache_size_kb
         self._mmap_size_bytes = mmap_size_bytes
+        self._busy_timeout_ms = busy_timeout_ms
         self._local = threading.local()
+        self._writer_lane = WriterLane()
+        # A private ":memory:" database is not visible to another connection,
+        # so deferred writes run inline and reads use the thread connection.
+        self._write_behind: WriteBehindBuffer | None = None
+        self._read_pool: ReadPool | None = None
+        if database_path != ":memory:":
+            self._write_behind = WriteBehindBuffer(
+                self._open_connection,
+                max_batch=write_batch_size,
+                max_delay=write_flush_seconds,
+                max_pending=write_queue_size,
+                write_lock=self._writer_lane.hold,
+            )
+            self._read_pool = ReadPool(self._open_read_connection, read_pool_size)
 
         # Ensure the directory for the database file exists
         db_path = Path(database_path)
@@ -129,7 +165,9 @@ class SQLiteDatabaseHandler(
         return connection
 
     def _open_connection(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self._database_path, check_same_thread=False)
+        connection = sqlite3.connect(
+            self._database_path, check_same_thread=False, cached_statements=DEFAULT_STATEMENT_CACHE_SIZE
+        )
         try:
             connection.row_factory = sqlite3.Row
             self._configure_connection(connection)
@@ -138,6 +176,15 @@ class SQLiteDatabaseHandler(
             connection.close()
             raise
 
+    def _open_read_connection(self) -> sqlite3.Connection:
+        connection = self._open_connection()
+        try:
+            connection.execute("PRAGMA query_only=ON")
+            return connection
+        except Exception:
+            connection.close()
+            raise
+
     def _is_corruption_error(self, exc: sqlite3.Error) -> bool:
         message = str(exc).lower()
         return (
@@ -180,6 +227,8 @@ class SQLiteDatabaseHandler(
         - Configurable cache: Reduces disk I/O (default 8 MB, Pi-friendly)
         - Memory temp store: Avoids temp file creation
         - Configurable mmap: Memory-mapped I/O (default 32 MB, Pi-friendly)
+        - busy_timeout: Wait for a competing writer instead of failing with
+          "database is locked"
 
         Values are controlled via SYSGROW_DB_CACHE_SIZE_KB and
         SYSGROW_DB_MMAP_SIZE_BYTES environment variables, or by passing
@@ -190,6 +239,7 @@ class SQLiteDatabaseHandler(
         connection.execute(f"PRAGMA cache_size=-{self._cache_size_kb}")  # negative = KB
         connection.execute("PRAGMA temp_store=MEMORY")
         connection.execute(f"PRAGMA mmap_size={self._mmap_size_bytes}")
+        connection.execute(f"PRAGMA busy_timeout={int(self._busy_timeout_ms)}")
         connection.commit()
 
     def close_db(self, _e: BaseException | None = None) -> None:
@@ -204,7 +254,74 @@ class SQLiteDatabaseHandler(
         try:
             yield conn
         finally:
-            conn.commit()
+            # Pure reads never open a transaction, so there is nothing to commit.
+            if conn.in_transaction:
+                conn.commit()
+
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a pooled ``query_only`` connection for read-only queries.
+
+        Only committed data is visible, so do not use it to read back rows the
+        current thread has written but not yet committed.
+        """
+        if self._read_pool is None:
+            yield self.get_db()
+            return
+        with self._read_pool.acquire() as conn:
+            yield conn
+
+    @contextmanager
+    def write_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run writes on the serialized writer lane.
+
+        Commits if a write happened and rolls back if the block raises.
+        """
+        with self._writer_lane.hold():
+            conn = self.get_db()
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            if conn.in_transaction:
+                conn.commit()
+
+    def close_read_pool(self) -> None:
+        """Close idle pooled read connections (used on shutdown)."""
+        if self._read_pool is not None:
+            self._read_pool.close_all()
+
+    def get_connection_lane_stats(self) -> dict:
+        """Wait time and contention counters for the read pool and writer lane."""
+        return {
+            "read": self._read_pool.get_stats() if self._read_pool is not None else {"pooled": False},
+            "write": self._writer_lane.get_stats(),
+        }
+
+    # --- Write-behind lane ------------------------------------------------------
+    def defer_write(self, sql: str, params: tuple) -> None:
+        """Queue an append-only write for group commit, or run it inline if the lane is full/stopped."""
+        if self._write_behind is not None and self._write_behind.submit(sql, params):
+            return
+        with self.connection() as db:
+            db.execute(sql, params)
+
+    def flush_writes(self, timeout: float = 5.0) -> bool:
+        """Wait until every deferred write queued so far is committed."""
+        return self._write_behind.flush(timeout) if self._write_behind is not None else True
+
+    def stop_write_behind(self, timeout: float = 10.0) -> None:
+        """Drain and stop the write-behind lane; later deferred writes run inline."""
+        if self._write_behind is not None:
+            self._write_behind.stop(timeout)
+
+    def get_write_behind_stats(self) -> dict:
+        """Queue depth, batch and rejection counters for the write-behind lane."""
+        return self._write_behind.get_stats() if self._write_behind is not None else {"running": False}
 
     # --- Schema ----------------------------------------------------------------
     def create_tables(self) -> None:
@@ -526,6 +643,156 @@ class SQLiteDatabaseHandler(
                     """
                 )
 
+                # Sensor Metric Samples (typed, one row per numeric metric of a reading).
+                # Kept in sync with SensorReading by triggers so every writer, including
+                # raw SQL seeders, populates it without decoding JSON at query time.
+                db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS SensorMetricSample (
+                        reading_id INTEGER NOT NULL,
+                        sensor_id INTEGER NOT NULL,
+                        ts_epoch REAL NOT NULL,
+                        metric VARCHAR(50) NOT NULL,
+                        value REAL NOT NULL,
+                        PRIMARY KEY (reading_id, metric)
+                    )
+                    """
+                )
+                db.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS trg_sensor_reading_samples_insert
+                    AFTER INSERT ON SensorReading
+                    BEGIN
+                        INSERT OR IGNORE INTO SensorMetricSample (reading_id, sensor_id, ts_epoch, metric, value)
+                        SELECT NEW.reading_id,
+                               NEW.sensor_id,
+                               ROUND((COALESCE(julianday(NEW.timestamp), julianday('now')) - 2440587.5) * 86400.0, 3),
+                               je.key,
+                               je.value
+                        FROM json_each(
+                            CASE WHEN json_valid(NEW.reading_data) AND json_type(NEW.reading_data) = 'object'
+                                 THEN NEW.reading_data ELSE '{}' END
+                        ) je
+                        WHERE je.type IN ('integer', 'real');
+                    END
+                    """
+                )
+                db.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS trg_sensor_reading_samples_delete
+                    AFTER DELETE ON SensorReading
+                    BEGIN
+                        DELETE FROM SensorMetricSample WHERE reading_id = OLD.reading_id;
+                    END
+                    """
+                )
+
+                # Sensor Metric Rollups (1-minute / 15-minute / 1-hour tiers for chart queries).
+                # Maintained per sample by trigger; pruned per tier by the nightly prune task.
+                db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS SensorMetricRollup (
+                        tier_seconds INTEGER NOT NULL,
+                        sensor_id INTEGER NOT NULL,
+                        metric VARCHAR(50) NOT NULL,
+                        bucket_start INTEGER NOT NULL,
+                        count_readings INTEGER NOT NULL DEFAULT 0,
+                        min_value REAL,
+                        max_value REAL,
+                        sum_value REAL,
+                        sum_squares REAL,
+                        PRIMARY KEY (tier_seconds, sensor_id, metric, bucket_start)
+                    )
+                    """
+                )
+                db.execute(SENSOR_ROLLUP_TRIGGER_SQL)
+
+                # Latest value per (sensor, metric) so "current readings" is one indexed lookup.
+                # Out-of-order inserts never overwrite a newer value; deleting the current
+                # latest sample falls back to the newest remaining one.
+                db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS SensorLatestValue (
+                        sensor_id INTEGER NOT NULL,
+                        metric VARCHAR(50) NOT NULL,
+                        value REAL NOT NULL,
+                        ts_epoch REAL NOT NULL,
+                        reading_id INTEGER NOT NULL,
+                        PRIMARY KEY (sensor_id, metric)
+                    )
+                    """
+                )
+                db.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS trg_metric_sample_latest_value
+                    AFTER INSERT ON SensorMetricSample
+                    BEGIN
+                        INSERT INTO SensorLatestValue (sensor_id, metric, value, ts_epoch, reading_id)
+                        VALUES (NEW.sensor_id, NEW.metric, NEW.value, NEW.ts_epoch, NEW.reading_id)
+                        ON CONFLICT (sensor_id, metric) DO UPDATE SET
+                            value = excluded.value,
+                            ts_epoch = excluded.ts_epoch,
+                            reading_id = excluded.reading_id
+                        WHERE excluded.ts_epoch > SensorLatestValue.ts_epoch
+                           OR (excluded.ts_epoch = SensorLatestValue.ts_epoch
+                               AND excluded.reading_id > SensorLatestValue.reading_id);
+                    END
+                    """
+                )
+                db.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS trg_metric_sample_latest_value_delete
+                    AFTER DELETE ON SensorMetricSample
+                    WHEN EXISTS (
+                        SELECT 1 FROM SensorLatestValue
+                        WHERE sensor_id = OLD.sensor_id AND metric = OLD.metric AND reading_id = OLD.reading_id
+                    )
+                    BEGIN
+                        DELETE FROM SensorLatestValue WHERE sensor_id = OLD.sensor_id AND metric = OLD.metric;
+                        INSERT INTO SensorLatestValue (sensor_id, metric, value, ts_epoch, reading_id)
+                        SELECT sensor_id, metric, value, ts_epoch, reading_id
+                        FROM SensorMetricSample
+                        WHERE sensor_id = OLD.sensor_id AND metric = OLD.metric
+                        ORDER BY ts_epoch DESC, reading_id DESC
+                        LIMIT 1;
+                    END
+                    """
+                )
+
+                # Sensor Reading Summaries (hourly/daily/weekly aggregates kept after pruning)
+                db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS SensorReadingSummary (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        sensor_id INTEGER NOT NULL,
+                        unit_id INTEGER,
+                        sensor_type TEXT NOT NULL,
+                        period_start DATETIME NOT NULL,
+                        period_end DATETIME NOT NULL,
+                        granularity TEXT NOT NULL DEFAULT 'daily',
+                        min_value REAL,
+                        max_value REAL,
+                        avg_value REAL,
+                        sum_value REAL,
+                        count_readings INTEGER NOT NULL DEFAULT 0,
+                        stddev_value REAL,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(sensor_id, period_start, granularity)
+                    )
+                    """
+                )
+
+                # Per-sensor high-water mark: samples with ts_epoch < summarized_until are summarized
+                db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS SensorSummaryWatermark (
+                        sensor_id INTEGER PRIMARY KEY,
+                        summarized_until REAL NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                    """
+                )
+
                 # Plants Table
                 db.execute(
                     """
@@ -706,6 +973,55 @@ class SQLiteDatabaseHandler(
                     """
                 )
 
+                # Plant Environment Accumulators (lifetime count/sum/sum²/min/max per plant and
+                # metric for harvest reports). Seeded per plant from SensorMetricSample, then kept
+                # current by trigger so reports never rescan a whole grow's readings.
+                db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS PlantEnvironmentAccumulator (
+                        plant_id INTEGER NOT NULL,
+                        metric VARCHAR(50) NOT NULL,
+                        since_epoch REAL NOT NULL DEFAULT 0,
+                        scope TEXT NOT NULL,
+                        unit_id INTEGER,
+                        linked_sensors INTEGER NOT NULL DEFAULT 0,
+                        count_readings INTEGER NOT NULL DEFAULT 0,
+                        min_value REAL,
+                        max_value REAL,
+                        sum_value REAL NOT NULL DEFAULT 0,
+                        sum_squares REAL NOT NULL DEFAULT 0,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (plant_id, metric),
+                        FOREIGN KEY (plant_id) REFERENCES Plants(plant_id) ON DELETE CASCADE
+                    )
+                    """
+                )
+                db.execute(
+                    """
+                    CREATE TRIGGER IF NOT EXISTS trg_metric_sample_plant_environment
+                    AFTER INSERT ON SensorMetricSample
+                    WHEN NEW.metric IN ('temperature', 'humidity')
+                    BEGIN
+                        UPDATE PlantEnvironmentAccumulator
+                        SET count_readings = count_readings + 1,
+                            min_value = MIN(COALESCE(min_value, NEW.value), NEW.value),
+                            max_value = MAX(COALESCE(max_value, NEW.value), NEW.value),
+                            sum_value = sum_value + NEW.value,
+                            sum_squares = sum_squares + NEW.value * NEW.value,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE metric = NEW.metric
+                          AND NEW.ts_epoch >= since_epoch
+                          AND CASE
+                                WHEN linked_sensors THEN EXISTS (
+                                    SELECT 1 FROM PlantSensors ps
+                                    WHERE ps.plant_id = PlantEnvironmentAccumulator.plant_id AND ps.sensor_id = NEW.sensor_id
+                                )
+                                ELSE unit_id = (SELECT s.unit_id FROM Sensor s WHERE s.sensor_id = NEW.sensor_id)
+                              END;
+                    END
+                    """
+                )
+
                 db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS PlantActuators (
@@ -753,6 +1069,8 @@ class SQLiteDatabaseHandler(
                     )
                     """
                 )
+                for trigger_sql in PLANT_ENVIRONMENT_SEED_TRIGGERS:
+                    db.execute(trigger_sql)
                 # ZigBee Energy Monitor Tables
                 db.execute(
                     """
@@ -1496,6 +1814,23 @@ class SQLiteDatabaseHandler(
                 )
                 db.execute("CREATE INDEX IF NOT EXISTS idx_sensor_reading_sensor_id ON SensorReading(sensor_id)")
                 db.execute("CREATE INDEX IF NOT EXISTS idx_sensor_reading_timestamp ON SensorReading(timestamp)")
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_metric_sample_sensor_ts ON SensorMetricSample(sensor_id, ts_epoch)"
+                )
+                db.execute("CREATE INDEX IF NOT EXISTS idx_metric_sample_ts ON SensorMetricSample(ts_epoch)")
+                db.execute("CREATE INDEX IF NOT EXISTS idx_plant_sensors_sensor_id ON PlantSensors(sensor_id)")
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_metric_rollup_tier_bucket ON SensorMetricRollup(tier_seconds, bucket_start)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_summary_sensor_period ON SensorReadingSummary(sensor_id, period_start DESC)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_summary_unit_period ON SensorReadingSummary(unit_id, period_start DESC)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_summary_type_period ON SensorReadingSummary(sensor_type, period_start DESC)"
+                )
                 db.execute("CREATE INDEX IF NOT EXISTS idx_plant_readings_time ON PlantReadings(timestamp DESC)")
                 db.execute("CREATE INDEX IF NOT EXISTS idx_plant_readings_plant ON PlantReadings(plant_id)")
 
@@ -1510,6 +1845,18 @@ class SQLiteDatabaseHandler(
                 db.execute(
                     "CREATE INDEX IF NOT EXISTS idx_actuator_anomaly_actuator_id ON ActuatorAnomaly(actuator_id)"
                 )
+                # Windowed "latest N per actuator" reads for batch failure predictions
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_actuator_health_actuator_time "
+                    "ON ActuatorHealthHistory(actuator_id, recorded_at DESC)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_actuator_anomaly_actuator_time "
+                    "ON ActuatorAnomaly(actuator_id, detected_at DESC)"
+                )
+                db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_actuator_anomaly_resolved_at ON ActuatorAnomaly(resolved_at)"
+                )
                 db.execute(
                     "CREATE INDEX IF NOT EXISTS idx_actuator_calibration_actuator_id ON ActuatorCalibration(actuator_id)"
                 )
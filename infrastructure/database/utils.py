@@ -8,9 +8,33 @@ Author: SYSGrow Team
 Date: January 2026
 """
 
+from datetime import UTC, datetime
 from typing import Any
 
 
+def to_epoch_seconds(value: datetime | str) -> float:
+    """
+    Convert a datetime or ISO-8601 string to UTC epoch seconds.
+
+    Naive values are treated as UTC, matching SQLite's ``julianday()``
+    interpretation of stored timestamps without an offset.
+
+    Args:
+        value: datetime instance or ISO-8601 string ("2026-01-11 00:00:00",
+            "2026-01-11T00:00:00+00:00", ...)
+
+    Returns:
+        Seconds since the Unix epoch as a float
+
+    Raises:
+        ValueError: If a string value cannot be parsed
+    """
+    dt = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
+
+
 def row_to_dict(row) -> dict[str, Any]:
     """
     Convert database row to dictionary.
@@ -0,0 +1,268 @@
+"""
+Write-Behind Buffer
+===================
+
+Group-commit queue for high-frequency, append-only SQLite writes.
+
+Ingest paths (sensor readings, actuator state history, connectivity events,
+drift metrics) used to commit one row at a time from EventBus worker threads.
+On SD-card storage every commit is an fsync-bound WAL append, so the buffer
+hands those rows to a single writer thread instead. The writer collects rows
+until ``max_batch`` rows are pending or ``max_delay`` seconds have passed
+since the oldest one, then writes each statement with ``executemany`` inside
+one transaction.
+
+The queue is bounded: a full queue blocks the producer for up to
+``put_timeout`` seconds and then refuses the row, so the caller can write it
+inline rather than lose it. ``stop()`` drains the queue and checkpoints the
+WAL so buffered rows are durable before the process exits.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 250
+DEFAULT_MAX_DELAY_SECONDS = 0.5
+DEFAULT_MAX_PENDING = 10_000
+
+_STOP = object()
+
+
+class WriteBehindBuffer:
+    """Bounded queue drained by one writer thread in ``executemany`` batches."""
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        put_timeout: float = 1.0,
+        write_lock: Callable[[], AbstractContextManager[Any]] | None = None,
+        name: str = "SQLiteWriteBehind",
+    ) -> None:
+        self._connect = connect
+        self._write_lock = write_lock or nullcontext
+        self._max_batch = max(1, int(max_batch))
+        self._max_delay = max(0.0, float(max_delay))
+        self._put_timeout = put_timeout
+        self._name = name
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        self._stats: dict[str, Any] = {
+            "enqueued": 0,
+            "written": 0,
+            "failed": 0,
+            "rejected": 0,
+            "blocked_puts": 0,
+            "batches": 0,
+            "high_water": 0,
+            "last_batch_size": 0,
+            "last_commit_ms": 0.0,
+            "max_commit_ms": 0.0,
+        }
+
+    # --- Producer side ----------------------------------------------------------
+    def submit(self, sql: str, params: tuple[Any, ...]) -> bool:
+        """
+        Queue one parameterised statement for the writer thread.
+
+        Returns:
+            True if queued, False if the buffer is stopped or stayed full for
+            ``put_timeout`` seconds (the caller should write inline).
+        """
+        if self._stopped or not self._ensure_started():
+            return False
+        item = (sql, params)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._stats["blocked_puts"] += 1
+            try:
+                self._queue.put(item, timeout=self._put_timeout)
+            except queue.Full:
+                with self._lock:
+                    self._stats["rejected"] += 1
+                logger.warning("Write-behind queue full (%d pending); writing inline", self._queue.qsize())
+                return False
+        with self._lock:
+            self._stats["enqueued"] += 1
+            depth = self._queue.qsize()
+            if depth > self._stats["high_water"]:
+                self._stats["high_water"] = depth
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every row queued before this call is committed."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Drain pending rows, checkpoint the WAL and stop the writer thread."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            thread = self._thread
+        if thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        if not thread.is_alive():
+            logger.warning("Write-behind writer already exited; %d rows not written", self._queue.qsize())
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning(
+                "Write-behind queue still full after %.1fs; abandoning %d rows", timeout, self._queue.qsize()
+            )
+            return
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            logger.warning("Write-behind writer did not stop within %.1fs", timeout)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return counters plus current queue depth (for backpressure monitoring)."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["pending"] = self._queue.qsize()
+        stats["capacity"] = self._queue.maxsize
+        stats["running"] = bool(self._thread and self._thread.is_alive())
+        return stats
+
+    def _ensure_started(self) -> bool:
+        if self._thread is not None:
+            return True
+        with self._lock:
+            if self._stopped:
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+        return True
+
+    # --- Writer side ------------------------------------------------------------
+    def _run(self) -> None:
+        try:
+            conn = self._connect()
+        except sqlite3.Error as exc:
+            logger.error("Write-behind writer could not open a connection: %s", exc)
+            with self._lock:
+                self._stopped = True
+            return
+        try:
+            running = True
+            while running:
+                item = self._queue.get()
+                batch: list[tuple[str, tuple[Any, ...]]] = []
+                waiters: list[threading.Event] = []
+                deadline = time.monotonic() + self._max_delay
+                while True:
+                    if item is _STOP:
+                        running = False
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+                    if not running or waiters or len(batch) >= self._max_batch:
+                        break
+                    remaining = deadline - time.monotonic()
+                    try:
+                        item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._write_batch(conn, batch)
+                if not running:
+                    self._drain(conn, waiters)
+                    self._checkpoint(conn)
+                for waiter in waiters:
+                    waiter.set()
+        finally:
+            conn.close()
+
+    def _drain(self, conn: sqlite3.Connection, waiters: list[threading.Event]) -> None:
+        """Write whatever producers queued before ``stop()`` was observed."""
+        batch: list[tuple[str, tuple[Any, ...]]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not _STOP:
+                batch.append(item)
+            if len(batch) >= self._max_batch:
+                self._write_batch(conn, batch)
+                batch = []
+        if batch:
+            self._write_batch(conn, batch)
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list[tuple[str, tuple[Any, ...]]]) -> None:
+        # Group by statement, preserving first-seen order so dependent rows
+        # (e.g. triggers keyed on insert order) keep their relative order.
+        grouped: dict[str, list[tuple[Any, ...]]] = {}
+        for sql, params in batch:
+            grouped.setdefault(sql, []).append(params)
+        started = time.perf_counter()
+        try:
+            with self._write_lock(), conn:
+                for sql, rows in grouped.items():
+                    conn.executemany(sql, rows)
+            written, failed = len(batch), 0
+        except sqlite3.Error as exc:
+            logger.error("Write-behind batch of %d rows failed, retrying per row: %s", len(batch), exc)
+            with self._write_lock():
+                written, failed = self._write_rows(conn, batch)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            self._stats["written"] += written
+            self._stats["failed"] += failed
+            self._stats["batches"] += 1
+            self._stats["last_batch_size"] = len(batch)
+            self._stats["last_commit_ms"] = round(elapsed_ms, 3)
+            if elapsed_ms > self._stats["max_commit_ms"]:
+                self._stats["max_commit_ms"] = round(elapsed_ms, 3)
+
+    @staticmethod
+    def _write_rows(conn: sqlite3.Connection, batch: list[tuple[str, tuple[Any, ...]]]) -> tuple[int, int]:
+        """Fallback after a failed batch: isolate bad rows so good ones still land."""
+        written = failed = 0
+        for sql, params in batch:
+            try:
+                with conn:
+                    conn.execute(sql, params)
+                written += 1
+            except sqlite3.Error as exc:
+                failed += 1
+                logger.error("Dropping write-behind row that failed to insert: %s", exc)
+        return written, failed
+
+    @staticmethod
+    def _checkpoint(conn: sqlite3.Connection) -> None:
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as exc:
+            logger.warning("WAL checkpoint on write-behind shutdown failed: %s", exc)
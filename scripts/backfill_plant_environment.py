@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+scripts/backfill_plant_environment.py
+
+One-off backfill for PlantEnvironmentAccumulator:
+- Seeds per-plant temperature/humidity accumulators from SensorMetricSample.
+- Safe to re-run; each plant's rows are rebuilt from scratch.
+
+Harvest reports seed missing plants lazily, so this only moves that one-time
+scan out of the first report for plants that were already growing.
+
+Usage:
+    python scripts/backfill_plant_environment.py
+    python scripts/backfill_plant_environment.py --db path/to/sysgrow.db --plant-id 12
+"""
+
+import argparse
+import os
+import sys
+
+# Ensure repository root is on sys.path when executed as a script
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+
+def backfill(db_path: str, plant_ids: list[int] | None = None) -> int:
+    dbh = SQLiteDatabaseHandler(db_path)
+    # Ensure schema (including the accumulator table and trigger) exists
+    dbh.init_app(None)
+    try:
+        return dbh.backfill_plant_environment_accumulators(plant_ids)
+    finally:
+        dbh.stop_write_behind()
+        dbh.close_read_pool()
+        dbh.close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed per-plant environment accumulators for harvest reports.")
+    parser.add_argument(
+        "--db", dest="db", default="database/sysgrow.db", help="Path to SQLite DB file (default: database/sysgrow.db)"
+    )
+    parser.add_argument("--plant-id", dest="plant_ids", type=int, action="append", help="Plant ID (repeatable)")
+    args = parser.parse_args()
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        raise SystemExit(1)
+    n = backfill(args.db, args.plant_ids)
+    print(f"Seeded environment accumulators for {n} plant(s).")
@@ -16,6 +16,8 @@
  * -------------------------------------------
  * - device_sensor_reading  : Full sensor reading (all metrics) -> /devices
  * - dashboard_snapshot     : Priority-selected metrics per unit -> /dashboard
+ * - dashboard_delta        : Metrics changed since the previous frame -> /dashboard
+ *                            (merged here and re-emitted as dashboard_snapshot)
  * - unregistered_sensor_data : Unregistered ESP32 sensor data  -> /devices
  *
  * Unit Room Membership:
@@ -54,6 +56,9 @@ class SocketManager {
     // Track room membership
     this.currentUnitId = null;
 
+    // Last full dashboard snapshot per unit (base for merging deltas)
+    this.dashboardFrames = new Map();
+
     // Constants
     this.SELECTED_UNIT_KEY = 'selected_unit_id';
 
@@ -61,6 +66,7 @@ class SocketManager {
     this.WS_EVENTS = {
       DEVICE_SENSOR_READING: 'device_sensor_reading',
       DASHBOARD_SNAPSHOT: 'dashboard_snapshot',
+      DASHBOARD_DELTA: 'dashboard_delta',
       UNREGISTERED_SENSOR: 'unregistered_sensor_data',
     };
 
@@ -215,8 +221,35 @@ class SocketManager {
         if (data && data.metrics && window.SensorFields) {
           data.metrics = window.SensorFields.standardize(data.metrics);
         }
+        if (data?.unit_id != null) {
+          this.dashboardFrames.set(data.unit_id, data);
+        }
         this.emit('dashboard_snapshot', data);
       });
+
+      // Delta frames: merge into the last snapshot. On a sequence gap (or no
+      // base snapshot yet) ask the server for a keyframe instead.
+      this.sockets.dashboard.on(this.WS_EVENTS.DASHBOARD_DELTA, (data) => {
+        const base = data?.unit_id != null ? this.dashboardFrames.get(data.unit_id) : null;
+        if (!base || base.seq == null || data.seq !== base.seq + 1) {
+          this.dashboardFrames.delete(data?.unit_id);
+          this.sockets.dashboard.emit('resync', { unit_id: data?.unit_id });
+          return;
+        }
+
+        let changed = data.metrics || {};
+        if (window.SensorFields) {
+          changed = window.SensorFields.standardize(changed);
+        }
+        const metrics = { ...base.metrics, ...changed };
+        (data.removed || []).forEach((name) => {
+          delete metrics[window.SensorFields ? window.SensorFields.getStandard(name) : name];
+        });
+
+        const snapshot = { ...base, seq: data.seq, timestamp: data.timestamp, metrics };
+        this.dashboardFrames.set(data.unit_id, snapshot);
+        this.emit('dashboard_snapshot', snapshot);
+      });
     }
 
 
@@ -55,6 +55,15 @@ logging.getLogger("app").setLevel(logging.WARNING)
 # ========================== Database Fixtures ==============================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def anomaly_state_path(tmp_path_factory):
+    """Keep app-level anomaly window state (saved on container shutdown) out of the repo's var/."""
+    path = tmp_path_factory.mktemp("state") / "anomaly_windows.json"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SYSGROW_ANOMALY_STATE_PATH", str(path))
+        yield path
+
+
 @pytest.fixture()
 def db_handler():
     """In-memory SQLite database with all tables created.
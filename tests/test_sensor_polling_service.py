@@ -1,9 +1,11 @@
+import threading
+import time
 from datetime import UTC, datetime
 from types import SimpleNamespace
 from unittest.mock import Mock
 
 from app.domain.sensors.reading import ReadingStatus, SensorReading
-from app.services.hardware.sensor_polling_service import SensorPollingService
+from app.services.hardware.sensor_polling_service import SensorPollingService, TimerWheel
 
 
 class StubProcessor:
@@ -121,3 +123,85 @@ def test_emit_sensor_reading_emits_unit_scoped_namespaces():
     emitter.emit_device_sensor_reading.assert_called_once()
     emitter.emit_dashboard_snapshot.assert_called_once()
     emitter.emit_sensor_reading.assert_not_called()
+
+
+def _sensor(sensor_id, protocol, **config):
+    return SimpleNamespace(
+        id=sensor_id,
+        unit_id=1,
+        name=f"Sensor {sensor_id}",
+        protocol=SimpleNamespace(value=protocol),
+        config=SimpleNamespace(extra_config=config.pop("extra_config", {}), **config),
+        _calibration=None,
+    )
+
+
+def test_bus_keys_group_sensors_that_share_hardware():
+    key = SensorPollingService._bus_key
+    assert key(_sensor(1, "I2C", i2c_bus=1)) == key(_sensor(2, "I2C", i2c_bus=None))
+    assert key(_sensor(3, "I2C", i2c_bus=3)) != key(_sensor(1, "I2C", i2c_bus=1))
+    assert key(_sensor(4, "ADC", i2c_address="0x48")) == key(_sensor(5, "ADC", i2c_address="0x48"))
+    assert key(_sensor(6, "GPIO", gpio_pin=4)) != key(_sensor(7, "GPIO", gpio_pin=17))
+
+
+def test_slow_bus_does_not_delay_independent_bus():
+    slow_gate = threading.Event()
+    read_times = {}
+
+    def read(sid):
+        if sid == 1:
+            slow_gate.wait(2.0)  # e.g. a DHT retry on its GPIO pin
+        read_times.setdefault(sid, time.monotonic())
+        return SimpleNamespace(data={"temperature": 21.0}, timestamp=datetime.now(UTC))
+
+    sensors = [_sensor(1, "GPIO", gpio_pin=4), _sensor(2, "I2C", i2c_bus=1, extra_config={"poll_interval_s": 1})]
+    manager = StubSensorManager(sensors=sensors, sensor_entities={s.id: s for s in sensors}, read_fn=read)
+    processor = StubProcessor()
+    processor.process = lambda sensor, data: processor.transform(data, sensor)
+    polling = SensorPollingService(
+        sensor_manager=manager, emitter=Mock(), processor=processor, poll_interval_s=5, max_workers=2
+    )
+
+    started = time.monotonic()
+    assert polling.start_polling() is True
+    try:
+        deadline = time.monotonic() + 3.0
+        while 2 not in read_times and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert read_times[2] - started < 1.0
+        assert 1 not in read_times
+    finally:
+        slow_gate.set()
+        polling.stop_polling()
+
+    snapshot = polling.get_health_snapshot()
+    assert snapshot["read_latency_ms"][2]["count"] >= 1
+    assert snapshot["buses"] == {}  # cleared on stop
+
+
+def test_overrun_reads_count_missed_deadlines():
+    polling = SensorPollingService(
+        sensor_manager=StubSensorManager(sensors=[], sensor_entities={}, read_fn=lambda _sid: None),
+        emitter=Mock(),
+        processor=StubProcessor(),
+        poll_interval_s=1,
+    )
+    polling._intervals[9] = 1.0
+    polling._queued.add(9)
+
+    polling._reschedule(9, due=time.monotonic() - 3.5)
+
+    assert polling._missed_deadlines[9] == 3
+    assert 9 not in polling._queued
+    assert polling._next_due[9] > time.monotonic()
+
+
+def test_timer_wheel_fires_entries_beyond_one_rotation():
+    wheel = TimerWheel(tick_s=1.0, slots=4)
+    wheel.schedule(1, 2.0)
+    wheel.schedule(2, 10.0)
+
+    assert wheel.advance(0.0) == []
+    assert wheel.advance(3.0) == [(1, 2.0)]
+    assert wheel.advance(6.0) == []
+    assert wheel.advance(10.5) == [(2, 10.0)]
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+from app.domain.sensors.sensor_entity import SensorType
+from app.hardware.sensors.processors import (
+    CalibrationProcessor,
+    CompositeProcessor,
+    EnrichmentProcessor,
+    PriorityProcessor,
+    TransformationProcessor,
+    ValidationProcessor,
+)
+
+
+def _sensor(sensor_id: int, unit_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=sensor_id,
+        unit_id=unit_id,
+        name=f"Env {sensor_id}",
+        sensor_type=SensorType.ENVIRONMENTAL,
+        model="BME280",
+        protocol="zigbee2mqtt",
+        _calibration=None,
+    )
+
+
+def _pipeline() -> tuple[CompositeProcessor, PriorityProcessor]:
+    priority = PriorityProcessor(stale_seconds=3600)
+    sensors = {1: _sensor(1, 1), 2: _sensor(2, 1), 3: _sensor(3, 2)}
+    processor = CompositeProcessor(
+        validator=ValidationProcessor(sensor_type="generic"),
+        calibrator=CalibrationProcessor(),
+        transformer=TransformationProcessor(),
+        enricher=EnrichmentProcessor(),
+        priority=priority,
+        resolve_sensor=sensors.get,
+    )
+    return processor, priority
+
+
+def test_process_batch_builds_one_snapshot_per_unit():
+    processor, priority = _pipeline()
+    items = [
+        (_sensor(1, 1), {"temperature": 21.0, "humidity": 50.0}),
+        (_sensor(3, 2), {"temperature": 25.0, "humidity": 40.0}),
+        (_sensor(2, 1), {"temperature": 22.0, "humidity": 55.0}),
+        (_sensor(1, 1), {"temperature": 23.0, "humidity": 52.0}),
+    ]
+
+    results = processor.process_batch(items)
+
+    assert [r.sensor.id for r in results] == [1, 3, 2, 1]
+    assert all(r.error is None and r.prepared is not None for r in results)
+    assert all(r.prepared.controller_events for r in results if r.sensor.id != 2)
+    snapshots = [r.prepared.dashboard_payload for r in results]
+    assert snapshots[0] is None and snapshots[2] is None
+    assert snapshots[1].unit_id == 2
+    assert snapshots[3].unit_id == 1
+    assert snapshots[3].metrics["temperature"].value == 23.0
+
+    stats = priority.get_stats()
+    assert stats["ingest_count"] == 4
+    assert stats["snapshots_built"] == 2
+
+
+def test_process_batch_reports_stage_errors_without_aborting():
+    processor, _ = _pipeline()
+
+    results = processor.process_batch(
+        [
+            (_sensor(1, 1), "not-a-dict"),
+            (_sensor(1, 1), {"temperature": 21.0}),
+        ]
+    )
+
+    assert results[0].error is not None and results[0].prepared is None
+    assert results[1].error is None
+    assert results[1].prepared.dashboard_payload is not None
+
+
+def test_process_batch_matches_single_reading_payloads():
+    batch_processor, _ = _pipeline()
+    single_processor, _ = _pipeline()
+    sensor = _sensor(1, 1)
+    raw = {"temperature": 24.0, "humidity": 60.0, "battery": 90}
+
+    batched = batch_processor.process_batch([(sensor, raw)])[0].prepared
+    reading = single_processor.process(sensor, raw)
+    single = single_processor.build_payloads(sensor=sensor, reading=reading)
+
+    def without_timestamps(events):
+        return [(name, {k: v for k, v in payload.items() if k != "timestamp"}) for name, payload in events]
+
+    assert without_timestamps(batched.controller_events) == without_timestamps(single.controller_events)
+    assert batched.device_payload.readings == single.device_payload.readings
+    assert {k: m.value for k, m in batched.dashboard_payload.metrics.items()} == {
+        k: m.value for k, m in single.dashboard_payload.metrics.items()
+    }
@@ -700,3 +700,43 @@ def test_light_sensors_are_not_evicted_too_aggressively():
 
     if snapshot3:
         assert snapshot3.metrics.get("lux") is None
+
+
+def test_incremental_refresh_recomputes_only_touched_metrics():
+    pr = PriorityProcessor(stale_seconds=STALE_NEVER)
+
+    env_sensor = SimpleNamespace(
+        id=1, unit_id=1, name="Env", sensor_type=SensorType.ENVIRONMENTAL, model="BME280", protocol="mqtt"
+    )
+    co2_sensor = SimpleNamespace(
+        id=2, unit_id=1, name="CO2", sensor_type=SensorType.ENVIRONMENTAL, model="SCD30", protocol="mqtt"
+    )
+    sensors = {1: env_sensor, 2: co2_sensor}
+
+    def reading(sensor_id: int, data: dict):
+        return SimpleNamespace(sensor_id=sensor_id, unit_id=1, data=data, quality_score=0.9)
+
+    pr.ingest(
+        sensor=env_sensor, reading=reading(1, {"temperature": 24.0, "humidity": 60.0}), resolve_sensor=sensors.get
+    )
+    assert pr.get_stats()["full_rebuilds"] == 1
+
+    recomputed = pr.get_stats()["metrics_recomputed"]
+    snapshot = pr.ingest(sensor=co2_sensor, reading=reading(2, {"co2": 800.0}), resolve_sensor=sensors.get)
+    stats = pr.get_stats()
+    assert stats["full_rebuilds"] == 1
+    assert stats["metrics_recomputed"] == recomputed + 1
+    assert snapshot.metrics["co2"].value == 800.0
+    assert snapshot.metrics["temperature"].value == 24.0
+    vpd_before = snapshot.metrics["vpd"].value
+
+    # Temperature changes pull the derived metrics along with them
+    snapshot = pr.ingest(sensor=env_sensor, reading=reading(1, {"temperature": 28.0}), resolve_sensor=sensors.get)
+    assert snapshot.metrics["temperature"].value == 28.0
+    assert snapshot.metrics["vpd"].value != vpd_before
+    assert snapshot.metrics["co2"].value == 800.0
+
+    # Invalidation forces the next refresh to rebuild everything
+    pr.clear_cache()
+    pr.ingest(sensor=co2_sensor, reading=reading(2, {"co2": 810.0}), resolve_sensor=sensors.get)
+    assert pr.get_stats()["full_rebuilds"] == 2
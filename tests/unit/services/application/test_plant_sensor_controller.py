@@ -10,7 +10,7 @@ class StubAnalyticsRepo:
         self.readings = []
         self.snapshots = []
 
-    def insert_sensor_reading(self, sensor_id: int, reading_data: dict, timestamp: str) -> None:
+    def enqueue_sensor_reading(self, sensor_id: int, reading_data: dict, timestamp: str) -> None:
         self.readings.append({"sensor_id": sensor_id, "reading_data": reading_data, "timestamp": timestamp})
 
     def save_plant_reading(self, **kwargs):
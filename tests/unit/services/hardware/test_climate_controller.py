@@ -19,7 +19,7 @@ class MockAnalyticsRepo:
     def __init__(self):
         self.readings = []
 
-    def insert_sensor_reading(self, sensor_id: int, reading_data: dict, timestamp: str):
+    def enqueue_sensor_reading(self, sensor_id: int, reading_data: dict, timestamp: str):
         self.readings.append(
             {
                 "sensor_id": sensor_id,
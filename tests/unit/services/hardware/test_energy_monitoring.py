@@ -0,0 +1,75 @@
+"""
+Tests for EnergyMonitoringService ring-buffer storage and windowed stats.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain.energy import EnergyReading
+from app.services.hardware.energy_monitoring import EnergyMonitoringService, EnergySampleBuffer
+
+
+def _reading(actuator_id: int, minutes_ago: float, power: float, energy: float | None = None) -> EnergyReading:
+    return EnergyReading(
+        actuator_id=actuator_id,
+        power=power,
+        energy=energy,
+        timestamp=datetime.now() - timedelta(minutes=minutes_ago),
+    )
+
+
+def test_runtime_and_energy_are_time_weighted():
+    service = EnergyMonitoringService(electricity_rate_kwh=0.5)
+    # 100W for 30 minutes, then off for 30 minutes, 5-minute spacing
+    for minute in range(0, 61, 5):
+        power = 100.0 if minute < 30 else 0.0
+        service.record_reading(_reading(1, 60 - minute, power))
+
+    stats = service.get_consumption_stats(1)
+    assert stats.runtime_hours == pytest.approx(0.5)
+    # 25 minutes at 100W plus the trapezoid over the 25->30 minute ramp-down
+    assert stats.total_energy_kwh == pytest.approx((100 * 25 / 60 + 50 * 5 / 60) / 1000)
+    assert stats.cost_estimate == pytest.approx(stats.total_energy_kwh * 0.5)
+    assert stats.peak_power_watts == 100.0
+
+    recent = service.get_consumption_stats(1, hours=0.25)
+    assert recent.runtime_hours == 0.0
+    assert recent.peak_power_watts == 0.0
+
+
+def test_meter_delta_preferred_over_integration():
+    service = EnergyMonitoringService()
+    service.record_reading(_reading(2, 10, 50.0, energy=12.0))
+    service.record_reading(_reading(2, 0, 50.0, energy=12.25))
+
+    assert service.get_consumption_stats(2).total_energy_kwh == pytest.approx(0.25)
+
+
+def test_ring_buffer_is_bounded_and_window_queries_wrap():
+    buffer = EnergySampleBuffer(capacity=4)
+    for i, watts in enumerate([500.0, 10.0, 20.0, 40.0, 30.0, 60.0]):
+        buffer.append(float(i * 60), watts)
+
+    assert len(buffer) == 4
+    stats = buffer.window_stats()
+    assert stats["sample_count"] == 4
+    assert stats["peak_power_watts"] == 60.0  # evicted 500W no longer counts
+    assert stats["average_power_watts"] == pytest.approx(37.5)
+
+    assert buffer.index_at_or_after(240.0) == 2
+    tail = buffer.window_stats(since=240.0)
+    assert tail["sample_count"] == 2
+    assert tail["energy_kwh"] == pytest.approx(45.0 / 60 / 1000)
+    assert buffer.window_stats(since=1e9) is None
+
+
+def test_reporting_gaps_are_not_integrated():
+    buffer = EnergySampleBuffer()
+    buffer.append(0.0, 100.0)
+    buffer.append(7200.0, 100.0)  # two hours offline
+    buffer.append(7260.0, 100.0)
+
+    stats = buffer.window_stats()
+    assert stats["runtime_hours"] == pytest.approx(60 / 3600)
+    assert stats["energy_kwh"] == pytest.approx(100 * 60 / 3600 / 1000)
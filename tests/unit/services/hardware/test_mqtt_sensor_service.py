@@ -5,11 +5,13 @@ Tests for unified MQTT sensor service (Zigbee + ESP32).
 """
 
 import json
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 
+from app.hardware.sensors.processors import ProcessedReading
 from app.schemas.events import DeviceSensorReadingPayload
 from app.services.hardware.mqtt_sensor_service import MQTTSensorService
 
@@ -242,3 +244,120 @@ class TestUnregisteredESP32:
         msg = _make_msg("sysgrow/unknown_device", {"soil_moisture": 45})
         mqtt_sensor_service._on_message(None, None, msg)
         mock_emitter.emit_unregistered_sensor_data.assert_called_once()
+
+
+class RecordingMetrics:
+    def __init__(self):
+        self.counters: dict[str, int] = {}
+        self.observations: dict[str, list[float]] = {}
+
+    def inc(self, name, value=1, **labels):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value, **labels):
+        self.observations.setdefault(name, []).append(value)
+
+
+class TestIngestStage:
+    """The MQTT thread only enqueues; a worker processes micro-batches."""
+
+    @pytest.fixture
+    def sensor(self, mock_sensor_manager):
+        sensor = SimpleNamespace(id=1, unit_id=1, name="Env", sensor_type="environment_sensor")
+        mock_sensor_manager.get_sensor_entity.return_value = sensor
+        mock_sensor_manager.get_sensor_by_friendly_name.return_value = sensor
+        return sensor
+
+    @pytest.fixture
+    def batch_processor(self):
+        processor = Mock()
+
+        def process_batch(items):
+            results = []
+            for sensor, raw in items:
+                reading = SimpleNamespace(sensor_id=sensor.id, unit_id=sensor.unit_id, data=raw, status=None)
+                prepared = SimpleNamespace(unit_id=1, device_payload={"raw": raw}, dashboard_payload=None)
+                results.append(ProcessedReading(sensor=sensor, raw_data=raw, reading=reading, prepared=prepared))
+            return results
+
+        processor.process_batch = Mock(side_effect=process_batch)
+        return processor
+
+    def _service(self, mock_mqtt_client, mock_emitter, mock_sensor_manager, processor, **kwargs):
+        metrics = RecordingMetrics()
+        service = MQTTSensorService(
+            mqtt_client=mock_mqtt_client,
+            emitter=mock_emitter,
+            sensor_manager=mock_sensor_manager,
+            processor=processor,
+            metrics=metrics,
+            ingest_queue_size=kwargs.pop("ingest_queue_size", 16),
+            ingest_flush_seconds=kwargs.pop("ingest_flush_seconds", 0.01),
+            **kwargs,
+        )
+        return service, metrics
+
+    def test_messages_are_processed_in_one_batch(
+        self, mock_mqtt_client, mock_emitter, mock_sensor_manager, batch_processor, sensor
+    ):
+        service, metrics = self._service(
+            mock_mqtt_client, mock_emitter, mock_sensor_manager, batch_processor, ingest_flush_seconds=0.2
+        )
+
+        service._on_message(None, None, _make_msg("zigbee2mqtt/env", {"temperature": 21.0}))
+        service._on_message(None, None, _make_msg("zigbee2mqtt/env", {"temperature": 22.0}))
+        assert service.flush_ingest()
+
+        batch_processor.process.assert_not_called()
+        batch_processor.process_batch.assert_called_once()
+        assert len(batch_processor.process_batch.call_args[0][0]) == 2
+        assert mock_emitter.emit_device_sensor_reading.call_count == 2
+        assert metrics.observations["mqtt_ingest_batch_size"] == [2]
+        assert len(metrics.observations["mqtt_ingest_e2e_latency_seconds"]) == 2
+        service.shutdown()
+
+    def test_repeated_retained_message_is_skipped(
+        self, mock_mqtt_client, mock_emitter, mock_sensor_manager, batch_processor, sensor
+    ):
+        service, metrics = self._service(mock_mqtt_client, mock_emitter, mock_sensor_manager, batch_processor)
+
+        live = _make_msg("zigbee2mqtt/env", {"temperature": 21.0})
+        live.retain = False
+        retained = _make_msg("zigbee2mqtt/env", {"temperature": 21.0})
+        retained.retain = True
+        service._on_message(None, None, live)
+        service._on_message(None, None, retained)
+        assert service.flush_ingest()
+
+        assert mock_emitter.emit_device_sensor_reading.call_count == 1
+        assert metrics.counters["mqtt_ingest_retained_duplicates_total"] == 1
+        service.shutdown()
+
+    def test_full_ring_buffer_drops_oldest(
+        self, mock_mqtt_client, mock_emitter, mock_sensor_manager, batch_processor, sensor
+    ):
+        started = threading.Event()
+        release = threading.Event()
+        process_batch = batch_processor.process_batch.side_effect
+
+        def blocking(items):
+            started.set()
+            release.wait(2)
+            return process_batch(items)
+
+        batch_processor.process_batch.side_effect = blocking
+        service, metrics = self._service(
+            mock_mqtt_client, mock_emitter, mock_sensor_manager, batch_processor, ingest_queue_size=2
+        )
+
+        service._on_message(None, None, _make_msg("zigbee2mqtt/env", {"seq": 0}))
+        assert started.wait(2)
+        for seq in (1, 2, 3):
+            service._on_message(None, None, _make_msg("zigbee2mqtt/env", {"seq": seq}))
+        release.set()
+        assert service.flush_ingest()
+
+        assert metrics.counters["mqtt_ingest_dropped_total"] == 1
+        second_batch = batch_processor.process_batch.call_args_list[1][0][0]
+        assert [raw["seq"] for _, raw in second_batch] == [2, 3]
+        service.shutdown()
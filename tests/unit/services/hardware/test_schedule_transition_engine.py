@@ -0,0 +1,142 @@
+"""
+Tests for schedule edge prediction and the event-driven ScheduleTransitionEngine.
+"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.domain.schedules import Schedule
+from app.enums import ScheduleType
+from app.services.hardware.schedule_transition_engine import ScheduleTransitionEngine
+from app.services.hardware.scheduling_service import SchedulingService
+from app.workers.scheduled_tasks import actuator_schedule_check_task, actuator_startup_sync_task
+
+
+def _service_with(*schedules: Schedule) -> SchedulingService:
+    service = SchedulingService()
+    for schedule in schedules:
+        service._add_schedule_to_memory(schedule)
+        service._loaded_units.add(schedule.unit_id)
+    return service
+
+
+def _growth(unit_ids):
+    growth = MagicMock()
+    growth.get_unit_runtimes.return_value = dict.fromkeys(unit_ids)
+    growth.get_unit_runtime.return_value = None
+    return growth
+
+
+def test_next_transition_simple_window():
+    service = SchedulingService()
+    day = Schedule(schedule_id=1, unit_id=1, device_type="fan", start_time="08:00", end_time="20:00")
+    always = Schedule(schedule_id=2, unit_id=1, device_type="fan", start_time="00:00", end_time="00:00")
+
+    assert service.next_transition_time(day, datetime(2026, 3, 2, 12, 0)) == datetime(2026, 3, 2, 20, 0)
+    assert service.next_transition_time(day, datetime(2026, 3, 2, 21, 0)) == datetime(2026, 3, 3, 8, 0)
+    assert service.next_transition_time(always, datetime(2026, 3, 2, 23, 0)) is None
+
+
+def test_next_transition_interval_and_days_of_week():
+    service = SchedulingService()
+    cycle = Schedule(
+        schedule_id=1,
+        unit_id=1,
+        device_type="pump",
+        schedule_type=ScheduleType.INTERVAL,
+        start_time="06:00",
+        end_time="18:00",
+        interval_minutes=120,
+        duration_minutes=15,
+    )
+    # 2026-03-02 is a Monday; Monday-only schedule resumes a week later
+    weekly = Schedule(schedule_id=2, unit_id=1, device_type="fan", days_of_week=[0])
+
+    assert service.next_transition_time(cycle, datetime(2026, 3, 2, 8, 5)) == datetime(2026, 3, 2, 8, 15)
+    assert service.next_transition_time(cycle, datetime(2026, 3, 2, 8, 20)) == datetime(2026, 3, 2, 10, 0)
+    assert service.next_transition_time(weekly, datetime(2026, 3, 2, 21, 0)) == datetime(2026, 3, 9, 8, 0)
+
+
+def test_engine_applies_schedule_changes_without_a_sweep():
+    now = datetime.now()
+    window_start = (now - timedelta(hours=1)).strftime("%H:%M")
+    window_end = (now + timedelta(hours=1)).strftime("%H:%M")
+    schedule = Schedule(
+        schedule_id=7,
+        unit_id=1,
+        device_type="light",
+        actuator_id=42,
+        start_time=window_start,
+        end_time=window_end,
+        enabled=False,
+    )
+    service = _service_with(schedule)
+    actuators = MagicMock()
+    actuators.get_actuator_state.return_value = False
+    engine = ScheduleTransitionEngine(service, actuators, growth_service=_growth([1]))
+    engine.start()
+    try:
+        service.set_schedule_enabled(7, True)
+        deadline = time.time() + 5
+        while not actuators.turn_on.called and time.time() < deadline:
+            time.sleep(0.01)
+        actuators.turn_on.assert_called_once_with(42)
+        assert engine.get_status()["queued_schedules"] == 1
+    finally:
+        engine.stop()
+
+
+def test_engine_fires_at_the_edge():
+    service = _service_with(Schedule(schedule_id=3, unit_id=1, device_type="fan", actuator_id=9))
+    actuators = MagicMock()
+    actuators.get_actuator_state.return_value = False
+    engine = ScheduleTransitionEngine(service, actuators, growth_service=_growth([1]))
+
+    edge = time.time() + 0.2
+    calls = []
+    service.next_transition_time = MagicMock(
+        side_effect=lambda *a, **k: datetime.fromtimestamp(edge) if time.time() < edge else None
+    )
+    service.is_schedule_active = MagicMock(side_effect=lambda *a, **k: calls.append(time.time()) or time.time() >= edge)
+
+    engine.start()
+    try:
+        deadline = time.time() + 5
+        while not actuators.turn_on.called and time.time() < deadline:
+            time.sleep(0.01)
+        actuators.turn_on.assert_called_once_with(9)
+        assert calls[-1] >= edge
+        # Evaluated once at startup and once at the edge - no polling in between
+        assert len(calls) == 2
+    finally:
+        engine.stop()
+
+
+def test_engine_starts_even_when_startup_sync_fails():
+    service = _service_with(Schedule(schedule_id=4, unit_id=1, device_type="fan", actuator_id=5))
+    service.sync_actuator_states_at_startup = MagicMock(side_effect=RuntimeError("bus offline"))
+    actuators = MagicMock(scheduling_service=service)
+    engine = ScheduleTransitionEngine(service, actuators, growth_service=_growth([1]))
+    container = SimpleNamespace(
+        actuator_management_service=actuators, growth_service=_growth([1]), schedule_transition_engine=engine
+    )
+    try:
+        results = actuator_startup_sync_task(container)
+        assert results["errors"] == ["bus offline"]
+        assert engine.is_running
+    finally:
+        engine.stop()
+
+
+def test_schedule_check_restarts_a_stopped_engine():
+    service = _service_with(Schedule(schedule_id=5, unit_id=1, device_type="fan", actuator_id=6))
+    engine = ScheduleTransitionEngine(service, MagicMock(), growth_service=_growth([1]))
+    try:
+        assert not engine.is_running
+        results = actuator_schedule_check_task(SimpleNamespace(schedule_transition_engine=engine))
+        assert engine.is_running
+        assert results["schedules_checked"] == 1
+    finally:
+        engine.stop()
@@ -0,0 +1,84 @@
+"""
+Tests for incremental sliding-window statistics and warm restart in AnomalyDetectionService.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from itertools import pairwise
+
+import pytest
+
+from app.enums import AnomalyType
+from app.services.utilities import anomaly_detection_service as module
+from app.services.utilities.anomaly_detection_service import AnomalyDetectionService
+from app.utils import persistent_store
+from app.utils.sliding_window_stats import SlidingWindowStats
+
+
+def test_window_stats_match_a_rescan():
+    rng = random.Random(3)
+    window = SlidingWindowStats(25)
+    samples: list[tuple[float, float]] = []
+    ts = 1_000.0
+
+    for _ in range(400):
+        ts += rng.choice([0.0, 0.5, 2.0])
+        value = rng.choice([rng.gauss(20, 5), 20.0])
+        window.add(ts, value)
+        samples.append((ts, value))
+
+        recent = samples[-25:]
+        values = [v for _, v in recent]
+        rates = [abs(v2 - v1) / (t2 - t1) for (t1, v1), (t2, v2) in pairwise(recent) if t2 > t1]
+        assert len(window) == len(recent)
+        assert window.mean == pytest.approx(statistics.fmean(values))
+        assert window.std == pytest.approx(statistics.pstdev(values), abs=1e-9)
+        assert (window.min, window.max) == (min(values), max(values))
+        assert window.mean_rate == (pytest.approx(statistics.fmean(rates)) if rates else None)
+        assert list(window.recent_values(3)) == values[::-1][:3]
+
+
+def test_checks_use_window_statistics():
+    service = AnomalyDetectionService(history_size=50)
+    rng = random.Random(11)
+    values = [20.0 + rng.uniform(-0.5, 0.5) for _ in range(30)]
+    for value in values:
+        service.check_reading(1, value)
+
+    stats = service.get_statistics(1)
+    assert stats["count"] == 30
+    assert stats["mean"] == pytest.approx(statistics.fmean(values))
+    assert stats["std_dev"] == pytest.approx(statistics.pstdev(values))
+
+    outlier = service.check_reading(1, 45.0)
+    assert outlier is not None and outlier.anomaly_type in (AnomalyType.SPIKE, AnomalyType.STATISTICAL)
+    # Statistics are only refreshed by non-anomalous readings
+    assert service.get_statistics(1)["count"] == 30
+
+    for _ in range(5):
+        service.check_reading(2, 7.0)
+    stuck = service.check_reading(2, 7.0)
+    assert stuck is not None and stuck.anomaly_type == AnomalyType.STUCK
+
+
+def test_state_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistent_store, "_VAR_DIR", str(tmp_path / "var"))
+    state_path = str(tmp_path / "state" / "windows.json")
+    service = AnomalyDetectionService(history_size=20, state_path=state_path)
+    for i in range(30):
+        service.check_reading(5, 10.0 + (i % 3) * 0.1)
+    service.save_state()
+    assert (tmp_path / "state" / "windows.json").exists()
+    assert not (tmp_path / "var").exists()
+
+    restored = AnomalyDetectionService(history_size=20, state_path=state_path)
+    assert restored.load_state() == 1
+    assert restored.get_statistics(5) == pytest.approx(service.get_statistics(5))
+    assert restored._sensor_history[5].samples() == service._sensor_history[5].samples()
+
+    later = time.time() + module.STATE_MAX_AGE_SECONDS + 60
+    monkeypatch.setattr(module.time, "time", lambda: later)
+    assert AnomalyDetectionService(history_size=20, state_path=state_path).load_state() == 0
@@ -0,0 +1,68 @@
+"""
+Tests for incremental window statistics and buffered persistence in the drift detector.
+"""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.ai.drift_detector import ModelDriftDetectorService
+
+
+def _detector(**kwargs) -> ModelDriftDetectorService:
+    registry = MagicMock()
+    registry.get_metadata.return_value = None
+    return ModelDriftDetectorService(model_registry=registry, training_data_repo=MagicMock(), **kwargs)
+
+
+def _scan(records, window):
+    """Reference statistics computed by rescanning the window."""
+    window_records = records[-window:]
+    with_actual = [r for r in window_records if r["error"] is not None]
+    confidences = [r["confidence"] for r in window_records if r["confidence"] is not None]
+    accuracy = sum(r["error"] < 0.1 for r in with_actual) / len(with_actual) if with_actual else 1.0
+    error_rate = sum(r["error"] > 0.1 for r in with_actual) / len(with_actual) if with_actual else 0.0
+    mean_confidence = sum(confidences) / len(confidences) if confidences else 1.0
+    return len(window_records), accuracy, error_rate, mean_confidence
+
+
+def test_running_window_stats_match_a_rescan():
+    detector = _detector()
+    detector.max_history_size = 150
+    rng = random.Random(7)
+
+    for _ in range(400):  # wraps the bounded history more than twice
+        actual = rng.choice([None, 10.0, "fungal"])
+        prediction = rng.choice([10.0, 10.05, 11.0]) if isinstance(actual, float) else rng.choice(["fungal", "pest"])
+        confidence = rng.choice([None, rng.random()])
+        detector.track_prediction("m", prediction, actual=actual, confidence=confidence)
+
+    records = list(detector.metrics_history["m"])
+    for window in (1, 37, 100, 150, 1000):
+        drift = detector.check_drift("m", window_size=window)
+        count, accuracy, error_rate, mean_confidence = _scan(records, window)
+        assert drift.prediction_count == count
+        assert drift.prediction_accuracy == pytest.approx(accuracy)
+        assert drift.error_rate == pytest.approx(error_rate)
+        assert drift.mean_confidence == pytest.approx(mean_confidence)
+
+    detector.clear_history("m")
+    assert detector.check_drift("m").prediction_count == 0
+    detector.track_prediction("m", 1.0, actual=2.0, confidence=0.5)
+    drift = detector.check_drift("m")
+    assert (drift.prediction_count, drift.error_rate, drift.mean_confidence) == (1, 1.0, 0.5)
+
+
+def test_tracking_queues_persistence_instead_of_writing():
+    repo = MagicMock()
+    detector = _detector(ai_health_repo=repo)
+
+    detector.track_prediction("m", 1.0, actual=1.0, confidence=0.9)
+
+    repo.enqueue_drift_metric.assert_called_once_with(
+        model_name="m", prediction=1.0, actual=1.0, confidence=0.9, error=0.0
+    )
+    repo.save_drift_metric.assert_not_called()
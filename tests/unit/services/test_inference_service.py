@@ -0,0 +1,85 @@
+"""
+Tests for micro-batched model inference shared by the AI predictors.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services.ai.climate_optimizer import ClimateOptimizer
+from app.services.ai.inference_service import BatchedInferenceService
+
+
+class _SumModel:
+    """Predicts the row sum; records every batch it is called with."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches: list[int] = []
+        self._lock = threading.Lock()
+
+    def predict(self, rows):
+        time.sleep(self.delay)
+        with self._lock:
+            self.batches.append(len(rows))
+        return np.asarray(rows, dtype=float).sum(axis=1)
+
+    def predict_proba(self, rows):
+        sums = self.predict(rows)
+        return np.column_stack([sums, -sums])
+
+
+def test_concurrent_requests_are_batched_and_fanned_out():
+    service = BatchedInferenceService(max_wait_ms=20)
+    model = _SumModel(delay=0.02)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        futures = [pool.submit(service.predict, "sum", model, [[i, i]]) for i in range(48)]
+        results = [f.result(timeout=5) for f in futures]
+
+    assert [float(r[0]) for r in results] == [2.0 * i for i in range(48)]
+    assert sum(model.batches) == 48
+    assert len(model.batches) < 48
+    stats = service.get_stats()["sum"]
+    assert stats["requests"] == 48
+    assert stats["max_batch_rows"] > 1
+    assert stats["avg_latency_ms"] > 0
+
+
+def test_sequential_calls_run_immediately_and_errors_propagate():
+    service = BatchedInferenceService(max_wait_ms=500)
+    model = _SumModel()
+
+    started = time.monotonic()
+    for i in range(5):
+        assert service.predict_proba("sum", model, np.array([[i, 1.0]]))[0].tolist() == [i + 1.0, -(i + 1.0)]
+    assert time.monotonic() - started < 0.5
+    assert model.batches == [1] * 5
+
+    with pytest.raises(ValueError):
+        service.predict("broken", _SumModel(), [["not", "numbers"]])
+    assert service.get_stats()["broken"]["errors"] == 1
+    assert service._lanes == {}
+
+
+def test_predictor_routes_through_shared_service():
+    class _ClimateModel:
+        def predict(self, rows):
+            return np.array([[23.0, 60.0, 45.0]] * len(rows))
+
+    service = BatchedInferenceService()
+    optimizer = ClimateOptimizer(inference_service=service)
+    optimizer._model = _ClimateModel()
+    optimizer._model_loaded = True
+
+    result = optimizer._predict_with_ml(
+        "basil", "Vegetative", is_daytime=True, unit_dimensions=None, current_conditions=None
+    )
+
+    assert result is not None and result.source == "ml"
+    assert service.get_stats()["climate_optimizer"]["requests"] == 1
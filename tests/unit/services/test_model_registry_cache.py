@@ -0,0 +1,68 @@
+"""
+Tests for the bounded, memory-mapped model/artifact cache in ModelRegistry.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import joblib
+import numpy as np
+
+from app.services.ai.model_registry import ModelCache, ModelRegistry
+
+
+def test_cache_evicts_least_recently_used_within_budget():
+    cache = ModelCache(max_bytes=100)
+    cache.put("a:v1", "A", 40)
+    cache.put("b:v1", "B", 40)
+    assert cache.get("a:v1") == "A"  # b is now least recently used
+
+    cache.put("c:v1", "C", 40)
+    assert cache.get("b:v1") is None
+    assert cache.get("a:v1") == "A"
+
+    cache.put("huge:v1", "H", 500)  # larger than the budget: not kept
+    assert cache.get("huge:v1") is None
+
+    cache.invalidate_prefix("a:")
+    stats = cache.get_stats()
+    assert stats["entries"] == 1
+    assert stats["resident_bytes"] == 40
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+
+
+def test_registry_caches_models_and_artifacts_memory_mapped(tmp_path):
+    registry = ModelRegistry(base_path=tmp_path)
+    weights = np.arange(50_000, dtype=np.float64)
+    registry.save_model("climate", {"weights": weights}, {"version": "v1"}, scaler={"mean": weights[:10]})
+
+    with patch("app.services.ai.model_registry.joblib.load", wraps=joblib.load) as load:
+        model = registry.load_model("climate", "v1")
+        assert registry.load_model("climate", "v1") is model
+        scaler = registry.load_artifact("climate", "scaler", "v1")
+        assert registry.load_artifact("climate", "scaler", "v1") is scaler
+        assert load.call_count == 2
+        assert all(call.kwargs["mmap_mode"] == "r" for call in load.call_args_list)
+
+    assert isinstance(model["weights"], np.memmap)
+    stats = registry.get_cache_stats()
+    assert stats["entries"] == 2
+    assert stats["resident_bytes"] > weights.nbytes
+    assert stats["hits"] == 2
+
+    registry._clear_model_cache("climate")
+    assert registry.get_cache_stats()["entries"] == 0
+
+
+def test_registry_budget_evicts_older_models(tmp_path):
+    registry = ModelRegistry(base_path=tmp_path, cache_max_bytes=600_000)
+    for name in ("first", "second"):
+        registry.save_model(name, np.zeros(50_000), {"version": "v1"})
+        registry.load_model(name, "v1")
+
+    stats = registry.get_cache_stats()
+    assert stats["entries"] == 1
+    assert stats["evictions"] == 1
+    assert stats["resident_bytes"] <= 600_000
@@ -0,0 +1,133 @@
+"""
+Tests for unit-scoped scoring and caching in PlantHealthScorer.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.enums.events import SensorEvent
+from app.services.ai.plant_health_scorer import PlantHealthScorer
+
+
+def _plant(plant_id: int, unit_id: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        plant_id=plant_id,
+        plant_type="basil",
+        current_stage="vegetative",
+        unit_id=unit_id,
+        moisture_level=None,
+        sensor_id=None,
+    )
+
+
+@pytest.fixture()
+def scorer():
+    repo = MagicMock()
+    repo.get_latest_sensor_readings.return_value = {"temperature": 24.0, "humidity": 60.0}
+    repo.get_latest_plant_readings_for_plants.return_value = {
+        1: [{"plant_id": 1, "soil_moisture": 60.0, "ph": 6.5, "ec": 1.5}],
+        2: [{"plant_id": 2, "soil_moisture": 20.0, "ph": None, "ec": None}, {"plant_id": 2, "ph": 4.0}],
+    }
+    plant_service = MagicMock()
+    plant_service.list_plants.return_value = [_plant(1), _plant(2)]
+    return PlantHealthScorer(analytics_repo=repo, plant_service=plant_service, event_bus=MagicMock())
+
+
+def test_unit_scoring_loads_inputs_once(scorer):
+    scores = scorer.score_plants_in_unit(1)
+
+    repo = scorer.analytics_repo
+    repo.get_latest_sensor_readings.assert_called_once_with(unit_id=1)
+    repo.get_latest_plant_readings_for_plants.assert_called_once_with([1, 2], limit=10)
+    repo.get_latest_plant_readings.assert_not_called()
+
+    by_plant = {s.plant_id: s for s in scores}
+    assert by_plant[1].soil_moisture_score == 100.0
+    assert by_plant[1].ph_score == 100.0
+    assert by_plant[1].health_status == "healthy"
+    # Soil moisture below min is critical; pH falls back to the older reading
+    assert by_plant[2].soil_moisture_score == 10.0
+    assert by_plant[2].raw_values["ph"] == 4.0
+    assert by_plant[2].ph_score == 10.0
+
+
+def test_vectorized_metric_scores(scorer):
+    threshold = {"optimal": 50.0, "tolerance": 5.0, "min": 0.0, "max": 100.0}
+    values = [52.0, 58.0, 64.0, 69.0, 80.0, 101.0, None]
+    width = len(scorer.WEIGHTS)
+    scores, overall = scorer._calculate_metric_scores(
+        [[v] * width for v in values], [[threshold] * width] * len(values)
+    )
+    expected = [100.0, 80.0, 60.0, 40.0, 20.0, 10.0, 50.0]
+    assert [row[0] for row in scores] == expected
+    # Weights sum to 1, so a row of equal component scores keeps that score overall
+    assert overall == pytest.approx(expected)
+
+
+def test_malformed_plant_falls_back_without_affecting_others(scorer):
+    scorer.plant_service.list_plants.return_value = [_plant(1), _plant(2), _plant(3)]
+    scorer.analytics_repo.get_latest_plant_readings_for_plants.return_value[3] = ["corrupt"]
+
+    by_plant = {s.plant_id: s for s in scorer.score_plants_in_unit(1)}
+
+    assert set(by_plant) == {1, 2, 3}
+    assert by_plant[1].health_status == "healthy"
+    assert by_plant[3].health_status == "unknown"
+    assert by_plant[3].overall_score == 50.0
+
+
+def test_failed_vectorized_pass_scores_rows_individually(scorer):
+    width = len(scorer.WEIGHTS)
+    good = [scorer.DEFAULT_THRESHOLDS[m] for m in scorer.WEIGHTS]
+    bad = [{"optimal": "n/a"}] * width
+
+    rows = scorer._score_rows([[None] * width, [None] * width], [good, bad])
+
+    assert rows[0] == ([50.0] * width, pytest.approx(50.0))
+    assert rows[1] is None
+
+
+def test_unit_scores_cached_until_next_reading(scorer):
+    first = scorer.score_plants_in_unit(1)
+    assert [s.plant_id for s in scorer.score_plants_in_unit(1)] == [s.plant_id for s in first]
+    assert scorer.analytics_repo.get_latest_sensor_readings.call_count == 1
+
+    # A reading for another unit leaves the cache alone
+    scorer._on_unit_data_changed({"unit_id": 2, "temperature": 20.0})
+    scorer.score_plants_in_unit(1)
+    assert scorer.analytics_repo.get_latest_sensor_readings.call_count == 1
+
+    scorer._on_unit_data_changed({"unit_id": 1, "temperature": 30.0})
+    scorer.score_plants_in_unit(1)
+    assert scorer.analytics_repo.get_latest_sensor_readings.call_count == 2
+
+    subscribed = {call.args[0] for call in scorer.event_bus.subscribe.call_args_list}
+    assert SensorEvent.TEMPERATURE_UPDATE in subscribed
+
+
+def test_bulk_plant_readings_query(db_handler, analytics_repo, seed):
+    unit_id = seed.create_unit()
+    first = seed.create_plant(unit_id=unit_id)
+    second = seed.create_plant(unit_id=unit_id)
+    with db_handler.connection() as conn:
+        for plant_id, moisture, ts in (
+            (first, 40.0, "2026-03-01 10:00:00"),
+            (first, 45.0, "2026-03-01 11:00:00"),
+            (first, 50.0, "2026-03-01 12:00:00"),
+            (second, 70.0, "2026-03-01 09:00:00"),
+        ):
+            conn.execute(
+                "INSERT INTO PlantReadings (plant_id, unit_id, soil_moisture, timestamp) VALUES (?, ?, ?, ?)",
+                (plant_id, unit_id, moisture, ts),
+            )
+
+    readings = analytics_repo.get_latest_plant_readings_for_plants([first, second, 999], limit=2)
+
+    assert [r["soil_moisture"] for r in readings[first]] == [50.0, 45.0]
+    assert [r["soil_moisture"] for r in readings[second]] == [70.0]
+    assert 999 not in readings
+    assert readings[first] == analytics_repo.get_latest_plant_readings(first, limit=2)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.services.application.energy_analytics_service import EnergyAnalyticsService
+from infrastructure.database.repositories.devices import DeviceRepository
+from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+
+def _service(tmp_path) -> tuple[EnergyAnalyticsService, DeviceRepository]:
+    handler = SQLiteDatabaseHandler(str(tmp_path / "fp.db"))
+    handler.create_tables()
+    with handler.connection() as conn:
+        conn.execute("INSERT INTO GrowthUnits (name) VALUES ('Unit')")
+        for name in ("pump", "fan", "light"):
+            conn.execute(
+                "INSERT INTO Actuator (unit_id, name, actuator_type, protocol, model) "
+                "VALUES (1, ?, 'relay', 'gpio', 'Generic')",
+                (name,),
+            )
+        # Actuator 1: declining health, high error rate, many unresolved anomalies
+        for i, score in enumerate([95, 95, 90, 90, 90, 60, 55, 50, 50, 50]):
+            conn.execute(
+                "INSERT INTO ActuatorHealthHistory (actuator_id, health_score, status, total_operations, "
+                "failed_operations, recorded_at) VALUES (1, ?, 'ok', 100, 20, datetime('2026-01-01', ?))",
+                (score, f"+{i} hours"),
+            )
+        for i in range(8):
+            conn.execute(
+                "INSERT INTO ActuatorAnomaly (actuator_id, anomaly_type, severity, detected_at, resolved_at) "
+                "VALUES (1, 'stuck', 'high', datetime('2026-01-01', ?), ?)",
+                (f"+{i} hours", "2026-01-02" if i == 0 else None),
+            )
+        # Actuator 2: healthy; actuator 3: no history
+        conn.execute(
+            "INSERT INTO ActuatorHealthHistory (actuator_id, health_score, status, total_operations, "
+            "failed_operations) VALUES (2, 100, 'ok', 50, 0)"
+        )
+    repo = DeviceRepository(handler)
+    return EnergyAnalyticsService(repository=None, device_repository=repo), repo
+
+
+def test_batch_predictions_match_per_actuator_predictions(tmp_path):
+    service, _repo = _service(tmp_path)
+
+    batch = service.predict_device_failures([1, 2, 3])
+
+    assert set(batch) == {1, 2, 3}
+    for actuator_id in (1, 2, 3):
+        assert batch[actuator_id] == service.predict_device_failure(actuator_id)
+    assert batch[1]["risk_level"] == "critical"
+    assert batch[2]["risk_level"] == "low"
+    assert batch[3]["risk_level"] == "unknown"
+
+
+def test_batch_predictions_are_cached_until_health_data_changes(tmp_path):
+    service, repo = _service(tmp_path)
+
+    first = service.predict_device_failures([2, 1])
+    with patch.object(repo, "get_actuator_failure_inputs", wraps=repo.get_actuator_failure_inputs) as fetch:
+        assert service.predict_device_failures([1, 2]) is first
+        assert fetch.call_count == 0
+
+        repo.save_actuator_health_snapshot(
+            2, health_score=40, status="degraded", total_operations=10, failed_operations=5
+        )
+        refreshed = service.predict_device_failures([1, 2])
+        assert fetch.call_count == 1
+        assert refreshed[2]["risk_level"] != first[2]["risk_level"]
+
+        anomaly_id = repo.get_actuator_anomalies(1, limit=1)[0]["anomaly_id"]
+        repo.resolve_actuator_anomaly(anomaly_id)
+        service.predict_device_failures([1, 2])
+        assert fetch.call_count == 2
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from infrastructure.database.connection_lanes import ReadPool, WriterLane
+from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+
+
+@pytest.fixture()
+def file_handler(tmp_path):
+    handler = SQLiteDatabaseHandler(str(tmp_path / "lanes.db"), read_pool_size=2)
+    handler.create_tables()
+    yield handler
+    handler.stop_write_behind()
+    handler.close_read_pool()
+    handler.close_db()
+
+
+def test_read_connections_are_query_only(file_handler):
+    with file_handler.read_connection() as conn:
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO GrowthUnits (name) VALUES ('x')")
+
+
+def test_pooled_reads_see_committed_writes(file_handler):
+    with file_handler.write_connection() as conn:
+        conn.execute("INSERT INTO GrowthUnits (name) VALUES ('Unit')")
+
+    with file_handler.read_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM GrowthUnits").fetchone()[0] == 1
+
+    stats = file_handler.get_connection_lane_stats()
+    assert stats["read"]["acquisitions"] == 1
+    assert stats["read"]["open"] == 1
+    assert stats["write"]["acquisitions"] == 1
+
+
+def test_write_connection_rolls_back_on_error(file_handler):
+    with pytest.raises(RuntimeError), file_handler.write_connection() as conn:
+        conn.execute("INSERT INTO GrowthUnits (name) VALUES ('Unit')")
+        raise RuntimeError("boom")
+
+    with file_handler.read_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM GrowthUnits").fetchone()[0] == 0
+
+
+def test_connection_commits_only_after_writes(file_handler):
+    conn = file_handler.get_db()
+    with file_handler.connection() as db:
+        db.execute("SELECT 1").fetchone()
+    assert not conn.in_transaction
+
+    with file_handler.connection() as db:
+        db.execute("INSERT INTO GrowthUnits (name) VALUES ('Unit')")
+    assert not conn.in_transaction
+
+
+def test_busy_timeout_is_configured(file_handler):
+    assert file_handler.get_db().execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_memory_database_reads_use_thread_connection(db_handler):
+    with db_handler.read_connection() as conn:
+        assert conn is db_handler.get_db()
+    assert db_handler.get_connection_lane_stats()["read"] == {"pooled": False}
+
+
+def test_read_pool_waits_when_exhausted(tmp_path):
+    pool = ReadPool(lambda: sqlite3.connect(str(tmp_path / "p.db"), check_same_thread=False), size=1)
+    released = threading.Event()
+
+    def borrower():
+        with pool.acquire():
+            released.wait(5)
+
+    worker = threading.Thread(target=borrower)
+    worker.start()
+    while pool.get_stats()["open"] == 0:
+        pass
+    threading.Timer(0.05, released.set).start()
+    with pool.acquire():
+        pass
+    worker.join()
+
+    stats = pool.get_stats()
+    assert stats["open"] == 1
+    assert stats["contended"] == 1
+    assert stats["wait_ms_max"] > 0
+    pool.close_all()
+
+
+def test_read_pool_overflows_when_wait_times_out(tmp_path):
+    opened = []
+
+    def connect():
+        opened.append(sqlite3.connect(str(tmp_path / "p.db"), check_same_thread=False))
+        return opened[-1]
+
+    pool = ReadPool(connect, size=1, acquire_timeout=0.05)
+    with pool.acquire() as held, pool.acquire() as extra:
+        assert extra is not held
+        assert extra.execute("SELECT 1").fetchone() == (1,)
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[1].execute("SELECT 1")  # overflow connection closed after use
+    stats = pool.get_stats()
+    assert stats["open"] == 1
+    assert stats["idle"] == 1
+    assert stats["overflow"] == 1
+    pool.close_all()
+
+
+def test_writer_lane_counts_contention():
+    lane = WriterLane()
+    entered = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with lane.hold():
+            entered.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=holder)
+    worker.start()
+    entered.wait(5)
+    threading.Timer(0.05, release.set).start()
+    with lane.hold():
+        pass
+    worker.join()
+
+    stats = lane.get_stats()
+    assert stats["acquisitions"] == 2
+    assert stats["contended"] == 1
@@ -1,7 +1,9 @@
 from datetime import datetime
+from types import SimpleNamespace
 
 from app.domain.sensors.reading import ReadingStatus, SensorReading
-from app.utils.emitters import SOCKETIO_NAMESPACE_DEVICES, EmitterService
+from app.schemas.events import DashboardSnapshotPayload
+from app.utils.emitters import SOCKETIO_NAMESPACE_DASHBOARD, SOCKETIO_NAMESPACE_DEVICES, EmitterService
 
 
 class FakeSocketIO:
@@ -49,3 +51,62 @@ def test_emit_sensor_reading_filters_non_numeric_fields():
 
     emitted_events = {e["event"] for e in sio.emits}
     assert "device_sensor_reading" in emitted_events
+
+
+def _snapshot(unit_id: int, **values: float) -> DashboardSnapshotPayload:
+    return DashboardSnapshotPayload(
+        unit_id=unit_id,
+        timestamp=datetime.now().isoformat(),
+        metrics={name: {"value": value, "unit": ""} for name, value in values.items()},
+    )
+
+
+def test_dashboard_frames_send_keyframe_then_deltas():
+    sio = FakeSocketIO()
+    emitter = EmitterService(sio=sio, replay_maxlen=10, dashboard_keyframe_seconds=3600)
+
+    emitter.emit_dashboard_snapshot(_snapshot(1, temperature=22.0, humidity=60.0))
+    emitter.emit_dashboard_snapshot(_snapshot(1, temperature=22.5, humidity=60.0))
+    emitter.emit_dashboard_snapshot(_snapshot(1, temperature=22.5, humidity=60.0))  # unchanged: nothing sent
+    emitter.emit_dashboard_snapshot(_snapshot(1, temperature=22.5))
+
+    assert [e["event"] for e in sio.emits] == ["dashboard_snapshot", "dashboard_delta", "dashboard_delta"]
+    keyframe, delta, removal = (e["payload"] for e in sio.emits)
+    assert keyframe["seq"] == 1
+    assert set(keyframe["metrics"]) == {"temperature", "humidity"}
+    assert delta["seq"] == 2
+    assert set(delta["metrics"]) == {"temperature"}
+    assert delta["removed"] == []
+    assert removal["seq"] == 3
+    assert removal["metrics"] == {}
+    assert removal["removed"] == ["humidity"]
+    assert all(e["namespace"] == SOCKETIO_NAMESPACE_DASHBOARD and e["room"] == "unit_1" for e in sio.emits)
+
+    # A client resync request turns the next frame into a keyframe
+    emitter.request_dashboard_keyframe(1)
+    emitter.emit_dashboard_snapshot(_snapshot(1, temperature=22.5))
+    assert sio.emits[-1]["event"] == "dashboard_snapshot"
+    assert sio.emits[-1]["payload"]["seq"] == 4
+
+
+def test_scheduled_emits_coalesce_per_key_and_skip_empty_rooms():
+    sio = FakeSocketIO()
+    # Only unit_1 on /devices has a connected client
+    sio.server = SimpleNamespace(manager=SimpleNamespace(rooms={"/devices": {None: {"a": "x"}, "unit_1": {"a": "x"}}}))
+    emitter = EmitterService(sio=sio, replay_maxlen=10, emit_rate_hz=0.01)  # flushed manually below
+
+    for value in (20.0, 21.0, 22.0):
+        emitter.schedule("device_sensor_reading", {"t": value}, room="unit_1", namespace="/devices", key=1)
+    emitter.schedule("device_sensor_reading", {"t": 5.0}, room="unit_1", namespace="/devices", key=2)
+    emitter.schedule("device_sensor_reading", {"t": 9.0}, room="unit_2", namespace="/devices", key=3)
+    assert sio.emits == []
+
+    assert emitter.flush() == 2
+    assert [e["payload"] for e in sio.emits] == [{"t": 22.0}, {"t": 5.0}]
+
+    metrics = emitter.get_metrics()
+    assert metrics["emitted"] == 2
+    assert metrics["coalesced"] == 2
+    assert metrics["skipped_no_clients"] == 1
+    assert metrics["pending"] == 0
+    emitter.shutdown()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from app.enums.events import EventDelivery
+from app.utils.event_bus import EventBus
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_partitioned_subscriber_only_receives_its_unit():
+    bus = EventBus()
+    unit_1: list[dict] = []
+    unit_2: list[dict] = []
+    everyone: list[dict] = []
+    unsubs = [
+        bus.subscribe("partition_test_topic", unit_1.append, partition_key=1),
+        bus.subscribe("partition_test_topic", unit_2.append, partition_key=2),
+        bus.subscribe("partition_test_topic", everyone.append),
+    ]
+
+    bus.publish("partition_test_topic", {"unit_id": 1, "value": 1})
+    bus.publish("partition_test_topic", {"unit_id": "2", "value": 2})
+    bus.publish("partition_test_topic", {"value": 3})
+
+    assert _wait_for(lambda: len(everyone) == 3 and unit_1 and unit_2)
+    assert [event["value"] for event in unit_1] == [1]
+    assert [event["value"] for event in unit_2] == [2]
+    for unsub in unsubs:
+        unsub()
+
+
+def test_unit_sensor_partition_key():
+    bus = EventBus()
+    received: list[dict] = []
+    unsub = bus.subscribe("partition_sensor_topic", received.append, partition_key=(1, 7))
+
+    bus.publish("partition_sensor_topic", {"unit_id": 1, "sensor_id": 8, "value": "other"})
+    bus.publish("partition_sensor_topic", {"unit_id": 1, "sensor_id": 7, "value": "mine"})
+
+    assert _wait_for(lambda: received)
+    time.sleep(0.05)
+    assert [event["value"] for event in received] == ["mine"]
+    unsub()
+
+
+def test_partition_preserves_order_and_slow_unit_does_not_block_others():
+    bus = EventBus()
+    release = threading.Event()
+    slow_seen: list[int] = []
+    fast_seen: list[int] = []
+
+    def slow(payload):
+        release.wait(2)
+        slow_seen.append(payload["seq"])
+
+    unsubs = [
+        bus.subscribe("partition_fair_topic", slow, partition_key=10),
+        bus.subscribe("partition_fair_topic", lambda p: fast_seen.append(p["seq"]), partition_key=11),
+    ]
+    for seq in range(5):
+        bus.publish("partition_fair_topic", {"unit_id": 10, "seq": seq})
+        bus.publish("partition_fair_topic", {"unit_id": 11, "seq": seq})
+
+    assert _wait_for(lambda: len(fast_seen) == 5)
+    assert fast_seen == [0, 1, 2, 3, 4]
+    release.set()
+    assert _wait_for(lambda: len(slow_seen) == 5)
+    assert slow_seen == [0, 1, 2, 3, 4]
+    for unsub in unsubs:
+        unsub()
+
+
+def test_full_partition_drops_are_counted_per_topic():
+    bus = EventBus()
+    release = threading.Event()
+    unsub = bus.subscribe("partition_drop_topic", lambda _p: release.wait(2), partition_key=99)
+    before = bus.get_metrics()["drops_by_topic"].get("partition_drop_topic", 0)
+
+    for _ in range(bus._partition_queue_size + 5):
+        bus.publish("partition_drop_topic", {"unit_id": 99})
+
+    metrics = bus.get_metrics()
+    assert metrics["drops_by_topic"]["partition_drop_topic"] - before >= 4
+    release.set()
+    unsub()
+
+
+def test_ordered_delivery_keeps_publish_order_per_sensor():
+    bus = EventBus()
+    seen: list[int] = []
+    unsub = bus.subscribe("ordered_test_topic", lambda p: seen.append(p["seq"]), delivery="ordered")
+
+    for seq in range(50):
+        bus.publish("ordered_test_topic", {"unit_id": 3, "sensor_id": 1, "seq": seq})
+
+    assert _wait_for(lambda: len(seen) == 50)
+    assert seen == list(range(50))
+    unsub()
+
+
+def test_latest_delivery_coalesces_pending_events_per_sensor():
+    bus = EventBus()
+    gate = threading.Event()
+    seen: list[tuple[int, int]] = []
+
+    def handler(payload):
+        gate.wait(2)
+        seen.append((payload["sensor_id"], payload["seq"]))
+
+    unsub = bus.subscribe("latest_test_topic", handler, partition_key=5, delivery=EventDelivery.LATEST)
+    before = bus.get_metrics()["coalesced_by_topic"].get("latest_test_topic", 0)
+
+    bus.publish("latest_test_topic", {"unit_id": 5, "sensor_id": 1, "seq": 0})
+    assert _wait_for(lambda: bus.get_metrics()["partition_depths"].get("5", 0) == 0)
+    for seq in range(1, 6):
+        bus.publish("latest_test_topic", {"unit_id": 5, "sensor_id": 1, "seq": seq})
+        bus.publish("latest_test_topic", {"unit_id": 5, "sensor_id": 2, "seq": seq})
+    gate.set()
+
+    assert _wait_for(lambda: len(seen) == 3)
+    time.sleep(0.05)
+    assert seen == [(1, 0), (1, 5), (2, 5)]
+    assert bus.get_metrics()["coalesced_by_topic"]["latest_test_topic"] - before == 8
+    unsub()
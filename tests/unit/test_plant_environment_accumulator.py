@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+
+
+def _set_planted(db_handler, plant_id: int, planted_date: str) -> None:
+    with db_handler.connection() as conn:
+        conn.execute("UPDATE Plants SET planted_date = ? WHERE plant_id = ?", (planted_date, plant_id))
+
+
+def _accumulator(db_handler, plant_id: int, metric: str) -> dict | None:
+    with db_handler.connection() as conn:
+        row = conn.execute(
+            "SELECT * FROM PlantEnvironmentAccumulator WHERE plant_id = ? AND metric = ?",
+            (plant_id, metric),
+        ).fetchone()
+    return dict(row) if row else None
+
+
+@pytest.fixture()
+def grow(db_handler, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id, sensor_type="temperature")
+    plant_id = seed.create_plant(unit_id=unit_id)
+    _set_planted(db_handler, plant_id, "2026-03-02 00:00:00")
+    return unit_id, sensor_id, plant_id
+
+
+def test_stats_cover_readings_since_planting(analytics_repo, seed, grow):
+    _, sensor_id, plant_id = grow
+    seed.insert_reading(sensor_id, temperature=5.0, humidity=10.0, timestamp="2026-03-01 12:00:00")
+    seed.insert_reading(sensor_id, temperature=20.0, humidity=60.0, timestamp="2026-03-02 10:00:00")
+    seed.insert_reading(sensor_id, temperature=24.0, humidity=70.0, timestamp="2026-03-03 10:00:00")
+
+    assert analytics_repo.get_average_temperature(plant_id) == pytest.approx(22.0)
+    assert analytics_repo.get_average_humidity(plant_id) == pytest.approx(65.0)
+
+    stats = analytics_repo.get_plant_environment_stats(plant_id, "temperature")
+    assert stats["count"] == 2
+    assert stats["min"] == 20.0
+    assert stats["max"] == 24.0
+    assert stats["stddev"] == pytest.approx(2.0)
+
+
+def test_trigger_keeps_seeded_accumulator_current(analytics_repo, db_handler, seed, grow):
+    _, sensor_id, plant_id = grow
+    seed.insert_reading(sensor_id, temperature=20.0, timestamp="2026-03-02 10:00:00")
+    analytics_repo.get_average_temperature(plant_id)
+
+    seed.insert_reading(sensor_id, temperature=26.0, timestamp="2026-03-04 10:00:00")
+    row = _accumulator(db_handler, plant_id, "temperature")
+    assert row["count_readings"] == 2
+    assert row["sum_value"] == pytest.approx(46.0)
+    assert row["sum_squares"] == pytest.approx(20.0**2 + 26.0**2)
+    assert row["max_value"] == 26.0
+    assert analytics_repo.get_average_temperature(plant_id) == pytest.approx(23.0)
+
+    # Moving the planted date reseeds from the new start
+    _set_planted(db_handler, plant_id, "2026-03-03 00:00:00")
+    stats = analytics_repo.get_plant_environment_stats(plant_id, "temperature")
+    assert stats["count"] == 1
+    assert stats["mean"] == pytest.approx(26.0)
+    assert stats["stddev"] == pytest.approx(0.0)
+
+
+def test_backfill_seeds_every_plant(analytics_repo, db_handler, seed, grow):
+    unit_id, sensor_id, plant_id = grow
+    other_plant = seed.create_plant(name="Basil", unit_id=unit_id)
+    _set_planted(db_handler, other_plant, "2026-03-03 00:00:00")
+    seed.insert_reading(sensor_id, temperature=18.0, humidity=50.0, timestamp="2026-03-02 06:00:00")
+    seed.insert_reading(sensor_id, temperature=22.0, humidity=54.0, timestamp="2026-03-03 06:00:00")
+
+    assert analytics_repo.backfill_plant_environment_accumulators() == 2
+    assert _accumulator(db_handler, plant_id, "temperature")["count_readings"] == 2
+    assert _accumulator(db_handler, other_plant, "humidity")["sum_value"] == pytest.approx(54.0)
+    assert analytics_repo.get_average_humidity(plant_id) == pytest.approx(52.0)
+
+
+def test_rows_are_seeded_before_raw_samples_are_pruned(analytics_repo, db_handler, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id, sensor_type="temperature")
+    plant_id = seed.create_plant(unit_id=unit_id)
+    _set_planted(db_handler, plant_id, "2026-01-01 00:00:00")
+    assert _accumulator(db_handler, plant_id, "temperature")["count_readings"] == 0
+
+    seed.insert_reading(sensor_id, temperature=10.0, timestamp="2026-01-05 10:00:00")
+    with db_handler.connection() as conn:
+        conn.execute("DELETE FROM SensorMetricSample WHERE ts_epoch < strftime('%s', '2026-02-01')")
+    seed.insert_reading(sensor_id, temperature=30.0, timestamp="2026-04-05 10:00:00")
+
+    assert analytics_repo.get_average_temperature(plant_id) == pytest.approx(20.0)
+
+
+def test_linking_a_sensor_reseeds_the_scope(analytics_repo, db_handler, seed, grow):
+    unit_id, unit_sensor, plant_id = grow
+    probe = seed.create_sensor(unit_id=unit_id, sensor_type="temperature")
+    seed.insert_reading(unit_sensor, temperature=18.0, timestamp="2026-03-02 10:00:00")
+    seed.insert_reading(probe, temperature=24.0, timestamp="2026-03-02 10:00:00")
+
+    db_handler.link_sensor_to_plant(plant_id, probe)
+    row = _accumulator(db_handler, plant_id, "temperature")
+    assert row["scope"] == f"sensors:{probe}"
+    assert row["count_readings"] == 1
+    assert analytics_repo.get_average_temperature(plant_id) == pytest.approx(24.0)
+
+    db_handler.unlink_sensor_from_plant(plant_id, probe)
+    assert _accumulator(db_handler, plant_id, "temperature")["scope"] == f"unit:{unit_id}"
+    assert analytics_repo.get_average_temperature(plant_id) == pytest.approx(21.0)
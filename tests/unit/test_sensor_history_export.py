@@ -0,0 +1,122 @@
+"""
+Tests for keyset-paginated, streaming sensor history export.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from app.blueprints.api.analytics.sensors import _csv_chunks, _ndjson_chunks
+from app.services.application.analytics_service import AnalyticsService
+from infrastructure.database.pagination import KeysetCursor
+
+START = datetime(2026, 3, 1)
+END = datetime(2026, 3, 2)
+
+
+@pytest.fixture()
+def history(analytics_repo, seed):
+    unit_id = seed.create_unit()
+    other_unit = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+    other_sensor = seed.create_sensor(unit_id=other_unit)
+    # Two readings share a timestamp so paging must tie-break on reading_id
+    stamps = ["2026-03-01 10:00:00", "2026-03-01 11:00:00", "2026-03-01 11:00:00", "2026-03-01 12:00:00"]
+    ids = [
+        seed.insert_reading(sensor_id, temperature=20.0 + i, humidity=50.0 + i, timestamp=ts)
+        for i, ts in enumerate(stamps)
+    ]
+    seed.insert_reading(other_sensor, temperature=30.0, timestamp="2026-03-01 10:30:00")
+    seed.insert_reading(sensor_id, temperature=99.0, timestamp="2026-03-03 10:00:00")  # outside window
+    return AnalyticsService(repository=analytics_repo), unit_id, ids
+
+
+def test_cursor_round_trip():
+    cursor = KeysetCursor(ts_epoch=1772359200.125, row_id=42)
+    assert KeysetCursor.decode(cursor.encode()) == cursor
+    with pytest.raises(ValueError):
+        KeysetCursor.decode("not-a-cursor")
+
+
+def test_export_pages_and_resumes_without_gaps(history):
+    service, unit_id, ids = history
+    service._sensor.repository.fetch_sensor_history_page = _counting(service._sensor.repository)
+
+    rows = list(service._sensor.iter_sensor_history_export(START, END, unit_id=unit_id, page_size=2))
+    assert [row["reading_id"] for row, _ in rows] == ids
+    assert rows[0][0]["temperature"] == 20.0
+    assert "ts_epoch" not in rows[0][0]
+    assert service._sensor.repository.fetch_sensor_history_page.calls == 3
+
+    # Resume after the first of the two readings sharing a timestamp
+    resumed = list(service.iter_sensor_history_export(START, END, unit_id=unit_id, cursor=rows[1][1]))
+    assert [row["reading_id"] for row, _ in resumed] == ids[2:]
+
+    limited = list(service.iter_sensor_history_export(START, END, unit_id=unit_id, limit=3))
+    assert [row["reading_id"] for row, _ in limited] == ids[:3]
+
+
+def test_export_metric_filter_and_encoders(history):
+    service, unit_id, ids = history
+    rows = list(service.iter_sensor_history_export(START, END, unit_id=unit_id, metrics=["humidity"]))
+    assert all(set(row) >= {"humidity"} and "temperature" not in row for row, _ in rows)
+
+    lines = "".join(_ndjson_chunks(iter(rows))).splitlines()
+    decoded = [json.loads(line) for line in lines]
+    assert [d["reading_id"] for d in decoded] == ids
+    assert KeysetCursor.decode(decoded[-1]["cursor"]) == rows[-1][1]
+
+    table = list(csv.DictReader(io.StringIO("".join(_csv_chunks(iter(rows))))))
+    assert [(r["metric"], float(r["value"])) for r in table] == [("humidity", 50.0 + i) for i in range(len(ids))]
+
+
+def test_page_error_aborts_export_instead_of_truncating(history):
+    service, unit_id, ids = history
+    repository = service._sensor.repository
+    original = repository.fetch_sensor_history_page
+    calls = []
+
+    def failing_second_page(*args, **kwargs):
+        calls.append(kwargs.get("after"))
+        if len(calls) % 2 == 0:
+            raise sqlite3.OperationalError("disk I/O error")
+        return original(*args, **kwargs)
+
+    repository.fetch_sensor_history_page = failing_second_page
+
+    received = []
+    with pytest.raises(sqlite3.OperationalError):
+        for row, cursor in service._sensor.iter_sensor_history_export(START, END, unit_id=unit_id, page_size=2):
+            received.append((row["reading_id"], cursor))
+    assert [reading_id for reading_id, _ in received] == ids[:2]
+
+    # The stream ends with an error after flushing the rows it had, not a clean EOF
+    chunks = []
+    with pytest.raises(sqlite3.OperationalError):
+        for chunk in _ndjson_chunks(
+            service._sensor.iter_sensor_history_export(START, END, unit_id=unit_id, page_size=2)
+        ):
+            chunks.append(chunk)
+    assert [json.loads(line)["reading_id"] for line in "".join(chunks).splitlines()] == ids[:2]
+
+    # Resuming from the last cursor received picks up the rest
+    repository.fetch_sensor_history_page = original
+    resumed = list(service.iter_sensor_history_export(START, END, unit_id=unit_id, cursor=received[-1][1]))
+    assert [row["reading_id"] for row, _ in resumed] == ids[2:]
+
+
+def _counting(repository):
+    original = repository.fetch_sensor_history_page
+
+    def wrapper(*args, **kwargs):
+        wrapper.calls += 1
+        return original(*args, **kwargs)
+
+    wrapper.calls = 0
+    return wrapper
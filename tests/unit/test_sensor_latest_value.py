@@ -0,0 +1,69 @@
+"""
+Tests for the trigger-maintained SensorLatestValue table behind get_latest_sensor_readings.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+MIGRATION = Path(__file__).resolve().parents[2] / "infrastructure/database/migrations/065_sensor_latest_value.py"
+
+
+def test_rare_metric_survives_many_newer_readings(analytics_repo, seed):
+    unit_id = seed.create_unit()
+    soil = seed.create_sensor(unit_id=unit_id)
+    climate = seed.create_sensor(unit_id=unit_id)
+    seed.insert_reading(soil, soil_moisture=41.0, timestamp="2026-03-01 08:00:00")
+    for minute in range(60):
+        seed.insert_reading(climate, temperature=20.0 + minute, timestamp=f"2026-03-01 09:{minute:02d}:00")
+
+    latest = analytics_repo.get_latest_sensor_readings(unit_id)
+
+    assert latest["soil_moisture"] == 41.0
+    assert latest["temperature"] == 79.0
+    assert latest["humidity"] is None
+
+
+def test_newest_value_wins_across_sensors_and_late_inserts(analytics_repo, seed):
+    unit_id = seed.create_unit()
+    first = seed.create_sensor(unit_id=unit_id)
+    second = seed.create_sensor(unit_id=unit_id)
+    other = seed.create_sensor(unit_id=seed.create_unit())
+    seed.insert_reading(first, temperature=21.0, timestamp="2026-03-01 10:00:00")
+    seed.insert_reading(second, temperature=23.0, timestamp="2026-03-01 11:00:00")
+    # Late-arriving older reading must not replace the newer value
+    seed.insert_reading(second, temperature=5.0, timestamp="2026-03-01 09:00:00")
+    seed.insert_reading(other, temperature=40.0, timestamp="2026-03-01 12:00:00")
+
+    assert analytics_repo.get_latest_sensor_readings(unit_id)["temperature"] == 23.0
+
+
+def test_deleting_latest_reading_falls_back(db_handler, analytics_repo, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+    seed.insert_reading(sensor_id, temperature=20.0, humidity=55.0, timestamp="2026-03-01 10:00:00")
+    newest = seed.insert_reading(sensor_id, temperature=22.0, timestamp="2026-03-01 11:00:00")
+
+    with db_handler.connection() as conn:
+        conn.execute("DELETE FROM SensorReading WHERE reading_id = ?", (newest,))
+
+    latest = analytics_repo.get_latest_sensor_readings(unit_id)
+    assert latest["temperature"] == 20.0
+    assert latest["humidity"] == 55.0
+
+
+def test_migration_backfills_existing_samples(db_handler, analytics_repo, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+    seed.insert_reading(sensor_id, temperature=20.0, timestamp="2026-03-01 10:00:00")
+    seed.insert_reading(sensor_id, temperature=24.0, timestamp="2026-03-01 11:00:00")
+    with db_handler.connection() as conn:
+        conn.execute("DELETE FROM SensorLatestValue")
+
+    spec = importlib.util.spec_from_file_location("migration_065", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.migrate(db_handler) is True
+
+    assert analytics_repo.get_latest_sensor_readings(unit_id)["temperature"] == 24.0
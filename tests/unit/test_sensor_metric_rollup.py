@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import importlib.util
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from app.services.application.sensor_analytics_service import SensorAnalyticsService
+from infrastructure.database.repositories.analytics import AnalyticsRepository
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MIGRATION_PATH = REPO_ROOT / "infrastructure" / "database" / "migrations" / "063_sensor_metric_rollup.py"
+
+BASE = datetime(2026, 3, 2, 10, 0, 0, tzinfo=UTC)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("migration_063", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _rollups(db_handler, tier: int) -> list[tuple]:
+    with db_handler.connection() as conn:
+        return [
+            tuple(row)
+            for row in conn.execute(
+                """
+                SELECT metric, bucket_start, count_readings, min_value, max_value, sum_value
+                FROM SensorMetricRollup WHERE tier_seconds = ? ORDER BY metric, bucket_start
+                """,
+                (tier,),
+            )
+        ]
+
+
+@pytest.fixture()
+def sensor(seed):
+    unit_id = seed.create_unit()
+    return unit_id, seed.create_sensor(unit_id=unit_id)
+
+
+def _insert_minutes(seed, sensor_id: int, minutes: range, base: datetime = BASE) -> None:
+    for minute in minutes:
+        ts = (base + timedelta(minutes=minute)).strftime("%Y-%m-%d %H:%M:%S")
+        seed.insert_reading(sensor_id, temperature=20.0 + minute % 2, timestamp=ts)
+
+
+def test_trigger_maintains_every_tier(db_handler, seed, sensor):
+    _, sensor_id = sensor
+    _insert_minutes(seed, sensor_id, range(0, 30, 10))
+    bucket = int(BASE.timestamp())
+
+    assert [row[:3] for row in _rollups(db_handler, 60)] == [
+        ("temperature", bucket, 1),
+        ("temperature", bucket + 600, 1),
+        ("temperature", bucket + 1200, 1),
+    ]
+    assert _rollups(db_handler, 900) == [
+        ("temperature", bucket, 2, 20.0, 20.0, 40.0),
+        ("temperature", bucket + 900, 1, 20.0, 20.0, 20.0),
+    ]
+    assert _rollups(db_handler, 3600) == [("temperature", bucket, 3, 20.0, 20.0, 60.0)]
+
+
+def test_planner_prefers_raw_then_finest_fitting_tier(analytics_repo, seed, sensor):
+    unit_id, sensor_id = sensor
+    start = datetime.now(UTC).replace(second=0, microsecond=0) - timedelta(days=1)
+    _insert_minutes(seed, sensor_id, range(120), base=start)
+    end = start + timedelta(hours=2)
+
+    assert analytics_repo.plan_sensor_history_resolution(start, end, 500, unit_id=unit_id) == 0
+    assert analytics_repo.plan_sensor_history_resolution(start, end, 100, unit_id=unit_id) == 900
+    assert analytics_repo.plan_sensor_history_resolution(start, end, 2, sensor_id=sensor_id) == 3600
+
+
+def test_planner_skips_sources_pruned_before_window_start(analytics_repo, seed, sensor):
+    unit_id, sensor_id = sensor
+    now = datetime.now(UTC).replace(second=0, microsecond=0)
+    for days_ago in (60, 40, 1):
+        _insert_minutes(seed, sensor_id, range(1), base=now - timedelta(days=days_ago))
+
+    def plan(days: int, max_points: int = 100) -> int:
+        return analytics_repo.plan_sensor_history_resolution(
+            now - timedelta(days=days), now, max_points, unit_id=unit_id, raw_retention_days=30
+        )
+
+    # Raw still holds a 20-day window; a 60-day one falls back to the finest
+    # tier still retained (1-minute buckets only cover 7 days).
+    assert plan(20) == 0
+    assert plan(61) == 900
+    # Past every finer tier's retention only the hourly tier remains.
+    assert plan(120) == 3600
+
+
+def test_rollup_history_returns_bucket_means(analytics_repo, seed, sensor):
+    unit_id, _ = sensor
+    _insert_minutes(seed, sensor[1], range(30))
+
+    rows = analytics_repo.fetch_sensor_rollup_history(BASE, BASE + timedelta(minutes=30), 900, unit_id=unit_id)
+
+    assert [row["timestamp"] for row in rows] == [BASE.isoformat(), (BASE + timedelta(minutes=15)).isoformat()]
+    assert rows[0]["temperature"] == pytest.approx(20.0 + 7 / 15)
+    assert rows[0]["reading_count"] == 15
+    assert rows[0]["unit_id"] == unit_id
+
+
+def test_migration_rebuilds_and_prune_respects_retention(db_handler, device_repo, seed, sensor):
+    _, sensor_id = sensor
+    month_ago = datetime.now(UTC).replace(minute=0, second=0, microsecond=0) - timedelta(days=30)
+    for minute in range(3):
+        ts = (month_ago + timedelta(minutes=minute)).strftime("%Y-%m-%d %H:%M:%S")
+        seed.insert_reading(sensor_id, temperature=20.0, timestamp=ts)
+    expected = _rollups(db_handler, 3600)
+    with db_handler.connection() as conn:
+        conn.execute("DELETE FROM SensorMetricRollup")
+
+    assert _load_migration().migrate(db_handler) is True
+    assert _rollups(db_handler, 3600) == expected
+
+    # Older than the 1-minute retention (7 days) but within the 15-minute and hourly ones
+    assert device_repo.prune_sensor_rollups() == 3
+    assert len(_rollups(db_handler, 900)) == 1
+    assert _rollups(db_handler, 60) == []
+    assert _rollups(db_handler, 3600) == expected
+
+
+def test_service_reads_rollup_tier_for_interval():
+    repo = Mock(spec=AnalyticsRepository)
+    repo.fetch_sensor_rollup_history.return_value = [
+        {"timestamp": BASE.isoformat(), "temperature": 20.0, "reading_count": 3},
+        {"timestamp": (BASE + timedelta(minutes=15)).isoformat(), "temperature": 23.0, "reading_count": 1},
+    ]
+    service = SensorAnalyticsService(repo, cache_name_prefix="test_rollup_tiers")
+
+    readings = service.fetch_chart_readings(BASE, BASE + timedelta(hours=6), unit_id=1, interval="30min")
+    chart = service.format_sensor_chart_data(readings, "30min")
+
+    repo.fetch_sensor_rollup_history.assert_called_once_with(
+        BASE, BASE + timedelta(hours=6), 900, unit_id=1, sensor_id=None
+    )
+    repo.plan_sensor_history_resolution.assert_not_called()
+    assert chart["temperature"] == [pytest.approx(20.75)]
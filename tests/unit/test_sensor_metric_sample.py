@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MIGRATION_PATH = REPO_ROOT / "infrastructure" / "database" / "migrations" / "062_sensor_metric_sample.py"
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("migration_062", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _samples(db_handler) -> list[tuple]:
+    with db_handler.connection() as conn:
+        return [
+            tuple(row)
+            for row in conn.execute(
+                "SELECT reading_id, sensor_id, metric, value FROM SensorMetricSample ORDER BY reading_id, metric"
+            )
+        ]
+
+
+def test_insert_populates_numeric_samples_only(db_handler, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+
+    reading_id = db_handler.insert_sensor_reading(
+        sensor_id=sensor_id,
+        reading_data={"temperature": 22.5, "humidity": 55, "status": "ok", "valid": True},
+    )
+
+    assert _samples(db_handler) == [
+        (reading_id, sensor_id, "humidity", 55.0),
+        (reading_id, sensor_id, "temperature", 22.5),
+    ]
+
+
+def test_batch_insert_and_delete_keep_samples_in_sync(db_handler, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+
+    inserted = db_handler.insert_sensor_readings_batch(
+        [(sensor_id, {"temperature": 20.0}, 1.0), (sensor_id, {"temperature": 21.0}, 1.0)]
+    )
+    assert inserted == 2
+    assert len(_samples(db_handler)) == 2
+
+    with db_handler.connection() as conn:
+        conn.execute("DELETE FROM SensorReading WHERE sensor_id = ?", (sensor_id,))
+
+    assert _samples(db_handler) == []
+
+
+def test_history_and_latest_read_from_samples(db_handler, seed, analytics_repo):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+    base = datetime(2026, 3, 1, 12, 0, 0)
+    for i in range(3):
+        seed.insert_reading(
+            sensor_id,
+            temperature=20.0 + i,
+            humidity=50.0,
+            timestamp=(base + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    rows = analytics_repo.fetch_sensor_history(base, base + timedelta(hours=1), unit_id=unit_id, limit=2)
+    assert [row["temperature"] for row in rows] == [20.0, 21.0]
+    assert rows[0]["humidity"] == 50.0
+    assert rows[0]["sensor_id"] == sensor_id
+
+    latest = analytics_repo.latest_readings_for_unit(unit_id)
+    assert latest["temperature"] == 22.0
+    assert latest["humidity"] == 50.0
+
+
+def test_migration_backfills_existing_readings(db_handler, seed):
+    unit_id = seed.create_unit()
+    sensor_id = seed.create_sensor(unit_id=unit_id)
+    with db_handler.connection() as conn:
+        conn.execute("DROP TRIGGER trg_sensor_reading_samples_insert")
+        conn.execute(
+            "INSERT INTO SensorReading (sensor_id, reading_data) VALUES (?, ?)",
+            (sensor_id, json.dumps({"ph": 6.2})),
+        )
+        conn.execute("INSERT INTO SensorReading (sensor_id, reading_data) VALUES (?, ?)", (sensor_id, "not json"))
+    assert _samples(db_handler) == []
+
+    assert _load_migration().migrate(db_handler) is True
+
+    samples = _samples(db_handler)
+    assert [(metric, value) for _, _, metric, value in samples] == [("ph", 6.2)]
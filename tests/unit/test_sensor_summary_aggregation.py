@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+
+def _summaries(db_handler, granularity: str) -> list[dict]:
+    with db_handler.connection() as conn:
+        return [
+            dict(row)
+            for row in conn.execute(
+                """
+                SELECT period_start, period_end, count_readings, min_value, max_value, avg_value, stddev_value
+                FROM SensorReadingSummary WHERE granularity = ? ORDER BY period_start
+                """,
+                (granularity,),
+            )
+        ]
+
+
+@pytest.fixture()
+def temp_sensor(seed):
+    unit_id = seed.create_unit()
+    return seed.create_sensor(unit_id=unit_id, sensor_type="temperature")
+
+
+def test_single_pass_writes_all_granularities(db_handler, device_repo, seed, temp_sensor):
+    # 2026-03-02 is a Monday
+    for ts, value in (
+        ("2026-03-02 10:05:00", 20.0),
+        ("2026-03-02 10:40:00", 22.0),
+        ("2026-03-02 11:10:00", 24.0),
+        ("2026-03-03 09:00:00", 30.0),
+    ):
+        seed.insert_reading(temp_sensor, temperature=value, humidity=99.0, timestamp=ts)
+
+    written = device_repo.aggregate_pending_sensor_readings(until="2026-03-04 00:00:00")
+
+    hourly = _summaries(db_handler, "hourly")
+    daily = _summaries(db_handler, "daily")
+    weekly = _summaries(db_handler, "weekly")
+    assert written == len(hourly) + len(daily) + len(weekly) == 3 + 2 + 1
+
+    assert hourly[0]["period_start"] == "2026-03-02 10:00:00"
+    assert hourly[0]["period_end"] == "2026-03-02 11:00:00"
+    assert hourly[0]["count_readings"] == 2
+    assert daily[0]["count_readings"] == 3
+    assert daily[0]["avg_value"] == pytest.approx(22.0)
+    assert daily[0]["stddev_value"] == pytest.approx(math.sqrt(8 / 3))
+    assert weekly[0]["period_start"] == "2026-03-02 00:00:00"
+    assert weekly[0]["min_value"] == 20.0
+    assert weekly[0]["max_value"] == 30.0
+
+
+def test_incremental_runs_merge_straddling_buckets(db_handler, device_repo, seed, temp_sensor):
+    seed.insert_reading(temp_sensor, temperature=20.0, timestamp="2026-03-02 10:05:00")
+    seed.insert_reading(temp_sensor, temperature=22.0, timestamp="2026-03-02 10:20:00")
+    device_repo.aggregate_pending_sensor_readings(until="2026-03-02 10:30:00")
+
+    seed.insert_reading(temp_sensor, temperature=24.0, timestamp="2026-03-02 10:45:00")
+    seed.insert_reading(temp_sensor, temperature=26.0, timestamp="2026-03-02 12:00:00")
+    device_repo.aggregate_pending_sensor_readings(until="2026-03-03 00:00:00")
+
+    hourly = _summaries(db_handler, "hourly")
+    assert [row["count_readings"] for row in hourly] == [3, 1]
+    assert hourly[0]["avg_value"] == pytest.approx(22.0)
+    assert hourly[0]["stddev_value"] == pytest.approx(math.sqrt(8 / 3))
+
+    daily = _summaries(db_handler, "daily")
+    assert len(daily) == 1
+    assert daily[0]["count_readings"] == 4
+    assert daily[0]["avg_value"] == pytest.approx(23.0)
+    assert daily[0]["stddev_value"] == pytest.approx(math.sqrt(5.0))
+
+    # Nothing new below the watermark: no rows touched
+    assert device_repo.aggregate_pending_sensor_readings(until="2026-03-03 00:00:00") == 0
+
+
+def test_harvest_stats_only_use_daily_summaries(device_repo, seed, temp_sensor, db_handler):
+    for hour in range(4):
+        seed.insert_reading(temp_sensor, temperature=20.0 + hour, timestamp=f"2026-03-02 0{hour}:00:00")
+    device_repo.aggregate_pending_sensor_readings(until="2026-03-10 00:00:00")
+
+    with db_handler.connection() as conn:
+        unit_id = conn.execute("SELECT unit_id FROM Sensor WHERE sensor_id = ?", (temp_sensor,)).fetchone()[0]
+
+    stats = device_repo.get_sensor_summary_stats_for_harvest(unit_id, "2026-03-01", "2026-03-31")
+    assert stats["temperature"]["total_readings"] == 4
+    assert stats["temperature"]["summary_periods"] == 1
+    assert len(device_repo.get_sensor_summaries_for_unit(unit_id, granularity=None)) == 4 + 1 + 1
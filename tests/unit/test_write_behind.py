@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+from infrastructure.database.sqlite_handler import SQLiteDatabaseHandler
+from infrastructure.database.write_behind import WriteBehindBuffer
+
+
+def _handler(tmp_path, **kwargs) -> SQLiteDatabaseHandler:
+    handler = SQLiteDatabaseHandler(str(tmp_path / "wb.db"), **kwargs)
+    handler.create_tables()
+    with handler.connection() as conn:
+        conn.execute("INSERT INTO GrowthUnits (name) VALUES ('Unit')")
+        conn.execute(
+            "INSERT INTO Sensor (unit_id, name, sensor_type, protocol, model) "
+            "VALUES (1, 's', 'temperature', 'i2c', 'BME280')"
+        )
+        conn.execute(
+            "INSERT INTO Actuator (unit_id, name, actuator_type, protocol, model) "
+            "VALUES (1, 'p', 'water_pump', 'gpio', 'Generic')"
+        )
+    return handler
+
+
+def _count(handler, table: str) -> int:
+    with handler.connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # nosec B608 — test table names
+
+
+def test_deferred_rows_are_group_committed_on_flush(tmp_path):
+    handler = _handler(tmp_path, write_flush_seconds=60)
+
+    for i in range(10):
+        handler.enqueue_sensor_reading(sensor_id=1, reading_data={"temperature": 20.0 + i})
+        handler.enqueue_actuator_state(1, "on" if i % 2 else "off")
+    handler.enqueue_connectivity_event("mqtt", "connected", endpoint="broker:1883")
+
+    assert handler.flush_writes()
+    assert _count(handler, "SensorReading") == 10
+    assert _count(handler, "SensorMetricSample") == 10
+    assert _count(handler, "ActuatorStateHistory") == 10
+    assert _count(handler, "DeviceConnectivityHistory") == 1
+    stats = handler.get_write_behind_stats()
+    assert stats["written"] == 21
+    assert stats["batches"] == 1
+    handler.stop_write_behind()
+
+
+def test_batch_commits_when_size_limit_reached(tmp_path):
+    handler = _handler(tmp_path, write_batch_size=5, write_flush_seconds=60)
+
+    for _ in range(12):
+        handler.enqueue_actuator_state(1, "on")
+    handler.flush_writes()
+
+    stats = handler.get_write_behind_stats()
+    assert stats["written"] == 12
+    assert stats["batches"] == 3
+    handler.stop_write_behind()
+
+
+def test_stop_drains_queue_and_later_writes_run_inline(tmp_path):
+    handler = _handler(tmp_path, write_flush_seconds=60)
+    for _ in range(3):
+        handler.enqueue_actuator_state(1, "on")
+
+    handler.stop_write_behind()
+    assert _count(handler, "ActuatorStateHistory") == 3
+
+    handler.enqueue_actuator_state(1, "off")
+    assert _count(handler, "ActuatorStateHistory") == 4
+
+
+def test_memory_database_writes_inline(db_handler, seed):
+    actuator_id = seed.create_actuator(unit_id=seed.create_unit())
+
+    db_handler.enqueue_actuator_state(actuator_id, "on")
+
+    assert _count(db_handler, "ActuatorStateHistory") == 1
+    assert db_handler.get_write_behind_stats() == {"running": False}
+
+
+def test_full_queue_rejects_after_timeout(tmp_path):
+    gate = threading.Event()
+
+    def connect():
+        gate.wait(5)
+        return sqlite3.connect(str(tmp_path / "slow.db"), check_same_thread=False)
+
+    buffer = WriteBehindBuffer(connect, max_pending=1, put_timeout=0.01)
+    assert buffer.submit("SELECT ?", (1,))
+    assert buffer.submit("SELECT ?", (2,)) is False
+
+    stats = buffer.get_stats()
+    assert stats["rejected"] == 1
+    assert stats["blocked_puts"] == 1
+    gate.set()
+    buffer.stop()
+
+
+def test_stop_with_full_queue_returns_within_timeout(tmp_path):
+    gate = threading.Event()
+
+    def connect():
+        gate.wait(5)
+        return sqlite3.connect(str(tmp_path / "stuck.db"), check_same_thread=False)
+
+    buffer = WriteBehindBuffer(connect, max_pending=1, put_timeout=0.01)
+    assert buffer.submit("SELECT ?", (1,))
+
+    started = time.monotonic()
+    buffer.stop(timeout=0.2)
+    assert time.monotonic() - started < 1.0
+    gate.set()
+
+
+def test_failed_row_does_not_drop_rest_of_batch(tmp_path):
+    path = tmp_path / "rows.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT NOT NULL)")
+    buffer = WriteBehindBuffer(lambda: sqlite3.connect(str(path), check_same_thread=False), max_delay=60)
+
+    buffer.submit("INSERT INTO t (v) VALUES (?)", ("a",))
+    buffer.submit("INSERT INTO t (v) VALUES (?)", (None,))
+    buffer.submit("INSERT INTO t (v) VALUES (?)", ("b",))
+    buffer.stop()
+
+    with sqlite3.connect(path) as conn:
+        assert [row[0] for row in conn.execute("SELECT v FROM t ORDER BY id")] == ["a", "b"]
+    assert buffer.get_stats()["failed"] == 1
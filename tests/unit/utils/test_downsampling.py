@@ -0,0 +1,60 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.utils.downsampling import downsample_rows
+
+BASE = datetime(2026, 3, 2, tzinfo=UTC)
+
+
+def _rows(values, *, sensor_id=1, metric="temperature"):
+    for i, value in enumerate(values):
+        yield {"timestamp": (BASE + timedelta(minutes=i)).isoformat(), "sensor_id": sensor_id, metric: value}
+
+
+def _window(minutes: int) -> dict:
+    return {"start_epoch": BASE.timestamp(), "end_epoch": (BASE + timedelta(minutes=minutes)).timestamp()}
+
+
+def test_lttb_keeps_endpoints_and_spike_across_whole_window():
+    values = [20.0] * 1000
+    values[700] = 45.0
+    values[-1] = 21.0
+
+    rows = downsample_rows(_rows(values), target=50, **_window(1000))
+
+    assert len(rows) <= 50
+    assert rows[0]["timestamp"] == BASE.isoformat()
+    assert rows[-1]["temperature"] == 21.0
+    assert any(row["temperature"] == 45.0 for row in rows)
+
+
+def test_minmax_keeps_bucket_extremes():
+    values = [float(i % 10) for i in range(100)]
+
+    rows = downsample_rows(_rows(values), target=20, mode="minmax", **_window(100))
+
+    assert len(rows) == 20
+    assert {row["temperature"] for row in rows} == {0.0, 9.0}
+
+
+def test_sparse_series_are_returned_unchanged():
+    rows = list(_rows([1.0, 2.0, 3.0]))
+
+    assert downsample_rows(iter(rows), target=500, **_window(3)) == rows
+
+
+def test_series_are_split_per_sensor():
+    a = list(_rows([1.0] * 10, sensor_id=1))
+    b = list(_rows([5.0] * 10, sensor_id=2))
+    merged = [row for pair in zip(a, b) for row in pair]
+
+    rows = downsample_rows(merged, target=3, **_window(10))
+
+    assert {row["sensor_id"] for row in rows} == {1, 2}
+    assert len(rows) == 6
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        downsample_rows([], target=10, mode="stride", **_window(1))
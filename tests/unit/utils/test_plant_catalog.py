@@ -0,0 +1,126 @@
+"""
+Tests for the shared, indexed plant catalog behind PlantJsonHandler.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+import pytest
+
+from app.utils.plant_json_handler import PlantJsonHandler
+
+
+def _plant(plant_id: int, common_name: str, **extra) -> dict:
+    return {"id": plant_id, "common_name": common_name, "species": f"Species {plant_id}", **extra}
+
+
+@pytest.fixture()
+def dataset(tmp_path):
+    path = tmp_path / "plants_info.json"
+    plants = [
+        _plant(
+            1,
+            "Tomatoes",
+            aliases=["Tomato"],
+            yield_data={"difficulty_level": "Medium"},
+            growth_stages=[{"stage": "Vegetative", "conditions": {"temperature_C": {"min": 20, "max": 26}}}],
+            automation={"lighting_schedule": {"vegetative": {"hours": 16}, "flowering": {"hours": 12}}},
+        ),
+        _plant(2, "Basil", scientific_name="Ocimum basilicum", yield_data={"difficulty_level": "Easy"}),
+    ]
+    path.write_text(json.dumps({"plants_info": plants}), encoding="utf-8")
+    return path
+
+
+def test_handlers_share_one_parsed_catalog(dataset):
+    first = PlantJsonHandler(dataset)
+    second = PlantJsonHandler(str(dataset))
+    assert first.data is second.data
+
+    assert first.add_plant(_plant(0, "Mint"))
+    assert second.plant_exists(" mint ")
+    assert second.get_plant_by_id(3)["common_name"] == "Mint"
+
+
+def test_indexed_lookups(dataset):
+    handler = PlantJsonHandler(dataset)
+
+    assert handler._find_plant_entry("tomato")["id"] == 1
+    assert handler._find_plant_entry("OCIMUM BASILICUM")["id"] == 2
+    assert handler._find_plant_entry("Kale") is None
+    assert handler.get_growth_stages("Tomato")[0]["stage"] == "Vegetative"
+    assert handler.get_growth_stage("tomatoes", "vegetative")["conditions"]["temperature_C"]["max"] == 26
+    assert handler.get_lighting_for_stage("Tomatoes", "Veg") == {"hours": 16}
+    assert handler.get_lighting_for_stage("Tomatoes", "bloom") == {"hours": 12}
+    assert handler.get_lighting_for_stage("Tomatoes", "seedling") is None
+    assert [p["id"] for p in handler.search_plants(common_name="basil")] == [2]
+    assert handler.search_plants(common_name="Basil", species="Other") == []
+    assert [p["id"] for p in handler.get_plants_by_difficulty("easy")] == [2]
+
+    # Mutations are reindexed on save
+    assert handler.update_plant(2, {"common_name": "Sweet Basil"}, validate=False)
+    assert handler.plant_exists("sweet basil")
+    assert not handler.plant_exists("basil")
+    assert handler.delete_plant(1)
+    assert handler._find_plant_entry("tomato") is None
+
+
+def test_reloads_only_when_file_changes(dataset):
+    handler = PlantJsonHandler(dataset)
+    data = handler.data
+    assert handler.data is data
+
+    payload = json.loads(dataset.read_text(encoding="utf-8"))
+    payload["plants_info"].append(_plant(9, "Kale"))
+    dataset.write_text(json.dumps(payload), encoding="utf-8")
+    stat = dataset.stat()
+    os.utime(dataset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert handler.plant_exists("kale")
+    assert handler.data is not data
+
+
+def test_save_is_atomic(dataset, monkeypatch):
+    handler = PlantJsonHandler(dataset)
+    assert handler.update_automation(2, {"watering_schedule": {"soil_moisture_trigger": 40}})
+    assert PlantJsonHandler(dataset).get_soil_moisture_trigger("Basil") == 40.0
+    # The handler's own write does not trigger a reload
+    data = handler.data
+    assert handler.data is data
+
+    original = dataset.read_text(encoding="utf-8")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", fail)
+    assert not handler.update_common_issues(2, [])
+    assert dataset.read_text(encoding="utf-8") == original
+    assert sorted(p.name for p in dataset.parent.iterdir()) == ["plants_info.json"]
+
+
+def test_concurrent_mutators_are_serialized(dataset):
+    handler = PlantJsonHandler(dataset)
+    errors = []
+
+    def writer(worker: int):
+        try:
+            for i in range(20):
+                assert handler.update_automation(1, {f"worker_{worker}_{i}": i})
+                assert handler.update_plant(2, {f"note_{worker}_{i}": i}, validate=False)
+        except Exception as exc:  # surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    saved = json.loads(dataset.read_text(encoding="utf-8"))["plants_info"]
+    assert len(saved[0]["automation"]) == 1 + 4 * 20
+    assert sum(key.startswith("note_") for key in saved[1]) == 4 * 20